@@ -7,6 +7,7 @@ API integration standards and the ReasoningProvider interface.
 
 import asyncio
 import logging
+import re
 import time
 import json
 from typing import Dict, Any, List, Optional, AsyncIterator
@@ -32,10 +33,16 @@ from shared.models.reasoning_models import (
 )
 from shared.utils.rate_limiter import BaseRateLimiter
 from shared.utils.cache import ResponseCache
+from shared.utils.disk_cache import DiskCache
+from shared.utils.single_flight import SingleFlight
+from shared.utils.shared_rate_limit import SharedRateLimitState
 
 from .config import ClaudeReasoningConfig
 from .data_mapper import ClaudeReasoningDataMapper
 
+# Start of a step line in step-by-step output, e.g. "Step 3: ..."
+_STEP_MARKER = re.compile(r'^\s*(Step \d+)\s*:\s*(.*)$')
+
 
 class ClaudeRateLimiter(BaseRateLimiter):
     """Rate limiter for Claude API calls."""
@@ -43,9 +50,18 @@ class ClaudeRateLimiter(BaseRateLimiter):
     def __init__(self, config: ClaudeReasoningConfig):
         super().__init__(
             calls_per_minute=config.rate_limit,
-            quota_per_day=config.daily_quota
+            calls_per_day=config.daily_quota,
+            shared_state=SharedRateLimitState.from_config(config, name='claude_reasoning')
         )
 
+    def can_make_call(self) -> bool:
+        """Check whether a Claude API call is allowed right now."""
+        return self.can_make_request()
+
+    def record_call(self) -> None:
+        """Record a completed Claude API call."""
+        self.record_request()
+
 
 class ClaudeReasoningClient(ReasoningProvider):
     """
@@ -71,11 +87,19 @@ class ClaudeReasoningClient(ReasoningProvider):
         if self.config.cache_enabled:
             self.cache = ResponseCache(
                 ttl_seconds=self.config.cache_ttl,
-                max_size=1000
+                max_size=1000,
+                disk_cache=DiskCache.from_config(self.config, namespace='claude_reasoning')
             )
         else:
             self.cache = None
         
+        # Concurrent identical requests share one in-flight API call
+        self._single_flight = SingleFlight()
+        
+        # Long-lived HTTP session, created on first use inside the event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Validate configuration
         validation = self.config.validate_config()
         if not validation['is_valid']:
@@ -101,8 +125,8 @@ class ClaudeReasoningClient(ReasoningProvider):
                 raise RateLimitError("Claude API rate limit exceeded")
             
             # Check cache if enabled
+            cache_key = self._generate_cache_key(request)
             if self.cache:
-                cache_key = self._generate_cache_key(request)
                 if cached_response := self.cache.get(cache_key):
                     self.logger.debug("Returning cached response")
                     return cached_response
@@ -111,13 +135,20 @@ class ClaudeReasoningClient(ReasoningProvider):
             api_config = {
                 'model': self.config.get_model_for_mode(request.mode.value),
                 'max_tokens': self.config.get_max_tokens_for_mode(request.mode.value),
-                'temperature': self.config.get_temperature_for_mode(request.mode.value)
+                'temperature': self.config.get_temperature_for_mode(request.mode.value),
+                'prompt_caching': getattr(self.config, 'prompt_caching', False)
             }
             
             claude_request = self.data_mapper.map_request_to_claude(request, api_config)
             
-            # Make API call
-            claude_response = await self._make_api_call(claude_request)
+            # Make API call; with caching on, identical concurrent requests
+            # share one call the way they would share its cached response
+            if self.cache:
+                claude_response = await self._single_flight.do_async(
+                    cache_key, lambda: self._make_recorded_api_call(claude_request)
+                )
+            else:
+                claude_response = await self._make_recorded_api_call(claude_request)
             
             # Map response back to shared format
             response = self.data_mapper.map_response_from_claude(claude_response, request)
@@ -125,10 +156,7 @@ class ClaudeReasoningClient(ReasoningProvider):
             
             # Cache response if enabled
             if self.cache and response.success:
-                self.cache.set(cache_key, response)
-            
-            # Record rate limiter usage
-            self.rate_limiter.record_call()
+                self.cache.set_response(cache_key, response, request.temperature)
             
             self.logger.info(
                 f"Claude reasoning completed in {response.processing_time:.2f}s "
@@ -159,12 +187,12 @@ class ClaudeReasoningClient(ReasoningProvider):
         Yields:
             ReasoningStep: Each step in the reasoning process
         """
-        # For Claude, we need to simulate streaming steps since the API doesn't
-        # natively support step-by-step streaming. We'll make a request and
-        # parse the response into steps.
-        
+        # Steps are streamed over SSE and yielded as soon as the next step
+        # (or the end of the stream) shows the current one is complete.
         try:
-            # Create a modified request for step-by-step processing
+            if not self.rate_limiter.can_make_call():
+                raise RateLimitError("Claude API rate limit exceeded")
+            
             step_request = ReasoningRequest(
                 prompt=request.prompt,
                 mode=ReasoningMode.STEP_BY_STEP,
@@ -173,25 +201,62 @@ class ClaudeReasoningClient(ReasoningProvider):
                 temperature=request.temperature,
                 context=request.context
             )
+            api_config = {
+                'model': self.config.get_model_for_mode(step_request.mode.value),
+                'max_tokens': self.config.get_max_tokens_for_mode(step_request.mode.value),
+                'temperature': self.config.get_temperature_for_mode(step_request.mode.value),
+                'prompt_caching': getattr(self.config, 'prompt_caching', False)
+            }
+            claude_request = self.data_mapper.map_request_to_claude(step_request, api_config)
+            claude_request['stream'] = True
+            
+            start_time = time.time()
+            step_number = 0
+            current: Optional[List[str]] = None  # [description, line, line, ...]
+            preamble: List[str] = []
+            pending = ""
             
-            # Get the full response
-            response = await self.reason(step_request)
+            async for text in self._stream_text(claude_request):
+                pending += text
+                *lines, pending = pending.split("\n")
+                for line in lines:
+                    match = _STEP_MARKER.match(line)
+                    if match:
+                        if current is not None:
+                            step_number += 1
+                            yield self.data_mapper.build_step(
+                                step_number, current[0], "\n".join(current[1:])
+                            )
+                        current = [match.group(1), match.group(2)]
+                    elif current is not None:
+                        current.append(line)
+                    else:
+                        preamble.append(line)
             
-            if response.success and response.thinking_chain:
-                # Yield each step with a small delay to simulate streaming
-                for step in response.thinking_chain.steps:
-                    yield step
-                    await asyncio.sleep(0.1)  # Small delay for streaming effect
+            self.rate_limiter.record_call()
+            self.rate_limiter.record_latency((time.time() - start_time) * 1000)
+            
+            # The last line has no trailing newline and may open the final step
+            match = _STEP_MARKER.match(pending)
+            if match:
+                if current is not None:
+                    step_number += 1
+                    yield self.data_mapper.build_step(
+                        step_number, current[0], "\n".join(current[1:])
+                    )
+                current = [match.group(1), match.group(2)]
+            elif current is not None:
+                current.append(pending)
             else:
-                # If no thinking chain, create a single step
-                step = ReasoningStep(
-                    step_number=1,
-                    step_type=StepType.ANALYSIS,
-                    description="Analysis",
-                    content=response.get_final_answer(),
-                    confidence=ConfidenceLevel.MEDIUM
+                preamble.append(pending)
+            
+            if current is not None:
+                yield self.data_mapper.build_step(
+                    step_number + 1, current[0], "\n".join(current[1:])
                 )
-                yield step
+            else:
+                # No structured steps; the whole answer is a single step
+                yield self.data_mapper.build_step(1, "Analysis", "\n".join(preamble))
                 
         except Exception as e:
             self.logger.error(f"Step-by-step thinking failed: {e}")
@@ -418,11 +483,11 @@ Respond in JSON format:
                 'thoughtful_analysis',
                 'chain_of_thought',
                 'step_by_step_reasoning',
+                'streaming_steps',
                 'adaptive_mode_selection',
                 'complexity_analysis'
             ],
             'limitations': [
-                'No true streaming step generation',
                 'Rate limits apply',
                 'Requires API key'
             ],
@@ -452,6 +517,76 @@ Respond in JSON format:
             self.logger.error(f"Claude reasoning health check failed: {e}")
             return False
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the client's pooled HTTP session, creating it on first use.
+        
+        The session keeps connections alive between requests, so calls after
+        the first skip the TCP and TLS handshakes. A session is bound to the
+        event loop it was created in and is replaced if used from another;
+        the stale session is closed on its own loop.
+        
+        Returns:
+            aiohttp.ClientSession: Shared session for Claude API calls
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._discard_session()
+            connector = aiohttp.TCPConnector(
+                limit=getattr(self.config, 'max_connections', 20),
+                keepalive_timeout=getattr(self.config, 'keepalive_timeout', 60.0),
+                ttl_dns_cache=getattr(self.config, 'dns_cache_ttl', 300)
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+                headers={
+                    'x-api-key': self.config.api_key,
+                    'content-type': 'application/json',
+                    'anthropic-version': '2023-06-01'
+                }
+            )
+            self._session_loop = loop
+        return self._session
+    
+    def _discard_session(self) -> None:
+        """Close a session left over from another event loop without awaiting it."""
+        session, loop = self._session, self._session_loop
+        self._session = None
+        self._session_loop = None
+        if session is None or session.closed or loop is None:
+            return
+        if not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        # A closed loop can no longer run the close; its sockets are
+        # released when the session is garbage collected
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session and its connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+    
+    async def __aenter__(self) -> 'ClaudeReasoningClient':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def _raise_for_status(self, response: aiohttp.ClientResponse) -> None:
+        """Map a non-200 Claude API response to a reasoning provider error."""
+        if response.status == 200:
+            return
+        if response.status == 401:
+            raise AuthenticationError("Invalid Claude API key")
+        if response.status == 429:
+            raise RateLimitError("Claude API rate limit exceeded")
+        error_text = await response.text()
+        raise ReasoningProviderError(
+            f"Claude API error {response.status}: {error_text}"
+        )
+    
     async def _make_api_call(self, claude_request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Make API call to Claude.
@@ -462,31 +597,63 @@ Respond in JSON format:
         Returns:
             Dict[str, Any]: Claude API response
         """
-        headers = {
-            'x-api-key': self.config.api_key,
-            'content-type': 'application/json',
-            'anthropic-version': '2023-06-01'
-        }
-        
         url = f"{self.config.base_url}/v1/messages"
         
-        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+        try:
+            async with self._get_session().post(url, json=claude_request) as response:
+                await self._raise_for_status(response)
+                return await response.json()
+                        
+        except aiohttp.ClientError as e:
+            raise ReasoningProviderError(f"Claude API connection error: {e}")
+    
+    async def _make_recorded_api_call(self, claude_request: Dict[str, Any]) -> Dict[str, Any]:
+        """Make an API call and record it against the rate limiter."""
+        start_time = time.time()
+        claude_response = await self._make_api_call(claude_request)
+        self.rate_limiter.record_call()
+        self.rate_limiter.record_latency((time.time() - start_time) * 1000)
+        return claude_response
+    
+    async def _stream_text(self, claude_request: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream a Claude API call, yielding text deltas as they arrive.
+        
+        Args:
+            claude_request: The Claude API request with ``stream`` set
+            
+        Yields:
+            str: Each text delta from the server-sent event stream
+        """
+        url = f"{self.config.base_url}/v1/messages"
+        # A long answer can stream for longer than the session's total
+        # timeout, so streams are bounded per connect and per read instead
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=self.config.timeout,
+            sock_read=self.config.timeout
+        )
         
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(url, json=claude_request, headers=headers) as response:
+            async with self._get_session().post(url, json=claude_request, timeout=timeout) as response:
+                await self._raise_for_status(response)
+                
+                async for raw_line in response.content:
+                    line = raw_line.decode('utf-8').strip()
+                    if not line.startswith('data:'):
+                        continue
                     
-                    if response.status == 200:
-                        return await response.json()
-                    elif response.status == 401:
-                        raise AuthenticationError("Invalid Claude API key")
-                    elif response.status == 429:
-                        raise RateLimitError("Claude API rate limit exceeded")
-                    else:
-                        error_text = await response.text()
-                        raise ReasoningProviderError(
-                            f"Claude API error {response.status}: {error_text}"
-                        )
+                    event = json.loads(line[5:])
+                    event_type = event.get('type')
+                    if event_type == 'content_block_delta':
+                        text = event.get('delta', {}).get('text')
+                        if text:
+                            yield text
+                    elif event_type == 'message_stop':
+                        return
+                    elif event_type == 'error':
+                        message = event.get('error', {}).get('message', 'unknown error')
+                        raise ReasoningProviderError(f"Claude API stream error: {message}")
                         
         except aiohttp.ClientError as e:
             raise ReasoningProviderError(f"Claude API connection error: {e}")
@@ -495,5 +662,15 @@ Respond in JSON format:
         """Generate cache key for a reasoning request."""
         import hashlib
         
-        key_data = f"{request.prompt}:{request.mode.value}:{request.temperature}:{request.max_steps}"
-        return hashlib.md5(key_data.encode()).hexdigest()
\ No newline at end of file
+        # Context is part of the prompt sent to Claude, so requests that only
+        # differ by context must not share a cached or in-flight response
+        context = json.dumps(request.context, sort_keys=True, default=str) if request.context else ""
+        key_data = f"{request.prompt}:{request.mode.value}:{request.temperature}:{request.max_steps}:{context}"
+        return hashlib.md5(key_data.encode()).hexdigest()
+    
+    def get_client_stats(self) -> Dict[str, Any]:
+        """Get cache and request coalescing statistics."""
+        return {
+            'cache_stats': self.cache.get_stats() if self.cache else None,
+            'single_flight_stats': self._single_flight.get_stats()
+        }
\ No newline at end of file
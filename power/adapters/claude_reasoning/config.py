@@ -34,18 +34,31 @@ class ClaudeReasoningConfig(BaseAdapterConfig):
         self.temperature: float = float(self.get_optional('temperature', '0.7'))
         self.timeout: float = float(self.get_optional('timeout', '30.0'))
         
+        # Connection pool for the client's long-lived HTTP session
+        self.max_connections: int = int(self.get_optional('max_connections', '20'))
+        self.keepalive_timeout: float = float(self.get_optional('keepalive_timeout', '60.0'))
+        self.dns_cache_ttl: int = int(self.get_optional('dns_cache_ttl', '300'))
+        
         # Rate limiting
         self.rate_limit: int = int(self.get_optional('rate_limit', '50'))  # per minute
         self.daily_quota: int = int(self.get_optional('daily_quota', '10000'))
+        # SQLite file shared by all workers so they draw from one rate limit budget
+        self.rate_limit_state_path: Optional[str] = self.get_optional('rate_limit_state_path')
         
         # Reasoning parameters
         self.max_reasoning_steps: int = int(self.get_optional('max_reasoning_steps', '10'))
         self.step_timeout: float = float(self.get_optional('step_timeout', '5.0'))
         self.complexity_threshold: float = float(self.get_optional('complexity_threshold', '0.5'))
+        # JSON file keeping the adaptive mode classifier's learned weights across restarts
+        self.classifier_weights_path: Optional[str] = self.get_optional('classifier_weights_path')
         
         # Cache settings
         self.cache_enabled: bool = self.get_optional('cache_enabled', 'true').lower() == 'true'
         self.cache_ttl: int = int(self.get_optional('cache_ttl', '3600'))  # 1 hour
+        self.disk_cache_path: Optional[str] = self.get_optional('disk_cache_path')
+        self.disk_cache_max_mb: int = int(self.get_optional('disk_cache_max_mb', '256'))
+        # Mark the system prompt as a cacheable prompt prefix
+        self.prompt_caching: bool = self.get_optional('prompt_caching', 'true').lower() == 'true'
         
         # Logging
         self.log_requests: bool = self.get_optional('log_requests', 'false').lower() == 'true'
@@ -138,6 +151,10 @@ class ClaudeReasoningConfig(BaseAdapterConfig):
             validation['errors'].append('Max tokens must be positive')
             validation['is_valid'] = False
         
+        if self.max_connections <= 0:
+            validation['errors'].append('Max connections must be positive')
+            validation['is_valid'] = False
+        
         if self.rate_limit <= 0:
             validation['warnings'].append('Rate limit should be positive for production use')
         
@@ -163,13 +180,21 @@ class ClaudeReasoningConfig(BaseAdapterConfig):
             'max_tokens': self.max_tokens,
             'temperature': self.temperature,
             'timeout': self.timeout,
+            'max_connections': self.max_connections,
+            'keepalive_timeout': self.keepalive_timeout,
+            'dns_cache_ttl': self.dns_cache_ttl,
             'rate_limit': self.rate_limit,
             'daily_quota': self.daily_quota,
+            'rate_limit_state_path': self.rate_limit_state_path,
             'max_reasoning_steps': self.max_reasoning_steps,
             'step_timeout': self.step_timeout,
             'complexity_threshold': self.complexity_threshold,
+            'classifier_weights_path': self.classifier_weights_path,
             'cache_enabled': self.cache_enabled,
             'cache_ttl': self.cache_ttl,
+            'disk_cache_path': self.disk_cache_path,
+            'disk_cache_max_mb': self.disk_cache_max_mb,
+            'prompt_caching': self.prompt_caching,
             'log_requests': self.log_requests,
             'log_responses': self.log_responses
         }
@@ -10,6 +10,7 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from shared.models.llm_response import UsageStats
 from shared.models.reasoning_models import (
     ReasoningRequest,
     ReasoningResponse,
@@ -67,7 +68,8 @@ class ClaudeReasoningDataMapper:
         # Build the system message based on reasoning mode
         system_message = self._build_system_message(request)
         
-        # Format the user prompt
+        # Templates lead with their fixed instructions; the per-request
+        # context and the question come last
         formatted_prompt = prompt_template.format(
             user_prompt=request.prompt,
             max_steps=request.max_steps,
@@ -75,6 +77,13 @@ class ClaudeReasoningDataMapper:
             temperature=request.temperature
         )
         
+        # Only the system block is stable across requests, so it is the only
+        # cache breakpoint; marking per-request text would pay for a cache
+        # write on every call without ever being read back
+        system: Any = system_message
+        if api_config.get('prompt_caching', False):
+            system = [self._cacheable_block(system_message)]
+        
         # Build Claude messages
         messages = [
             {
@@ -88,7 +97,7 @@ class ClaudeReasoningDataMapper:
             "model": api_config.get('model', 'claude-3-sonnet-20240229'),
             "max_tokens": api_config.get('max_tokens', 4096),
             "temperature": request.temperature,
-            "system": system_message,
+            "system": system,
             "messages": messages
         }
         
@@ -108,6 +117,38 @@ class ClaudeReasoningDataMapper:
         
         return claude_request
     
+    @staticmethod
+    def _cacheable_block(text: str) -> Dict[str, Any]:
+        """Wrap text in a content block marked as a cacheable prompt prefix."""
+        return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+    
+    @staticmethod
+    def extract_usage(claude_response: Dict[str, Any]) -> UsageStats:
+        """
+        Extract token usage, including prompt cache reads and writes.
+        
+        Anthropic reports cached input separately from ``input_tokens``;
+        prompt_tokens here is the full prompt so cached tokens are a subset.
+        
+        Args:
+            claude_response: The Claude API response
+            
+        Returns:
+            UsageStats: Token usage for the call
+        """
+        usage = claude_response.get('usage') or {}
+        cache_read = usage.get('cache_read_input_tokens') or 0
+        cache_write = usage.get('cache_creation_input_tokens') or 0
+        prompt_tokens = (usage.get('input_tokens') or 0) + cache_read + cache_write
+        completion_tokens = usage.get('output_tokens') or 0
+        return UsageStats(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+            cached_prompt_tokens=cache_read,
+            cache_write_tokens=cache_write
+        )
+    
     def map_response_from_claude(
         self, 
         claude_response: Dict[str, Any], 
@@ -161,7 +202,8 @@ class ClaudeReasoningDataMapper:
             tokens_used=claude_response.get('usage', {}).get('output_tokens', 0),
             complexity_score=0.2,  # Low complexity for rapid responses
             provider="claude",
-            success=True
+            success=True,
+            metadata={'usage': self.extract_usage(claude_response).to_dict()}
         )
     
     def _parse_structured_response(
@@ -185,7 +227,8 @@ class ClaudeReasoningDataMapper:
             tokens_used=claude_response.get('usage', {}).get('output_tokens', 0),
             complexity_score=complexity_score,
             provider="claude",
-            success=True
+            success=True,
+            metadata={'usage': self.extract_usage(claude_response).to_dict()}
         )
     
     def _extract_thinking_chain(self, response_text: str, mode: ReasoningMode) -> ThinkingChain:
@@ -246,6 +289,27 @@ class ClaudeReasoningDataMapper:
         
         return thinking_chain
     
+    def build_step(self, step_number: int, description: str, content: str) -> ReasoningStep:
+        """
+        Build a reasoning step from streamed step text.
+        
+        Args:
+            step_number: Position of the step in the chain
+            description: Step heading, e.g. "Step 2"
+            content: Step body text
+            
+        Returns:
+            ReasoningStep: Step with detected type and confidence
+        """
+        content = content.strip()
+        return ReasoningStep(
+            step_number=step_number,
+            step_type=self._detect_step_type(description, content),
+            description=description,
+            content=content,
+            confidence=self._detect_confidence(content)
+        )
+    
     def _detect_step_type(self, description: str, content: str) -> StepType:
         """Detect step type from description and content."""
         
@@ -420,31 +484,27 @@ Use quick responses for simple questions and detailed reasoning for complex ones
     def _get_rapid_prompt_template(self) -> str:
         """Get prompt template for rapid mode."""
         return """
+Please provide a quick, direct answer to the question below. Be concise but accurate.
+
 {context}
 
 Question: {user_prompt}
-
-Please provide a quick, direct answer. Be concise but accurate.
 """
     
     def _get_thoughtful_prompt_template(self) -> str:
         """Get prompt template for thoughtful mode."""
         return """
+Please think through the question below carefully and provide a detailed response with your reasoning.
+
 {context}
 
 Question: {user_prompt}
-
-Please think through this carefully and provide a detailed response with your reasoning.
 """
     
     def _get_chain_of_thought_template(self) -> str:
         """Get prompt template for chain of thought mode."""
         return """
-{context}
-
-Question: {user_prompt}
-
-Please solve this step by step. Show your reasoning process clearly with numbered steps.
+Please solve the question below step by step. Show your reasoning process clearly with numbered steps.
 Use the format:
 
 Step 1: [First reasoning step]
@@ -453,16 +513,16 @@ Step 2: [Second reasoning step]
 Final Answer: [Your conclusion]
 
 Maximum steps: {max_steps}
+
+{context}
+
+Question: {user_prompt}
 """
     
     def _get_step_by_step_template(self) -> str:
         """Get prompt template for step-by-step mode."""
         return """
-{context}
-
-Question: {user_prompt}
-
-Please provide a comprehensive, step-by-step analysis. Be thorough and methodical.
+Please provide a comprehensive, step-by-step analysis of the question below. Be thorough and methodical.
 
 Structure your response with:
 1. Problem Analysis
@@ -471,14 +531,18 @@ Structure your response with:
 4. Final Conclusion
 
 Maximum steps: {max_steps}
+
+{context}
+
+Question: {user_prompt}
 """
     
     def _get_adaptive_prompt_template(self) -> str:
         """Get prompt template for adaptive mode."""
         return """
+Please respond appropriately to the question below, using the level of detail and reasoning depth that best fits the complexity and nature of the question.
+
 {context}
 
 Question: {user_prompt}
-
-Please respond appropriately to this question, using the level of detail and reasoning depth that best fits the complexity and nature of the question.
 """
\ No newline at end of file
@@ -4,6 +4,7 @@ Provides integration with Google Gen AI (2024) through the shared LLM interface.
 """
 
 from .client import GeminiClient
+from .async_client import AsyncGeminiClient
 from .config import GeminiConfig
 from .data_mapper import GeminiDataMapper
 from .rate_limiter import GeminiRateLimiter
@@ -12,6 +13,7 @@ from .exceptions import GeminiExceptionMapper, handle_gemini_exception
 # Public exports
 __all__ = [
     'GeminiClient',
+    'AsyncGeminiClient',
     'GeminiConfig',
     'GeminiDataMapper',
     'GeminiRateLimiter',
@@ -0,0 +1,198 @@
+"""
+Async Gemini API client.
+Implements AsyncLLMProvider with the google-genai SDK's ``client.aio``
+interface so requests never block the event loop.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from shared.exceptions import (
+    InvalidRequestError, LLMProviderError, RateLimitError, get_retry_delay, is_retryable_error
+)
+from shared.interfaces.llm_provider import AsyncLLMProvider
+from shared.models.llm_request import LLMRequest
+from shared.models.llm_response import LLMResponse
+from shared.utils.cache import generate_cache_key
+
+from .base_client import GeminiBaseClient
+from .exceptions import handle_gemini_exception
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGeminiClient(GeminiBaseClient, AsyncLLMProvider):
+    """
+    Asynchronous Gemini client for text and chat generation.
+
+    Requests claim a rate limit slot with ``areserve()`` and wait for it
+    with ``asyncio.sleep``; retryable failures back off the same way.
+    """
+
+    @property
+    def provider_name(self) -> str:
+        """Return the name of the LLM provider."""
+        return 'gemini'
+
+    def batch_concurrency(self, batch_size: int) -> int:
+        """
+        Size batch concurrency to the configured cap and remaining rate limit budget.
+
+        Args:
+            batch_size: Number of requests in the batch
+
+        Returns:
+            Concurrency limit (at least 1)
+        """
+        cap = getattr(self.config, 'max_concurrent_requests', self.default_batch_concurrency)
+        limit = min(batch_size, cap if isinstance(cap, int) else self.default_batch_concurrency)
+        available = self.rate_limiter.available_requests()
+        if available is not None:
+            limit = min(limit, available)
+        return max(1, limit)
+
+    async def generate_text(self, request: LLMRequest) -> LLMResponse:
+        """
+        Generate text based on the provided request.
+
+        Args:
+            request: LLM request containing prompt and parameters
+
+        Returns:
+            LLMResponse with generated text
+        """
+        cache_key = None
+        if self.cache:
+            cache_key = generate_cache_key(request.prompt, request.provider_params,
+                                           request.temperature)
+            cached_response = self.cache.get(cache_key)
+            if cached_response:
+                self._stats['cache_hits'] += 1
+                return cached_response
+
+        gemini_request = self.data_mapper.map_llm_request(request)
+        if not self.data_mapper.validate_request_size(gemini_request):
+            raise InvalidRequestError(
+                "Request exceeds maximum token limit for Gemini API",
+                error_code="REQUEST_TOO_LARGE"
+            )
+
+        llm_response = await self._generate_content(
+            model=self.config.model,
+            contents=gemini_request.get('contents', []),
+            config=gemini_request.get('generationConfig', {}),
+            request_id=request.request_id
+        )
+
+        if cache_key is not None:
+            self.cache.set_response(cache_key, llm_response, request.temperature)
+
+        return llm_response
+
+    async def generate_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Generate chat completion based on conversation history.
+
+        Args:
+            messages: List of chat messages in conversation
+            model: Optional model override
+            max_tokens: Optional max tokens override
+            temperature: Optional temperature override
+            **kwargs: Additional parameters
+
+        Returns:
+            LLMResponse with chat completion
+        """
+        selected_model = model or self.config.model
+        gemini_request = self.data_mapper.map_chat_request(
+            messages=messages,
+            model=selected_model,
+            max_tokens=max_tokens or self.config.default_max_tokens,
+            temperature=temperature or self.config.default_temperature,
+            **kwargs
+        )
+
+        return await self._generate_content(
+            model=selected_model,
+            contents=gemini_request.get('contents', []),
+            config=gemini_request.get('generationConfig', {})
+        )
+
+    async def _generate_content(
+        self,
+        model: str,
+        contents: List[Any],
+        config: Dict[str, Any],
+        request_id: Optional[str] = None
+    ) -> LLMResponse:
+        """
+        Call ``generate_content`` with rate limiting and async retry backoff.
+
+        Args:
+            model: Model name
+            contents: Gemini request contents
+            config: Gemini generation config
+            request_id: Request identifier for the response
+
+        Returns:
+            Mapped LLMResponse
+        """
+        wait_time = await self.rate_limiter.areserve()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+        client = self._get_genai_client()
+        max_retries = getattr(self.config, 'max_retries', 0)
+        retry_delay = getattr(self.config, 'retry_delay', 1.0)
+
+        for attempt in range(max_retries + 1):
+            start_time = time.time()
+            try:
+                response = await client.aio.models.generate_content(
+                    model=model,
+                    contents=contents,
+                    config=config
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                error = handle_gemini_exception(e, {
+                    'operation': 'generate_content_async',
+                    'model': model
+                })
+                if not is_retryable_error(error) or attempt >= max_retries:
+                    self._stats['errors'] += 1
+                    logger.error("Async generation failed for request %s: %s", request_id, error)
+                    raise error from e
+
+                delay = max(get_retry_delay(error), retry_delay * (2 ** attempt))
+                logger.warning(
+                    "Gemini call failed (attempt %s), retrying in %ss: %s",
+                    attempt + 1, delay, error
+                )
+                if isinstance(error, RateLimitError):
+                    self.rate_limiter.record_429_error()
+                await asyncio.sleep(delay)
+                continue
+
+            llm_response = self.data_mapper.map_gemini_response(
+                response,
+                request_id=request_id,
+                model=model
+            )
+            llm_response.latency_ms = (time.time() - start_time) * 1000
+            self.rate_limiter.record_latency(llm_response.latency_ms)
+
+            self._stats['requests_made'] += 1
+            if llm_response.usage:
+                self._stats['total_tokens'] += llm_response.usage.total_tokens or 0
+            return llm_response
+
+        raise LLMProviderError("All retry attempts failed")
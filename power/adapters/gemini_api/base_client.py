@@ -6,6 +6,7 @@ import logging
 from typing import Dict, Any, Optional
 
 from shared.utils.cache import ResponseCache
+from shared.utils.disk_cache import DiskCache
 from shared.exceptions import LLMProviderError
 
 from .config import GeminiConfig
@@ -36,7 +37,8 @@ class GeminiBaseClient:
         if self.config.enable_caching:
             self.cache = ResponseCache(
                 max_size=self.config.cache_max_size,
-                default_ttl_seconds=self.config.cache_ttl_seconds
+                default_ttl_seconds=self.config.cache_ttl_seconds,
+                disk_cache=DiskCache.from_config(self.config, namespace='gemini')
             )
         else:
             self.cache = None
@@ -127,11 +129,9 @@ class GeminiBaseClient:
         if self.cache:
             cache_stats = self.cache.get_stats()
             stats.update({
-                'cache_size': cache_stats.get('current_size', 0),  # pylint: disable=no-member
-                'cache_max_size': cache_stats.get('max_size', 0),  # pylint: disable=no-member
-                'cache_hit_rate': (
-                    self._stats['cache_hits'] / max(1, self._stats['requests_made'])
-                )
+                'cache_size': cache_stats.current_size,
+                'cache_max_size': cache_stats.max_size,
+                'cache_hit_rate': cache_stats.hit_rate
             })
         return stats
 
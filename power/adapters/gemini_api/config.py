@@ -68,6 +68,10 @@ class GeminiConfig(BaseAdapterConfig):  # pylint: disable=too-many-instance-attr
 
         # Store additional rate limiting for Gemini
         self.rate_limit_per_hour = self.get_int('rate_limit_per_hour', 1000)
+        # SQLite file shared by all workers so they draw from one rate limit budget
+        self.rate_limit_state_path = self.get_optional('rate_limit_state_path')
+        # In-flight requests per async batch (further capped by the rate limit budget)
+        self.max_concurrent_requests = self.get_int('max_concurrent_requests', 8)
 
         # Response Configuration
         self.default_max_tokens = self.get_int('default_max_tokens', 1000)
@@ -79,6 +83,8 @@ class GeminiConfig(BaseAdapterConfig):  # pylint: disable=too-many-instance-attr
         self.enable_caching = self.get_bool('enable_caching', True)
         self.cache_ttl_seconds = self.get_int('cache_ttl_seconds', 3600)
         self.cache_max_size = self.get_int('cache_max_size', 1000)
+        self.disk_cache_path = self.get_optional('disk_cache_path')
+        self.disk_cache_max_mb = self.get_int('disk_cache_max_mb', 256)
 
         # Safety and Content Configuration
         self.safety_threshold = self.get_optional(
@@ -114,6 +120,8 @@ class GeminiConfig(BaseAdapterConfig):  # pylint: disable=too-many-instance-attr
 
         # Advanced Configuration
         self.enable_streaming = self.get_bool('enable_streaming', True)
+        # Chunks read ahead of a slow async stream consumer before reads pause
+        self.stream_buffer_size = self.get_int('stream_buffer_size', 16)
         self.min_request_interval = self.get_float('min_request_interval', 0.0)
 
         # Validate configuration
@@ -206,7 +214,9 @@ class GeminiConfig(BaseAdapterConfig):  # pylint: disable=too-many-instance-attr
         rate_limit_fields = [
             ('rate_limit_per_minute', self.rate_limit_per_minute),
             ('rate_limit_per_hour', self.rate_limit_per_hour),
-            ('daily_quota', self.daily_quota)
+            ('daily_quota', self.daily_quota),
+            ('max_concurrent_requests', self.max_concurrent_requests),
+            ('stream_buffer_size', self.stream_buffer_size)
         ]
 
         for name, value in rate_limit_fields:
@@ -385,6 +395,8 @@ class GeminiConfig(BaseAdapterConfig):  # pylint: disable=too-many-instance-attr
             'rate_limit_per_minute': self.rate_limit_per_minute,
             'rate_limit_per_hour': self.rate_limit_per_hour,
             'daily_quota': self.daily_quota,
+            'rate_limit_state_path': self.rate_limit_state_path,
+            'max_concurrent_requests': self.max_concurrent_requests,
             'default_max_tokens': self.default_max_tokens,
             'default_temperature': self.default_temperature,
             'default_top_p': self.default_top_p,
@@ -392,6 +404,8 @@ class GeminiConfig(BaseAdapterConfig):  # pylint: disable=too-many-instance-attr
             'enable_caching': self.enable_caching,
             'cache_ttl_seconds': self.cache_ttl_seconds,
             'cache_max_size': self.cache_max_size,
+            'disk_cache_path': self.disk_cache_path,
+            'disk_cache_max_mb': self.disk_cache_max_mb,
             'safety_threshold': self.safety_threshold,
             'enable_safety_filtering': self.enable_safety_filtering,
             'harassment_threshold': self.harassment_threshold,
@@ -405,6 +419,7 @@ class GeminiConfig(BaseAdapterConfig):  # pylint: disable=too-many-instance-attr
             'max_image_size_mb': self.max_image_size_mb,
             'supported_image_formats': self.supported_image_formats,
             'enable_streaming': self.enable_streaming,
+            'stream_buffer_size': self.stream_buffer_size,
             'min_request_interval': self.min_request_interval,
             'is_vision_supported': self.is_vision_supported(),
             'supports_image_generation': self.supports_image_generation(),
@@ -4,7 +4,7 @@ Handles request/response mapping and format conversion.
 """
 
 import base64
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from shared.models.llm_request import LLMRequest
@@ -12,7 +12,9 @@ from shared.models.llm_response import (
     LLMResponse,
     FinishReason,
     UsageStats,
-    StreamingResponse
+    StreamingResponse,
+    StreamChunk,
+    StreamAccumulator
 )
 from shared.exceptions import DataMappingError, InvalidRequestError
 from .config import GeminiConfig
@@ -338,7 +340,9 @@ class GeminiDataMapper:
         return UsageStats(
             prompt_tokens=prompt_tokens,
             completion_tokens=completion_tokens,
-            total_tokens=total_tokens
+            total_tokens=total_tokens,
+            # Tokens served by Gemini's implicit or explicit context cache
+            cached_prompt_tokens=usage_metadata.get('cachedContentTokenCount', 0) or 0
         )
 
     def _extract_safety_scores(self, candidate: Dict[str, Any]) -> Dict[str, float]:
@@ -391,6 +395,9 @@ class GeminiDataMapper:
         """
         Convert Gemini streaming chunk to StreamingResponse.
 
+        Builds the cumulative content by concatenation, which copies the
+        whole text on every chunk; use map_streaming_delta for long streams.
+
         Args:
             chunk: Individual streaming chunk from Gemini
             cumulative_content: All content received so far
@@ -403,26 +410,7 @@ class GeminiDataMapper:
             DataMappingError: If mapping fails
         """
         try:
-            # Extract content delta from chunk
-            content_delta = ""
-
-            candidates = chunk.get('candidates', [])
-            if candidates:
-                candidate = candidates[0]
-                if 'content' in candidate:
-                    parts = candidate['content'].get('parts', [])
-                    for part in parts:
-                        if 'text' in part:
-                            content_delta += part['text']
-
-            # Check if this is the final chunk
-            is_final = False
-            final_response = None
-
-            if candidates and 'finishReason' in candidates[0]:
-                is_final = True
-                # Create final response for the last chunk
-                final_response = self.map_gemini_response(chunk)
+            content_delta, is_final = self._read_streaming_chunk(chunk)
 
             return StreamingResponse(
                 content_delta=content_delta,
@@ -430,7 +418,7 @@ class GeminiDataMapper:
                 is_final=is_final,
                 chunk_index=chunk_index,
                 timestamp=datetime.now(),
-                final_response=final_response
+                final_response=self.map_gemini_response(chunk) if is_final else None
             )
 
         except Exception as e:
@@ -440,6 +428,90 @@ class GeminiDataMapper:
                 target_format='StreamingResponse'
             ) from e
 
+    def map_streaming_delta(
+        self,
+        chunk: Any,
+        accumulator: StreamAccumulator,
+        chunk_index: int,
+        request_id: Optional[str] = None
+    ) -> StreamChunk:
+        """
+        Convert Gemini streaming chunk to a delta-only StreamChunk.
+
+        The delta is appended to the stream's accumulator, so content is
+        joined once at the end rather than copied per chunk.
+
+        Args:
+            chunk: Streaming chunk from Gemini, as a dict or SDK object
+            accumulator: Accumulator for the stream's content
+            chunk_index: Index of this chunk
+            request_id: Optional request ID for the final response
+
+        Returns:
+            Delta-only streaming chunk
+
+        Raises:
+            DataMappingError: If mapping fails
+        """
+        try:
+            content_delta, is_final = self._read_streaming_chunk(chunk)
+            accumulator.append(content_delta)
+
+            final_response = None
+            if is_final:
+                final_response = self.map_gemini_response(chunk, request_id=request_id)
+                # The final chunk only carries its own delta
+                final_response.content = accumulator.text
+
+            return StreamChunk(
+                content_delta=content_delta,
+                accumulator=accumulator,
+                is_final=is_final,
+                chunk_index=chunk_index,
+                final_response=final_response
+            )
+
+        except Exception as e:
+            raise DataMappingError(
+                f"Failed to map Gemini streaming chunk: {e}",
+                source_format='Gemini Streaming',
+                target_format='StreamChunk'
+            ) from e
+
+    @staticmethod
+    def _read_streaming_chunk(chunk: Any) -> Tuple[str, bool]:
+        """
+        Read the content delta and final flag from a streaming chunk.
+
+        Works on both the dict form and SDK objects, so chunks do not need
+        to be converted to dicts first.
+
+        Args:
+            chunk: Streaming chunk from Gemini
+
+        Returns:
+            Content delta and whether the chunk finishes the stream
+        """
+        def field(obj: Any, dict_name: str, attr_name: str) -> Any:
+            if isinstance(obj, dict):
+                return obj.get(dict_name)
+            return getattr(obj, attr_name, None)
+
+        if chunk is None:
+            raise ValueError("Streaming chunk is empty")
+
+        candidates = field(chunk, 'candidates', 'candidates')
+        if not candidates:
+            return "", False
+
+        candidate = candidates[0]
+        content = field(candidate, 'content', 'content')
+        parts = field(content, 'parts', 'parts') if content is not None else None
+        texts = [field(part, 'text', 'text') for part in parts or ()]
+        content_delta = ''.join(text for text in texts if text)
+
+        return content_delta, field(candidate, 'finishReason', 'finish_reason') is not None
+
     def extract_model_info(self, model_name: str) -> Dict[str, Any]:
         """
         Extract model information for the get_model_info method.
@@ -6,6 +6,7 @@ Extends shared rate limiter with Gemini-specific features.
 import time
 from typing import Dict, Any
 from shared.utils.rate_limiter import AdaptiveRateLimiter, BaseRateLimiter
+from shared.utils.shared_rate_limit import SharedRateLimitState
 from .config import GeminiConfig
 
 
@@ -26,7 +27,8 @@ class GeminiRateLimiter(AdaptiveRateLimiter):
             calls_per_minute=config.rate_limit_per_minute,
             calls_per_hour=config.rate_limit_per_hour,
             calls_per_day=config.daily_quota,
-            min_interval_seconds=config.min_request_interval
+            min_interval_seconds=config.min_request_interval,
+            shared_state=SharedRateLimitState.from_config(config, name='gemini')
         )
 
         self.config = config
@@ -51,8 +53,7 @@ class GeminiRateLimiter(AdaptiveRateLimiter):
         self._consecutive_quota_errors = 0
         self._last_quota_reset = time.time()
 
-        # Performance tracking
-        self._request_latencies = []
+        # Performance tracking; latency samples live in the base limiter
         self._last_performance_cleanup = time.time()
 
     def can_make_request(self, request_type: str = 'text') -> bool:
@@ -121,11 +122,7 @@ class GeminiRateLimiter(AdaptiveRateLimiter):
         self._total_cost += cost
 
         # Track performance metrics
-        if latency_ms > 0:
-            self._request_latencies.append(latency_ms)
-            # Keep only recent latencies for memory efficiency
-            if len(self._request_latencies) > 100:
-                self._request_latencies = self._request_latencies[-50:]
+        self.record_latency(latency_ms)
 
         # Update request type counters
         if request_type == 'text':
@@ -337,30 +334,12 @@ class GeminiRateLimiter(AdaptiveRateLimiter):
         if current_time - self._last_performance_cleanup > 300:  # 5 minutes
             # Keep only recent latencies
             if len(self._request_latencies) > 50:
-                self._request_latencies = self._request_latencies[-25:]
+                self._request_latencies.trim(25)
             self._last_performance_cleanup = current_time
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get detailed performance statistics."""
-        if not self._request_latencies:
-            return {
-                'average_latency_ms': 0.0,
-                'min_latency_ms': 0.0,
-                'max_latency_ms': 0.0,
-                'p95_latency_ms': 0.0,
-                'sample_count': 0
-            }
-
-        sorted_latencies = sorted(self._request_latencies)
-        count = len(sorted_latencies)
-
-        return {
-            'average_latency_ms': sum(sorted_latencies) / count,
-            'min_latency_ms': sorted_latencies[0],
-            'max_latency_ms': sorted_latencies[-1],
-            'p95_latency_ms': sorted_latencies[int(count * 0.95)] if count > 0 else 0.0,
-            'sample_count': count
-        }
+        return self._request_latencies.summary()
 
     def get_comprehensive_stats(self) -> Dict[str, Any]:
         """Get comprehensive statistics including performance metrics."""
@@ -2,14 +2,17 @@
 Streaming capabilities for Gemini API client.
 """
 
+import asyncio
 import logging
-from typing import Iterator, List, Optional
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from shared.models.llm_request import LLMRequest, ChatMessage
-from shared.models.llm_response import StreamingResponse
+from shared.models.llm_response import StreamAccumulator, StreamChunk
+from shared.utils.bounded_stream import bounded_stream
 
 from .base_client import GeminiBaseClient
-from .exceptions import wrap_gemini_call
+from .exceptions import handle_gemini_exception, wrap_gemini_call
 
 logger = logging.getLogger(__name__)
 
@@ -17,10 +20,14 @@ logger = logging.getLogger(__name__)
 class GeminiStreamingClient(GeminiBaseClient):
     """
     Gemini client for streaming operations.
+
+    The ``astream_*`` methods use the SDK's ``client.aio`` streams for callers
+    on an event loop; chunks are read ahead through a bounded queue, and
+    closing the stream cancels the upstream request.
     """
 
     @wrap_gemini_call
-    def generate_text_stream(self, request: LLMRequest) -> Iterator[StreamingResponse]:
+    def generate_text_stream(self, request: LLMRequest) -> Iterator[StreamChunk]:
         """
         Generate streaming text response.
 
@@ -28,7 +35,7 @@ class GeminiStreamingClient(GeminiBaseClient):
             request: LLM request containing prompt and parameters
 
         Yields:
-            StreamingResponse objects with partial content
+            Delta-only StreamChunk objects with partial content
         """
         # Rate limiting
         self.rate_limiter.wait_if_needed()
@@ -52,13 +59,11 @@ class GeminiStreamingClient(GeminiBaseClient):
             )
 
             # Process streaming responses
-            for chunk in stream:
-                streaming_response = self._process_stream_chunk(
-                    chunk,
-                    request.request_id
+            accumulator = StreamAccumulator()
+            for chunk_index, chunk in enumerate(stream):
+                yield self.data_mapper.map_streaming_delta(
+                    chunk, accumulator, chunk_index, request.request_id
                 )
-                if streaming_response:
-                    yield streaming_response
 
             # Update statistics
             self._stats['requests_made'] += 1
@@ -77,7 +82,7 @@ class GeminiStreamingClient(GeminiBaseClient):
         messages: List[ChatMessage],
         model: Optional[str] = None,
         **kwargs
-    ) -> Iterator[StreamingResponse]:
+    ) -> Iterator[StreamChunk]:
         """
         Generate streaming chat completion.
 
@@ -87,7 +92,7 @@ class GeminiStreamingClient(GeminiBaseClient):
             **kwargs: Additional parameters
 
         Yields:
-            StreamingResponse objects with partial chat content
+            Delta-only StreamChunk objects with partial chat content
         """
         selected_model = model or self.config.model
 
@@ -117,10 +122,9 @@ class GeminiStreamingClient(GeminiBaseClient):
             )
 
             # Process streaming responses
-            for chunk in stream:
-                streaming_response = self._process_stream_chunk(chunk)
-                if streaming_response:
-                    yield streaming_response
+            accumulator = StreamAccumulator()
+            for chunk_index, chunk in enumerate(stream):
+                yield self.data_mapper.map_streaming_delta(chunk, accumulator, chunk_index)
 
             # Update statistics
             self._stats['requests_made'] += 1
@@ -130,70 +134,113 @@ class GeminiStreamingClient(GeminiBaseClient):
             logger.error("Streaming chat completion failed: %s", str(e))
             raise
 
-    def _process_stream_chunk(
-        self,
-        chunk,
-        request_id: Optional[str] = None
-    ) -> Optional[StreamingResponse]:
+    async def astream_text(self, request: LLMRequest) -> AsyncIterator[StreamChunk]:
         """
-        Process a single streaming chunk from Gemini API.
+        Generate streaming text response without blocking the event loop.
 
         Args:
-            chunk: Raw chunk from Gemini streaming API
-            request_id: Optional request ID for tracking
+            request: LLM request containing prompt and parameters
 
-        Returns:
-            StreamingResponse or None if chunk should be skipped
+        Yields:
+            Delta-only StreamChunk objects with partial content
         """
-        try:
-            # Extract content from chunk - adjust based on actual API format
-            if hasattr(chunk, 'candidates') and chunk.candidates:
-                candidate = chunk.candidates[0]
-                if hasattr(candidate, 'content') and candidate.content:
-                    content = candidate.content.parts[0].text if candidate.content.parts else ""
-
-                    # Determine if this is the final chunk
-                    is_final = (
-                        hasattr(chunk, 'finish_reason') and
-                        chunk.finish_reason is not None
-                    )
-
-                    return StreamingResponse(
-                        content=content,
-                        is_final=is_final,
-                        request_id=request_id,
-                        model=self.config.model,
-                        usage=self._extract_usage_from_chunk(chunk) if is_final else None
-                    )
-
-            return None
+        gemini_request = self.data_mapper.map_llm_request(request)
+
+        async with aclosing(self._astream(
+            self.config.model,
+            gemini_request.get('contents', []),
+            gemini_request.get('generationConfig', {}),
+            request.request_id
+        )) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+    async def astream_chat_completion(
+        self,
+        messages: List[ChatMessage],
+        model: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[StreamChunk]:
+        """
+        Generate streaming chat completion without blocking the event loop.
 
-        except Exception as e:
-            logger.warning("Failed to process stream chunk: %s", e)
-            return None
+        Args:
+            messages: List of chat messages
+            model: Optional model override
+            **kwargs: Additional parameters
 
-    def _extract_usage_from_chunk(self, chunk) -> Optional[dict]:
+        Yields:
+            Delta-only StreamChunk objects with partial chat content
         """
-        Extract usage information from a streaming chunk.
+        selected_model = model or self.config.model
+        gemini_request = self.data_mapper.map_chat_request(
+            messages=messages,
+            model=selected_model,
+            **kwargs
+        )
+
+        async with aclosing(self._astream(
+            selected_model,
+            gemini_request.get('contents', []),
+            gemini_request.get('generationConfig', {})
+        )) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+    async def _astream(
+        self,
+        model: str,
+        contents: List[Any],
+        config: Dict[str, Any],
+        request_id: Optional[str] = None
+    ) -> AsyncIterator[StreamChunk]:
+        """
+        Open an async ``generate_content_stream`` and map its chunks.
+
+        The request claims a rate limit slot with ``areserve()`` and waits for
+        it with ``asyncio.sleep``. Chunks pass through a queue of
+        ``config.stream_buffer_size``, so a slow consumer pauses the read;
+        closing this generator cancels the read and closes the SDK stream.
 
         Args:
-            chunk: Raw chunk from API
+            model: Model name
+            contents: Gemini request contents
+            config: Gemini generation config
+            request_id: Request identifier for the chunks
 
-        Returns:
-            Usage dictionary or None
+        Yields:
+            Delta-only StreamChunk objects
         """
+        wait_time = await self.rate_limiter.areserve()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
         try:
-            if hasattr(chunk, 'usage_metadata'):
-                usage = chunk.usage_metadata
-                return {
-                    'prompt_tokens': getattr(usage, 'prompt_token_count', 0),
-                    'completion_tokens': getattr(usage, 'candidates_token_count', 0),
-                    'total_tokens': getattr(usage, 'total_token_count', 0)
-                }
+            client = self._get_genai_client()
+            stream = await client.aio.models.generate_content_stream(
+                model=model,
+                contents=contents,
+                config=config
+            )
+
+            accumulator = StreamAccumulator()
+            async with aclosing(bounded_stream(stream, self.config.stream_buffer_size)) as chunks:
+                chunk_index = 0
+                async for chunk in chunks:
+                    yield self.data_mapper.map_streaming_delta(
+                        chunk, accumulator, chunk_index, request_id
+                    )
+                    chunk_index += 1
+
         except Exception as e:
-            logger.debug("Could not extract usage from chunk: %s", e)
+            self._stats['errors'] += 1
+            logger.error("Async streaming failed for request %s: %s", request_id, e)
+            raise handle_gemini_exception(e, {
+                'operation': 'generate_content_stream_async',
+                'model': model
+            }) from e
 
-        return None
+        self._stats['requests_made'] += 1
 
     def stream_with_callback(
         self,
@@ -206,7 +253,7 @@ class GeminiStreamingClient(GeminiBaseClient):
 
         Args:
             request: LLM request
-            callback: Function to call with each StreamingResponse
+            callback: Function to call with each StreamChunk
             **kwargs: Additional parameters
         """
         try:
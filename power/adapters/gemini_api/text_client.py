@@ -34,7 +34,8 @@ class GeminiTextClient(GeminiBaseClient):
         """
         # Check cache first if enabled
         if self.cache:
-            cache_key = generate_cache_key(request.prompt, request.provider_params)
+            cache_key = generate_cache_key(request.prompt, request.provider_params,
+                                           request.temperature)
             cached_response = self.cache.get(cache_key)
             if cached_response:
                 self._stats['cache_hits'] += 1
@@ -81,6 +82,7 @@ class GeminiTextClient(GeminiBaseClient):
 
             # Set latency
             llm_response.latency_ms = latency_ms
+            self.rate_limiter.record_latency(latency_ms)
 
             # Update statistics
             self._stats['requests_made'] += 1
@@ -89,8 +91,9 @@ class GeminiTextClient(GeminiBaseClient):
 
             # Cache the response if caching is enabled
             if self.cache:
-                cache_key = generate_cache_key(request.prompt, request.provider_params)
-                self.cache.set(cache_key, llm_response)
+                cache_key = generate_cache_key(request.prompt, request.provider_params,
+                                               request.temperature)
+                self.cache.set_response(cache_key, llm_response, request.temperature)
 
             return llm_response
 
@@ -11,6 +11,7 @@ from .chat_client import OpenAIChatClient
 from .streaming_client import OpenAIStreamingClient
 from .multimodal_client import OpenAIMultimodalClient
 from .function_client import OpenAIFunctionClient
+from .async_client import AsyncOpenAIClient
 from .data_mapper import OpenAIDataMapper
 from .rate_limiter import OpenAIRateLimiter
 from .exceptions import OpenAIExceptionMapper
@@ -32,6 +33,7 @@ __all__ = [
     'OpenAIStreamingClient',
     'OpenAIMultimodalClient',
     'OpenAIFunctionClient',
+    'AsyncOpenAIClient',
     'OpenAIDataMapper',
     'OpenAIRateLimiter',
     'OpenAIExceptionMapper'
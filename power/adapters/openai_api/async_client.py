@@ -0,0 +1,320 @@
+"""
+Async OpenAI client.
+Implements AsyncLLMProvider on top of the SDK's AsyncOpenAI client so
+callers on an event loop never block on network I/O or retry backoff.
+"""
+
+import asyncio
+import time
+from typing import Dict, Any, List, Optional
+
+import openai
+
+from .base_client import BaseOpenAIClient
+from .data_mapper import OpenAIDataMapper
+from .exceptions import OpenAIExceptionMapper, is_retriable_openai_error, get_retry_delay_for_openai_error
+from shared.exceptions import LLMProviderError, AuthenticationError, ContentFilterError
+from shared.interfaces.llm_provider import AsyncLLMProvider
+from shared.models.llm_request import LLMRequest
+from shared.models.llm_response import LLMResponse
+
+
+class AsyncOpenAIClient(BaseOpenAIClient, AsyncLLMProvider):
+    """
+    Asynchronous OpenAI client for text and chat completions.
+
+    Shares configuration, rate limiter, caching and usage tracking with the
+    synchronous clients. Requests claim a rate limit slot with
+    ``areserve()`` and wait for it with ``asyncio.sleep``, so a batch queues
+    politely instead of failing fast or blocking the loop.
+    """
+
+    def _init_openai_client(self) -> None:
+        """Initialize both the sync and async OpenAI SDK clients."""
+        super()._init_openai_client()
+        try:
+            self.async_client = openai.AsyncOpenAI(**self._client_params())
+        except Exception as e:
+            error_msg = f"Failed to initialize async OpenAI client: {e}"
+            self.logger.error(error_msg)
+            raise AuthenticationError(error_msg)
+
+    @property
+    def provider_name(self) -> str:
+        """Return the name of the LLM provider."""
+        return 'openai'
+
+    def batch_concurrency(self, batch_size: int) -> int:
+        """
+        Size batch concurrency to the configured cap and remaining rate limit budget.
+
+        Args:
+            batch_size: Number of requests in the batch
+
+        Returns:
+            Concurrency limit (at least 1)
+        """
+        limit = min(batch_size, self.config.max_concurrent_requests)
+        available = self.rate_limiter.available_requests()
+        if available is not None:
+            limit = min(limit, available)
+        return max(1, limit)
+
+    async def generate_text(self, request: LLMRequest) -> LLMResponse:
+        """
+        Generate text completion using OpenAI's completion API.
+
+        Args:
+            request: Shared LLM request
+
+        Returns:
+            Shared LLM response
+        """
+        openai_request = OpenAIDataMapper.map_llm_request_to_openai(request)
+        if not openai_request.get('model'):
+            openai_request['model'] = self.config.default_model
+
+        estimated_tokens = self.estimate_tokens(request.prompt, openai_request['model'])
+        if request.max_tokens:
+            estimated_tokens += request.max_tokens
+
+        cache_key = None
+        if self.config.enable_response_cache and not request.provider_params.get('no_cache'):
+            cache_key = self._generate_cache_key(openai_request)
+
+        if self.config.enable_moderation and self.config.moderate_input:
+            await self._moderate_content_async(request.prompt)
+
+        response = await self._make_api_call_async(
+            api_method=self.async_client.completions.create,
+            request_data=openai_request,
+            estimated_tokens=estimated_tokens,
+            cache_key=cache_key
+        )
+
+        llm_response = OpenAIDataMapper.map_openai_response_to_llm_response(
+            response,
+            openai_request['model'],
+            request.request_id
+        )
+
+        if self.config.enable_moderation and self.config.moderate_output:
+            await self._moderate_content_async(llm_response.content)
+
+        return llm_response
+
+    async def generate_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Generate chat completion using OpenAI's chat completion API.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            Shared LLM response
+        """
+        openai_request = OpenAIDataMapper.map_chat_request_to_openai(messages, **kwargs)
+
+        estimated_tokens = self._estimate_chat_tokens(messages, openai_request.get('model'))
+        if kwargs.get('max_tokens'):
+            estimated_tokens += kwargs['max_tokens']
+
+        cache_key = None
+        if (self.config.enable_response_cache and
+                not kwargs.get('stream', False) and
+                not kwargs.get('no_cache', False)):
+            cache_key = self._generate_cache_key(openai_request)
+
+        if self.config.enable_moderation and self.config.moderate_input:
+            for message in messages:
+                if message.get('content'):
+                    await self._moderate_content_async(message['content'])
+
+        response = await self._make_api_call_async(
+            api_method=self.async_client.chat.completions.create,
+            request_data=openai_request,
+            estimated_tokens=estimated_tokens,
+            cache_key=cache_key
+        )
+
+        llm_response = OpenAIDataMapper.map_openai_response_to_llm_response(
+            response,
+            openai_request['model'],
+            kwargs.get('request_id')
+        )
+
+        if self.config.enable_moderation and self.config.moderate_output:
+            await self._moderate_content_async(llm_response.content)
+
+        return llm_response
+
+    async def _make_api_call_async(
+        self,
+        api_method,
+        request_data: Dict[str, Any],
+        estimated_tokens: Optional[int] = None,
+        cache_key: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make an API call with rate limiting, caching, and error handling.
+
+        Args:
+            api_method: Async OpenAI API method to call
+            request_data: Request data dictionary
+            estimated_tokens: Estimated tokens for rate limiting
+            cache_key: Cache key for response caching
+            **kwargs: Additional parameters
+
+        Returns:
+            API response data
+        """
+        if cache_key and self.cache:
+            cached_response = self.cache.get(cache_key)
+            if cached_response:
+                self.logger.debug("Cache hit for key: %s", cache_key)
+                return cached_response
+
+            if not request_data.get('stream', False):
+                return await self._single_flight.do_async(
+                    cache_key,
+                    lambda: self._execute_api_call_async(api_method, request_data, estimated_tokens,
+                                                         cache_key, **kwargs)
+                )
+
+        return await self._execute_api_call_async(api_method, request_data, estimated_tokens,
+                                                  cache_key, **kwargs)
+
+    async def _execute_api_call_async(
+        self,
+        api_method,
+        request_data: Dict[str, Any],
+        estimated_tokens: Optional[int] = None,
+        cache_key: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make a rate-limited API call and cache its response.
+
+        Args:
+            api_method: Async OpenAI API method to call
+            request_data: Request data dictionary
+            estimated_tokens: Estimated tokens for rate limiting
+            cache_key: Cache key for response caching
+            **kwargs: Additional parameters
+
+        Returns:
+            API response data
+        """
+        # A call that just finished for this key may have filled the cache
+        if cache_key and self.cache:
+            cached_response = self.cache.get(cache_key)
+            if cached_response:
+                return cached_response
+
+        model = request_data.get('model', self.config.default_model)
+        wait_time = await self.rate_limiter.areserve(estimated_tokens or 0, model)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+        request_data = self._with_prompt_cache_key(request_data)
+        response = await self._make_request_with_retries_async(api_method, request_data, **kwargs)
+
+        self._record_request_usage(response, estimated_tokens, model, reserved=True)
+
+        if cache_key and self.cache and not request_data.get('stream', False):
+            self.cache.set_response(cache_key, response, request_data.get('temperature'))
+
+        return response
+
+    async def _make_request_with_retries_async(
+        self,
+        api_method,
+        request_data: Dict[str, Any],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make API request with retry logic, backing off with ``asyncio.sleep``.
+
+        Args:
+            api_method: Async OpenAI API method
+            request_data: Request data
+            **kwargs: Additional parameters
+
+        Returns:
+            API response
+        """
+        last_exception = None
+
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                start_time = time.time()
+                response_dict = self._response_to_dict(await api_method(**request_data, **kwargs))
+                latency_ms = int((time.time() - start_time) * 1000)
+                response_dict['_latency_ms'] = latency_ms
+                self.rate_limiter.record_latency(latency_ms)
+
+                self.logger.info("OpenAI API call successful in %sms", latency_ms)
+                return response_dict
+
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                last_exception = e
+
+                if not is_retriable_openai_error(e) or attempt >= self.config.max_retries:
+                    break
+
+                retry_delay = get_retry_delay_for_openai_error(e)
+                retry_delay = max(retry_delay, self.config.retry_delay * (2 ** attempt))
+
+                self.logger.warning(
+                    "OpenAI API call failed (attempt %s), retrying in %ss: %s",
+                    attempt + 1, retry_delay, e
+                )
+
+                if isinstance(e, openai.RateLimitError):
+                    self.rate_limiter.record_429_error()
+
+                await asyncio.sleep(retry_delay)
+
+        if last_exception:
+            if isinstance(last_exception, (openai.OpenAIError, openai.APIError)):
+                raise OpenAIExceptionMapper.translate_openai_exception(last_exception)
+            raise last_exception
+        raise LLMProviderError("All retry attempts failed")
+
+    async def _moderate_content_async(self, content: str) -> None:
+        """
+        Moderate content using OpenAI's moderation API.
+
+        Args:
+            content: Content to moderate
+
+        Raises:
+            ContentFilterError: If content violates policies
+        """
+        try:
+            moderation_response = await self.async_client.moderations.create(input=content)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Don't block the request if moderation fails
+            self.logger.warning("Content moderation failed: %s", e)
+            return
+
+        if moderation_response.results and moderation_response.results[0].flagged:
+            categories = moderation_response.results[0].categories
+            flagged_categories = [
+                category for category, flagged in categories.__dict__.items()
+                if flagged
+            ]
+            raise ContentFilterError(
+                f"Content flagged by moderation: {', '.join(flagged_categories)}",
+                filter_reason=', '.join(flagged_categories)
+            )
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client."""
+        await self.async_client.close()
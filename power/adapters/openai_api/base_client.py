@@ -3,10 +3,11 @@ Base OpenAI client with common functionality.
 Provides shared utilities for all OpenAI client implementations.
 """
 
+import hashlib
 import openai
 import time
 import logging
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
 from .config import OpenAIConfig
@@ -14,6 +15,9 @@ from .rate_limiter import OpenAIRateLimiter
 from .exceptions import OpenAIExceptionMapper, is_retriable_openai_error, get_retry_delay_for_openai_error
 from shared.exceptions import LLMProviderError, AuthenticationError, RateLimitError
 from shared.utils.cache import ResponseCache
+from shared.utils.disk_cache import DiskCache
+from shared.utils.single_flight import SingleFlight
+from shared.utils.token_counter import TokenCounter, get_token_counter
 
 
 class BaseOpenAIClient:
@@ -41,9 +45,13 @@ class BaseOpenAIClient:
         if self.config.enable_response_cache:
             self.cache = ResponseCache(
                 default_ttl_seconds=self.config.cache_ttl_seconds,
-                max_size=self.config.max_cache_size
+                max_size=self.config.max_cache_size,
+                disk_cache=DiskCache.from_config(self.config, namespace='openai')
             )
 
+        # Concurrent identical requests share one in-flight call
+        self._single_flight = SingleFlight()
+
         # Request tracking
         self._request_count = 0
         self._total_tokens_used = 0
@@ -52,8 +60,8 @@ class BaseOpenAIClient:
         # Validation
         self._validate_configuration()
 
-    def _init_openai_client(self) -> None:
-        """Initialize the OpenAI client with configuration."""
+    def _client_params(self) -> Dict[str, Any]:
+        """Build OpenAI SDK client parameters from configuration."""
         client_params = {
             'api_key': self.config.api_key,
             'base_url': self.config.base_url,
@@ -69,8 +77,12 @@ class BaseOpenAIClient:
         if self.config.project_id:
             client_params['project'] = self.config.project_id
 
+        return client_params
+
+    def _init_openai_client(self) -> None:
+        """Initialize the OpenAI client with configuration."""
         try:
-            self.client = openai.OpenAI(**client_params)
+            self.client = openai.OpenAI(**self._client_params())
             self.logger.info("OpenAI client initialized successfully")
         except Exception as e:
             error_msg = f"Failed to initialize OpenAI client: {e}"
@@ -114,6 +126,42 @@ class BaseOpenAIClient:
                 self.logger.debug(f"Cache hit for key: {cache_key}")
                 return cached_response
 
+            if not request_data.get('stream', False):
+                return self._single_flight.do(
+                    cache_key,
+                    lambda: self._execute_api_call(api_method, request_data, estimated_tokens,
+                                                   cache_key, **kwargs)
+                )
+
+        return self._execute_api_call(api_method, request_data, estimated_tokens, cache_key, **kwargs)
+
+    def _execute_api_call(
+        self,
+        api_method,
+        request_data: Dict[str, Any],
+        estimated_tokens: Optional[int] = None,
+        cache_key: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Make a rate-limited API call and cache its response.
+
+        Args:
+            api_method: OpenAI API method to call
+            request_data: Request data dictionary
+            estimated_tokens: Estimated tokens for rate limiting
+            cache_key: Cache key for response caching
+            **kwargs: Additional parameters
+
+        Returns:
+            API response data
+        """
+        # A call that just finished for this key may have filled the cache
+        if cache_key and self.cache:
+            cached_response = self.cache.get(cache_key)
+            if cached_response:
+                return cached_response
+
         # Check rate limits
         model = request_data.get('model', self.config.default_model)
         if not self.rate_limiter.can_make_request(estimated_tokens, model):
@@ -124,6 +172,7 @@ class BaseOpenAIClient:
             )
 
         # Make the API call with retries
+        request_data = self._with_prompt_cache_key(request_data)
         response = self._make_request_with_retries(api_method, request_data, **kwargs)
 
         # Record usage
@@ -131,7 +180,7 @@ class BaseOpenAIClient:
 
         # Cache response if applicable
         if cache_key and self.cache and not request_data.get('stream', False):
-            self.cache.set(cache_key, response)
+            self.cache.set_response(cache_key, response, request_data.get('temperature'))
             self.logger.debug(f"Cached response for key: {cache_key}")
 
         return response
@@ -162,19 +211,12 @@ class BaseOpenAIClient:
                 self.logger.debug(f"Making OpenAI API call (attempt {attempt + 1})")
 
                 # Make the actual API call
-                response = api_method(**request_data, **kwargs)
-
-                # Convert to dict if needed
-                if hasattr(response, 'model_dump'):
-                    response_dict = response.model_dump()
-                elif hasattr(response, 'to_dict'):
-                    response_dict = response.to_dict()
-                else:
-                    response_dict = dict(response)
+                response_dict = self._response_to_dict(api_method(**request_data, **kwargs))
 
                 # Add timing information
                 latency_ms = int((time.time() - start_time) * 1000)
                 response_dict['_latency_ms'] = latency_ms
+                self.rate_limiter.record_latency(latency_ms)
 
                 self.logger.info(f"OpenAI API call successful in {latency_ms}ms")
                 return response_dict
@@ -207,11 +249,21 @@ class BaseOpenAIClient:
         else:
             raise LLMProviderError("All retry attempts failed")
 
+    @staticmethod
+    def _response_to_dict(response: Any) -> Dict[str, Any]:
+        """Convert an SDK response object to a plain dictionary."""
+        if hasattr(response, 'model_dump'):
+            return response.model_dump()
+        if hasattr(response, 'to_dict'):
+            return response.to_dict()
+        return dict(response)
+
     def _record_request_usage(
         self,
         response: Dict[str, Any],
         estimated_tokens: Optional[int],
-        model: str
+        model: str,
+        reserved: bool = False
     ) -> None:
         """
         Record request usage for tracking and rate limiting.
@@ -220,6 +272,8 @@ class BaseOpenAIClient:
             response: API response
             estimated_tokens: Estimated tokens
             model: Model used
+            reserved: The request and its estimated tokens were already
+                charged through ``rate_limiter.reserve``
         """
         self._request_count += 1
 
@@ -240,7 +294,8 @@ class BaseOpenAIClient:
         self.rate_limiter.record_request(
             tokens_used=total_tokens,
             cost=cost,
-            model=model
+            model=model,
+            reserved_tokens=(estimated_tokens or 0) if reserved else None
         )
 
         self.logger.debug(
@@ -287,12 +342,13 @@ class BaseOpenAIClient:
             str(request_data.get('max_tokens', '')),
         ]
 
-        # Add prompt or messages
+        # Add prompt or messages; sha256 keeps keys stable across processes,
+        # unlike hash(), so they can be shared through the disk cache tier
         if 'prompt' in request_data:
-            key_parts.append(str(hash(request_data['prompt'])))
+            key_parts.append(hashlib.sha256(str(request_data['prompt']).encode()).hexdigest())
         elif 'messages' in request_data:
             messages_str = str(request_data['messages'])
-            key_parts.append(str(hash(messages_str)))
+            key_parts.append(hashlib.sha256(messages_str.encode()).hexdigest())
 
         return 'openai:' + ':'.join(filter(None, key_parts))
 
@@ -314,6 +370,7 @@ class BaseOpenAIClient:
             ),
             'rate_limit_stats': rate_limit_stats,
             'cache_stats': self.cache.get_stats() if self.cache else None,
+            'single_flight_stats': self._single_flight.get_stats(),
             'configuration': self.config.to_dict()
         }
 
@@ -349,18 +406,80 @@ class BaseOpenAIClient:
             self.logger.error(f"Failed to retrieve available models: {e}")
             raise OpenAIExceptionMapper.translate_openai_exception(e)
 
-    def estimate_tokens(self, text: str) -> int:
+    def _with_prompt_cache_key(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add a prompt cache routing hint for chat requests with a stable system prefix.
+
+        OpenAI caches prompt prefixes automatically; a ``prompt_cache_key``
+        shared by requests with the same leading system messages keeps them
+        on the same cache, raising hit rates for large reused prompts. It is
+        sent through ``extra_body`` so SDK releases without a
+        ``prompt_cache_key`` parameter still accept the request.
+
+        Args:
+            request_data: OpenAI request data
+
+        Returns:
+            Request data, with ``prompt_cache_key`` added to ``extra_body``
+            when applicable
+        """
+        messages = request_data.get('messages')
+        extra_body = request_data.get('extra_body') or {}
+        if (not getattr(self.config, 'enable_prompt_caching', False) or not messages or
+                'prompt_cache_key' in request_data or 'prompt_cache_key' in extra_body):
+            return request_data
+
+        prefix = []
+        for message in messages:
+            if message.get('role') not in ('system', 'developer'):
+                break
+            prefix.append(str(message.get('content')))
+        if not prefix:
+            return request_data
+
+        digest = hashlib.sha256("\x00".join(prefix).encode('utf-8')).hexdigest()[:32]
+        return {**request_data, 'extra_body': {**extra_body, 'prompt_cache_key': f"prefix-{digest}"}}
+
+    def token_counter(self, model: Optional[str] = None) -> TokenCounter:
+        """
+        Get the shared token counter for a model.
+
+        Args:
+            model: Model name (defaults to the configured default model)
+
+        Returns:
+            Memoizing TokenCounter for that model's tokenizer
+        """
+        return get_token_counter(model or self.config.default_model)
+
+    def _estimate_chat_tokens(self, messages: List[Dict[str, str]],
+                              model: Optional[str] = None) -> int:
+        """
+        Count total tokens for chat messages, including chat format overhead.
+
+        Args:
+            messages: List of messages
+            model: Model whose tokenizer to use
+
+        Returns:
+            Token count
         """
-        Estimate token count for text (rough approximation).
+        return self.token_counter(model).count_messages(messages)
+
+    def estimate_tokens(self, text: str, model: Optional[str] = None) -> int:
+        """
+        Count tokens in text with the model's tokenizer.
+
+        Falls back to ~4 characters per token if the tokenizer is unavailable.
 
         Args:
             text: Input text
+            model: Model whose tokenizer to use
 
         Returns:
-            Estimated token count
+            Token count (at least 1)
         """
-        # Rough estimation: ~4 characters per token for English
-        return max(1, len(text) // 4)
+        return max(1, self.token_counter(model).count(text))
 
     def close(self) -> None:
         """Clean up resources."""
@@ -3,11 +3,12 @@ OpenAI chat completion client.
 Handles chat-based interactions using OpenAI's chat completion API.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 
 from .base_client import BaseOpenAIClient
 from .data_mapper import OpenAIDataMapper
 from shared.models.llm_response import LLMResponse
+from shared.utils.conversation_window import ConversationWindow
 
 
 class OpenAIChatClient(BaseOpenAIClient):
@@ -37,8 +38,8 @@ class OpenAIChatClient(BaseOpenAIClient):
         # Map request to OpenAI format
         openai_request = OpenAIDataMapper.map_chat_request_to_openai(messages, **kwargs)
 
-        # Estimate tokens for rate limiting
-        estimated_tokens = self._estimate_chat_tokens(messages)
+        # Count tokens for rate limiting
+        estimated_tokens = self._estimate_chat_tokens(messages, model)
         if kwargs.get('max_tokens'):
             estimated_tokens += kwargs['max_tokens']
 
@@ -109,41 +110,87 @@ class OpenAIChatClient(BaseOpenAIClient):
 
         return self.generate_chat_completion(messages, **kwargs)
 
+    def create_conversation(
+        self,
+        messages: Optional[List[Dict[str, str]]] = None,
+        max_context_tokens: Optional[int] = None,
+        model: Optional[str] = None,
+        summarize: bool = False
+    ) -> ConversationWindow:
+        """
+        Create a conversation that stays packed into the model's context budget.
+
+        Args:
+            messages: Initial messages
+            max_context_tokens: Token budget (defaults to half the model's context length)
+            model: Model whose tokenizer and context length to use
+            summarize: Fold dropped turns into a pinned summary instead of discarding them
+
+        Returns:
+            ConversationWindow to pass to continue_conversation and friends
+        """
+        model = model or self.config.default_model
+        if not max_context_tokens:
+            max_context_tokens = self.config.get_model_config(model).get('context_length', 8192) // 2
+
+        conversation = ConversationWindow(
+            self.token_counter(model),
+            max_context_tokens,
+            summarizer=self._summarize_dropped_turns if summarize else None
+        )
+        conversation.extend(messages or [])
+        return conversation
+
     def continue_conversation(
         self,
-        conversation_history: List[Dict[str, str]],
+        conversation_history: Union[List[Dict[str, str]], ConversationWindow],
         new_message: str,
         **kwargs
     ) -> LLMResponse:
         """
         Continue an existing conversation with a new message.
 
+        A ConversationWindow is updated in place with the new message and the
+        reply once the call succeeds, so long sessions never re-count their
+        history and a failed call leaves the window unchanged.
+
         Args:
-            conversation_history: Previous messages in conversation
+            conversation_history: Previous messages or a ConversationWindow
             new_message: New user message to add
             **kwargs: Additional parameters
 
         Returns:
             Shared LLM response
         """
+        user_message = {'role': 'user', 'content': new_message}
+
+        if isinstance(conversation_history, ConversationWindow):
+            response = self.generate_chat_completion(
+                conversation_history.packed_with(user_message), **kwargs
+            )
+            conversation_history.append(user_message)
+            conversation_history.append({'role': 'assistant', 'content': response.content})
+            return response
+
         # Add new user message to conversation
-        messages = conversation_history + [
-            {'role': 'user', 'content': new_message}
-        ]
+        messages = conversation_history + [user_message]
 
         return self.generate_chat_completion(messages, **kwargs)
 
     def multi_turn_conversation(
         self,
-        messages: List[Dict[str, str]],
+        messages: Union[List[Dict[str, str]], ConversationWindow],
         max_turns: int = 10,
         **kwargs
     ) -> List[LLMResponse]:
         """
         Handle multi-turn conversation with automatic turn management.
 
+        Each turn is packed into the context budget incrementally; pass a
+        ConversationWindow to control the budget or enable summarization.
+
         Args:
-            messages: Initial messages
+            messages: Initial messages or a ConversationWindow
             max_turns: Maximum number of turns
             **kwargs: Additional parameters
 
@@ -151,15 +198,18 @@ class OpenAIChatClient(BaseOpenAIClient):
             List of LLM responses for each turn
         """
         responses = []
-        current_messages = messages.copy()
+        if isinstance(messages, ConversationWindow):
+            conversation = messages
+        else:
+            conversation = self.create_conversation(messages, model=kwargs.get('model'))
 
         for turn in range(max_turns):
             try:
-                response = self.generate_chat_completion(current_messages, **kwargs)
+                response = self.generate_chat_completion(conversation.messages, **kwargs)
                 responses.append(response)
 
                 # Add assistant response to conversation
-                current_messages.append({
+                conversation.append({
                     'role': 'assistant',
                     'content': response.content
                 })
@@ -178,7 +228,7 @@ class OpenAIChatClient(BaseOpenAIClient):
 
     def generate_with_context_window_management(
         self,
-        messages: List[Dict[str, str]],
+        messages: Union[List[Dict[str, str]], ConversationWindow],
         max_context_tokens: Optional[int] = None,
         **kwargs
     ) -> LLMResponse:
@@ -186,13 +236,16 @@ class OpenAIChatClient(BaseOpenAIClient):
         Generate chat completion with automatic context window management.
 
         Args:
-            messages: Input messages
+            messages: Input messages, or a ConversationWindow that is already packed
             max_context_tokens: Maximum tokens to use for context
             **kwargs: Additional parameters
 
         Returns:
             Shared LLM response
         """
+        if isinstance(messages, ConversationWindow):
+            return self.generate_chat_completion(messages.messages, **kwargs)
+
         model = kwargs.get('model', self.config.default_model)
         model_config = self.config.get_model_config(model)
 
@@ -200,7 +253,7 @@ class OpenAIChatClient(BaseOpenAIClient):
             max_context_tokens = model_config.get('context_length', 8192) // 2
 
         # Estimate tokens and truncate if needed
-        truncated_messages = self._truncate_messages_to_fit(messages, max_context_tokens)
+        truncated_messages = self._truncate_messages_to_fit(messages, max_context_tokens, model)
 
         if len(truncated_messages) < len(messages):
             self.logger.warning(
@@ -210,44 +263,25 @@ class OpenAIChatClient(BaseOpenAIClient):
 
         return self.generate_chat_completion(truncated_messages, **kwargs)
 
-    def _estimate_chat_tokens(self, messages: List[Dict[str, str]]) -> int:
-        """
-        Estimate total tokens for chat messages.
-
-        Args:
-            messages: List of messages
-
-        Returns:
-            Estimated token count
-        """
-        total_tokens = 0
-
-        for message in messages:
-            # OpenAI chat format has some overhead per message
-            total_tokens += 4  # Overhead for role, content structure
-            total_tokens += self.estimate_tokens(message.get('content', ''))
-            if message.get('name'):
-                total_tokens += self.estimate_tokens(message['name'])
-
-        # Additional overhead for chat format
-        total_tokens += 2
-
-        return total_tokens
-
     def _truncate_messages_to_fit(
         self,
         messages: List[Dict[str, str]],
-        max_tokens: int
+        max_tokens: int,
+        model: Optional[str] = None
     ) -> List[Dict[str, str]]:
         """
         Truncate message list to fit within token limit.
 
+        System messages are always kept; the most recent other messages are
+        added until the next one would not fit, each counted only once.
+
         Args:
             messages: Original messages
             max_tokens: Maximum tokens allowed
+            model: Model whose tokenizer to count with
 
         Returns:
-            Truncated message list
+            Truncated message list in original order
         """
         if not messages:
             return messages
@@ -256,21 +290,16 @@ class OpenAIChatClient(BaseOpenAIClient):
         system_messages = [msg for msg in messages if msg.get('role') == 'system']
         other_messages = [msg for msg in messages if msg.get('role') != 'system']
 
-        # Start with system messages
-        result_messages = system_messages.copy()
-        current_tokens = self._estimate_chat_tokens(system_messages)
-
-        # Add other messages from the end (most recent first)
+        # Start with system messages, then add from the end (most recent first)
+        tally = self.token_counter(model).tally(system_messages)
+        kept = 0
         for message in reversed(other_messages):
-            message_tokens = self._estimate_chat_tokens([message])
-
-            if current_tokens + message_tokens <= max_tokens:
-                result_messages.insert(-len(system_messages) if system_messages else 0, message)
-                current_tokens += message_tokens
-            else:
+            tally.append(message)
+            if tally.total > max_tokens:
                 break
+            kept += 1
 
-        return result_messages
+        return system_messages + other_messages[len(other_messages) - kept:]
 
     def _moderate_messages(self, messages: List[Dict[str, str]]) -> None:
         """
@@ -342,6 +371,14 @@ class OpenAIChatClient(BaseOpenAIClient):
         if not messages:
             return "Empty conversation"
 
+        try:
+            return self._generate_summary(messages, summary_length)
+        except Exception as e:
+            self.logger.error(f"Failed to generate conversation summary: {e}")
+            return f"Error generating summary: {e}"
+
+    def _generate_summary(self, messages: List[Dict[str, str]], summary_length: str) -> str:
+        """Summarize messages, letting API errors propagate."""
         # Create summarization prompt
         conversation_text = "\n".join([
             f"{msg['role']}: {msg['content']}" for msg in messages
@@ -359,16 +396,31 @@ class OpenAIChatClient(BaseOpenAIClient):
 
 Summary:"""
 
-        try:
-            response = self.generate_chat_completion([
-                {'role': 'user', 'content': summary_prompt}
-            ], max_tokens=500, temperature=0.3)
+        response = self.generate_chat_completion([
+            {'role': 'user', 'content': summary_prompt}
+        ], max_tokens=500, temperature=0.3)
+
+        return response.content.strip()
 
-            return response.content.strip()
+    def _summarize_dropped_turns(
+        self,
+        previous_summary: Optional[str],
+        dropped: List[Dict[str, str]]
+    ) -> Optional[str]:
+        """
+        Fold turns dropped from a ConversationWindow into its running summary.
 
+        Returns None when the summary call fails, so the window keeps its
+        previous summary instead of pinning an error message.
+        """
+        messages = list(dropped)
+        if previous_summary:
+            messages.insert(0, {'role': 'system', 'content': previous_summary})
+        try:
+            return self._generate_summary(messages, summary_length="short")
         except Exception as e:
-            self.logger.error(f"Failed to generate conversation summary: {e}")
-            return f"Error generating summary: {e}"
+            self.logger.warning(f"Skipping conversation summary: {e}")
+            return None
 
     def extract_key_points(self, messages: List[Dict[str, str]]) -> List[str]:
         """
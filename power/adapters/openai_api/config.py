@@ -19,6 +19,10 @@ class OpenAIConfig(BaseAdapterConfig):
 
         # Rate limiting (rate_limit_per_minute handled by base class)
         self.rate_limit_per_day = self.get_int('rate_limit_per_day', 200000)
+        # SQLite file shared by all workers so they draw from one rate limit budget
+        self.rate_limit_state_path = self.get_optional('rate_limit_state_path')
+        # In-flight requests per async batch (further capped by the rate limit budget)
+        self.max_concurrent_requests = self.get_int('max_concurrent_requests', 8)
 
         # Request configuration
         self.retry_delay = self.get_float('retry_delay', 1.0)
@@ -30,6 +34,8 @@ class OpenAIConfig(BaseAdapterConfig):
 
         # Advanced features
         self.enable_streaming = self.get_bool('enable_streaming', True)
+        # Chunks read ahead of a slow async stream consumer before reads pause
+        self.stream_buffer_size = self.get_int('stream_buffer_size', 16)
         self.enable_function_calling = self.get_bool('enable_function_calling', True)
         self.enable_vision = self.get_bool('enable_vision', True)
         self.enable_image_generation = self.get_bool('enable_image_generation', True)
@@ -43,6 +49,11 @@ class OpenAIConfig(BaseAdapterConfig):
         self.enable_response_cache = self.get_bool('enable_response_cache', True)
         self.cache_ttl_seconds = self.get_int('cache_ttl_seconds', 3600)
         self.max_cache_size = self.get_int('max_cache_size', 1000)
+        self.disk_cache_path = self.get_optional('disk_cache_path')
+        self.disk_cache_max_mb = self.get_int('disk_cache_max_mb', 256)
+        # Send a prompt_cache_key derived from the system prompt so requests sharing
+        # it are routed to the same server-side prefix cache
+        self.enable_prompt_caching = self.get_bool('enable_prompt_caching', True)
 
     def get_model_config(self, model_name: str) -> dict:
         """Get configuration for a specific model."""
@@ -121,6 +132,12 @@ class OpenAIConfig(BaseAdapterConfig):
         if self.rate_limit_per_day <= 0:
             errors.append("rate_limit_per_day must be positive")
 
+        if self.max_concurrent_requests <= 0:
+            errors.append("max_concurrent_requests must be positive")
+
+        if self.stream_buffer_size <= 0:
+            errors.append("stream_buffer_size must be positive")
+
         if self.default_max_tokens <= 0:
             errors.append("default_max_tokens must be positive")
 
@@ -139,11 +156,14 @@ class OpenAIConfig(BaseAdapterConfig):
             'organization_id': self.organization_id,
             'project_id': self.project_id,
             'rate_limit_per_day': self.rate_limit_per_day,
+            'rate_limit_state_path': self.rate_limit_state_path,
+            'max_concurrent_requests': self.max_concurrent_requests,
             'retry_delay': self.retry_delay,
             'default_model': self.default_model,
             'default_max_tokens': self.default_max_tokens,
             'default_temperature': self.default_temperature,
             'enable_streaming': self.enable_streaming,
+            'stream_buffer_size': self.stream_buffer_size,
             'enable_function_calling': self.enable_function_calling,
             'enable_vision': self.enable_vision,
             'enable_image_generation': self.enable_image_generation,
@@ -153,6 +173,9 @@ class OpenAIConfig(BaseAdapterConfig):
             'enable_response_cache': self.enable_response_cache,
             'cache_ttl_seconds': self.cache_ttl_seconds,
             'max_cache_size': self.max_cache_size,
+            'disk_cache_path': self.disk_cache_path,
+            'disk_cache_max_mb': self.disk_cache_max_mb,
+            'enable_prompt_caching': self.enable_prompt_caching,
             'supported_models': self.get_supported_models()
         })
         return base_dict
@@ -221,7 +221,9 @@ class OpenAIDataMapper:
         usage = UsageStats(
             prompt_tokens=usage_data.get('prompt_tokens', 0),
             completion_tokens=usage_data.get('completion_tokens', 0),
-            total_tokens=usage_data.get('total_tokens', 0)
+            total_tokens=usage_data.get('total_tokens', 0),
+            # Tokens served by OpenAI's automatic prompt-prefix cache
+            cached_prompt_tokens=(usage_data.get('prompt_tokens_details') or {}).get('cached_tokens') or 0
         )
 
         # Calculate costs if possible (rough estimates)
@@ -114,7 +114,7 @@ class OpenAIExceptionMapper:
             )
 
         # Timeout errors
-        if isinstance(openai_error, (openai.APIRequestTimeoutError, openai.Timeout)):
+        if isinstance(openai_error, (openai.APITimeoutError, openai.Timeout)):
             timeout_seconds = None
             if hasattr(openai_error, 'timeout'):
                 timeout_seconds = openai_error.timeout
@@ -277,7 +277,7 @@ def is_retriable_openai_error(error: Exception) -> bool:
         return True
 
     # Timeout errors are retriable
-    if isinstance(error, (openai.APIRequestTimeoutError, openai.Timeout, RequestTimeoutError)):
+    if isinstance(error, (openai.APITimeoutError, openai.Timeout, RequestTimeoutError)):
         return True
 
     # Connection errors are retriable
@@ -315,7 +315,7 @@ def get_retry_delay_for_openai_error(error: Exception) -> float:
         return 60.0  # Default 1 minute for rate limits
 
     # Timeout errors - short delay
-    if isinstance(error, (openai.APIRequestTimeoutError, openai.Timeout, RequestTimeoutError)):
+    if isinstance(error, (openai.APITimeoutError, openai.Timeout, RequestTimeoutError)):
         return 5.0
 
     # Connection errors - medium delay
@@ -61,7 +61,7 @@ class OpenAIFunctionClient(BaseOpenAIClient):
         )
 
         # Estimate tokens
-        estimated_tokens = self._estimate_function_tokens(messages, functions)
+        estimated_tokens = self._estimate_function_tokens(messages, functions, model)
         if request.max_tokens:
             estimated_tokens += request.max_tokens
 
@@ -148,7 +148,7 @@ class OpenAIFunctionClient(BaseOpenAIClient):
         )
 
         # Estimate tokens
-        estimated_tokens = self._estimate_tool_tokens(messages, tools)
+        estimated_tokens = self._estimate_tool_tokens(messages, tools, model)
         if request.max_tokens:
             estimated_tokens += request.max_tokens
 
@@ -330,7 +330,7 @@ class OpenAIFunctionClient(BaseOpenAIClient):
                 response = self._make_api_call(
                     api_method=self.client.chat.completions.create,
                     request_data=openai_request,
-                    estimated_tokens=self._estimate_function_tokens(messages, functions)
+                    estimated_tokens=self._estimate_function_tokens(messages, functions, model)
                 )
 
                 # Convert to shared format
@@ -427,7 +427,9 @@ class OpenAIFunctionClient(BaseOpenAIClient):
         continued_response = self._make_api_call(
             api_method=self.client.chat.completions.create,
             request_data=original_request,
-            estimated_tokens=self._estimate_function_tokens(messages, [])
+            estimated_tokens=self._estimate_function_tokens(
+                messages, [], original_request.get('model')
+            )
         )
 
         return continued_response
@@ -479,7 +481,9 @@ class OpenAIFunctionClient(BaseOpenAIClient):
         continued_response = self._make_api_call(
             api_method=self.client.chat.completions.create,
             request_data=original_request,
-            estimated_tokens=self._estimate_function_tokens(messages, [])
+            estimated_tokens=self._estimate_function_tokens(
+                messages, [], original_request.get('model')
+            )
         )
 
         return continued_response
@@ -508,17 +512,17 @@ class OpenAIFunctionClient(BaseOpenAIClient):
     def _estimate_function_tokens(
         self,
         messages: List[Dict[str, str]],
-        functions: List[Dict[str, Any]]
+        functions: List[Dict[str, Any]],
+        model: Optional[str] = None
     ) -> int:
         """Estimate tokens for function calling request."""
+        counter = self.token_counter(model)
+
         # Base message tokens
-        message_tokens = sum(self.estimate_tokens(msg.get('content', '')) for msg in messages)
+        message_tokens = counter.count_messages(messages)
 
-        # Function definition tokens (rough estimate)
-        function_tokens = 0
-        for func in functions:
-            func_str = json.dumps(func)
-            function_tokens += self.estimate_tokens(func_str)
+        # Function definition tokens; definitions repeat across calls so these are memoized
+        function_tokens = sum(counter.count(json.dumps(func, sort_keys=True)) for func in functions)
 
         # Add overhead for function calling format
         overhead = 20 + (5 * len(functions))
@@ -528,11 +532,12 @@ class OpenAIFunctionClient(BaseOpenAIClient):
     def _estimate_tool_tokens(
         self,
         messages: List[Dict[str, str]],
-        tools: List[Dict[str, Any]]
+        tools: List[Dict[str, Any]],
+        model: Optional[str] = None
     ) -> int:
         """Estimate tokens for tool calling request."""
         # Similar to function tokens but with tool format overhead
-        return self._estimate_function_tokens(messages, tools) + 10
+        return self._estimate_function_tokens(messages, tools, model) + 10
 
     def get_function_calling_capabilities(self) -> Dict[str, Any]:
         """Get information about function calling capabilities."""
@@ -3,12 +3,12 @@ OpenAI API rate limiter and quota management.
 Handles OpenAI-specific rate limits and usage tracking.
 """
 
-import time
 import threading
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 
 from shared.utils.rate_limiter import BaseRateLimiter, AdaptiveRateLimiter, RateLimitStats
+from shared.utils.shared_rate_limit import SharedRateLimitState
 from shared.exceptions import RateLimitError, QuotaExceededError
 from .config import OpenAIConfig
 
@@ -26,21 +26,20 @@ class OpenAIRateLimiter(AdaptiveRateLimiter):
         Args:
             config: OpenAI configuration with rate limits
         """
+        # Token-based rate limiting (OpenAI measures both requests and tokens)
+        self._token_limits = self._get_tier_token_limits()
+
         super().__init__(
             calls_per_minute=config.rate_limit_per_minute,
             calls_per_day=config.rate_limit_per_day,
-            min_interval_seconds=1.0  # OpenAI requires some spacing
+            min_interval_seconds=1.0,  # OpenAI requires some spacing
+            tokens_per_minute=self._token_limits['per_minute'],
+            tokens_per_day=self._token_limits['per_day'],
+            shared_state=SharedRateLimitState.from_config(config, name='openai')
         )
 
         self.config = config
 
-        # Token-based rate limiting (OpenAI measures both requests and tokens)
-        self._token_limits = self._get_tier_token_limits()
-        self._tokens_per_minute = 0
-        self._tokens_per_day = 0
-        self._token_minute_window = []
-        self._token_day_window = []
-
         # Model-specific limits
         self._model_limits = self._get_model_limits()
 
@@ -73,7 +72,7 @@ class OpenAIRateLimiter(AdaptiveRateLimiter):
                 return False
 
             # Token-based rate limiting
-            if estimated_tokens and not self._can_use_tokens(estimated_tokens):
+            if estimated_tokens and not self.can_use_tokens(estimated_tokens):
                 return False
 
             # Model-specific limits
@@ -90,7 +89,8 @@ class OpenAIRateLimiter(AdaptiveRateLimiter):
         self,
         tokens_used: Optional[int] = None,
         cost: Optional[float] = None,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        reserved_tokens: Optional[int] = None
     ) -> None:
         """
         Record completed request with token and cost tracking.
@@ -99,12 +99,17 @@ class OpenAIRateLimiter(AdaptiveRateLimiter):
             tokens_used: Actual tokens consumed
             cost: Actual cost incurred
             model: Model used
+            reserved_tokens: Tokens already charged by :meth:`reserve`; the
+                request itself is then not charged again and only tokens
+                beyond the reservation are recorded
         """
         with self._lock:
-            super().record_request()
-
-            if tokens_used:
-                self._record_token_usage(tokens_used)
+            if reserved_tokens is None:
+                super().record_request()
+                if tokens_used:
+                    self.record_tokens(tokens_used)
+            elif tokens_used and tokens_used > reserved_tokens:
+                self.record_tokens(tokens_used - reserved_tokens)
 
             if cost:
                 self._estimated_cost_today += cost
@@ -119,6 +124,49 @@ class OpenAIRateLimiter(AdaptiveRateLimiter):
                 if len(self._request_sizes) > 100:
                     self._request_sizes = self._request_sizes[-50:]
 
+    def reserve(self, n_tokens: int = 0, model: Optional[str] = None) -> float:
+        """
+        Claim the next request slot, also enforcing the daily cost limit.
+
+        Args:
+            n_tokens: Estimated tokens for the request
+            model: Model to be used
+
+        Returns:
+            Seconds to wait before sending the request
+
+        Raises:
+            QuotaExceededError: If a quota or the daily cost limit is used up
+        """
+        self._ensure_cost_allowed(n_tokens, model)
+        return super().reserve(n_tokens)
+
+    async def areserve(self, n_tokens: int = 0, model: Optional[str] = None) -> float:
+        """
+        Async :meth:`reserve` that never blocks the event loop.
+
+        Args:
+            n_tokens: Estimated tokens for the request
+            model: Model to be used
+
+        Returns:
+            Seconds to wait before sending the request
+
+        Raises:
+            QuotaExceededError: If a quota or the daily cost limit is used up
+        """
+        self._ensure_cost_allowed(n_tokens, model)
+        return await super().areserve(n_tokens)
+
+    def _ensure_cost_allowed(self, n_tokens: int, model: Optional[str]) -> None:
+        """Raise if the request would exceed the daily cost limit."""
+        with self._lock:
+            if not self._check_cost_limits(n_tokens, model):
+                raise QuotaExceededError(
+                    "Daily OpenAI cost limit would be exceeded",
+                    quota_type='cost'
+                )
+
     def get_wait_time_for_tokens(self, estimated_tokens: int) -> float:
         """
         Get wait time considering token limits.
@@ -129,11 +177,7 @@ class OpenAIRateLimiter(AdaptiveRateLimiter):
         Returns:
             Seconds to wait
         """
-        with self._lock:
-            base_wait = super().get_wait_time()
-            token_wait = self._get_token_wait_time(estimated_tokens)
-
-            return max(base_wait, token_wait)
+        return self.get_wait_time(estimated_tokens)
 
     def get_openai_stats(self) -> Dict[str, Any]:
         """Get OpenAI-specific usage statistics."""
@@ -142,8 +186,7 @@ class OpenAIRateLimiter(AdaptiveRateLimiter):
 
             return {
                 **base_stats.to_dict(),
-                'tokens_this_minute': self._tokens_per_minute,
-                'tokens_this_day': self._tokens_per_day,
+                **self.get_token_usage(),
                 'estimated_cost_today': self._estimated_cost_today,
                 'average_request_size': (
                     sum(self._request_sizes) / len(self._request_sizes)
@@ -214,60 +257,6 @@ class OpenAIRateLimiter(AdaptiveRateLimiter):
                 'efficiency_score': self._calculate_efficiency_score()
             }
 
-    def _can_use_tokens(self, tokens: int) -> bool:
-        """Check if token usage is within limits."""
-        now = time.time()
-        self._cleanup_token_windows(now)
-
-        # Check per-minute token limit
-        if (self._tokens_per_minute + tokens) > self._token_limits['per_minute']:
-            return False
-
-        # Check per-day token limit
-        if (self._tokens_per_day + tokens) > self._token_limits['per_day']:
-            return False
-
-        return True
-
-    def _record_token_usage(self, tokens: int) -> None:
-        """Record token usage with time windows."""
-        now = time.time()
-
-        # Add to tracking windows
-        self._token_minute_window.append((now, tokens))
-        self._token_day_window.append((now, tokens))
-
-        # Update counters
-        self._tokens_per_minute += tokens
-        self._tokens_per_day += tokens
-
-        # Cleanup old entries
-        self._cleanup_token_windows(now)
-
-    def _cleanup_token_windows(self, now: float) -> None:
-        """Clean up old token usage entries."""
-        # Clean minute window
-        minute_ago = now - 60
-        while self._token_minute_window and self._token_minute_window[0][0] < minute_ago:
-            removed_entry = self._token_minute_window.pop(0)
-            self._tokens_per_minute -= removed_entry[1]
-
-        # Clean day window
-        day_ago = now - 86400
-        while self._token_day_window and self._token_day_window[0][0] < day_ago:
-            removed_entry = self._token_day_window.pop(0)
-            self._tokens_per_day -= removed_entry[1]
-
-    def _get_token_wait_time(self, tokens: int) -> float:
-        """Calculate wait time based on token limits."""
-        if not self._can_use_tokens(tokens):
-            # Need to wait for oldest tokens to expire
-            if self._token_minute_window:
-                oldest_time = self._token_minute_window[0][0]
-                return max(0, 60 - (time.time() - oldest_time))
-
-        return 0.0
-
     def _check_model_limits(self, model: str) -> bool:
         """Check model-specific limits."""
         model_config = self._model_limits.get(model, {})
@@ -3,30 +3,56 @@ OpenAI streaming client for real-time response generation.
 Handles streaming text and chat completions.
 """
 
+import asyncio
 import json
-from typing import Generator, List, Dict, Any, Optional
+from contextlib import aclosing
+from typing import AsyncIterator, Generator, List, Dict, Any, Optional, Tuple, Union
+
+import openai
 
 from .base_client import BaseOpenAIClient
 from .data_mapper import OpenAIDataMapper
 from shared.models.llm_request import LLMRequest
-from shared.models.llm_response import StreamingResponse, LLMResponse, FinishReason, UsageStats
+from shared.models.llm_response import (
+    StreamingResponse, StreamChunk, StreamAccumulator, LLMResponse, FinishReason, UsageStats
+)
+from shared.utils.bounded_stream import bounded_stream
+
+
+def _field(obj: Any, name: str) -> Any:
+    """Read a field from an SDK object or its dict form."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
 
 
 class OpenAIStreamingClient(BaseOpenAIClient):
     """
     OpenAI client for streaming responses.
     Provides real-time streaming for both text and chat completions.
+
+    The ``astream_*`` methods stream through the SDK's AsyncOpenAI client for
+    callers on an event loop; their chunks are read ahead through a bounded
+    queue, and closing the stream cancels the upstream request.
     """
 
-    def generate_text_stream(self, request: LLMRequest) -> Generator[StreamingResponse, None, LLMResponse]:
+    _async_client = None
+
+    def generate_text_stream(
+        self,
+        request: LLMRequest,
+        delta_only: bool = False
+    ) -> Generator[Union[StreamingResponse, StreamChunk], None, LLMResponse]:
         """
         Generate streaming text completion.
 
         Args:
             request: Shared LLM request
+            delta_only: Yield lightweight StreamChunk objects whose cumulative
+                content is only materialized on demand
 
         Yields:
-            StreamingResponse objects with incremental content
+            StreamingResponse (or StreamChunk) objects with incremental content
 
         Returns:
             Final LLMResponse object
@@ -41,13 +67,14 @@ class OpenAIStreamingClient(BaseOpenAIClient):
         if not openai_request.get('model'):
             openai_request['model'] = self.config.default_model
 
-        # Estimate tokens for rate limiting
-        estimated_tokens = self.estimate_tokens(request.prompt)
+        # Count tokens for rate limiting
+        model = openai_request['model']
+        prompt_tokens = self.estimate_tokens(request.prompt, model)
+        estimated_tokens = prompt_tokens
         if request.max_tokens:
             estimated_tokens += request.max_tokens
 
         # Check rate limits before starting stream
-        model = openai_request['model']
         if not self.rate_limiter.can_make_request(estimated_tokens, model):
             wait_time = self.rate_limiter.get_wait_time_for_tokens(estimated_tokens)
             from shared.exceptions import RateLimitError
@@ -63,54 +90,11 @@ class OpenAIStreamingClient(BaseOpenAIClient):
         self.logger.debug("Making streaming text completion request")
 
         # Make streaming API call
-        cumulative_content = ""
-        chunk_index = 0
-        final_response = None
-
         try:
             stream = self.client.completions.create(**openai_request)
-
-            for chunk in stream:
-                chunk_dict = chunk.model_dump() if hasattr(chunk, 'model_dump') else dict(chunk)
-
-                # Extract content delta
-                content_delta = ""
-                if 'choices' in chunk_dict and chunk_dict['choices']:
-                    choice = chunk_dict['choices'][0]
-                    content_delta = choice.get('text', '')
-
-                # Update cumulative content
-                cumulative_content += content_delta
-
-                # Check if this is the final chunk
-                is_final = False
-                if 'choices' in chunk_dict and chunk_dict['choices']:
-                    choice = chunk_dict['choices'][0]
-                    if choice.get('finish_reason') is not None:
-                        is_final = True
-
-                        # Create final response
-                        final_response = self._create_final_response_from_stream(
-                            chunk_dict,
-                            cumulative_content,
-                            model,
-                            request.request_id
-                        )
-
-                # Create streaming response
-                streaming_response = StreamingResponse(
-                    content_delta=content_delta,
-                    cumulative_content=cumulative_content,
-                    is_final=is_final,
-                    chunk_index=chunk_index,
-                    final_response=final_response if is_final else None
-                )
-
-                chunk_index += 1
-                yield streaming_response
-
-                if is_final:
-                    break
+            final_response, content_length = yield from self._consume_stream(
+                stream, self._text_delta, model, request.request_id, prompt_tokens, delta_only
+            )
 
             # Record usage
             if final_response:
@@ -120,23 +104,26 @@ class OpenAIStreamingClient(BaseOpenAIClient):
             self.logger.error(f"Streaming text generation failed: {e}")
             raise
 
-        self.logger.info(f"Streaming text generation completed: {len(cumulative_content)} characters")
+        self.logger.info(f"Streaming text generation completed: {content_length} characters")
         return final_response
 
     def generate_chat_completion_stream(
         self,
         messages: List[Dict[str, str]],
+        delta_only: bool = False,
         **kwargs
-    ) -> Generator[StreamingResponse, None, LLMResponse]:
+    ) -> Generator[Union[StreamingResponse, StreamChunk], None, LLMResponse]:
         """
         Generate streaming chat completion.
 
         Args:
             messages: List of message dictionaries
+            delta_only: Yield lightweight StreamChunk objects whose cumulative
+                content is only materialized on demand
             **kwargs: Additional parameters
 
         Yields:
-            StreamingResponse objects with incremental content
+            StreamingResponse (or StreamChunk) objects with incremental content
 
         Returns:
             Final LLMResponse object
@@ -147,8 +134,9 @@ class OpenAIStreamingClient(BaseOpenAIClient):
         # Map request to OpenAI format with streaming enabled
         openai_request = OpenAIDataMapper.map_chat_request_to_openai(messages, stream=True, **kwargs)
 
-        # Estimate tokens for rate limiting
-        estimated_tokens = self._estimate_chat_tokens(messages)
+        # Count tokens for rate limiting
+        prompt_tokens = self._estimate_chat_tokens(messages, model)
+        estimated_tokens = prompt_tokens
         if kwargs.get('max_tokens'):
             estimated_tokens += kwargs['max_tokens']
 
@@ -168,55 +156,11 @@ class OpenAIStreamingClient(BaseOpenAIClient):
         self.logger.debug(f"Making streaming chat completion request: {len(messages)} messages")
 
         # Make streaming API call
-        cumulative_content = ""
-        chunk_index = 0
-        final_response = None
-
         try:
-            stream = self.client.chat.completions.create(**openai_request)
-
-            for chunk in stream:
-                chunk_dict = chunk.model_dump() if hasattr(chunk, 'model_dump') else dict(chunk)
-
-                # Extract content delta
-                content_delta = ""
-                if 'choices' in chunk_dict and chunk_dict['choices']:
-                    choice = chunk_dict['choices'][0]
-                    if 'delta' in choice and 'content' in choice['delta']:
-                        content_delta = choice['delta']['content'] or ""
-
-                # Update cumulative content
-                cumulative_content += content_delta
-
-                # Check if this is the final chunk
-                is_final = False
-                if 'choices' in chunk_dict and chunk_dict['choices']:
-                    choice = chunk_dict['choices'][0]
-                    if choice.get('finish_reason') is not None:
-                        is_final = True
-
-                        # Create final response
-                        final_response = self._create_final_response_from_stream(
-                            chunk_dict,
-                            cumulative_content,
-                            model,
-                            kwargs.get('request_id')
-                        )
-
-                # Create streaming response
-                streaming_response = StreamingResponse(
-                    content_delta=content_delta,
-                    cumulative_content=cumulative_content,
-                    is_final=is_final,
-                    chunk_index=chunk_index,
-                    final_response=final_response if is_final else None
-                )
-
-                chunk_index += 1
-                yield streaming_response
-
-                if is_final:
-                    break
+            stream = self.client.chat.completions.create(**self._with_prompt_cache_key(openai_request))
+            final_response, content_length = yield from self._consume_stream(
+                stream, self._chat_delta, model, kwargs.get('request_id'), prompt_tokens, delta_only
+            )
 
             # Record usage
             if final_response:
@@ -226,7 +170,7 @@ class OpenAIStreamingClient(BaseOpenAIClient):
             self.logger.error(f"Streaming chat completion failed: {e}")
             raise
 
-        self.logger.info(f"Streaming chat completion completed: {len(cumulative_content)} characters")
+        self.logger.info(f"Streaming chat completion completed: {content_length} characters")
         return final_response
 
     def stream_with_function_calls(
@@ -279,12 +223,287 @@ class OpenAIStreamingClient(BaseOpenAIClient):
         # Use regular streaming with tools support
         yield from self.generate_chat_completion_stream(messages, **kwargs)
 
+    async def astream_text(
+        self,
+        request: LLMRequest,
+        delta_only: bool = False
+    ) -> AsyncIterator[Union[StreamingResponse, StreamChunk]]:
+        """
+        Generate streaming text completion without blocking the event loop.
+
+        Args:
+            request: Shared LLM request
+            delta_only: Yield lightweight StreamChunk objects whose cumulative
+                content is only materialized on demand
+
+        Yields:
+            StreamingResponse (or StreamChunk) objects with incremental content;
+            the final one carries the final LLMResponse
+        """
+        openai_request = OpenAIDataMapper.map_llm_request_to_openai(request)
+        openai_request['stream'] = True
+        if not openai_request.get('model'):
+            openai_request['model'] = self.config.default_model
+
+        model = openai_request['model']
+        prompt_tokens = self.estimate_tokens(request.prompt, model)
+        estimated_tokens = prompt_tokens
+        if request.max_tokens:
+            estimated_tokens += request.max_tokens
+
+        if self.config.enable_moderation and self.config.moderate_input:
+            await asyncio.to_thread(self._moderate_content, request.prompt)
+
+        self.logger.debug("Making async streaming text completion request")
+
+        async with aclosing(self._astream(
+            self._get_async_client().completions.create, openai_request, self._text_delta,
+            model, request.request_id, prompt_tokens, estimated_tokens, delta_only
+        )) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+    async def astream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        delta_only: bool = False,
+        **kwargs
+    ) -> AsyncIterator[Union[StreamingResponse, StreamChunk]]:
+        """
+        Generate streaming chat completion without blocking the event loop.
+
+        Args:
+            messages: List of message dictionaries
+            delta_only: Yield lightweight StreamChunk objects whose cumulative
+                content is only materialized on demand
+            **kwargs: Additional parameters
+
+        Yields:
+            StreamingResponse (or StreamChunk) objects with incremental content;
+            the final one carries the final LLMResponse
+        """
+        model = kwargs.get('model', self.config.default_model)
+        openai_request = OpenAIDataMapper.map_chat_request_to_openai(messages, stream=True, **kwargs)
+
+        prompt_tokens = self._estimate_chat_tokens(messages, model)
+        estimated_tokens = prompt_tokens
+        if kwargs.get('max_tokens'):
+            estimated_tokens += kwargs['max_tokens']
+
+        if self.config.enable_moderation and self.config.moderate_input:
+            await asyncio.to_thread(self._moderate_messages, messages)
+
+        self.logger.debug(f"Making async streaming chat completion request: {len(messages)} messages")
+
+        async with aclosing(self._astream(
+            self._get_async_client().chat.completions.create, self._with_prompt_cache_key(openai_request),
+            self._chat_delta, model, kwargs.get('request_id'), prompt_tokens, estimated_tokens, delta_only
+        )) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+    async def _astream(
+        self,
+        api_method,
+        openai_request: Dict[str, Any],
+        extract_delta,
+        model: str,
+        request_id: Optional[str],
+        prompt_tokens: int,
+        estimated_tokens: int,
+        delta_only: bool
+    ) -> AsyncIterator[Union[StreamingResponse, StreamChunk]]:
+        """
+        Open an async SDK stream and turn its chunks into streaming responses.
+
+        The request claims a rate limit slot with ``areserve()`` and waits for
+        it with ``asyncio.sleep``. Chunks pass through a queue of
+        ``config.stream_buffer_size``, so a slow consumer pauses the read
+        instead of buffering the whole completion. Closing this generator
+        (e.g. when the HTTP client disconnects) cancels the read and closes
+        the SDK stream, which aborts the request.
+
+        Args:
+            api_method: Async OpenAI API method to call
+            openai_request: Request data with ``stream`` enabled
+            extract_delta: Callable returning a choice's content delta
+            model: Model used
+            request_id: Request identifier
+            prompt_tokens: Counted prompt tokens
+            estimated_tokens: Estimated tokens for rate limiting
+            delta_only: Yield StreamChunk instead of StreamingResponse
+
+        Yields:
+            Streaming responses in order
+        """
+        wait_time = await self.rate_limiter.areserve(estimated_tokens, model)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+        accumulator = StreamAccumulator()
+        final_response = None
+
+        try:
+            stream = await api_method(**openai_request)
+            async with aclosing(bounded_stream(stream, self.config.stream_buffer_size)) as chunks:
+                chunk_index = 0
+                async for chunk in chunks:
+                    item = self._map_stream_chunk(
+                        chunk, chunk_index, accumulator, extract_delta, model, request_id,
+                        prompt_tokens, delta_only
+                    )
+                    yield item
+                    chunk_index += 1
+
+                    if item.is_final:
+                        final_response = item.final_response
+                        break
+
+        except Exception as e:
+            self.logger.error(f"Async streaming failed: {e}")
+            raise
+
+        if final_response:
+            self._record_stream_usage(final_response, estimated_tokens, model, reserved=True)
+
+        self.logger.info(f"Async streaming completed: {len(accumulator)} characters")
+
+    def _get_async_client(self) -> openai.AsyncOpenAI:
+        """Get the AsyncOpenAI client, creating it on first use."""
+        if self._async_client is None:
+            self._async_client = openai.AsyncOpenAI(**self._client_params())
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def _consume_stream(
+        self,
+        stream,
+        extract_delta,
+        model: str,
+        request_id: Optional[str],
+        prompt_tokens: int,
+        delta_only: bool
+    ) -> Generator[Union[StreamingResponse, StreamChunk], None, Tuple[Optional[LLMResponse], int]]:
+        """
+        Turn raw stream chunks into streaming responses.
+
+        Deltas go into a StreamAccumulator, so the content is joined once
+        instead of re-copied on every chunk. Only the final chunk is
+        converted to a dict for building the final response.
+
+        Args:
+            stream: OpenAI SDK stream
+            extract_delta: Callable returning a choice's content delta
+            model: Model used
+            request_id: Request identifier
+            prompt_tokens: Counted prompt tokens
+            delta_only: Yield StreamChunk instead of StreamingResponse
+
+        Yields:
+            Streaming responses in order
+
+        Returns:
+            Final response (None if the stream ended early) and content length
+        """
+        accumulator = StreamAccumulator()
+        final_response = None
+
+        for chunk_index, chunk in enumerate(stream):
+            item = self._map_stream_chunk(
+                chunk, chunk_index, accumulator, extract_delta, model, request_id, prompt_tokens, delta_only
+            )
+            yield item
+
+            if item.is_final:
+                final_response = item.final_response
+                break
+
+        return final_response, len(accumulator)
+
+    def _map_stream_chunk(
+        self,
+        chunk: Any,
+        chunk_index: int,
+        accumulator: StreamAccumulator,
+        extract_delta,
+        model: str,
+        request_id: Optional[str],
+        prompt_tokens: int,
+        delta_only: bool
+    ) -> Union[StreamingResponse, StreamChunk]:
+        """
+        Map one raw stream chunk, appending its delta to the accumulator.
+
+        Args:
+            chunk: OpenAI SDK stream chunk
+            chunk_index: Position of the chunk in the stream
+            accumulator: Accumulator holding the stream's content
+            extract_delta: Callable returning a choice's content delta
+            model: Model used
+            request_id: Request identifier
+            prompt_tokens: Counted prompt tokens
+            delta_only: Return StreamChunk instead of StreamingResponse
+
+        Returns:
+            Streaming response for the chunk, carrying the final response on the last one
+        """
+        choices = _field(chunk, 'choices')
+        choice = choices[0] if choices else None
+
+        content_delta = extract_delta(choice) if choice is not None else ""
+        accumulator.append(content_delta)
+
+        final_response = None
+        is_final = choice is not None and _field(choice, 'finish_reason') is not None
+        if is_final:
+            chunk_dict = chunk.model_dump() if hasattr(chunk, 'model_dump') else dict(chunk)
+            final_response = self._create_final_response_from_stream(
+                chunk_dict,
+                accumulator.text,
+                model,
+                request_id,
+                prompt_tokens
+            )
+
+        if delta_only:
+            return StreamChunk(
+                content_delta=content_delta,
+                accumulator=accumulator,
+                is_final=is_final,
+                chunk_index=chunk_index,
+                final_response=final_response
+            )
+        return StreamingResponse(
+            content_delta=content_delta,
+            cumulative_content=accumulator.text,
+            is_final=is_final,
+            chunk_index=chunk_index,
+            final_response=final_response
+        )
+
+    @staticmethod
+    def _text_delta(choice: Any) -> str:
+        """Content delta of a text completion choice."""
+        return _field(choice, 'text') or ""
+
+    @staticmethod
+    def _chat_delta(choice: Any) -> str:
+        """Content delta of a chat completion choice."""
+        delta = _field(choice, 'delta')
+        return (_field(delta, 'content') or "") if delta is not None else ""
+
     def _create_final_response_from_stream(
         self,
         final_chunk: Dict[str, Any],
         cumulative_content: str,
         model: str,
-        request_id: Optional[str]
+        request_id: Optional[str],
+        prompt_tokens: int = 0
     ) -> LLMResponse:
         """
         Create final LLMResponse from the last streaming chunk.
@@ -294,6 +513,7 @@ class OpenAIStreamingClient(BaseOpenAIClient):
             cumulative_content: All accumulated content
             model: Model used
             request_id: Request identifier
+            prompt_tokens: Counted prompt tokens, used when the stream reports no usage
 
         Returns:
             Final LLMResponse object
@@ -308,13 +528,12 @@ class OpenAIStreamingClient(BaseOpenAIClient):
         # Create usage stats (streaming doesn't always provide these)
         usage_data = final_chunk.get('usage', {})
         if not usage_data:
-            # Estimate usage if not provided
-            estimated_prompt_tokens = self.estimate_tokens(cumulative_content) // 2  # Rough estimate
-            estimated_completion_tokens = self.estimate_tokens(cumulative_content) - estimated_prompt_tokens
+            # Count usage ourselves if the stream did not report it
+            completion_tokens = self.token_counter(model).count(cumulative_content)
             usage_data = {
-                'prompt_tokens': estimated_prompt_tokens,
-                'completion_tokens': estimated_completion_tokens,
-                'total_tokens': estimated_prompt_tokens + estimated_completion_tokens
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens
             }
 
         usage = UsageStats(
@@ -351,7 +570,8 @@ class OpenAIStreamingClient(BaseOpenAIClient):
         self,
         response: LLMResponse,
         estimated_tokens: int,
-        model: str
+        model: str,
+        reserved: bool = False
     ) -> None:
         """
         Record usage from streaming response.
@@ -360,6 +580,8 @@ class OpenAIStreamingClient(BaseOpenAIClient):
             response: Final response object
             estimated_tokens: Original token estimate
             model: Model used
+            reserved: The request and its estimated tokens were already
+                charged through ``rate_limiter.reserve``
         """
         # Calculate cost
         cost = response.usage.total_cost if response.usage.total_cost else 0.0
@@ -368,7 +590,8 @@ class OpenAIStreamingClient(BaseOpenAIClient):
         self.rate_limiter.record_request(
             tokens_used=response.usage.total_tokens,
             cost=cost,
-            model=model
+            model=model,
+            reserved_tokens=estimated_tokens if reserved else None
         )
 
         # Update client stats
@@ -376,30 +599,6 @@ class OpenAIStreamingClient(BaseOpenAIClient):
         self._total_tokens_used += response.usage.total_tokens
         self._total_cost += cost
 
-    def _estimate_chat_tokens(self, messages: List[Dict[str, str]]) -> int:
-        """
-        Estimate total tokens for chat messages.
-
-        Args:
-            messages: List of messages
-
-        Returns:
-            Estimated token count
-        """
-        total_tokens = 0
-
-        for message in messages:
-            # OpenAI chat format has some overhead per message
-            total_tokens += 4  # Overhead for role, content structure
-            total_tokens += self.estimate_tokens(message.get('content', ''))
-            if message.get('name'):
-                total_tokens += self.estimate_tokens(message['name'])
-
-        # Additional overhead for chat format
-        total_tokens += 2
-
-        return total_tokens
-
     def _moderate_messages(self, messages: List[Dict[str, str]]) -> None:
         """
         Moderate all messages in the conversation.
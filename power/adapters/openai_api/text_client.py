@@ -37,7 +37,7 @@ class OpenAITextClient(BaseOpenAIClient):
             openai_request['model'] = self.config.default_model
 
         # Estimate tokens for rate limiting
-        estimated_tokens = self.estimate_tokens(request.prompt)
+        estimated_tokens = self.estimate_tokens(request.prompt, openai_request['model'])
         if request.max_tokens:
             estimated_tokens += request.max_tokens
 
@@ -291,7 +291,7 @@ class OpenAITextClient(BaseOpenAIClient):
         model_name = model or self.config.default_model
         model_config = self.config.get_model_config(model_name)
 
-        prompt_tokens = self.estimate_tokens(prompt)
+        prompt_tokens = self.estimate_tokens(prompt, model_name)
 
         prompt_cost = (prompt_tokens / 1000) * model_config.get('cost_per_1k_input_tokens', 0)
         max_completion_cost = (max_tokens / 1000) * model_config.get('cost_per_1k_output_tokens', 0)
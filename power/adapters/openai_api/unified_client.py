@@ -135,9 +135,9 @@ class OpenAIUnifiedClient(AdvancedLLMProvider):
 
     # StreamingLLMProvider interface methods
 
-    def generate_text_stream(self, request: LLMRequest):
+    def generate_text_stream(self, request: LLMRequest, delta_only: bool = False):
         """Generate text with streaming response."""
-        yield from self._streaming_client.generate_text_stream(request)
+        yield from self._streaming_client.generate_text_stream(request, delta_only=delta_only)
 
     def generate_chat_completion_stream(
         self,
@@ -147,6 +147,22 @@ class OpenAIUnifiedClient(AdvancedLLMProvider):
         """Generate chat completion with streaming response."""
         yield from self._streaming_client.generate_chat_completion_stream(messages, **kwargs)
 
+    def astream_text(self, request: LLMRequest, delta_only: bool = False):
+        """Generate text with an async streaming response."""
+        return self._streaming_client.astream_text(request, delta_only=delta_only)
+
+    def astream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        **kwargs
+    ):
+        """Generate chat completion with an async streaming response."""
+        return self._streaming_client.astream_chat_completion(messages, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client used for async streaming."""
+        await self._streaming_client.aclose()
+
     # FunctionCallingLLMProvider interface methods
 
     def generate_with_functions(
@@ -318,9 +334,9 @@ class OpenAIUnifiedClient(AdvancedLLMProvider):
         """Estimate cost for a text generation request."""
         return self._text_client.estimate_cost(prompt, max_tokens, model)
 
-    def estimate_tokens(self, text: str) -> int:
-        """Estimate token count for text."""
-        return self._text_client.estimate_tokens(text)
+    def estimate_tokens(self, text: str, model: Optional[str] = None) -> int:
+        """Count tokens in text with the model's tokenizer."""
+        return self._text_client.estimate_tokens(text, model)
 
     def get_available_models(self) -> List[str]:
         """Get list of available models from OpenAI."""
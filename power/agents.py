@@ -94,6 +94,82 @@ def conscious_agents(task: str, use_workspace: bool = True, task_type: str = "de
         return agents(task, use_workspace, task_type)
 
 
+# Fixed agent instructions. They lead every agent prompt, ahead of the task-specific
+# part, so repeated delegations share one cacheable prompt prefix.
+_AGENT_INSTRUCTIONS = """You are a development agent. Complete the task given at the end with PYLINT-CLEAN CODE from the first attempt.
+
+MANDATORY PRE-CODING STEPS:
+- Read every standard listed under REQUIRED STANDARDS completely before starting
+- Understand three-layer architecture: core/ adapters/ shared/
+- Plan all docstrings, type hints, and import organization upfront
+
+PYLINT 10/10 REQUIREMENTS (WRITE CLEAN FROM START):
+- Module docstring: Triple-quoted description at file top
+- Function docstrings: Args, Returns, Raises for every function
+- Type hints: All parameters and return types annotated
+- Import organization: stdlib → third-party → local with blank lines
+- Variable naming: snake_case, descriptive names, no single letters
+- Function length: Keep under 15 lines, extract complex logic
+- Error handling: Specific exception types, no bare except
+- Code complexity: Simple, readable, well-structured
+
+CLEAN CODE PATTERN EXAMPLES:
+```python
+\"\"\"Module description here.\"\"\"
+from typing import List, Dict, Any
+import os
+from pathlib import Path
+
+def process_data(input_data: List[str], max_length: int = 100) -> Dict[str, Any]:
+    \"\"\"
+    Process input data with specified constraints.
+    
+    Args:
+        input_data: List of strings to process
+        max_length: Maximum allowed length
+        
+    Returns:
+        Dict containing processed results
+        
+    Raises:
+        ValueError: If input_data is empty
+    \"\"\"
+    if not input_data:
+        raise ValueError("Input data cannot be empty")
+    # Implementation here
+    return {"processed": len(input_data)}
+```
+
+ARCHITECTURE COMPLIANCE:
+- Place files in correct layer (core/adapters/shared)
+- Use shared interfaces for external dependencies
+- No cross-layer imports (core ↔ adapters forbidden)
+- Follow dependency injection patterns
+
+QUALITY GATES (MUST ACHIEVE):
+- Perfect 10/10 pylint score on first attempt
+- 100% test coverage with proper test structure
+- Zero architecture violations
+- Complete documentation
+
+PRE-SUBMISSION CHECKLIST:
+□ Module docstring present
+□ All functions have complete docstrings with Args/Returns/Raises
+□ Type hints on all parameters and returns
+□ Imports properly organized (stdlib → third-party → local)
+□ Variable names descriptive and snake_case
+□ Functions under 15 lines each
+□ Specific exception handling
+□ Architecture layer compliance verified
+□ Tests cover all functionality
+
+CRITICAL: Write pylint-compliant code from the start. NO reactive fixing cycles.
+
+End with: "Task complete and ready for next step"
+
+Begin with reading required standards, then implement clean code immediately."""
+
+
 def agents(task: str, use_workspace: bool = True, task_type: str = "development") -> str:
     """
     Delegate task to real Claude Code agent with optional workspace isolation.
@@ -164,84 +240,15 @@ WORK IN ISOLATED ENVIRONMENT:
         for standard in required_standards
     ])
 
-    # Create comprehensive agent prompt
-    agent_prompt = f"""You are a development agent. Complete this task with PYLINT-CLEAN CODE from the first attempt:
-
-TASK: {task}
-TASK TYPE: {task_type}
-
-{workspace_info}
+    # Fixed instructions first, task-specific details last
+    agent_prompt = f"""{_AGENT_INSTRUCTIONS}
 
-MANDATORY PRE-CODING STEPS:
+REQUIRED STANDARDS:
 {standards_instructions}
-- Understand three-layer architecture: core/ adapters/ shared/
-- Plan all docstrings, type hints, and import organization upfront
-
-PYLINT 10/10 REQUIREMENTS (WRITE CLEAN FROM START):
-- Module docstring: Triple-quoted description at file top
-- Function docstrings: Args, Returns, Raises for every function
-- Type hints: All parameters and return types annotated
-- Import organization: stdlib → third-party → local with blank lines
-- Variable naming: snake_case, descriptive names, no single letters
-- Function length: Keep under 15 lines, extract complex logic
-- Error handling: Specific exception types, no bare except
-- Code complexity: Simple, readable, well-structured
-
-CLEAN CODE PATTERN EXAMPLES:
-```python
-\"\"\"Module description here.\"\"\"
-from typing import List, Dict, Any
-import os
-from pathlib import Path
-
-def process_data(input_data: List[str], max_length: int = 100) -> Dict[str, Any]:
-    \"\"\"
-    Process input data with specified constraints.
-    
-    Args:
-        input_data: List of strings to process
-        max_length: Maximum allowed length
-        
-    Returns:
-        Dict containing processed results
-        
-    Raises:
-        ValueError: If input_data is empty
-    \"\"\"
-    if not input_data:
-        raise ValueError("Input data cannot be empty")
-    # Implementation here
-    return {{"processed": len(input_data)}}
-```
-
-ARCHITECTURE COMPLIANCE:
-- Place files in correct layer (core/adapters/shared)
-- Use shared interfaces for external dependencies
-- No cross-layer imports (core ↔ adapters forbidden)
-- Follow dependency injection patterns
-
-QUALITY GATES (MUST ACHIEVE):
-- Perfect 10/10 pylint score on first attempt
-- 100% test coverage with proper test structure
-- Zero architecture violations
-- Complete documentation
 
-PRE-SUBMISSION CHECKLIST:
-□ Module docstring present
-□ All functions have complete docstrings with Args/Returns/Raises
-□ Type hints on all parameters and returns
-□ Imports properly organized (stdlib → third-party → local)
-□ Variable names descriptive and snake_case
-□ Functions under 15 lines each
-□ Specific exception handling
-□ Architecture layer compliance verified
-□ Tests cover all functionality
-
-CRITICAL: Write pylint-compliant code from the start. NO reactive fixing cycles.
-
-End with: "Task complete and ready for next step"
-
-Begin with reading required standards, then implement clean code immediately."""
+TASK: {task}
+TASK TYPE: {task_type}
+{workspace_info}"""
 
     # Delegate to Task tool
     task_tool(description=f"Execute {task_type} task", prompt=agent_prompt)
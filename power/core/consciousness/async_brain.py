@@ -0,0 +1,151 @@
+"""
+Async Power Brain: Non-blocking access to the brain database.
+
+This module wraps PowerBrain for use inside the event loop. Writes are
+serialized on one dedicated writer thread that owns the read-write
+connection; reads run on a pool of read-only WAL connections, so a slow
+write never holds up concurrent memory queries.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, TypeVar
+
+from .brain_database import PowerBrain
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncPowerBrain:
+    """
+    Async facade over PowerBrain with one writer and a pool of readers.
+
+    Every public PowerBrain method is available as a coroutine of the same
+    name. Mutators run on the writer thread; queries run on a reader thread
+    with its own read-only connection. Readers see everything the writer has
+    committed, so with ``write_behind`` enabled on the writer, queued writes
+    only become visible to readers once they are flushed.
+    """
+
+    _WRITE_METHODS = frozenset({
+        "update_working_memory", "add_task", "update_task_status", "log_thought",
+        "store_memory", "store_memories_bulk", "index_memory_concepts",
+        "cache_embeddings", "update_memory_embeddings", "add_knowledge_edge",
+        "add_knowledge_edges_bulk", "flush",
+    })
+
+    _READ_METHODS = frozenset({
+        "get_working_memory", "get_next_task", "search_memories", "get_memory",
+        "get_memories", "get_memory_embeddings", "count_embedded_memories",
+        "get_memory_concepts", "get_memories_by_concepts",
+        "get_memories_without_concepts", "get_memories_with_stale_embeddings",
+        "get_cached_embeddings",
+        "get_related_concepts", "get_related_concepts_bulk", "get_knowledge_edges",
+        "get_relationships_by_type", "get_brain_stats",
+    })
+
+    def __init__(self, brain: Optional[PowerBrain] = None,
+                 brain_path: Optional[str] = None, max_readers: int = 4):
+        """
+        Initialize the async brain.
+
+        Args:
+            brain: Existing read-write PowerBrain to use as the writer
+            brain_path: Path used to open a writer when ``brain`` is not given
+            max_readers: Size of the read-only connection pool
+        """
+        self._owns_brain = brain is None
+        self.brain = brain or PowerBrain(brain_path)
+        self.max_readers = max_readers
+
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="brain-writer")
+        self._readers = ThreadPoolExecutor(max_workers=max_readers,
+                                           thread_name_prefix="brain-reader")
+        self._reader_local = threading.local()
+        self._reader_brains: List[PowerBrain] = []
+        self._reader_lock = threading.Lock()
+
+        # An in-memory database is private to its connection, so it has no readers
+        self._pooled_reads = self.brain.brain_path != ":memory:"
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name in self._WRITE_METHODS:
+            return functools.partial(self.run_write, getattr(PowerBrain, name))
+        if name in self._READ_METHODS:
+            return functools.partial(self.run_read, getattr(PowerBrain, name))
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    async def run_write(self, operation: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run ``operation(writer_brain, *args, **kwargs)`` on the writer thread.
+
+        Args:
+            operation: Callable taking the writer PowerBrain as first argument
+
+        Returns:
+            The operation's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._writer, functools.partial(operation, self.brain, *args, **kwargs)
+        )
+
+    async def run_read(self, operation: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run ``operation(reader_brain, *args, **kwargs)`` on a pooled reader.
+
+        Args:
+            operation: Callable taking a read-only PowerBrain as first argument
+
+        Returns:
+            The operation's result
+        """
+        if not self._pooled_reads:
+            return await self.run_write(operation, *args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._readers,
+            lambda: operation(self._reader_brain(), *args, **kwargs)
+        )
+
+    async def close(self) -> None:
+        """Drain both pools, close reader connections and flush the writer."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._shutdown)
+
+    def _shutdown(self) -> None:
+        """Blocking part of :meth:`close`."""
+        self._readers.shutdown(wait=True)
+        self._writer.shutdown(wait=True)
+        with self._reader_lock:
+            for reader in self._reader_brains:
+                reader.close()
+            self._reader_brains.clear()
+        if self._owns_brain:
+            self.brain.close()
+        else:
+            self.brain.flush()
+
+    def _reader_brain(self) -> PowerBrain:
+        """Return this reader thread's read-only brain, opening it on first use."""
+        reader = getattr(self._reader_local, "brain", None)
+        if reader is None:
+            reader = PowerBrain(self.brain.brain_path, read_only=True)
+            self._reader_local.brain = reader
+            with self._reader_lock:
+                self._reader_brains.append(reader)
+        return reader
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
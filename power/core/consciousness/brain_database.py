@@ -7,11 +7,13 @@ task queues, thought logs, knowledge stores, and symbolic relationships.
 
 import sqlite3
 import json
+import threading
 import time
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -72,33 +74,85 @@ class MemoryRecord:  # pylint: disable=too-many-instance-attributes
     last_accessed: datetime = None
     embedding_vector: Optional[bytes] = None
     access_count: int = 0
+    embedding_model: Optional[str] = None
 
     def __post_init__(self):
         if self.last_accessed is None:
             self.last_accessed = self.created_at
 
 
-class PowerBrain:
+class PowerBrain:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """
     The persistent brain database for AI consciousness.
 
     Provides ACID-compliant storage for working memory, task queues,
     thought logs, episodic memory, and symbolic knowledge graphs.
+
+    With ``write_behind`` enabled, mutators queue their statements and the
+    queue is committed in one transaction once ``flush_size`` writes are
+    pending or ``flush_interval`` seconds have passed. Every read flushes
+    first, so callers always see their own writes, and ``close()`` forces a
+    final flush.
+    """
+
+    _STORE_MEMORY_SQL = """
+        INSERT OR REPLACE INTO knowledge_store
+        (memory_id, content, embedding_vector, memory_type, source_type,
+         confidence_score, created_at, last_accessed, access_count, embedding_model)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     """
 
-    def __init__(self, brain_path: Optional[str] = None):
+    _ADD_EDGE_SQL = """
+        INSERT OR REPLACE INTO knowledge_graph
+        (edge_id, source_node, target_node, relationship_type, confidence, evidence)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    def __init__(self, brain_path: Optional[str] = None, write_behind: bool = False,
+                 flush_size: int = 100, flush_interval: float = 1.0,
+                 read_only: bool = False):
         """
         Initialize the Power Brain database.
 
         Args:
             brain_path: Path to SQLite database file (defaults to power_brain.db)
+            write_behind: Queue writes and commit them in batches instead of one by one
+            flush_size: Number of queued writes that triggers a flush
+            flush_interval: Seconds after the first queued write before a flush
+            read_only: Open an existing brain as a read-only WAL reader
         """
         self.brain_path = brain_path or "power_brain.db"
+        self.read_only = read_only
         self.connection: Optional[sqlite3.Connection] = None
+
+        # Write-behind queue: ordered (sql, params) pairs plus a coalescing map
+        self.write_behind = write_behind
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._pending_writes: List[Tuple[str, tuple]] = []
+        self._coalesced_writes: Dict[Tuple[str, Any], int] = {}
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+
+        # Callbacks notified with (source, target, relationship, confidence, evidence) edges
+        self._edge_listeners: List[Callable[[List[Tuple[str, str, str, float, str]]], None]] = []
+
         self._initialize_database()
 
     def _initialize_database(self) -> None:
         """Create database schema and initialize brain structures."""
+        if self.read_only:
+            # Readers never write, so they never wait on the writer's lock in WAL mode
+            self.connection = sqlite3.connect(
+                f"{Path(self.brain_path).resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                timeout=30.0
+            )
+            self.connection.execute("PRAGMA query_only = ON")
+            logger.debug("Power Brain reader opened: %s", self.brain_path)
+            return
+
         self.connection = sqlite3.connect(
             self.brain_path,
             check_same_thread=False,
@@ -168,7 +222,8 @@ class PowerBrain:
                 confidence_score REAL DEFAULT 1.0,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                access_count INTEGER DEFAULT 0
+                access_count INTEGER DEFAULT 0,
+                embedding_model TEXT
             )
             """,
 
@@ -185,6 +240,25 @@ class PowerBrain:
             )
             """,
 
+            # Concept Index: Inverted concept -> memory lookup for associations
+            """
+            CREATE TABLE IF NOT EXISTS concept_index (
+                concept TEXT NOT NULL,
+                memory_id TEXT NOT NULL,
+                PRIMARY KEY (concept, memory_id)
+            ) WITHOUT ROWID
+            """,
+
+            # Embedding Cache: Content-hash keyed vectors shared across restarts
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                content_hash TEXT PRIMARY KEY,
+                model_name TEXT NOT NULL,
+                embedding_vector BLOB NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+
             # Agent Performance: Learning and improvement
             """
             CREATE TABLE IF NOT EXISTS agent_performance (
@@ -203,6 +277,7 @@ class PowerBrain:
 
         for statement in schema_statements:
             self.connection.execute(statement)
+        self._migrate_schema()
 
         # Create indexes for performance
         indexes = [
@@ -212,7 +287,10 @@ class PowerBrain:
             "CREATE INDEX IF NOT EXISTS idx_memory_accessed ON knowledge_store(last_accessed DESC)",
             "CREATE INDEX IF NOT EXISTS idx_thought_timestamp ON thought_log(timestamp DESC)",
             "CREATE INDEX IF NOT EXISTS idx_graph_source ON knowledge_graph(source_node)",
-            "CREATE INDEX IF NOT EXISTS idx_graph_target ON knowledge_graph(target_node)"
+            "CREATE INDEX IF NOT EXISTS idx_graph_target ON knowledge_graph(target_node)",
+            "CREATE INDEX IF NOT EXISTS idx_graph_type_confidence "
+            "ON knowledge_graph(relationship_type, confidence DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_concept_memory ON concept_index(memory_id)"
         ]
 
         for index in indexes:
@@ -220,9 +298,15 @@ class PowerBrain:
 
         self.connection.commit()
 
+    def _migrate_schema(self) -> None:
+        """Add columns introduced after a brain database was created."""
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(knowledge_store)")}
+        if "embedding_model" not in columns:
+            self.connection.execute("ALTER TABLE knowledge_store ADD COLUMN embedding_model TEXT")
+
     def update_working_memory(self, state: WorkingMemoryState) -> None:
         """Update the current cognitive state."""
-        self.connection.execute(
+        self._write(
             """
             INSERT OR REPLACE INTO working_memory
             (session_id, current_goal_id, current_task_id, cognitive_state,
@@ -236,17 +320,17 @@ class PowerBrain:
                 state.cognitive_state,
                 json.dumps(state.context_data),
                 state.last_update
-            )
+            ),
+            coalesce_key=("working_memory", state.session_id)
         )
-        self.connection.commit()
 
     def get_working_memory(self, session_id: str) -> Optional[WorkingMemoryState]:
         """Retrieve current cognitive state."""
-        cursor = self.connection.execute(
+        rows = self._read(
             "SELECT * FROM working_memory WHERE session_id = ?",
             (session_id,)
         )
-        row = cursor.fetchone()
+        row = rows[0] if rows else None
 
         if not row:
             return None
@@ -262,7 +346,7 @@ class PowerBrain:
 
     def add_task(self, task: TaskRecord) -> None:
         """Add a new task to the queue."""
-        self.connection.execute(
+        self._write(
             """
             INSERT INTO task_queue
             (task_id, parent_goal_id, description, task_type, status, priority,
@@ -284,7 +368,6 @@ class PowerBrain:
                 task.completion_signal
             )
         )
-        self.connection.commit()
 
     def get_next_task(self, agent_type: Optional[str] = None) -> Optional[TaskRecord]:
         """Get the highest priority pending task."""
@@ -297,8 +380,8 @@ class PowerBrain:
 
         query += " ORDER BY priority DESC, created_at ASC LIMIT 1"
 
-        cursor = self.connection.execute(query, params)
-        row = cursor.fetchone()
+        rows = self._read(query, params)
+        row = rows[0] if rows else None
 
         if not row:
             return None
@@ -317,12 +400,11 @@ class PowerBrain:
 
         query += " WHERE task_id = ?"
 
-        self.connection.execute(query, params)
-        self.connection.commit()
+        self._write(query, tuple(params))
 
     def log_thought(self, thought: ThoughtRecord) -> None:
         """Log a thought/decision for introspection."""
-        self.connection.execute(
+        self._write(
             """
             INSERT INTO thought_log
             (thought_id, timestamp, decision_type, reasoning, context,
@@ -340,30 +422,15 @@ class PowerBrain:
                 thought.learning_extracted
             )
         )
-        self.connection.commit()
 
     def store_memory(self, memory: MemoryRecord) -> None:
         """Store a memory with optional vector embedding."""
-        self.connection.execute(
-            """
-            INSERT OR REPLACE INTO knowledge_store
-            (memory_id, content, embedding_vector, memory_type, source_type,
-             confidence_score, created_at, last_accessed, access_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                memory.memory_id,
-                memory.content,
-                memory.embedding_vector,
-                memory.memory_type,
-                memory.source_type,
-                memory.confidence_score,
-                memory.created_at,
-                memory.last_accessed,
-                memory.access_count
-            )
-        )
-        self.connection.commit()
+        self._write(self._STORE_MEMORY_SQL, self._memory_params(memory))
+
+    def store_memories_bulk(self, memories: List[MemoryRecord]) -> None:
+        """Store many memories in a single transaction."""
+        self._write_many(self._STORE_MEMORY_SQL,
+                         [self._memory_params(memory) for memory in memories])
 
     def search_memories(self, memory_type: Optional[str] = None,
                        limit: int = 10) -> List[MemoryRecord]:
@@ -378,25 +445,201 @@ class PowerBrain:
         query += " ORDER BY last_accessed DESC LIMIT ?"
         params.append(limit)
 
-        cursor = self.connection.execute(query, params)
-        return [self._row_to_memory_record(row) for row in cursor.fetchall()]
+        rows = self._read(query, params)
+        return [self._row_to_memory_record(row) for row in rows]
+
+    def get_memory(self, memory_id: str) -> Optional[MemoryRecord]:
+        """Fetch a single memory by ID."""
+        rows = self._read(
+            "SELECT * FROM knowledge_store WHERE memory_id = ?",
+            (memory_id,)
+        )
+        return self._row_to_memory_record(rows[0]) if rows else None
+
+    def get_memories(self, memory_ids: List[str]) -> List[MemoryRecord]:
+        """Fetch memories by ID, preserving the order of the given IDs."""
+        if not memory_ids:
+            return []
+
+        placeholders = ",".join("?" * len(memory_ids))
+        rows = self._read(
+            f"SELECT * FROM knowledge_store WHERE memory_id IN ({placeholders})",
+            list(memory_ids)
+        )
+        records = {row[0]: self._row_to_memory_record(row) for row in rows}
+        return [records[memory_id] for memory_id in memory_ids if memory_id in records]
+
+    def get_memory_embeddings(self) -> List[Tuple[str, str, bytes]]:
+        """Get (memory_id, memory_type, embedding_vector) for every embedded memory."""
+        return self._read(
+            """
+            SELECT memory_id, memory_type, embedding_vector
+            FROM knowledge_store
+            WHERE embedding_vector IS NOT NULL
+            """
+        )
+
+    def count_embedded_memories(self) -> int:
+        """Count the memories that carry an embedding vector."""
+        rows = self._read(
+            "SELECT COUNT(*) FROM knowledge_store WHERE embedding_vector IS NOT NULL"
+        )
+        return rows[0][0]
+
+    def index_memory_concepts(self, memory_id: str, concepts: List[str]) -> None:
+        """Record the concepts mentioned by a memory in the inverted concept index."""
+        if not concepts:
+            return
+
+        self._write_many(
+            "INSERT OR IGNORE INTO concept_index (concept, memory_id) VALUES (?, ?)",
+            [(concept, memory_id) for concept in concepts]
+        )
+
+    def get_memory_concepts(self, memory_id: str) -> List[str]:
+        """Get the concepts indexed for a memory."""
+        rows = self._read(
+            "SELECT concept FROM concept_index WHERE memory_id = ?",
+            (memory_id,)
+        )
+        return [row[0] for row in rows]
+
+    def get_memories_by_concepts(self, concepts: List[str],
+                                 exclude_memory_id: Optional[str] = None,
+                                 limit: int = 10) -> List[MemoryRecord]:
+        """Get memories mentioning any of the concepts, most shared concepts first."""
+        if not concepts:
+            return []
+
+        placeholders = ",".join("?" * len(concepts))
+        rows = self._read(
+            f"""
+            SELECT k.* FROM knowledge_store k
+            JOIN (
+                SELECT memory_id, COUNT(*) AS matches
+                FROM concept_index
+                WHERE concept IN ({placeholders}) AND memory_id != ?
+                GROUP BY memory_id
+            ) c ON c.memory_id = k.memory_id
+            ORDER BY c.matches DESC, k.confidence_score DESC, k.last_accessed DESC
+            LIMIT ?
+            """,
+            [*concepts, exclude_memory_id or "", limit]
+        )
+        return [self._row_to_memory_record(row) for row in rows]
+
+    def get_memories_without_concepts(self) -> List[Tuple[str, str]]:
+        """Get (memory_id, content) for memories missing from the concept index."""
+        return self._read(
+            """
+            SELECT memory_id, content FROM knowledge_store k
+            WHERE NOT EXISTS (SELECT 1 FROM concept_index c WHERE c.memory_id = k.memory_id)
+            """
+        )
+
+    def get_cached_embeddings(self, content_hashes: List[str]) -> Dict[str, bytes]:
+        """Look up cached embeddings by content hash."""
+        if not content_hashes:
+            return {}
+
+        placeholders = ",".join("?" * len(content_hashes))
+        rows = self._read(
+            f"""
+            SELECT content_hash, embedding_vector FROM embedding_cache
+            WHERE content_hash IN ({placeholders})
+            """,
+            list(content_hashes)
+        )
+        return dict(rows)
+
+    def cache_embeddings(self, entries: List[Tuple[str, str, bytes]]) -> None:
+        """Store (content_hash, model_name, embedding_vector) entries in one transaction."""
+        if not entries:
+            return
+
+        self._write_many(
+            """
+            INSERT OR REPLACE INTO embedding_cache
+            (content_hash, model_name, embedding_vector)
+            VALUES (?, ?, ?)
+            """,
+            entries
+        )
+
+    def get_memories_with_stale_embeddings(self, model_name: str) -> List[Tuple[str, str]]:
+        """Get (memory_id, content) for embedded memories not embedded by the given model."""
+        return self._read(
+            """
+            SELECT memory_id, content FROM knowledge_store
+            WHERE embedding_vector IS NOT NULL
+              AND (embedding_model IS NULL OR embedding_model != ?)
+            """,
+            (model_name,)
+        )
+
+    def update_memory_embeddings(self, embeddings: List[Tuple[str, bytes]],
+                                 model_name: str) -> None:
+        """Replace the embedding of existing memories given (memory_id, embedding) pairs."""
+        if not embeddings:
+            return
+
+        self._write_many(
+            "UPDATE knowledge_store SET embedding_vector = ?, embedding_model = ? "
+            "WHERE memory_id = ?",
+            [(embedding, model_name, memory_id) for memory_id, embedding in embeddings]
+        )
 
     def add_knowledge_edge(self, source: str, target: str, relationship: str,
                           **kwargs) -> None:
         """Add a relationship to the knowledge graph."""
         confidence = kwargs.get('confidence', 1.0)
         evidence = kwargs.get('evidence', '')
-        edge_id = f"{source}_{relationship}_{target}_{int(time.time())}"
+        self._write(self._ADD_EDGE_SQL,
+                    self._edge_params(source, target, relationship, confidence, evidence))
+        self._notify_edge_listeners([(source, target, relationship, confidence, evidence)])
+
+    def add_knowledge_edges_bulk(self, edges: List[Tuple[str, str, str, float, str]]) -> None:
+        """Add (source, target, relationship, confidence, evidence) edges in one transaction."""
+        self._write_many(self._ADD_EDGE_SQL, [self._edge_params(*edge) for edge in edges])
+        self._notify_edge_listeners(edges)
+
+    def get_knowledge_edges(self) -> List[Tuple[str, str, str, float]]:
+        """Get every (source, target, relationship, confidence) edge in the knowledge graph."""
+        return self._read(
+            "SELECT source_node, target_node, relationship_type, confidence FROM knowledge_graph"
+        )
+
+    def get_relationships_by_type(self, relationship_type: str, min_confidence: float = 0.0,
+                                  limit: Optional[int] = None) -> List[Tuple[str, str, float, str]]:
+        """
+        Get (source, target, confidence, evidence) edges of one type, highest confidence first.
 
-        self.connection.execute(
+        Repeated observations of an edge are stored as separate rows; each
+        edge is returned once, with its most confident row's evidence.
+        """
+        # SQLite takes bare columns from the row holding MAX(confidence)
+        return self._read(
             """
-            INSERT OR REPLACE INTO knowledge_graph
-            (edge_id, source_node, target_node, relationship_type, confidence, evidence)
-            VALUES (?, ?, ?, ?, ?, ?)
+            SELECT source_node, target_node, MAX(confidence), evidence
+            FROM knowledge_graph
+            WHERE relationship_type = ? AND confidence >= ?
+            GROUP BY source_node, target_node
+            ORDER BY MAX(confidence) DESC
+            LIMIT ?
             """,
-            (edge_id, source, target, relationship, confidence, evidence)
+            (relationship_type, min_confidence, -1 if limit is None else limit)
         )
-        self.connection.commit()
+
+    def add_edge_listener(self,
+                          listener: Callable[[List[Tuple[str, str, str, float, str]]], None]) -> None:
+        """Register a callback invoked with the edges of every knowledge graph write."""
+        self._edge_listeners.append(listener)
+
+    def remove_edge_listener(self,
+                             listener: Callable[[List[Tuple[str, str, str, float, str]]], None]) -> None:
+        """Unregister a callback added with :meth:`add_edge_listener`."""
+        if listener in self._edge_listeners:
+            self._edge_listeners.remove(listener)
 
     def get_related_concepts(self, concept: str,
                             max_depth: int = 2) -> List[Tuple[str, str, float]]:
@@ -406,7 +649,7 @@ class PowerBrain:
         related = []
 
         # Direct relationships
-        cursor = self.connection.execute(
+        rows = self._read(
             """
             SELECT target_node, relationship_type, confidence
             FROM knowledge_graph
@@ -420,34 +663,173 @@ class PowerBrain:
             (concept, concept)
         )
 
-        related.extend(cursor.fetchall())
+        related.extend(rows)
         return related[:20]  # Limit results
 
+    def get_related_concepts_bulk(self, concepts: List[str],
+                                  limit: int = 20) -> List[Tuple[str, str, float]]:
+        """Get concepts related to any of the given concepts in a single query."""
+        if not concepts:
+            return []
+
+        placeholders = ",".join("?" * len(concepts))
+        return self._read(
+            f"""
+            SELECT target_node, relationship_type, confidence
+            FROM knowledge_graph
+            WHERE source_node IN ({placeholders})
+            UNION
+            SELECT source_node, relationship_type, confidence
+            FROM knowledge_graph
+            WHERE target_node IN ({placeholders})
+            ORDER BY confidence DESC
+            LIMIT ?
+            """,
+            [*concepts, *concepts, limit]
+        )
+
     def get_brain_stats(self) -> Dict[str, Any]:
         """Get comprehensive brain statistics."""
         stats = {}
 
         tables = ['working_memory', 'task_queue', 'thought_log',
-                 'knowledge_store', 'knowledge_graph', 'agent_performance']
+                 'knowledge_store', 'knowledge_graph', 'agent_performance',
+                 'embedding_cache']
 
         for table in tables:
-            cursor = self.connection.execute(f"SELECT COUNT(*) FROM {table}")
-            stats[f"{table}_count"] = cursor.fetchone()[0]
+            rows = self._read(f"SELECT COUNT(*) FROM {table}")
+            stats[f"{table}_count"] = rows[0][0]
 
         # Task status distribution
-        cursor = self.connection.execute(
+        rows = self._read(
             "SELECT status, COUNT(*) FROM task_queue GROUP BY status"
         )
-        stats['task_status'] = dict(cursor.fetchall())
+        stats['task_status'] = dict(rows)
 
         # Memory type distribution
-        cursor = self.connection.execute(
+        rows = self._read(
             "SELECT memory_type, COUNT(*) FROM knowledge_store GROUP BY memory_type"
         )
-        stats['memory_types'] = dict(cursor.fetchall())
+        stats['memory_types'] = dict(rows)
 
         return stats
 
+    def flush(self) -> None:
+        """Commit every queued write-behind statement in a single transaction."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending_writes or self.connection is None:
+                return
+
+            pending = self._pending_writes
+            self._pending_writes = []
+            self._coalesced_writes = {}
+
+            # Consecutive writes of the same statement go through one executemany
+            try:
+                with self.connection:
+                    start = 0
+                    while start < len(pending):
+                        sql = pending[start][0]
+                        end = start
+                        while end < len(pending) and pending[end][0] == sql:
+                            end += 1
+                        self.connection.executemany(
+                            sql, [params for _, params in pending[start:end]]
+                        )
+                        start = end
+            except sqlite3.Error as e:
+                # One bad row must not drop the whole batch: replay individually
+                logger.warning("Batched brain flush failed (%s), replaying %d writes",
+                               e, len(pending))
+                for sql, params in pending:
+                    try:
+                        with self.connection:
+                            self.connection.execute(sql, params)
+                    except sqlite3.Error as row_error:
+                        logger.error("Dropped queued brain write: %s", row_error)
+
+            logger.debug("Flushed %d queued brain writes", len(pending))
+
+    def _write(self, sql: str, params: tuple, coalesce_key: Optional[Tuple[str, Any]] = None) -> None:
+        """Execute a write now, or queue it when write-behind is enabled."""
+        with self._lock:
+            if not self.write_behind:
+                self.connection.execute(sql, params)
+                self.connection.commit()
+                return
+
+            # A later full-row replace supersedes a queued one for the same key
+            if coalesce_key is not None and coalesce_key in self._coalesced_writes:
+                self._pending_writes[self._coalesced_writes[coalesce_key]] = (sql, params)
+                return
+            if coalesce_key is not None:
+                self._coalesced_writes[coalesce_key] = len(self._pending_writes)
+            self._pending_writes.append((sql, params))
+            self._schedule_flush()
+
+    def _write_many(self, sql: str, rows: List[tuple]) -> None:
+        """Execute a batch of writes in one transaction, or queue them."""
+        if not rows:
+            return
+        with self._lock:
+            if not self.write_behind:
+                with self.connection:
+                    self.connection.executemany(sql, rows)
+                return
+
+            self._pending_writes.extend((sql, params) for params in rows)
+            self._schedule_flush()
+
+    def _notify_edge_listeners(self, edges: List[Tuple[str, str, str, float, str]]) -> None:
+        """Forward written edges to listeners; a failing listener never fails the write."""
+        for listener in list(self._edge_listeners):
+            try:
+                listener(edges)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning("Knowledge edge listener failed: %s", e)
+
+    def _read(self, sql: str, params=()) -> List[tuple]:
+        """Run a query after flushing queued writes so reads see them."""
+        with self._lock:
+            if self._pending_writes:
+                self.flush()
+            return self.connection.execute(sql, params).fetchall()
+
+    def _schedule_flush(self) -> None:
+        """Flush on the size threshold, or arm the time-threshold timer."""
+        if len(self._pending_writes) >= self.flush_size:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    @staticmethod
+    def _memory_params(memory: MemoryRecord) -> tuple:
+        """Build knowledge_store insert parameters for a memory."""
+        return (
+            memory.memory_id,
+            memory.content,
+            memory.embedding_vector,
+            memory.memory_type,
+            memory.source_type,
+            memory.confidence_score,
+            memory.created_at,
+            memory.last_accessed,
+            memory.access_count,
+            memory.embedding_model
+        )
+
+    @staticmethod
+    def _edge_params(source: str, target: str, relationship: str,
+                     confidence: float = 1.0, evidence: str = '') -> tuple:
+        """Build knowledge_graph insert parameters for an edge."""
+        edge_id = f"{source}_{relationship}_{target}_{int(time.time())}"
+        return (edge_id, source, target, relationship, confidence, evidence)
+
     def _row_to_task_record(self, row) -> TaskRecord:
         """Convert database row to TaskRecord."""
         return TaskRecord(
@@ -475,14 +857,17 @@ class PowerBrain:
             confidence_score=row[5],
             created_at=datetime.fromisoformat(row[6]),
             last_accessed=datetime.fromisoformat(row[7]),
-            access_count=row[8]
+            access_count=row[8],
+            embedding_model=row[9]
         )
 
     def close(self) -> None:
-        """Close the brain database connection."""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Flush queued writes and close the brain database connection."""
+        with self._lock:
+            self.flush()
+            if self.connection:
+                self.connection.close()
+                self.connection = None
 
     def __enter__(self):
         """Context manager entry."""
@@ -266,14 +266,13 @@ class CognitiveEngine:  # pylint: disable=too-many-instance-attributes
 
         relevant_memories = []
 
-        # Search for memories related to pending tasks
-        for task in perception.pending_tasks:
-            task_memories = self.memory_manager.search_memories(
-                query=task.description,
-                memory_type="task_execution",
-                limit=3
-            )
-
+        # Search for memories related to pending tasks (one batched lookup)
+        task_results = self.memory_manager.search_memories_batch(
+            queries=[task.description for task in perception.pending_tasks],
+            memory_type="task_execution",
+            limit=3
+        )
+        for task_memories in task_results:
             for memory_result in task_memories:
                 relevant_memories.append({
                     "type": "task_memory",
@@ -290,12 +289,12 @@ class CognitiveEngine:  # pylint: disable=too-many-instance-attributes
             pass
 
         # Search for relevant knowledge based on environment changes
-        for change_type, change_data in perception.environment_changes.items():
-            change_memories = self.memory_manager.search_memories(
-                query=f"{change_type} {str(change_data)}",
-                limit=2
-            )
-
+        change_results = self.memory_manager.search_memories_batch(
+            queries=[f"{change_type} {str(change_data)}"
+                     for change_type, change_data in perception.environment_changes.items()],
+            limit=2
+        )
+        for change_memories in change_results:
             for memory_result in change_memories:
                 relevant_memories.append({
                     "type": "environment_memory",
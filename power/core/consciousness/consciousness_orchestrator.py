@@ -11,6 +11,7 @@ import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Callable
 
+from .async_brain import AsyncPowerBrain
 from .brain_database import PowerBrain
 from .memory_manager import MemoryManager, MemoryContext
 from .cognitive_loop import CognitiveEngine, CognitiveContext
@@ -31,20 +32,23 @@ class ConsciousnessOrchestrator:  # pylint: disable=too-many-instance-attributes
     providing intelligent task delegation, memory-based decisions, and continuous learning.
     """
 
-    def __init__(self, brain_path: Optional[str] = None, user_id: str = "default_user"):
+    def __init__(self, brain_path: Optional[str] = None, user_id: str = "default_user",
+                 write_behind: bool = False):
         """
         Initialize the Consciousness Orchestrator.
 
         Args:
             brain_path: Path to the brain database file
             user_id: User identifier for this session
+            write_behind: Batch brain writes from the cognitive loop (see PowerBrain)
         """
         self.user_id = user_id
         self.session_id = f"conscious_session_{uuid.uuid4().hex[:8]}"
 
         # Initialize core consciousness components
-        self.brain = PowerBrain(brain_path)
-        self.memory_manager = MemoryManager(self.brain)
+        self.brain = PowerBrain(brain_path, write_behind=write_behind)
+        self.async_brain = AsyncPowerBrain(self.brain)
+        self.memory_manager = MemoryManager(self.brain, async_brain=self.async_brain)
         self.decision_engine = DecisionEngine()
         self.cognitive_engine = CognitiveEngine(
             self.brain, self.memory_manager, self.decision_engine, self.session_id
@@ -293,7 +297,7 @@ class ConsciousnessOrchestrator:  # pylint: disable=too-many-instance-attributes
         cognitive_status = self.cognitive_engine.get_consciousness_status()
 
         # Get brain statistics
-        brain_stats = self.brain.get_brain_stats()
+        brain_stats = await self.async_brain.get_brain_stats()
 
         # Get memory insights
         memory_context = MemoryContext(
@@ -458,4 +462,6 @@ class ConsciousnessOrchestrator:  # pylint: disable=too-many-instance-attributes
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self.stop_consciousness()
+        self.memory_manager.save_index()
+        await self.async_brain.close()
         self.brain.close()
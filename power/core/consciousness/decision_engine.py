@@ -6,8 +6,10 @@ LLM system (OpenAI, Gemini, Claude, Perplexity) for sophisticated reasoning
 and decision-making capabilities.
 """
 
+import asyncio
 import json
 import logging
+import time
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from enum import Enum
@@ -15,6 +17,7 @@ from enum import Enum
 from shared.interfaces.llm_provider import LLMProvider
 from shared.models.llm_request import LLMRequest
 from shared.exceptions import LLMProviderError
+from shared.utils.latency import LatencyTracker
 
 logger = logging.getLogger(__name__)
 
@@ -59,10 +62,31 @@ class DecisionEngine:
     sophisticated reasoning capabilities for the cognitive loop.
     """
 
-    def __init__(self):
-        """Initialize the Decision Engine."""
+    # Providers asked for a consensus decision, in order of preference
+    CONSENSUS_PROVIDERS = ("openai", "claude", "gemini")
+
+    # Latency samples needed before a provider's own p90 sets its hedge delay
+    MIN_HEDGE_SAMPLES = 5
+
+    def __init__(self, consensus_timeout_seconds: float = 30.0,
+                 hedge_urgency_level: int = 8,
+                 default_hedge_delay_seconds: float = 2.0):
+        """
+        Initialize the Decision Engine.
+
+        Args:
+            consensus_timeout_seconds: Deadline for each provider's consensus answer
+            hedge_urgency_level: Urgency at which slow decisions are hedged with
+                a second provider (above 10 disables hedging)
+            default_hedge_delay_seconds: Hedge delay used until a provider has
+                enough latency samples for its own p90
+        """
+        self.consensus_timeout_seconds = consensus_timeout_seconds
+        self.hedge_urgency_level = hedge_urgency_level
+        self.default_hedge_delay_seconds = default_hedge_delay_seconds
         self.provider_registry: Dict[str, LLMProvider] = {}
         self.provider_performance: Dict[str, Dict[str, float]] = {}
+        self.provider_latency: Dict[str, LatencyTracker] = {}
         self.reasoning_templates: Dict[str, str] = {}
         self._initialize_reasoning_templates()
 
@@ -82,6 +106,7 @@ class DecisionEngine:
             "total_calls": 0,
             "successful_calls": 0
         }
+        self.provider_latency[name] = LatencyTracker()
         logger.info("Registered LLM provider: %s", name)
 
     async def make_decision(self, context: ReasoningContext,
@@ -107,29 +132,17 @@ class DecisionEngine:
             return self._fallback_decision(context)
 
         try:
-            # Generate the reasoning prompt
-            prompt = self._build_reasoning_prompt(context, reasoning_mode)
-
-            # Make the LLM call
-            provider = self.provider_registry[provider_name]
-            request = LLMRequest(
-                prompt=prompt,
-                model=self._get_optimal_model(provider_name, reasoning_mode),
-                max_tokens=2048,
-                temperature=0.3  # Lower temperature for more consistent reasoning
-            )
-
-            response = await provider.generate_response(request)
-
-            # Parse the response into a structured decision
-            decision_result = self._parse_decision_response(
-                response.content, provider_name, reasoning_mode
-            )
-
-            # Update provider performance
-            self._update_provider_performance(provider_name, True)
+            if context.urgency_level >= self.hedge_urgency_level:
+                decision_result = await self._hedged_decision(
+                    provider_name, context, reasoning_mode
+                )
+            else:
+                decision_result = await self._decide_with_provider(
+                    provider_name, context, reasoning_mode
+                )
 
-            logger.info("Decision made using %s: %s", provider_name, decision_result.decision)
+            logger.info("Decision made using %s: %s",
+                        decision_result.provider_used, decision_result.decision)
             return decision_result
 
         except LLMProviderError as e:
@@ -141,37 +154,185 @@ class DecisionEngine:
             logger.error("Unexpected error in decision making: %s", e)
             return self._fallback_decision(context)
 
-    async def get_consensus_decision(self, context: ReasoningContext) -> DecisionResult:
+    async def get_consensus_decision(self, context: ReasoningContext,
+                                     quorum: Optional[int] = None) -> DecisionResult:
         """
         Get consensus decision from multiple providers.
 
+        Every consensus provider is asked concurrently, each under its own
+        deadline, and answers are tallied as they arrive. Once ``quorum``
+        providers agree the remaining calls are cancelled, so consensus
+        takes as long as the slowest provider needed, not the sum of all.
+
         Args:
             context: Reasoning context
+            quorum: Agreeing answers needed to stop early (default: a majority)
 
         Returns:
             Consensus decision result
         """
-        decisions = []
-        providers_used = []
-
-        # Get decisions from multiple providers
-        for provider_name in ["openai", "claude", "gemini"]:
-            if provider_name in self.provider_registry:
-                try:
-                    provider_decision = await self.make_decision(
-                        context, ReasoningMode.FAST_DECISION
-                    )
-                    decisions.append(provider_decision)
+        names = [name for name in self.CONSENSUS_PROVIDERS if name in self.provider_registry]
+        if not names:
+            return self._fallback_decision(context)
+
+        quorum = quorum or len(names) // 2 + 1
+        tasks = {
+            asyncio.ensure_future(asyncio.wait_for(
+                self._decide_with_provider(name, context, ReasoningMode.FAST_DECISION),
+                timeout=self.consensus_timeout_seconds
+            )): name
+            for name in names
+        }
+
+        decisions: List[DecisionResult] = []
+        providers_used: List[str] = []
+        agreement: Dict[str, int] = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    provider_name = tasks[task]
+                    try:
+                        decision_result = task.result()
+                    except asyncio.TimeoutError:
+                        logger.warning("Provider %s timed out in consensus", provider_name)
+                        self._update_provider_performance(provider_name, False)
+                        continue
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        logger.warning("Provider %s failed in consensus: %s", provider_name, e)
+                        self._update_provider_performance(provider_name, False)
+                        continue
+
+                    decisions.append(decision_result)
                     providers_used.append(provider_name)
-                except Exception as e:  # pylint: disable=broad-exception-caught
-                    logger.warning("Provider %s failed in consensus: %s", provider_name, e)
+                    key = self._normalize_decision(decision_result.decision)
+                    agreement[key] = agreement.get(key, 0) + 1
+
+                if agreement and max(agreement.values()) >= quorum:
+                    logger.debug("Consensus quorum of %d reached", quorum)
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
 
         if not decisions:
             return self._fallback_decision(context)
 
-        # Analyze consensus
-        consensus_result = self._analyze_consensus(decisions, providers_used)
-        return consensus_result
+        return self._analyze_consensus(decisions, providers_used)
+
+    async def _hedged_decision(self, provider_name: str, context: ReasoningContext,
+                               mode: ReasoningMode) -> DecisionResult:
+        """
+        Ask the primary provider, racing a backup if it is slower than usual.
+
+        If the primary has not answered within its observed p90 latency, or
+        fails before then, the same prompt goes to the next best provider;
+        the first successful answer wins and the other call is cancelled.
+
+        Args:
+            provider_name: Primary provider
+            context: Reasoning context
+            mode: Reasoning mode
+
+        Returns:
+            Decision from whichever provider answered first
+
+        Raises:
+            Exception: The primary's error if every raced provider failed
+        """
+        primary = asyncio.ensure_future(self._decide_with_provider(provider_name, context, mode))
+        tasks = {primary: provider_name}
+        try:
+            backup_name = self._select_backup_provider(provider_name)
+            if backup_name is None:
+                return await primary
+
+            hedge_delay = self._hedge_delay(provider_name)
+            done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+            errors: Dict[str, BaseException] = {}
+            if done:
+                if primary.exception() is None:
+                    return primary.result()
+                errors[provider_name] = primary.exception()
+                logger.info("Provider %s failed early, trying %s", provider_name, backup_name)
+            else:
+                logger.info("Provider %s slower than %.2fs, hedging with %s",
+                            provider_name, hedge_delay, backup_name)
+            backup = asyncio.ensure_future(self._decide_with_provider(backup_name, context, mode))
+            tasks[backup] = backup_name
+
+            pending = {task for task in tasks if not task.done()}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    errors[tasks[task]] = task.exception()
+
+            logger.warning("Hedge provider %s also failed: %s", backup_name, errors[backup_name])
+            self._update_provider_performance(backup_name, False)
+            raise errors[provider_name]
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _select_backup_provider(self, primary: str) -> Optional[str]:
+        """Select the best available provider other than the primary."""
+        candidates = [name for name in self.provider_registry if name != primary]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda p: self.provider_performance[p]["accuracy"])
+
+    def _hedge_delay(self, provider_name: str) -> float:
+        """Seconds to wait on a provider before hedging: its p90 latency."""
+        tracker = self.provider_latency.get(provider_name)
+        if tracker is None or len(tracker) < self.MIN_HEDGE_SAMPLES:
+            return self.default_hedge_delay_seconds
+        return tracker.percentile(90.0) / 1000
+
+    async def _decide_with_provider(self, provider_name: str, context: ReasoningContext,
+                                    mode: ReasoningMode) -> DecisionResult:
+        """
+        Ask one specific provider for a decision.
+
+        Args:
+            provider_name: Registered provider to ask
+            context: Reasoning context
+            mode: Reasoning mode for the prompt and model choice
+
+        Returns:
+            Parsed decision from that provider
+        """
+        prompt = self._build_reasoning_prompt(context, mode)
+        provider = self.provider_registry[provider_name]
+        request = LLMRequest(
+            prompt=prompt,
+            model=self._get_optimal_model(provider_name, mode),
+            max_tokens=2048,
+            temperature=0.3  # Lower temperature for more consistent reasoning
+        )
+
+        started = time.perf_counter()
+        try:
+            response = await provider.generate_response(request)
+        except asyncio.CancelledError:
+            # A hedged or timed-out call took at least this long; recording
+            # it as a censored sample keeps p90 from drifting towards only
+            # the fast completions
+            self.provider_latency[provider_name].record((time.perf_counter() - started) * 1000)
+            raise
+        self.provider_latency[provider_name].record((time.perf_counter() - started) * 1000)
+
+        decision_result = self._parse_decision_response(response.content, provider_name, mode)
+        self._update_provider_performance(provider_name, True)
+        return decision_result
+
+    @staticmethod
+    def _normalize_decision(decision: str) -> str:
+        """Normalize decision text so trivially different phrasings agree."""
+        return " ".join(decision.casefold().split()).rstrip(".!")
 
     def _select_reasoning_mode(self, context: ReasoningContext) -> ReasoningMode:
         """Select the optimal reasoning mode based on context."""
@@ -257,7 +418,12 @@ class DecisionEngine:
         return provider_models.get(mode, "default")
 
     def _build_reasoning_prompt(self, context: ReasoningContext, mode: ReasoningMode) -> str:
-        """Build the reasoning prompt for the LLM."""
+        """
+        Build the reasoning prompt for the LLM.
+
+        Templates put the situation last so the fixed instructions form an
+        identical prompt prefix across calls, which providers can cache.
+        """
         template = self.reasoning_templates.get(mode.value,
                                                self.reasoning_templates["default"])
 
@@ -329,25 +495,25 @@ class DecisionEngine:
                 success_criteria=[]
             ))
 
-        # Simple consensus: most common decision
-        decision_counts = {}
+        # Simple consensus: most common decision, in arrival order on ties
+        decision_counts: Dict[str, int] = {}
         for decision_result in decisions:
-            decision = decision_result.decision
-            if decision in decision_counts:
-                decision_counts[decision] += 1
-            else:
-                decision_counts[decision] = 1
+            key = self._normalize_decision(decision_result.decision)
+            decision_counts[key] = decision_counts.get(key, 0) + 1
 
-        # Get the most common decision
-        consensus_decision = max(decision_counts.keys(), key=lambda k: decision_counts[k])
+        consensus_key = max(decision_counts, key=decision_counts.get)
 
         # Average confidence of decisions that match consensus
-        consensus_decisions = [d for d in decisions if d.decision == consensus_decision]
-        avg_confidence = sum(d.confidence for d in consensus_decisions) / len(consensus_decisions)
+        matching = [
+            (i, d) for i, d in enumerate(decisions)
+            if self._normalize_decision(d.decision) == consensus_key
+        ]
+        consensus_decision = matching[0][1].decision
+        avg_confidence = sum(d.confidence for _, d in matching) / len(matching)
 
         # Combine reasoning chains
         combined_reasoning = []
-        for i, decision_result in enumerate(consensus_decisions):
+        for i, decision_result in matching:
             provider_name = providers[i] if i < len(providers) else f"Provider_{i}"
             reasoning_text = (decision_result.reasoning_chain[0]
                             if decision_result.reasoning_chain
@@ -358,9 +524,9 @@ class DecisionEngine:
             decision=consensus_decision,
             confidence=avg_confidence,
             reasoning_chain=combined_reasoning,
-            provider_used=f"consensus_{len(consensus_decisions)}_{len(decisions)}",
+            provider_used=f"consensus_{len(matching)}_{len(decisions)}",
             alternative_options=list(set(d.decision for d in decisions
-                                       if d.decision != consensus_decision)),
+                                       if self._normalize_decision(d.decision) != consensus_key)),
             resource_requirements={},
             execution_plan=[]
         )
@@ -435,21 +601,19 @@ class DecisionEngine:
             "fast_decision": """
             You are an AI decision-making system. Analyze the situation and provide a quick, actionable decision.
 
-            {situation}
-
             Respond with a clear decision and brief reasoning. Focus on speed and practicality.
 
             Format your response as:
             DECISION: [Your decision]
             REASONING: [Brief reasoning]
             CONFIDENCE: [0.0-1.0]
+
+            {situation}
             """,
 
             "deep_analysis": """
             You are an AI reasoning system specializing in complex analysis. Carefully analyze the situation from multiple angles.
 
-            {situation}
-
             Provide a thorough analysis with:
             1. Multiple perspectives on the situation
             2. Potential consequences of different actions
@@ -464,40 +628,42 @@ class DecisionEngine:
                 "alternatives": ["option 1", "option 2"],
                 "risk_assessment": "risk analysis"
             }}
+
+            {situation}
             """,
 
             "research": """
             You are an AI research specialist. Analyze the situation and determine what information is needed.
 
-            {situation}
-
             Focus on:
             1. What information is missing
             2. Best sources for gathering information
             3. Research strategy
             4. Decision framework based on research findings
+
+            {situation}
             """,
 
             "multimodal": """
             You are an AI system with multimodal analysis capabilities. Analyze all available data including any visual/structured information.
 
-            {situation}
-
             Consider:
             1. All data types present (text, visual, structured)
             2. Patterns and insights from multimodal analysis
             3. Integrated decision based on comprehensive analysis
+
+            {situation}
             """,
 
             "default": """
             Analyze the following situation and provide a decision with reasoning:
 
-            {situation}
-
             Provide:
             - Clear decision
             - Reasoning steps
             - Confidence level
             - Alternative options if applicable
+
+            {situation}
             """
         }
@@ -0,0 +1,140 @@
+"""
+Embedding Matrix: Vectorized similarity scoring for memory embeddings.
+
+This module packs memory embeddings into one contiguous float32 matrix with
+precomputed norms so that recall and consolidation score whole batches with
+a single matrix multiply instead of pairwise Python loops.
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .brain_database import MemoryRecord
+
+
+class EmbeddingMatrix:
+    """
+    Contiguous matrix of L2-normalised embeddings.
+
+    Rows keep the order of the memories they were built from. Memories without
+    an embedding, or whose dimension differs from the first embedded memory,
+    are left out; ``memory_ids`` maps rows back to memories.
+    """
+
+    def __init__(self, memory_ids: List[str], vectors: np.ndarray):
+        """
+        Initialize the embedding matrix.
+
+        Args:
+            memory_ids: Memory ID for each row
+            vectors: Raw embeddings, one per row
+        """
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        self.memory_ids = memory_ids
+        self.norms = np.linalg.norm(vectors, axis=1) if len(vectors) else np.zeros(0, np.float32)
+        safe_norms = np.where(self.norms == 0, 1.0, self.norms).astype(np.float32)
+        self.matrix = vectors / safe_norms[:, None]
+
+    def __len__(self) -> int:
+        return len(self.memory_ids)
+
+    @property
+    def dimension(self) -> int:
+        """Embedding dimension (0 for an empty matrix)."""
+        return self.matrix.shape[1] if self.matrix.ndim == 2 else 0
+
+    @classmethod
+    def from_records(cls, memories: Sequence[MemoryRecord]) -> "EmbeddingMatrix":
+        """
+        Build a matrix from memory records.
+
+        Args:
+            memories: Memory records with serialized float32 embeddings
+
+        Returns:
+            Embedding matrix over the embedded memories
+        """
+        memory_ids = []
+        vectors = []
+        dimension: Optional[int] = None
+        for memory in memories:
+            if not memory.embedding_vector:
+                continue
+            vector = np.frombuffer(memory.embedding_vector, dtype=np.float32)
+            if dimension is None:
+                dimension = len(vector)
+            if len(vector) != dimension:
+                continue
+            memory_ids.append(memory.memory_id)
+            vectors.append(vector)
+
+        if not vectors:
+            return cls([], np.zeros((0, 0), dtype=np.float32))
+        return cls(memory_ids, np.stack(vectors))
+
+    def score(self, query: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of one query against every row.
+
+        Args:
+            query: Query embedding
+
+        Returns:
+            Similarity per row
+        """
+        return self.score_batch(np.asarray(query, dtype=np.float32)[None, :])[0]
+
+    def score_batch(self, queries: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of a batch of queries against every row.
+
+        Args:
+            queries: Query embeddings, shape ``(n_queries, dimension)``
+
+        Returns:
+            Similarity matrix of shape ``(n_queries, len(self))``
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if len(self) == 0 or queries.shape[1] != self.dimension:
+            return np.zeros((len(queries), len(self)), dtype=np.float32)
+
+        query_norms = np.linalg.norm(queries, axis=1)
+        queries = queries / np.where(query_norms == 0, 1.0, query_norms)[:, None]
+        return queries @ self.matrix.T
+
+    def cluster(self, threshold: float = 0.8, block_size: int = 256) -> List[List[int]]:
+        """
+        Greedy leader clustering of the rows.
+
+        Each row that is not yet clustered becomes a leader and absorbs every
+        later unclustered row whose similarity exceeds ``threshold``.
+        Similarities are computed block by block so memory stays bounded at
+        ``block_size * len(self)`` floats.
+
+        Args:
+            threshold: Similarity above which rows join a leader's cluster
+            block_size: Number of leader rows scored per matrix multiply
+
+        Returns:
+            Row indices of every cluster with more than one member
+        """
+        count = len(self)
+        clustered = np.zeros(count, dtype=bool)
+        clustered[self.norms == 0] = True
+        clusters = []
+
+        for start in range(0, count, block_size):
+            stop = min(start + block_size, count)
+            block_scores = self.matrix[start:stop] @ self.matrix.T
+            for offset, leader in enumerate(range(start, stop)):
+                if clustered[leader]:
+                    continue
+                clustered[leader] = True
+                candidates = block_scores[offset, leader + 1:] > threshold
+                members = np.flatnonzero(candidates & ~clustered[leader + 1:]) + leader + 1
+                if len(members):
+                    clustered[members] = True
+                    clusters.append([leader] + members.tolist())
+
+        return clusters
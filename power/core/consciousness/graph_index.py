@@ -0,0 +1,373 @@
+"""
+Knowledge Graph Index: In-memory adjacency for fast graph traversal.
+
+This module loads the knowledge_graph table once into a compact adjacency
+structure (interned node ids, array-backed edge lists) and keeps it up to
+date from PowerBrain edge writes, so multi-hop path queries never go back
+to SQLite.
+"""
+
+import heapq
+import logging
+import math
+import threading
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (node, relationship_type, confidence)
+Neighbor = Tuple[str, str, float]
+# (path_nodes, relationship_chain, total_confidence)
+GraphPath = Tuple[List[str], List[str], float]
+
+
+class KnowledgeGraphIndex:  # pylint: disable=too-many-instance-attributes
+    """
+    Undirected adjacency over the knowledge graph.
+
+    Node and relationship names are interned to integers; each node keeps
+    parallel ``array`` buffers of neighbour ids, relationship codes and
+    confidences. Duplicate edges (same endpoints and relationship) collapse
+    into one, keeping the highest confidence.
+
+    ``version`` increases on every edge change, so callers can key caches
+    on it. Community labels are maintained by label propagation that only
+    revisits nodes touched since the previous pass.
+    """
+
+    def __init__(self):
+        """Initialize an empty graph index."""
+        self._node_ids: Dict[str, int] = {}
+        self._node_names: List[str] = []
+        self._relationship_ids: Dict[str, int] = {}
+        self._relationship_names: List[str] = []
+
+        self._neighbors: List[array] = []
+        self._relationships: List[array] = []
+        self._confidences: List[array] = []
+        self._edge_slots: Dict[Tuple[int, int, int], int] = {}
+
+        self.edge_count = 0
+        self.version = 0
+        self._lock = threading.RLock()
+
+        # Community label per node; nodes touched by new edges are re-propagated
+        self._labels = array("i")
+        self._dirty: Set[int] = set()
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[str, str, str, float]]) -> "KnowledgeGraphIndex":
+        """
+        Build an index from (source, target, relationship, confidence) edges.
+
+        Args:
+            edges: Knowledge graph edges
+
+        Returns:
+            Populated graph index
+        """
+        index = cls()
+        index.add_edges(edges)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._node_names)
+
+    def __contains__(self, concept: str) -> bool:
+        return concept in self._node_ids
+
+    @property
+    def concepts(self) -> List[str]:
+        """All concept names, in interning order."""
+        return list(self._node_names)
+
+    def add_edges(self, edges: Iterable[Tuple[str, str, str, float]]) -> None:
+        """
+        Add or strengthen edges.
+
+        Args:
+            edges: (source, target, relationship, confidence) tuples
+        """
+        with self._lock:
+            for source, target, relationship, confidence in edges:
+                self._add_edge(source, target, relationship, float(confidence))
+
+    def on_edges_added(self, edges: List[Tuple[str, str, str, float, str]]) -> None:
+        """PowerBrain edge listener: apply (source, target, relationship, confidence, evidence)."""
+        self.add_edges((edge[0], edge[1], edge[2], edge[3]) for edge in edges)
+
+    def neighbors(self, concept: str, limit: Optional[int] = None) -> List[Neighbor]:
+        """
+        Get the direct relations of a concept, highest confidence first.
+
+        Args:
+            concept: Concept name
+            limit: Maximum number of relations to return
+
+        Returns:
+            List of (related_concept, relationship_type, confidence)
+        """
+        with self._lock:
+            node = self._node_ids.get(concept)
+            if node is None:
+                return []
+            related = [
+                (self._node_names[other], self._relationship_names[rel], conf)
+                for other, rel, conf in zip(self._neighbors[node], self._relationships[node],
+                                            self._confidences[node])
+            ]
+        related.sort(key=lambda item: item[2], reverse=True)
+        return related[:limit] if limit is not None else related
+
+    def shortest_path(self, start: str, end: str, max_length: int = 4) -> Optional[GraphPath]:
+        """
+        Find a fewest-hops path with bidirectional BFS.
+
+        Both frontiers advance one layer at a time, always expanding the
+        smaller one. Among the shortest paths, the one with the highest
+        confidence product through the meeting layer is returned.
+
+        Args:
+            start: Starting concept
+            end: Target concept
+            max_length: Maximum number of edges in the path
+
+        Returns:
+            (path_nodes, relationship_chain, total_confidence) or None
+        """
+        with self._lock:
+            source = self._node_ids.get(start)
+            target = self._node_ids.get(end)
+            if source is None or target is None or source == target:
+                return None
+
+            # node -> (parent, relationship code, confidence from the root)
+            forward: Dict[int, Tuple[int, int, float]] = {source: (-1, -1, 1.0)}
+            backward: Dict[int, Tuple[int, int, float]] = {target: (-1, -1, 1.0)}
+            forward_frontier, backward_frontier = [source], [target]
+            forward_depth = backward_depth = 0
+
+            while forward_frontier and backward_frontier:
+                if forward_depth + backward_depth >= max_length:
+                    return None
+                if len(forward_frontier) <= len(backward_frontier):
+                    forward_frontier = self._expand(forward_frontier, forward)
+                    forward_depth += 1
+                    meeting = [node for node in forward_frontier if node in backward]
+                else:
+                    backward_frontier = self._expand(backward_frontier, backward)
+                    backward_depth += 1
+                    meeting = [node for node in backward_frontier if node in forward]
+
+                # Every meeting node closes a path of forward_depth + backward_depth hops
+                if meeting:
+                    best = max(meeting, key=lambda node: forward[node][2] * backward[node][2])
+                    return self._join_paths(best, forward, backward)
+
+            return None
+
+    def most_confident_path(self, start: str, end: str,
+                            max_length: int = 4) -> Optional[GraphPath]:
+        """
+        Find the path maximising the product of edge confidences.
+
+        Runs best-first search on ``-log(confidence)`` so the first time the
+        target is popped its path has the highest confidence product among
+        paths of at most ``max_length`` edges that the search kept.
+
+        Args:
+            start: Starting concept
+            end: Target concept
+            max_length: Maximum number of edges in the path
+
+        Returns:
+            (path_nodes, relationship_chain, total_confidence) or None
+        """
+        with self._lock:
+            source = self._node_ids.get(start)
+            target = self._node_ids.get(end)
+            if source is None or target is None or source == target:
+                return None
+
+            best_cost: Dict[int, float] = {source: 0.0}
+            parents: Dict[int, Tuple[int, int, float]] = {source: (-1, -1, 1.0)}
+            heap: List[Tuple[float, int, int]] = [(0.0, 0, source)]
+
+            while heap:
+                cost, hops, node = heapq.heappop(heap)
+                if node == target:
+                    return self._unwind(node, parents)
+                if cost > best_cost.get(node, math.inf) or hops >= max_length:
+                    continue
+                for other, rel, conf in zip(self._neighbors[node], self._relationships[node],
+                                            self._confidences[node]):
+                    if conf <= 0:
+                        continue
+                    new_cost = cost - math.log(min(conf, 1.0))
+                    if new_cost < best_cost.get(other, math.inf):
+                        best_cost[other] = new_cost
+                        parents[other] = (node, rel, conf)
+                        heapq.heappush(heap, (new_cost, hops + 1, other))
+
+            return None
+
+    def communities(self, min_size: int = 1) -> List[List[str]]:
+        """
+        Group concepts into communities by weighted label propagation.
+
+        Only nodes whose neighbourhood changed since the last call (and
+        whatever their relabelling reaches) are revisited, so repeated calls
+        on a growing graph cost roughly the size of the new-edge delta.
+
+        Args:
+            min_size: Minimum number of concepts in a returned community
+
+        Returns:
+            Communities as concept lists, largest first
+        """
+        with self._lock:
+            self._propagate_labels()
+            members: Dict[int, List[int]] = {}
+            for node, label in enumerate(self._labels):
+                members.setdefault(label, []).append(node)
+            groups = sorted((nodes for nodes in members.values() if len(nodes) >= min_size),
+                            key=lambda nodes: (-len(nodes), nodes[0]))
+            return [[self._node_names[node] for node in nodes] for nodes in groups]
+
+    def _propagate_labels(self, max_rounds: int = 20) -> None:
+        """Run label propagation from the dirty nodes until labels settle."""
+        if not self._dirty:
+            return
+
+        queue = deque(sorted(self._dirty))
+        queued = set(self._dirty)
+        self._dirty.clear()
+        budget = max_rounds * max(len(self._node_names), 1)
+
+        while queue and budget > 0:
+            budget -= 1
+            node = queue.popleft()
+            queued.discard(node)
+
+            weights: Dict[int, float] = {}
+            for other, conf in zip(self._neighbors[node], self._confidences[node]):
+                label = self._labels[other]
+                weights[label] = weights.get(label, 0.0) + conf
+            if not weights:
+                continue
+
+            current = self._labels[node]
+            best_weight = max(weights.values())
+            if weights.get(current, 0.0) >= best_weight:
+                continue
+            # Deterministic tie-break keeps results stable between runs
+            self._labels[node] = min(label for label, weight in weights.items()
+                                     if weight == best_weight)
+
+            for other in self._neighbors[node]:
+                if other not in queued:
+                    queued.add(other)
+                    queue.append(other)
+
+        if queue:
+            logger.debug("Label propagation stopped with %d nodes pending", len(queue))
+
+    def _add_edge(self, source: str, target: str, relationship: str, confidence: float) -> None:
+        """Insert one undirected edge, collapsing duplicates."""
+        u, v = self._intern_node(source), self._intern_node(target)
+        rel = self._relationship_ids.get(relationship)
+        if rel is None:
+            rel = len(self._relationship_names)
+            self._relationship_ids[relationship] = rel
+            self._relationship_names.append(relationship)
+
+        slot = self._edge_slots.get((u, v, rel))
+        if slot is not None:
+            if confidence > self._confidences[u][slot]:
+                self._confidences[u][slot] = confidence
+                self._confidences[v][self._edge_slots[(v, u, rel)]] = confidence
+                self._dirty.update((u, v))
+                self.version += 1
+            return
+
+        self._edge_slots[(u, v, rel)] = len(self._neighbors[u])
+        self._append(u, v, rel, confidence)
+        if u != v:
+            self._edge_slots[(v, u, rel)] = len(self._neighbors[v])
+            self._append(v, u, rel, confidence)
+        self.edge_count += 1
+        self._dirty.update((u, v))
+        self.version += 1
+
+    def _append(self, node: int, other: int, rel: int, confidence: float) -> None:
+        self._neighbors[node].append(other)
+        self._relationships[node].append(rel)
+        self._confidences[node].append(confidence)
+
+    def _intern_node(self, concept: str) -> int:
+        node = self._node_ids.get(concept)
+        if node is None:
+            node = len(self._node_names)
+            self._node_ids[concept] = node
+            self._node_names.append(concept)
+            self._neighbors.append(array("i"))
+            self._relationships.append(array("i"))
+            self._confidences.append(array("f"))
+            self._labels.append(node)
+        return node
+
+    def _expand(self, frontier: List[int], parents: Dict[int, Tuple[int, int, float]]) -> List[int]:
+        """Advance one BFS layer, keeping the most confident parent per new node."""
+        next_layer: Dict[int, Tuple[int, int, float]] = {}
+        for node in frontier:
+            base = parents[node][2]
+            for other, rel, conf in zip(self._neighbors[node], self._relationships[node],
+                                        self._confidences[node]):
+                if other in parents:
+                    continue
+                candidate = base * conf
+                if other not in next_layer or candidate > next_layer[other][2]:
+                    next_layer[other] = (node, rel, candidate)
+        parents.update(next_layer)
+        return list(next_layer)
+
+    def _unwind(self, node: int, parents: Dict[int, Tuple[int, int, float]]) -> GraphPath:
+        """Rebuild the path ending at ``node`` from a parent map."""
+        nodes, relationships, confidence = [], [], 1.0
+        while node != -1:
+            parent, rel, conf = parents[node]
+            nodes.append(self._node_names[node])
+            if parent != -1:
+                relationships.append(self._relationship_names[rel])
+                confidence *= conf
+            node = parent
+        nodes.reverse()
+        relationships.reverse()
+        return nodes, relationships, confidence
+
+    def _join_paths(self, meeting: int, forward: Dict[int, Tuple[int, int, float]],
+                    backward: Dict[int, Tuple[int, int, float]]) -> GraphPath:
+        """Concatenate the forward path to ``meeting`` with the backward path from it."""
+        head_nodes, head_relationships = [], []
+        node = meeting
+        while node != -1:
+            parent, rel, _ = forward[node]
+            head_nodes.append(self._node_names[node])
+            if parent != -1:
+                head_relationships.append(self._relationship_names[rel])
+            node = parent
+        head_nodes.reverse()
+        head_relationships.reverse()
+
+        tail_nodes, tail_relationships = [], []
+        node = meeting
+        while backward[node][0] != -1:
+            parent, rel, _ = backward[node]
+            tail_relationships.append(self._relationship_names[rel])
+            tail_nodes.append(self._node_names[parent])
+            node = parent
+
+        return (head_nodes + tail_nodes, head_relationships + tail_relationships,
+                forward[meeting][2] * backward[meeting][2])
@@ -5,14 +5,22 @@ This module implements sophisticated memory management with vector embeddings,
 semantic search, and associative memory retrieval for the Power Brain system.
 """
 
+import asyncio
 import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+import os
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 import numpy as np
 
+from shared.interfaces.embedding_provider import EmbeddingProvider
+from shared.utils.hashing_embedder import HashingEmbeddingProvider
+
+from .async_brain import AsyncPowerBrain
 from .brain_database import PowerBrain, MemoryRecord
+from .embedding_matrix import EmbeddingMatrix
+from .vector_index import VectorIndex
 
 logger = logging.getLogger(__name__)
 
@@ -43,19 +51,38 @@ class MemoryManager:
     knowledge graph traversal, and intelligent memory consolidation.
     """
 
-    def __init__(self, brain: PowerBrain, embedding_model: Optional[str] = None):
+    def __init__(self, brain: PowerBrain, embedding_model: Optional[str] = None,
+                 embedding_provider: Optional[EmbeddingProvider] = None,
+                 index_path: Optional[str] = None,
+                 async_brain: Optional[AsyncPowerBrain] = None):
         """
         Initialize the Memory Manager.
 
         Args:
             brain: PowerBrain database instance
             embedding_model: Model for generating embeddings (future integration)
+            embedding_provider: Provider used to embed text (defaults to local hashing)
+            index_path: Where to persist the vector index (defaults to next to the brain)
+            async_brain: Async brain used by asearch_memories to read off the event loop
         """
         self.brain = brain
+        self.async_brain = async_brain
         self.embedding_model = embedding_model
-        self.embedding_cache: Dict[str, np.ndarray] = {}
+        self.embedding_provider = embedding_provider or HashingEmbeddingProvider()
+        self.embedding_cache: Dict[str, bytes] = {}
+        self._embedding_cache_size = 1024
         self._memory_consolidation_threshold = 100
 
+        # Approximate nearest-neighbour index over the whole knowledge store
+        self.index_path = index_path or self._default_index_path()
+        self._index_save_interval = 50
+        self._unsaved_index_changes = 0
+        reembedded = self._reembed_stale_memories()
+        self.vector_index = self._load_vector_index(rebuild=reembedded > 0)
+        if self._unsaved_index_changes:
+            self.save_index()
+        self._backfill_concept_index()
+
     def store_memory(self, content: str, memory_type: str,
                     context: MemoryContext,
                     confidence_score: float = 1.0) -> str:
@@ -87,11 +114,13 @@ class MemoryManager:
             confidence_score=confidence_score,
             created_at=datetime.utcnow(),
             last_accessed=datetime.utcnow(),
-            access_count=0
+            access_count=0,
+            embedding_model=self.embedding_provider.model_name
         )
 
-        # Store in brain database
+        # Store in brain database and keep the vector index in sync
         self.brain.store_memory(memory_record)
+        self._index_memory(memory_id, embedding_vector, memory_type)
 
         # Extract and store knowledge graph relationships
         self._extract_knowledge_relationships(content, memory_id)
@@ -99,6 +128,49 @@ class MemoryManager:
         logger.info("Stored memory: %s (%s)", memory_id, memory_type)
         return memory_id
 
+    def store_memories(self, contents: List[Tuple[str, str]], context: MemoryContext,
+                       confidence_score: float = 1.0) -> List[str]:
+        """
+        Store several memories with one embedding batch and one transaction.
+
+        Args:
+            contents: (content, memory_type) pairs to store
+            context: Context information shared by the memories
+            confidence_score: Confidence in the memories' accuracy
+
+        Returns:
+            Generated memory IDs, in input order
+        """
+        if not contents:
+            return []
+
+        now = datetime.utcnow()
+        embeddings = self._generate_embeddings([content for content, _ in contents])
+        source_type = self._determine_source_type(context)
+        records = [
+            MemoryRecord(
+                memory_id=self._generate_memory_id(content, context),
+                content=content,
+                embedding_vector=embedding,
+                memory_type=memory_type,
+                source_type=source_type,
+                confidence_score=confidence_score,
+                created_at=now,
+                last_accessed=now,
+                access_count=0,
+                embedding_model=self.embedding_provider.model_name
+            )
+            for (content, memory_type), embedding in zip(contents, embeddings)
+        ]
+
+        self.brain.store_memories_bulk(records)
+        for record in records:
+            self._index_memory(record.memory_id, record.embedding_vector, record.memory_type)
+            self._extract_knowledge_relationships(record.content, record.memory_id)
+
+        logger.info("Stored %d memories", len(records))
+        return [record.memory_id for record in records]
+
     def search_memories(self, query: str, memory_type: Optional[str] = None,
                        limit: int = 10,
                        similarity_threshold: float = 0.7) -> List[MemorySearchResult]:
@@ -114,37 +186,97 @@ class MemoryManager:
         Returns:
             List of relevant memory search results
         """
-        # Generate query embedding
-        query_embedding = self._generate_embedding(query)
+        query_embedding = np.frombuffer(self._generate_embedding(query), dtype=np.float32)
 
-        # Get candidate memories from database
-        candidate_memories = self.brain.search_memories(memory_type, limit * 2)
+        # Approximate nearest-neighbour search across the whole knowledge store
+        hits = self.vector_index.search(
+            query_embedding, limit=limit, memory_type=memory_type,
+            similarity_threshold=similarity_threshold
+        )
+        results = self._build_search_results([hits])[0]
 
-        # Calculate similarity scores
-        results = []
-        for memory in candidate_memories:
-            if memory.embedding_vector:
-                memory_embedding = np.frombuffer(memory.embedding_vector, dtype=np.float32)
-                similarity = self._calculate_similarity(query_embedding, memory_embedding)
+        # Update access counts for retrieved memories
+        for result in results:
+            self._update_memory_access(result.memory_record.memory_id)
 
-                if similarity >= similarity_threshold:
-                    results.append(MemorySearchResult(
-                        memory_record=memory,
-                        similarity_score=similarity,
-                        relevance_rank=len(results) + 1
-                    ))
+        logger.info("Found %d relevant memories for query: %s", len(results), query)
+        return results
 
-        # Sort by similarity and update access patterns
-        results.sort(key=lambda x: x.similarity_score, reverse=True)
-        results = results[:limit]
+    async def asearch_memories(self, query: str, memory_type: Optional[str] = None,
+                               limit: int = 10,
+                               similarity_threshold: float = 0.7) -> List[MemorySearchResult]:
+        """
+        Semantic search that keeps database work off the event loop.
+
+        Embedding cache lookups and record fetches run on the async brain's
+        read-only connection pool, so concurrent queries do not queue behind
+        writes. Without an async brain this is the same as search_memories.
+
+        Args:
+            query: Search query
+            memory_type: Optional memory type filter
+            limit: Maximum number of results
+            similarity_threshold: Minimum similarity score
+
+        Returns:
+            List of relevant memory search results
+        """
+        if self.async_brain is None:
+            return self.search_memories(query, memory_type, limit, similarity_threshold)
+
+        embedding = (await self._agenerate_embeddings([query]))[0]
+        hits = self.vector_index.search(
+            np.frombuffer(embedding, dtype=np.float32), limit=limit,
+            memory_type=memory_type, similarity_threshold=similarity_threshold
+        )
+        records = await self.async_brain.get_memories([memory_id for memory_id, _ in hits])
+        results = self._rank_search_results([hits], records)[0]
 
-        # Update access counts for retrieved memories
         for result in results:
             self._update_memory_access(result.memory_record.memory_id)
 
         logger.info("Found %d relevant memories for query: %s", len(results), query)
         return results
 
+    def search_memories_batch(self, queries: List[str], memory_type: Optional[str] = None,
+                              limit: int = 10,
+                              similarity_threshold: float = 0.7) -> List[List[MemorySearchResult]]:
+        """
+        Semantic search for several queries at once.
+
+        All queries are scored with one matrix multiply and the matching
+        records are fetched in a single database round-trip.
+
+        Args:
+            queries: Search queries
+            memory_type: Optional memory type filter
+            limit: Maximum number of results per query
+            similarity_threshold: Minimum similarity score
+
+        Returns:
+            One list of memory search results per query
+        """
+        if not queries:
+            return []
+
+        query_matrix = np.stack([
+            np.frombuffer(embedding, dtype=np.float32)
+            for embedding in self._generate_embeddings(queries)
+        ])
+        batch_hits = self.vector_index.search_batch(
+            query_matrix, limit=limit, memory_type=memory_type,
+            similarity_threshold=similarity_threshold
+        )
+        batch_results = self._build_search_results(batch_hits)
+
+        # Update access counts for retrieved memories
+        for memory_id in {r.memory_record.memory_id for results in batch_results for r in results}:
+            self._update_memory_access(memory_id)
+
+        logger.info("Found %d relevant memories for %d queries",
+                    sum(len(results) for results in batch_results), len(queries))
+        return batch_results
+
     def get_associative_memories(self, seed_memory_id: str,
                                 max_associations: int = 5) -> List[MemoryRecord]:
         """
@@ -157,32 +289,23 @@ class MemoryManager:
         Returns:
             List of associated memory records
         """
-        # Get the seed memory
-        seed_memories = self.brain.search_memories(limit=1000)
-        seed_memory = next((m for m in seed_memories if m.memory_id == seed_memory_id), None)
+        seed_memory = self.brain.get_memory(seed_memory_id)
 
         if not seed_memory:
             return []
 
-        # Extract key concepts from seed memory
-        concepts = self._extract_concepts(seed_memory.content)
+        # Key concepts from the inverted concept index (extracted on store)
+        concepts = (self.brain.get_memory_concepts(seed_memory_id)
+                    or self._extract_concepts(seed_memory.content))
 
         # Find related concepts through knowledge graph
-        related_concepts = []
-        for concept in concepts:
-            related = self.brain.get_related_concepts(concept)
-            related_concepts.extend([r[0] for r in related])
+        related = self.brain.get_related_concepts_bulk(concepts, limit=max_associations * 20)
+        related_concepts = list(dict.fromkeys(r[0] for r in related))[:max_associations * 2]
 
         # Find memories containing related concepts
-        associated_memories = []
-        for concept in related_concepts[:max_associations * 2]:
-            concept_memories = self.search_memories(concept, limit=3, similarity_threshold=0.5)
-            for result in concept_memories:
-                if (result.memory_record.memory_id != seed_memory_id and
-                    result.memory_record not in associated_memories):
-                    associated_memories.append(result.memory_record)
-
-        return associated_memories[:max_associations]
+        return self.brain.get_memories_by_concepts(
+            related_concepts, exclude_memory_id=seed_memory_id, limit=max_associations
+        )
 
     def consolidate_memories(self, session_id: str) -> Dict[str, Any]:
         """
@@ -222,6 +345,7 @@ class MemoryManager:
                 )
                 consolidated_count += 1
 
+        self.save_index()
         logger.info("Consolidated %d memory clusters", consolidated_count)
         return {
             "status": "completed",
@@ -230,6 +354,16 @@ class MemoryManager:
             "total_memories": len(recent_memories)
         }
 
+    def save_index(self) -> None:
+        """Persist the vector index next to the brain database."""
+        if self.index_path is None:
+            return
+        try:
+            self.vector_index.save(self.index_path)
+            self._unsaved_index_changes = 0
+        except OSError as e:
+            logger.warning("Could not persist vector index to %s: %s", self.index_path, e)
+
     def get_memory_insights(self, context: MemoryContext = None) -> Dict[str, Any]:
         """
         Generate insights about stored memories and learning patterns.
@@ -269,6 +403,80 @@ class MemoryManager:
 
         return insights
 
+    def _default_index_path(self) -> Optional[str]:
+        """Place the vector index file next to the brain database."""
+        brain_path = getattr(self.brain, "brain_path", None)
+        if not brain_path or brain_path == ":memory:":
+            return None
+        return f"{brain_path}.vindex.npz"
+
+    def _reembed_stale_memories(self, batch_size: int = 256) -> int:
+        """
+        Re-embed stored memories whose vectors came from another embedding model.
+
+        Vectors from different models are not comparable, so memories stored
+        before a provider change are migrated when the manager starts.
+
+        Args:
+            batch_size: Number of memories embedded per provider call
+
+        Returns:
+            Number of memories re-embedded
+        """
+        model_name = self.embedding_provider.model_name
+        stale = self.brain.get_memories_with_stale_embeddings(model_name)
+        for start in range(0, len(stale), batch_size):
+            batch = stale[start:start + batch_size]
+            embeddings = self._generate_embeddings([content for _, content in batch])
+            self.brain.update_memory_embeddings(
+                [(memory_id, embedding) for (memory_id, _), embedding in zip(batch, embeddings)],
+                model_name
+            )
+
+        if stale:
+            logger.info("Re-embedded %d memories with %s", len(stale), model_name)
+        return len(stale)
+
+    def _load_vector_index(self, rebuild: bool = False) -> VectorIndex:
+        """Load the persisted vector index and catch up with the knowledge store."""
+        index = None
+        if self.index_path and os.path.exists(self.index_path) and not rebuild:
+            try:
+                index = VectorIndex.load(self.index_path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("Rebuilding unreadable vector index %s: %s", self.index_path, e)
+        index = index or VectorIndex()
+
+        if len(index) != self.brain.count_embedded_memories():
+            added = 0
+            for memory_id, memory_type, embedding in self.brain.get_memory_embeddings():
+                if memory_id not in index:
+                    index.add(memory_id, np.frombuffer(embedding, dtype=np.float32), memory_type)
+                    added += 1
+            if added:
+                logger.info("Indexed %d memories missing from the vector index", added)
+                self._unsaved_index_changes = added
+        return index
+
+    def _backfill_concept_index(self) -> None:
+        """Index the concepts of memories stored before the concept index existed."""
+        backfilled = 0
+        for memory_id, content in self.brain.get_memories_without_concepts():
+            concepts = self._extract_concepts(content)
+            if concepts:
+                self.brain.index_memory_concepts(memory_id, concepts)
+                backfilled += 1
+        if backfilled:
+            logger.info("Backfilled concept index for %d memories", backfilled)
+
+    def _index_memory(self, memory_id: str, embedding_vector: bytes, memory_type: str) -> None:
+        """Add a stored memory to the vector index, persisting periodically."""
+        self.vector_index.add(memory_id, np.frombuffer(embedding_vector, dtype=np.float32),
+                              memory_type)
+        self._unsaved_index_changes += 1
+        if self._unsaved_index_changes >= self._index_save_interval:
+            self.save_index()
+
     def _generate_memory_id(self, content: str, context: MemoryContext) -> str:
         """Generate unique memory ID based on content and context."""
         _ = context  # Context reserved for future use in ID generation
@@ -278,7 +486,7 @@ class MemoryManager:
 
     def _generate_embedding(self, text: str) -> bytes:
         """
-        Generate vector embedding for text (placeholder implementation).
+        Generate vector embedding for text.
 
         Args:
             text: Text to embed
@@ -286,33 +494,108 @@ class MemoryManager:
         Returns:
             Serialized embedding vector
         """
-        # Placeholder: Simple hash-based pseudo-embedding
-        # In production, this would use a real embedding model
-        text_hash = hashlib.sha256(text.encode()).digest()
-        # Convert to 128-dimensional float vector
-        pseudo_embedding = np.frombuffer(text_hash, dtype=np.uint8)[:32]
-        normalized = pseudo_embedding.astype(np.float32) / 255.0
-
-        # Pad to 128 dimensions
-        if len(normalized) < 128:
-            padding = np.zeros(128 - len(normalized), dtype=np.float32)
-            normalized = np.concatenate([normalized, padding])
-
-        return normalized[:128].tobytes()
+        return self._generate_embeddings([text])[0]
 
-    def _calculate_similarity(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
-        """Calculate cosine similarity between embeddings."""
-        if len(embedding1) != len(embedding2):
-            return 0.0
+    def _generate_embeddings(self, texts: List[str]) -> List[bytes]:
+        """
+        Generate embeddings for a batch of texts through the embedding cache.
 
-        dot_product = np.dot(embedding1, embedding2)
-        norm1 = np.linalg.norm(embedding1)
-        norm2 = np.linalg.norm(embedding2)
+        Lookups go to the in-process cache first, then to the persistent
+        cache in the brain database; only texts missing from both are sent
+        to the embedding provider, in a single batch.
 
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
+        Args:
+            texts: Texts to embed
 
-        return float(dot_product / (norm1 * norm2))
+        Returns:
+            Serialized embedding vector per text
+        """
+        keys = [self._embedding_cache_key(text) for text in texts]
+        embeddings = {key: self.embedding_cache[key] for key in keys if key in self.embedding_cache}
+
+        missing = [key for key in dict.fromkeys(keys) if key not in embeddings]
+        embeddings.update(self.brain.get_cached_embeddings(missing))
+
+        to_embed = {key: text for key, text in zip(keys, texts) if key not in embeddings}
+        if to_embed:
+            vectors = self.embedding_provider.embed_texts(list(to_embed.values()))
+            new_entries = self._embedding_cache_entries(to_embed, vectors)
+            self.brain.cache_embeddings(new_entries)
+            embeddings.update((key, embedding) for key, _, embedding in new_entries)
+
+        for key in keys:
+            self._remember_embedding(key, embeddings[key])
+        return [embeddings[key] for key in keys]
+
+    async def _agenerate_embeddings(self, texts: List[str]) -> List[bytes]:
+        """Async counterpart of _generate_embeddings using the async brain."""
+        keys = [self._embedding_cache_key(text) for text in texts]
+        embeddings = {key: self.embedding_cache[key] for key in keys if key in self.embedding_cache}
+
+        missing = [key for key in dict.fromkeys(keys) if key not in embeddings]
+        if missing:
+            embeddings.update(await self.async_brain.get_cached_embeddings(missing))
+
+        to_embed = {key: text for key, text in zip(keys, texts) if key not in embeddings}
+        if to_embed:
+            loop = asyncio.get_running_loop()
+            vectors = await loop.run_in_executor(
+                None, self.embedding_provider.embed_texts, list(to_embed.values())
+            )
+            new_entries = self._embedding_cache_entries(to_embed, vectors)
+            await self.async_brain.cache_embeddings(new_entries)
+            embeddings.update((key, embedding) for key, _, embedding in new_entries)
+
+        for key in keys:
+            self._remember_embedding(key, embeddings[key])
+        return [embeddings[key] for key in keys]
+
+    def _embedding_cache_entries(self, to_embed: Dict[str, str],
+                                 vectors: np.ndarray) -> List[Tuple[str, str, bytes]]:
+        """Serialize freshly computed embeddings as embedding_cache rows."""
+        return [
+            (key, self.embedding_provider.model_name,
+             np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in zip(to_embed, vectors)
+        ]
+
+    def _embedding_cache_key(self, text: str) -> str:
+        """Content hash of a text under the current embedding model."""
+        return hashlib.sha256(
+            f"{self.embedding_provider.model_name}\0{text}".encode()
+        ).hexdigest()
+
+    def _remember_embedding(self, key: str, embedding: bytes) -> None:
+        """Keep an embedding in the bounded in-process cache."""
+        self.embedding_cache.pop(key, None)
+        self.embedding_cache[key] = embedding
+        if len(self.embedding_cache) > self._embedding_cache_size:
+            del self.embedding_cache[next(iter(self.embedding_cache))]
+
+    def _build_search_results(
+            self, batch_hits: List[List[Tuple[str, float]]]) -> List[List[MemorySearchResult]]:
+        """Resolve index hits to ranked search results with one record lookup."""
+        memory_ids = list({memory_id for hits in batch_hits for memory_id, _ in hits})
+        return self._rank_search_results(batch_hits, self.brain.get_memories(memory_ids))
+
+    @staticmethod
+    def _rank_search_results(batch_hits: List[List[Tuple[str, float]]],
+                             memories: List[MemoryRecord]) -> List[List[MemorySearchResult]]:
+        """Pair index hits with their records, skipping hits whose record is gone."""
+        records = {m.memory_id: m for m in memories}
+
+        batch_results = []
+        for hits in batch_hits:
+            results = []
+            for memory_id, similarity in hits:
+                if memory_id in records:
+                    results.append(MemorySearchResult(
+                        memory_record=records[memory_id],
+                        similarity_score=similarity,
+                        relevance_rank=len(results) + 1
+                    ))
+            batch_results.append(results)
+        return batch_results
 
     def _determine_source_type(self, context: MemoryContext) -> str:
         """Determine the source type based on context."""
@@ -330,22 +613,20 @@ class MemoryManager:
         words = text.lower().split()
         # Filter for potential concepts (nouns, technical terms)
         concepts = [w for w in words if len(w) > 3 and w.isalpha()]
-        return list(set(concepts))[:10]  # Limit to top 10 unique concepts
+        return list(dict.fromkeys(concepts))[:10]  # Limit to first 10 unique concepts
 
     def _extract_knowledge_relationships(self, content: str, memory_id: str) -> None:
         """Extract and store relationships in the knowledge graph."""
         concepts = self._extract_concepts(content)
+        self.brain.index_memory_concepts(memory_id, concepts)
 
         # Create relationships between concepts found in the same memory
-        for i, concept1 in enumerate(concepts):
-            for concept2 in concepts[i+1:]:
-                self.brain.add_knowledge_edge(
-                    source=concept1,
-                    target=concept2,
-                    relationship="co_occurs_with",
-                    confidence=0.7,
-                    evidence=f"Found together in memory {memory_id}"
-                )
+        evidence = f"Found together in memory {memory_id}"
+        self.brain.add_knowledge_edges_bulk([
+            (concept1, concept2, "co_occurs_with", 0.7, evidence)
+            for i, concept1 in enumerate(concepts)
+            for concept2 in concepts[i+1:]
+        ])
 
     def _update_memory_access(self, memory_id: str) -> None:
         """Update memory access count and timestamp."""
@@ -355,35 +636,14 @@ class MemoryManager:
 
     def _cluster_similar_memories(self, memories: List[MemoryRecord]) -> List[List[MemoryRecord]]:
         """Group similar memories for consolidation."""
-        clusters = []
-        processed = set()
-
-        for i, memory1 in enumerate(memories):
-            if memory1.memory_id in processed:
-                continue
-
-            cluster = [memory1]
-            processed.add(memory1.memory_id)
-
-            # Find similar memories
-            if memory1.embedding_vector:
-                embedding1 = np.frombuffer(memory1.embedding_vector, dtype=np.float32)
-
-                for memory2 in memories[i+1:]:
-                    if memory2.memory_id in processed or not memory2.embedding_vector:
-                        continue
-
-                    embedding2 = np.frombuffer(memory2.embedding_vector, dtype=np.float32)
-                    similarity = self._calculate_similarity(embedding1, embedding2)
-
-                    if similarity > 0.8:  # High similarity threshold for clustering
-                        cluster.append(memory2)
-                        processed.add(memory2.memory_id)
-
-            if len(cluster) > 1:
-                clusters.append(cluster)
-
-        return clusters
+        embeddings = EmbeddingMatrix.from_records(memories)
+        by_id = {m.memory_id: m for m in memories}
+
+        # High similarity threshold for clustering
+        return [
+            [by_id[embeddings.memory_ids[row]] for row in cluster]
+            for cluster in embeddings.cluster(threshold=0.8)
+        ]
 
     def _create_consolidated_memory(self, memory_cluster: List[MemoryRecord]) -> str:
         """Create a consolidated memory from a cluster of similar memories."""
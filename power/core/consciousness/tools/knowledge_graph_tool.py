@@ -6,10 +6,11 @@ in the consciousness system, enabling logical reasoning and concept mapping.
 """
 
 import logging
-from typing import List, Dict, Any, Tuple, Optional, Set
+from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass
 
 from ..brain_database import PowerBrain
+from ..graph_index import KnowledgeGraphIndex
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,21 @@ class KnowledgeGraphTool:
         self.brain = brain
         self.concept_cache: Dict[str, ConceptNode] = {}
         self.relationship_cache: Dict[str, List[Tuple[str, str, float]]] = {}
+        self._graph: Optional[KnowledgeGraphIndex] = None
+        # min_cluster_size -> (graph version, clusters)
+        self._cluster_cache: Dict[int, Tuple[int, List[Dict[str, Any]]]] = {}
+
+    @property
+    def graph(self) -> KnowledgeGraphIndex:
+        """In-memory adjacency index, loaded on first use and kept current by the brain."""
+        if self._graph is None:
+            self._graph = KnowledgeGraphIndex()
+            # Subscribe before loading so edges written meanwhile are not lost
+            self.brain.add_edge_listener(self._graph.on_edges_added)
+            self._graph.add_edges(self.brain.get_knowledge_edges())
+            logger.info("Loaded knowledge graph index: %d concepts, %d edges",
+                        len(self._graph), self._graph.edge_count)
+        return self._graph
 
     async def explore_concept(self, concept: str, depth: int = 2) -> ConceptNode:
         """
@@ -69,8 +85,9 @@ class KnowledgeGraphTool:
         if concept in self.concept_cache:
             return self.concept_cache[concept]
 
-        # Get direct relationships from brain
-        related_concepts = self.brain.get_related_concepts(concept, max_depth=depth)
+        # Get direct relationships from the adjacency index
+        _ = depth  # Exploration is currently limited to direct relationships
+        related_concepts = self.graph.neighbors(concept, limit=20)
 
         if not related_concepts:
             # Create minimal node for unknown concept
@@ -106,133 +123,118 @@ class KnowledgeGraphTool:
         logger.info("Explored concept '%s' with %d relationships", concept, node.evidence_count)
         return node
 
-    async def find_connection_path(self, start_concept: str, end_concept: str,  # pylint: disable=too-many-locals
-                                 max_path_length: int = 4) -> Optional[RelationshipPath]:
+    async def find_connection_path(self, start_concept: str, end_concept: str,
+                                 max_path_length: int = 4,
+                                 strategy: str = "shortest") -> Optional[RelationshipPath]:
         """
         Find a path of relationships between two concepts.
 
         Args:
             start_concept: Starting concept
             end_concept: Target concept
-            max_path_length: Maximum path length to search
+            max_path_length: Maximum number of relationships in the path
+            strategy: "shortest" for fewest hops (bidirectional BFS) or
+                "confident" for the highest confidence product (best-first)
 
         Returns:
             RelationshipPath if connection exists, None otherwise
         """
-        # Use breadth-first search to find shortest path
-        visited: Set[str] = set()
-        queue: List[Tuple[str, List[str], List[str], float]] = [
-            (start_concept, [start_concept], [], 1.0)
-        ]
-
-        while queue and len(queue[0][1]) <= max_path_length:
-            current_concept, path, relationships, confidence = queue.pop(0)
-
-            if current_concept == end_concept and len(path) > 1:
-                # Found the target!
-                return RelationshipPath(
-                    start_concept=start_concept,
-                    end_concept=end_concept,
-                    path_nodes=path,
-                    relationship_chain=relationships,
-                    total_confidence=confidence,
-                    path_length=len(path) - 1
-                )
-
-            if current_concept in visited:
-                continue
-
-            visited.add(current_concept)
-
-            # Get neighbors
-            related_concepts = self.brain.get_related_concepts(current_concept, max_depth=1)
-
-            for neighbor, relationship, rel_confidence in related_concepts:
-                if neighbor not in visited:
-                    new_path = path + [neighbor]
-                    new_relationships = relationships + [relationship]
-                    new_confidence = confidence * rel_confidence
-
-                    queue.append((neighbor, new_path, new_relationships, new_confidence))
-
-        logger.info("No path found between '%s' and '%s'", start_concept, end_concept)
-        return None
+        if strategy == "confident":
+            found = self.graph.most_confident_path(start_concept, end_concept, max_path_length)
+        else:
+            found = self.graph.shortest_path(start_concept, end_concept, max_path_length)
+
+        if found is None:
+            logger.info("No path found between '%s' and '%s'", start_concept, end_concept)
+            return None
+
+        path_nodes, relationship_chain, confidence = found
+        return RelationshipPath(
+            start_concept=start_concept,
+            end_concept=end_concept,
+            path_nodes=path_nodes,
+            relationship_chain=relationship_chain,
+            total_confidence=confidence,
+            path_length=len(path_nodes) - 1
+        )
 
     async def get_concept_clusters(self, min_cluster_size: int = 3) -> List[Dict[str, Any]]:
         """
         Identify clusters of highly connected concepts.
 
+        Communities come from incremental label propagation over the graph
+        index. Results are cached until the graph's edge-change counter moves.
+
         Args:
             min_cluster_size: Minimum number of concepts in a cluster
 
         Returns:
             List of concept clusters with metadata
         """
-        # This is a simplified clustering algorithm
-        # In practice, would use more sophisticated graph clustering
-
-        # Get all unique concepts from the knowledge graph
-        _ = min_cluster_size  # Reserved for future implementation
-        _ = set()  # Would store all_concepts in full implementation
-
-        # Would implement proper concept extraction from the knowledge graph
-        # For now, return a placeholder structure
-        clusters = [
-            {
-                "cluster_id": "programming_concepts",
-                "concepts": ["python", "coding", "development", "programming"],
-                "central_concept": "programming",
-                "cluster_size": 4,
-                "internal_connections": 6,
-                "average_confidence": 0.85
-            },
-            {
-                "cluster_id": "ai_concepts",
-                "concepts": ["llm", "ai", "machine_learning", "neural_network"],
-                "central_concept": "ai",
-                "cluster_size": 4,
-                "internal_connections": 8,
-                "average_confidence": 0.92
-            }
-        ]
+        graph = self.graph
+        version = graph.version
+        cached = self._cluster_cache.get(min_cluster_size)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        clusters = []
+        for concepts in graph.communities(min_size=min_cluster_size):
+            members = set(concepts)
+            strength: Dict[str, float] = {}
+            internal_confidences = []
 
+            for concept in concepts:
+                for neighbor, _, confidence in graph.neighbors(concept):
+                    if neighbor in members:
+                        strength[concept] = strength.get(concept, 0.0) + confidence
+                        internal_confidences.append(confidence)
+
+            central_concept = max(concepts, key=lambda c: (strength.get(c, 0.0), c))
+            # Each internal edge is seen once from each endpoint
+            internal_connections = len(internal_confidences) // 2
+            clusters.append({
+                "cluster_id": f"{central_concept}_cluster",
+                "concepts": sorted(concepts, key=lambda c: -strength.get(c, 0.0)),
+                "central_concept": central_concept,
+                "cluster_size": len(concepts),
+                "internal_connections": internal_connections,
+                "average_confidence": (sum(internal_confidences) / len(internal_confidences)
+                                       if internal_confidences else 0.0)
+            })
+
+        self._cluster_cache[min_cluster_size] = (version, clusters)
         logger.info("Identified %d concept clusters", len(clusters))
         return clusters
 
     async def query_relationships(self, relationship_type: str,
-                                 confidence_threshold: float = 0.5) -> List[Dict[str, Any]]:
+                                 confidence_threshold: float = 0.5,
+                                 limit: int = 100) -> List[Dict[str, Any]]:
         """
         Query all relationships of a specific type.
 
         Args:
             relationship_type: Type of relationship to find
             confidence_threshold: Minimum confidence for relationships
+            limit: Maximum number of relationships to return
 
         Returns:
-            List of relationships matching the criteria
+            List of relationships matching the criteria, highest confidence first
         """
-        # This would query the knowledge_graph table directly
-        # For now, return a placeholder structure
-
-        relationships = []
+        rows = self.brain.get_relationships_by_type(
+            relationship_type, min_confidence=confidence_threshold, limit=limit
+        )
 
-        # Simulate relationship query results
-        mock_relationships = [
-            ("python", "programming_language", "is_a", 0.95),
-            ("claude", "ai_model", "is_a", 0.90),
-            ("pytest", "testing_framework", "is_a", 0.88)
+        relationships = [
+            {
+                "source": source,
+                "target": target,
+                "relationship": relationship_type,
+                "confidence": confidence,
+                "evidence": evidence or f"Relationship established with {confidence:.2f} confidence"
+            }
+            for source, target, confidence, evidence in rows
         ]
 
-        for source, target, rel_type, confidence in mock_relationships:
-            if rel_type == relationship_type and confidence >= confidence_threshold:
-                relationships.append({
-                    "source": source,
-                    "target": target,
-                    "relationship": rel_type,
-                    "confidence": confidence,
-                    "evidence": f"Relationship established with {confidence:.2f} confidence"
-                })
-
         logger.info("Found %d relationships of type '%s'", len(relationships), relationship_type)
         return relationships
 
@@ -290,7 +292,7 @@ class KnowledgeGraphTool:
         inferences = []
 
         # Get existing relationships for the concept
-        existing_relations = self.brain.get_related_concepts(concept)
+        existing_relations = self.graph.neighbors(concept, limit=20)
 
         if not existing_relations:
             return inferences
@@ -298,7 +300,7 @@ class KnowledgeGraphTool:
         # Simple inference: if A relates to B and B relates to C, maybe A relates to C
         for related_concept, relationship, confidence in existing_relations:
             # Get second-level relationships
-            second_level = self.brain.get_related_concepts(related_concept)
+            second_level = self.graph.neighbors(related_concept, limit=20)
 
             for second_concept, second_relationship, second_confidence in second_level:
                 if second_concept != concept:  # Avoid self-references
@@ -68,7 +68,7 @@ class MemorySearchTool:
         enhanced_query = self._enhance_query(query, context)
 
         # Perform the search
-        results = self.memory_manager.search_memories(
+        results = await self.memory_manager.asearch_memories(
             query=enhanced_query,
             memory_type=None,
             limit=limit,
@@ -184,7 +184,7 @@ class MemorySearchTool:
         types_to_search = memory_types or ["experience", "pattern", "task_execution"]
 
         for memory_type in types_to_search:
-            type_results = self.memory_manager.search_memories(
+            type_results = await self.memory_manager.asearch_memories(
                 query=pattern_description,
                 memory_type=memory_type,
                 limit=10,
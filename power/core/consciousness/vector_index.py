@@ -0,0 +1,370 @@
+"""
+Vector Index: Approximate nearest-neighbour search over memory embeddings.
+
+This module implements an inverted-file (IVF) index in pure NumPy so that
+semantic recall can cover the whole knowledge store in sub-linear time
+instead of re-scoring a handful of recently accessed rows.
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class VectorIndex:  # pylint: disable=too-many-instance-attributes
+    """
+    Inverted-file approximate nearest-neighbour index.
+
+    Embeddings are L2-normalised and partitioned into ``sqrt(n)`` cells by a
+    spherical k-means pass. A query only scores the vectors stored in the
+    ``n_probe`` cells whose centroids are closest to it. Below
+    ``min_train_size`` vectors the index falls back to an exact flat scan.
+    """
+
+    def __init__(self, dimension: Optional[int] = None, n_probe: int = 4,
+                 min_train_size: int = 256, seed: int = 0):
+        """
+        Initialize the vector index.
+
+        Args:
+            dimension: Embedding dimension (inferred from the first vector if omitted)
+            n_probe: Number of cells scanned per query
+            min_train_size: Vector count at which the IVF partition is first trained
+            seed: Seed for centroid initialisation, keeps rebuilds deterministic
+        """
+        self.dimension = dimension
+        self.n_probe = n_probe
+        self.min_train_size = min_train_size
+        self._rng = np.random.default_rng(seed)
+
+        self._size = 0
+        self._vectors = np.zeros((0, dimension or 0), dtype=np.float32)
+        self._type_codes = np.zeros(0, dtype=np.int32)
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._ids: List[str] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._type_names: List[str] = []
+        self._type_lookup: Dict[str, int] = {}
+
+        self._centroids: Optional[np.ndarray] = None
+        self._inverted_lists: List[List[int]] = []
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._id_to_row
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether queries are routed through the IVF partition."""
+        return self._centroids is not None
+
+    def add(self, memory_id: str, embedding: np.ndarray, memory_type: str) -> bool:
+        """
+        Add or replace a vector in the index.
+
+        Args:
+            memory_id: Identifier of the memory in ``knowledge_store``
+            embedding: Raw embedding vector
+            memory_type: Memory type used for filtered search
+
+        Returns:
+            True if the vector was indexed, False if its dimension does not match
+        """
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        if self.dimension is None:
+            self.dimension = int(vector.shape[0])
+            self._vectors = np.zeros((0, self.dimension), dtype=np.float32)
+        if vector.shape[0] != self.dimension:
+            return False
+
+        vector = self._normalize(vector)
+        type_code = self._intern_type(memory_type)
+
+        row = self._id_to_row.get(memory_id)
+        if row is None:
+            row = self._size
+            self._ensure_capacity(row + 1)
+            self._ids.append(memory_id)
+            self._id_to_row[memory_id] = row
+            self._size += 1
+        elif self._centroids is not None:
+            self._inverted_lists[self._assignments[row]].remove(row)
+
+        self._vectors[row] = vector
+        self._type_codes[row] = type_code
+
+        if self._centroids is not None:
+            cell = int(np.argmax(self._centroids @ vector))
+            self._assignments[row] = cell
+            self._inverted_lists[cell].append(row)
+
+        if self._size >= max(self.min_train_size, 2 * self._trained_size):
+            self.train()
+        return True
+
+    def search(self, query: np.ndarray, limit: int = 10,
+               memory_type: Optional[str] = None,
+               similarity_threshold: float = -1.0) -> List[Tuple[str, float]]:
+        """
+        Find the memories most similar to a query embedding.
+
+        Args:
+            query: Query embedding vector
+            limit: Maximum number of results
+            memory_type: Optional memory type filter
+            similarity_threshold: Minimum cosine similarity
+
+        Returns:
+            List of ``(memory_id, similarity)`` pairs, best first
+        """
+        if self._size == 0 or limit <= 0:
+            return []
+
+        query = np.asarray(query, dtype=np.float32).ravel()
+        if query.shape[0] != self.dimension:
+            return []
+        query = self._normalize(query)
+        if not query.any():
+            return []
+
+        type_code = None
+        if memory_type is not None:
+            type_code = self._type_lookup.get(memory_type)
+            if type_code is None:
+                return []
+
+        if self._centroids is None:
+            return self._score(np.arange(self._size), query, limit,
+                               type_code, similarity_threshold)
+
+        cell_order = np.argsort(-(self._centroids @ query))
+        rows = self._candidate_rows(cell_order, type_code, limit)
+        return self._score(rows, query, limit, None, similarity_threshold)
+
+    def search_batch(self, queries: np.ndarray, limit: int = 10,
+                     memory_type: Optional[str] = None,
+                     similarity_threshold: float = -1.0) -> List[List[Tuple[str, float]]]:
+        """
+        Search for several queries with a single matrix multiply.
+
+        Every query is scored against the union of the candidates probed for
+        the whole batch, so recall is at least that of :meth:`search`, and
+        under-filled queries stay in the same matrix multiply.
+
+        Args:
+            queries: Query embeddings, shape ``(n_queries, dimension)``
+            limit: Maximum number of results per query
+            memory_type: Optional memory type filter
+            similarity_threshold: Minimum cosine similarity
+
+        Returns:
+            One list of ``(memory_id, similarity)`` pairs per query, best first
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        empty: List[List[Tuple[str, float]]] = [[] for _ in range(len(queries))]
+        if self._size == 0 or limit <= 0 or queries.shape[1] != self.dimension:
+            return empty
+
+        norms = np.linalg.norm(queries, axis=1)
+        queries = queries / np.where(norms == 0, 1.0, norms)[:, None]
+
+        type_code = None
+        if memory_type is not None:
+            type_code = self._type_lookup.get(memory_type)
+            if type_code is None:
+                return empty
+
+        if self._centroids is None:
+            rows = np.arange(self._size)
+            if type_code is not None:
+                rows = rows[self._type_codes[rows] == type_code]
+        else:
+            # Union of every query's candidates, each widened for a
+            # selective type filter exactly as search() would
+            cell_orders = np.argsort(-(queries @ self._centroids.T), axis=1)
+            rows = np.unique(np.concatenate([
+                self._candidate_rows(cell_order, type_code, limit)
+                for cell_order, norm in zip(cell_orders, norms) if norm != 0
+            ] or [np.zeros(0, dtype=np.int64)]))
+
+        scores = queries @ self._vectors[rows].T if len(rows) else None
+        results = []
+        for i, norm in enumerate(norms):
+            if norm == 0 or scores is None:
+                results.append([])
+                continue
+            results.append(self._top_k(rows, scores[i], limit, similarity_threshold))
+        return results
+
+    def train(self, iterations: int = 10) -> None:
+        """
+        (Re)build the IVF partition with spherical k-means.
+
+        Args:
+            iterations: Number of Lloyd iterations
+        """
+        if self._size == 0:
+            return
+
+        vectors = self._vectors[:self._size]
+        n_cells = max(1, int(np.sqrt(self._size)))
+        sample_size = min(self._size, n_cells * 64)
+        sample = vectors[self._rng.choice(self._size, sample_size, replace=False)]
+        centroids = sample[self._rng.choice(sample_size, n_cells, replace=False)].copy()
+
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for cell in range(n_cells):
+                members = sample[labels == cell]
+                if len(members):
+                    centroids[cell] = self._normalize(members.sum(axis=0))
+
+        self._centroids = centroids
+        self._assignments[:self._size] = np.argmax(vectors @ centroids.T, axis=1)
+        self._inverted_lists = [[] for _ in range(n_cells)]
+        for row, cell in enumerate(self._assignments[:self._size]):
+            self._inverted_lists[cell].append(row)
+        self._trained_size = self._size
+
+        logger.debug("Trained vector index: %d vectors in %d cells", self._size, n_cells)
+
+    def save(self, path: str) -> None:
+        """
+        Persist the index atomically.
+
+        Args:
+            path: Destination file path
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as handle:
+            np.savez(
+                handle,
+                vectors=self._vectors[:self._size],
+                type_codes=self._type_codes[:self._size],
+                assignments=self._assignments[:self._size],
+                ids=np.array(self._ids, dtype=str),
+                type_names=np.array(self._type_names, dtype=str),
+                centroids=(self._centroids if self._centroids is not None
+                           else np.zeros((0, self.dimension or 0), dtype=np.float32)),
+                params=np.array([self.n_probe, self.min_train_size, self._trained_size]),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "VectorIndex":
+        """
+        Load an index previously written by :meth:`save`.
+
+        Args:
+            path: Index file path
+
+        Returns:
+            Restored vector index
+        """
+        with np.load(path, allow_pickle=False) as data:
+            vectors = data["vectors"].astype(np.float32)
+            n_probe, min_train_size, trained_size = (int(v) for v in data["params"])
+            index = cls(dimension=vectors.shape[1], n_probe=n_probe,
+                        min_train_size=min_train_size)
+            index._size = len(vectors)
+            index._vectors = vectors
+            index._type_codes = data["type_codes"].astype(np.int32)
+            index._assignments = data["assignments"].astype(np.int32)
+            index._ids = [str(memory_id) for memory_id in data["ids"]]
+            index._type_names = [str(name) for name in data["type_names"]]
+            centroids = data["centroids"].astype(np.float32)
+
+        index._id_to_row = {memory_id: row for row, memory_id in enumerate(index._ids)}
+        index._type_lookup = {name: code for code, name in enumerate(index._type_names)}
+        index._trained_size = trained_size
+        if len(centroids):
+            index._centroids = centroids
+            index._inverted_lists = [[] for _ in range(len(centroids))]
+            for row, cell in enumerate(index._assignments):
+                index._inverted_lists[cell].append(row)
+        return index
+
+    def _candidate_rows(self, cell_order: np.ndarray, type_code: Optional[int],
+                        limit: int) -> np.ndarray:
+        """
+        Collect the rows of the closest cells, filtered by memory type.
+
+        The probe is widened only when a selective type filter leaves fewer
+        than ``limit`` candidates; each widening step reads just the newly
+        added cells. The similarity threshold never widens the probe.
+        """
+        n_cells = len(cell_order)
+        probed, n_probe = 0, min(self.n_probe, n_cells)
+        chunks: List[np.ndarray] = []
+        found = 0
+        while True:
+            rows = np.asarray([row for cell in cell_order[probed:n_probe]
+                               for row in self._inverted_lists[cell]], dtype=np.int64)
+            if type_code is not None and len(rows):
+                rows = rows[self._type_codes[rows] == type_code]
+            chunks.append(rows)
+            found += len(rows)
+            probed = n_probe
+            if type_code is None or found >= limit or probed >= n_cells:
+                return np.concatenate(chunks)
+            n_probe = min(n_probe * 2, n_cells)
+
+    def _score(self, rows: np.ndarray, query: np.ndarray, limit: int,
+               type_code: Optional[int], threshold: float) -> List[Tuple[str, float]]:
+        """Score candidate rows and return the top matches above threshold."""
+        if type_code is not None and len(rows):
+            rows = rows[self._type_codes[rows] == type_code]
+        if not len(rows):
+            return []
+
+        return self._top_k(rows, self._vectors[rows] @ query, limit, threshold)
+
+    def _top_k(self, rows: np.ndarray, scores: np.ndarray, limit: int,
+               threshold: float) -> List[Tuple[str, float]]:
+        """Select the best-scoring rows above threshold."""
+        keep = scores >= threshold
+        rows, scores = rows[keep], scores[keep]
+        if len(rows) > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            rows, scores = rows[top], scores[top]
+
+        order = np.argsort(-scores, kind="stable")
+        return [(self._ids[rows[i]], float(scores[i])) for i in order]
+
+    def _intern_type(self, memory_type: str) -> int:
+        """Map a memory type name to a compact integer code."""
+        code = self._type_lookup.get(memory_type)
+        if code is None:
+            code = len(self._type_names)
+            self._type_names.append(memory_type)
+            self._type_lookup[memory_type] = code
+        return code
+
+    def _ensure_capacity(self, needed: int) -> None:
+        """Grow backing arrays geometrically so appends stay amortised O(1)."""
+        capacity = len(self._vectors)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2, 64)
+        vectors = np.zeros((new_capacity, self.dimension), dtype=np.float32)
+        vectors[:self._size] = self._vectors[:self._size]
+        type_codes = np.zeros(new_capacity, dtype=np.int32)
+        type_codes[:self._size] = self._type_codes[:self._size]
+        assignments = np.zeros(new_capacity, dtype=np.int32)
+        assignments[:self._size] = self._assignments[:self._size]
+        self._vectors, self._type_codes, self._assignments = vectors, type_codes, assignments
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        """Return the unit-length copy of a vector (zero vectors stay zero)."""
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return vector
+        return vector / norm
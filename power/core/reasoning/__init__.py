@@ -9,10 +9,18 @@ from .reasoning_engine import ReasoningEngine
 from .step_processor import StepProcessor
 from .mode_manager import ModeManager
 from .context_manager import ReasoningContextManager
+from .step_scheduler import StepScheduler
+from .complexity_classifier import ComplexityClassifier, ModeDecision
+from .pattern_matcher import PatternMatcher, ScanResult
 
 __all__ = [
     'ReasoningEngine',
     'StepProcessor', 
     'ModeManager',
-    'ReasoningContextManager'
+    'ReasoningContextManager',
+    'StepScheduler',
+    'ComplexityClassifier',
+    'ModeDecision',
+    'PatternMatcher',
+    'ScanResult'
 ]
\ No newline at end of file
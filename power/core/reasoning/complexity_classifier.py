@@ -0,0 +1,217 @@
+"""
+Complexity Classifier
+
+Local, trainable mode classifier used to answer adaptive mode selection
+without an LLM round-trip. Low-confidence predictions are escalated to the
+provider's complexity analysis, whose answer becomes a training label.
+"""
+
+import json
+import logging
+import math
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+from shared.models.reasoning_models import ReasoningMode
+
+
+@dataclass
+class ModeDecision:
+    """Represents a logged mode selection decision."""
+    request_id: str
+    mode: ReasoningMode
+    confidence: float
+    complexity_score: float
+    features: Dict[str, float]
+    matched_rules: List[str] = field(default_factory=list)
+    escalated: bool = False
+    final_mode: Optional[ReasoningMode] = None
+    satisfaction: Optional[float] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the decision to a dictionary for retraining exports."""
+        return {
+            'request_id': self.request_id,
+            'mode': self.mode.value,
+            'confidence': self.confidence,
+            'complexity_score': self.complexity_score,
+            'features': self.features,
+            'matched_rules': self.matched_rules,
+            'escalated': self.escalated,
+            'final_mode': self.final_mode.value if self.final_mode else None,
+            'satisfaction': self.satisfaction,
+            'created_at': self.created_at.isoformat()
+        }
+
+
+class ComplexityClassifier:
+    """
+    Softmax linear classifier over reasoning modes.
+
+    Features are sparse name/value pairs, so a prediction is a handful of
+    dictionary lookups. Weights start from a prior (the ModeManager rules)
+    and are refined online with ``learn``.
+    """
+
+    MODES = (
+        ReasoningMode.RAPID,
+        ReasoningMode.THOUGHTFUL,
+        ReasoningMode.CHAIN_OF_THOUGHT,
+        ReasoningMode.STEP_BY_STEP
+    )
+
+    def __init__(
+        self,
+        confidence_threshold: float = 0.75,
+        learning_rate: float = 0.1,
+        max_decisions: int = 1000
+    ):
+        """
+        Initialize the classifier with zero weights.
+
+        Args:
+            confidence_threshold: Minimum probability to trust a prediction
+            learning_rate: Step size for online updates
+            max_decisions: Number of recent decisions kept for retraining
+        """
+        self.logger = logging.getLogger(__name__)
+        self.confidence_threshold = confidence_threshold
+        self.learning_rate = learning_rate
+        self.max_decisions = max_decisions
+        self.weights: Dict[ReasoningMode, Dict[str, float]] = {mode: {} for mode in self.MODES}
+        self.decisions: 'OrderedDict[str, ModeDecision]' = OrderedDict()
+        self.updates = 0
+
+    def set_weight(self, feature: str, mode: ReasoningMode, weight: float) -> None:
+        """Set a feature's weight for a mode, e.g. to seed a prior."""
+        self.weights[mode][feature] = weight
+
+    def save_weights(self, path: str) -> None:
+        """
+        Write the learned weights to a JSON file.
+
+        The file is replaced atomically, so a crash mid-write keeps the
+        previous weights.
+
+        Args:
+            path: Destination file
+        """
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as weights_file:
+            json.dump({
+                'weights': {mode.value: weights for mode, weights in self.weights.items()},
+                'updates': self.updates
+            }, weights_file)
+        os.replace(temp_path, path)
+
+    def load_weights(self, path: str) -> None:
+        """
+        Replace the weights with ones saved by ``save_weights``.
+
+        Modes missing from the file keep no weights.
+
+        Args:
+            path: File written by ``save_weights``
+        """
+        with open(path, 'r', encoding='utf-8') as weights_file:
+            data = json.load(weights_file)
+
+        saved = data.get('weights', {})
+        self.weights = {mode: dict(saved.get(mode.value, {})) for mode in self.MODES}
+        self.updates = data.get('updates', 0)
+
+    def predict(self, features: Dict[str, float]) -> Tuple[ReasoningMode, float, Dict[ReasoningMode, float]]:
+        """
+        Predict the best mode for a feature vector.
+
+        Args:
+            features: Feature values keyed by name
+
+        Returns:
+            Tuple of predicted mode, its probability, and all probabilities
+        """
+        probabilities = self._probabilities(features)
+        mode = max(probabilities, key=probabilities.get)
+        return mode, probabilities[mode], probabilities
+
+    def is_confident(self, confidence: float) -> bool:
+        """Whether a prediction is confident enough to skip escalation."""
+        return confidence >= self.confidence_threshold
+
+    def learn(self, features: Dict[str, float], mode: ReasoningMode, weight: float = 1.0) -> None:
+        """
+        Take one gradient step towards (or, for negative weight, away from) a mode.
+
+        Args:
+            features: Feature values of the example
+            mode: Labelled mode
+            weight: Example weight; negative values penalize the mode
+        """
+        if mode not in self.weights or not weight:
+            return
+
+        probabilities = self._probabilities(features)
+        step = self.learning_rate * weight
+        for candidate in self.MODES:
+            gradient = (1.0 if candidate == mode else 0.0) - probabilities[candidate]
+            candidate_weights = self.weights[candidate]
+            for name, value in features.items():
+                candidate_weights[name] = candidate_weights.get(name, 0.0) + step * gradient * value
+        self.updates += 1
+
+    def _probabilities(self, features: Dict[str, float]) -> Dict[ReasoningMode, float]:
+        """Softmax over the modes' linear scores."""
+        scores = {}
+        for mode in self.MODES:
+            mode_weights = self.weights[mode]
+            scores[mode] = sum(mode_weights.get(name, 0.0) * value for name, value in features.items())
+
+        top = max(scores.values())
+        exps = {mode: math.exp(score - top) for mode, score in scores.items()}
+        total = sum(exps.values())
+        return {mode: value / total for mode, value in exps.items()}
+
+    def log_decision(self, decision: ModeDecision) -> None:
+        """
+        Keep a decision for later labelling and log it.
+
+        Args:
+            decision: The decision to record
+        """
+        self.decisions[decision.request_id] = decision
+        self.decisions.move_to_end(decision.request_id)
+        while len(self.decisions) > self.max_decisions:
+            self.decisions.popitem(last=False)
+
+        self.logger.info(
+            "Mode decision %s: %s (confidence %.2f, %s)",
+            decision.request_id, decision.mode.value, decision.confidence,
+            'escalated' if decision.escalated else 'local'
+        )
+
+    def get_decision(self, request_id: str) -> Optional[ModeDecision]:
+        """Get a recent decision by request id."""
+        return self.decisions.get(request_id)
+
+    def export_decisions(self) -> List[Dict[str, Any]]:
+        """Export recent decisions, oldest first, for offline retraining."""
+        return [decision.to_dict() for decision in self.decisions.values()]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get classifier statistics."""
+        decisions = list(self.decisions.values())
+        escalated = sum(1 for decision in decisions if decision.escalated)
+        labelled = [decision for decision in decisions if decision.escalated and decision.final_mode]
+        agreed = sum(1 for decision in labelled if decision.final_mode == decision.mode)
+        return {
+            'decisions': len(decisions),
+            'escalated': escalated,
+            'local_rate': (len(decisions) - escalated) / len(decisions) if decisions else 0.0,
+            'escalation_agreement': agreed / len(labelled) if labelled else 0.0,
+            'updates': self.updates,
+            'confidence_threshold': self.confidence_threshold
+        }
@@ -257,6 +257,20 @@ class ReasoningContextManager:
         
         return context_info
     
+    def get_reasoning_patterns(self, session_id: str) -> Dict[str, Any]:
+        """
+        Get the reasoning patterns of a session's history.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Dict[str, Any]: Reasoning patterns, empty for unknown sessions
+        """
+        if session_id not in self.contexts:
+            return {}
+        return self._analyze_reasoning_patterns(self.contexts[session_id])
+    
     def _analyze_reasoning_patterns(self, context: ReasoningContext) -> Dict[str, Any]:
         """Analyze user's reasoning patterns from history."""
         patterns = {
@@ -6,7 +6,7 @@ and historical performance data.
 """
 
 import logging
-import re
+import os
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
@@ -15,6 +15,8 @@ from shared.models.reasoning_models import (
     ComplexityAnalysis,
     ConfidenceLevel
 )
+from .complexity_classifier import ComplexityClassifier, ModeDecision
+from .pattern_matcher import PatternMatcher, ScanResult
 
 
 @dataclass
@@ -35,12 +37,39 @@ class ModeManager:
     reasoning mode based on content patterns and complexity indicators.
     """
     
-    def __init__(self):
-        """Initialize the mode manager with default rules."""
+    # Classifier logit contributed by a matching rule, per unit of rule weight
+    RULE_PRIOR_SCALE = 3.0
+
+    # Patterns behind the complexity score, scanned together with the rules
+    COMPLEXITY_PATTERNS = {
+        ('complexity', 'question'): [r'\b(what|why|how|when|where|which|who)\b'],
+        ('complexity', 'technical', 0): [r'\b(algorithm|implementation|architecture|system|database)\b'],
+        ('complexity', 'technical', 1): [r'\b(analysis|synthesis|evaluation|optimization)\b'],
+        ('complexity', 'technical', 2): [r'\b(complex|complicated|sophisticated|advanced)\b'],
+        ('complexity', 'math'): [r'[\+\-\*\/\=\(\)\[\]]'],
+        ('complexity', 'conditional'): [r'\b(if|then|else|when|unless|provided|given)\b']
+    }
+    TECHNICAL_CATEGORIES = tuple(
+        category for category in COMPLEXITY_PATTERNS if category[1] == 'technical'
+    )
+
+    def __init__(self, classifier_path: Optional[str] = None):
+        """
+        Initialize the mode manager with default rules.
+        
+        Args:
+            classifier_path: Optional JSON file the classifier's learned
+                weights are loaded from and saved to after each update
+        """
         self.logger = logging.getLogger(__name__)
         self.mode_rules = self._initialize_mode_rules()
         self.performance_history: Dict[str, List[float]] = {}
-        
+        self.classifier = ComplexityClassifier()
+        self.classifier_path = classifier_path
+        self._seed_classifier()
+        self._load_classifier()
+        self._build_matcher()
+
     def _initialize_mode_rules(self) -> List[ModeRule]:
         """Initialize default mode selection rules."""
         return [
@@ -123,6 +152,126 @@ class ModeManager:
             )
         ]
     
+    def _seed_classifier(self) -> None:
+        """Seed the classifier's weights from the mode rules and complexity heuristic."""
+        for rule in self.mode_rules:
+            self.classifier.set_weight(f"rule:{rule.name}", rule.mode, rule.weight * self.RULE_PRIOR_SCALE)
+
+        # Same leanings determine_optimal_mode gives length and complexity
+        self.classifier.set_weight('length', ReasoningMode.THOUGHTFUL, 0.9)
+        self.classifier.set_weight('length', ReasoningMode.STEP_BY_STEP, 0.6)
+        self.classifier.set_weight('complexity', ReasoningMode.RAPID, -1.5)
+        self.classifier.set_weight('complexity', ReasoningMode.THOUGHTFUL, 0.5)
+        self.classifier.set_weight('complexity', ReasoningMode.CHAIN_OF_THOUGHT, 0.5)
+        self.classifier.set_weight('complexity', ReasoningMode.STEP_BY_STEP, 1.5)
+
+    def _build_matcher(self) -> None:
+        """Compile the rule and complexity patterns into one matcher."""
+        categories: Dict[Any, List[str]] = dict(self.COMPLEXITY_PATTERNS)
+        for index, rule in enumerate(self.mode_rules):
+            categories[('rule', index)] = [rule.pattern]
+        self.matcher = PatternMatcher(categories)
+
+    def scan_prompt(self, prompt: str) -> ScanResult:
+        """
+        Scan a prompt once for every mode rule and complexity pattern.
+
+        Args:
+            prompt: The input prompt
+
+        Returns:
+            ScanResult: Match counts keyed by ``('rule', index)`` into
+            ``mode_rules`` and by ``COMPLEXITY_PATTERNS`` category
+        """
+        return self.matcher.scan(prompt)
+
+    def extract_features(
+        self,
+        prompt: str,
+        history: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, float]:
+        """
+        Extract classifier features for a prompt.
+        
+        Args:
+            prompt: The input prompt
+            history: Optional reasoning patterns from ReasoningContextManager
+            
+        Returns:
+            Dict[str, float]: Feature values keyed by name
+        """
+        scan = self.scan_prompt(prompt)
+        features = {
+            'bias': 1.0,
+            'length': min(len(prompt) / 1000, 1.0),
+            'complexity': self._calculate_complexity_score(prompt, scan)
+        }
+        
+        for index, rule in enumerate(self.mode_rules):
+            if scan.matched(('rule', index)):
+                features[f"rule:{rule.name}"] = 1.0
+        
+        if history:
+            features['history:complexity'] = history.get('complexity_preference', 0.5)
+            features['history:speed'] = history.get('speed_preference', 0.5)
+            mode_counts = history.get('preferred_modes') or {}
+            total = sum(mode_counts.values())
+            for mode, count in mode_counts.items():
+                features[f"history:mode:{mode}"] = count / total
+        
+        return features
+    
+    def classify(
+        self,
+        prompt: str,
+        request_id: str,
+        history: Optional[Dict[str, Any]] = None
+    ) -> ModeDecision:
+        """
+        Classify a prompt locally and log the decision.
+        
+        Args:
+            prompt: The input prompt
+            request_id: Request identifier the decision is logged under
+            history: Optional reasoning patterns from ReasoningContextManager
+            
+        Returns:
+            ModeDecision: Predicted mode; ``escalated`` is set when its
+            confidence is too low to skip the provider's analysis
+        """
+        features = self.extract_features(prompt, history)
+        mode, confidence, _ = self.classifier.predict(features)
+        
+        decision = ModeDecision(
+            request_id=request_id,
+            mode=mode,
+            confidence=confidence,
+            complexity_score=features['complexity'],
+            features=features,
+            matched_rules=[name[len('rule:'):] for name in features if name.startswith('rule:')],
+            escalated=not self.classifier.is_confident(confidence)
+        )
+        if not decision.escalated:
+            decision.final_mode = mode
+        self.classifier.log_decision(decision)
+        return decision
+    
+    def record_escalation(self, request_id: str, recommended_mode: ReasoningMode) -> None:
+        """
+        Learn from the provider's recommendation for an escalated decision.
+        
+        Args:
+            request_id: Request identifier of the decision
+            recommended_mode: Mode the provider's complexity analysis chose
+        """
+        decision = self.classifier.get_decision(request_id)
+        if decision is None:
+            return
+        
+        decision.final_mode = recommended_mode
+        self.classifier.learn(decision.features, recommended_mode)
+        self.save_classifier()
+    
     def determine_optimal_mode(
         self, 
         prompt: str, 
@@ -138,7 +287,7 @@ class ModeManager:
         Returns:
             ReasoningMode: The recommended reasoning mode
         """
-        prompt_lower = prompt.lower()
+        scan = self.scan_prompt(prompt)
         mode_scores: Dict[ReasoningMode, float] = {
             ReasoningMode.RAPID: 0.0,
             ReasoningMode.THOUGHTFUL: 0.0,
@@ -147,8 +296,8 @@ class ModeManager:
         }
         
         # Apply rules to calculate scores
-        for rule in self.mode_rules:
-            if re.search(rule.pattern, prompt_lower, re.IGNORECASE):
+        for index, rule in enumerate(self.mode_rules):
+            if scan.matched(('rule', index)):
                 mode_scores[rule.mode] += rule.weight
                 self.logger.debug(f"Rule '{rule.name}' matched, +{rule.weight} to {rule.mode.value}")
         
@@ -158,7 +307,7 @@ class ModeManager:
         mode_scores[ReasoningMode.STEP_BY_STEP] += prompt_length_factor * 0.2
         
         # Factor in complexity indicators
-        complexity_score = self._calculate_complexity_score(prompt)
+        complexity_score = self._calculate_complexity_score(prompt, scan)
         if complexity_score > 0.7:
             mode_scores[ReasoningMode.STEP_BY_STEP] += 0.4
         elif complexity_score > 0.5:
@@ -180,16 +329,19 @@ class ModeManager:
         
         return optimal_mode
     
-    def _calculate_complexity_score(self, prompt: str) -> float:
+    def _calculate_complexity_score(self, prompt: str, scan: Optional[ScanResult] = None) -> float:
         """
         Calculate a complexity score for the prompt.
         
         Args:
             prompt: The input prompt
+            scan: Scan of the prompt, if already available
             
         Returns:
             float: Complexity score between 0 and 1
         """
+        if scan is None:
+            scan = self.scan_prompt(prompt)
         score = 0.0
         
         # Length factor
@@ -197,26 +349,20 @@ class ModeManager:
         score += length_score
         
         # Question complexity
-        question_words = len(re.findall(r'\b(what|why|how|when|where|which|who)\b', prompt.lower()))
+        question_words = scan.count(('complexity', 'question'))
         score += min(question_words * 0.1, 0.2)
         
         # Technical terms
-        technical_patterns = [
-            r'\b(algorithm|implementation|architecture|system|database)\b',
-            r'\b(analysis|synthesis|evaluation|optimization)\b',
-            r'\b(complex|complicated|sophisticated|advanced)\b'
-        ]
-        
-        for pattern in technical_patterns:
-            if re.search(pattern, prompt.lower()):
+        for category in self.TECHNICAL_CATEGORIES:
+            if scan.matched(category):
                 score += 0.15
         
-        # Mathematical content
-        if re.search(r'[\+\-\*\/\=\(\)\[\]]', prompt) or re.search(r'\b\d+\b', prompt):
+        # Mathematical content (any number contains a standalone integer)
+        if scan.matched(('complexity', 'math')) or scan.numbers:
             score += 0.1
         
         # Conditional logic
-        if re.search(r'\b(if|then|else|when|unless|provided|given)\b', prompt.lower()):
+        if scan.matched(('complexity', 'conditional')):
             score += 0.1
         
         return min(score, 1.0)
@@ -249,16 +395,28 @@ class ModeManager:
         self, 
         user_id: str, 
         mode: ReasoningMode, 
-        satisfaction_score: float
+        satisfaction_score: float,
+        request_id: Optional[str] = None
     ) -> None:
         """
         Record performance data for future mode selection.
         
+        With a request id whose decision is still logged, the classifier is
+        also trained: towards the mode on satisfaction above 0.5, away from
+        it below.
+        
         Args:
             user_id: User identifier
             mode: Mode that was used
             satisfaction_score: User satisfaction score (0-1)
+            request_id: Optional request identifier of the logged decision
         """
+        decision = self.classifier.get_decision(request_id) if request_id else None
+        if decision is not None:
+            decision.satisfaction = satisfaction_score
+            self.classifier.learn(decision.features, mode, weight=2 * (satisfaction_score - 0.5))
+            self.save_classifier()
+        
         if user_id not in self.performance_history:
             self.performance_history[user_id] = []
         
@@ -268,6 +426,26 @@ class ModeManager:
         if len(self.performance_history[user_id]) > 20:
             self.performance_history[user_id] = self.performance_history[user_id][-20:]
     
+    def save_classifier(self) -> None:
+        """Persist the classifier's learned weights, if a path is configured."""
+        if self.classifier_path is None:
+            return
+        try:
+            self.classifier.save_weights(self.classifier_path)
+        except OSError as e:
+            self.logger.warning("Could not save classifier weights to %s: %s", self.classifier_path, e)
+    
+    def _load_classifier(self) -> None:
+        """Replace the seeded prior with previously learned weights, if saved."""
+        if self.classifier_path is None or not os.path.exists(self.classifier_path):
+            return
+        try:
+            self.classifier.load_weights(self.classifier_path)
+        except (OSError, ValueError) as e:
+            self.logger.warning("Keeping the rule prior, unreadable classifier weights %s: %s",
+                                self.classifier_path, e)
+            self._seed_classifier()
+    
     def get_mode_statistics(self) -> Dict[str, Any]:
         """Get statistics about mode usage and performance."""
         
@@ -286,12 +464,15 @@ class ModeManager:
             'total_users': total_users,
             'average_satisfaction': avg_satisfaction,
             'rule_count': len(self.mode_rules),
+            'classifier': self.classifier.get_statistics(),
             'supported_modes': [mode.value for mode in ReasoningMode]
         }
     
     def add_custom_rule(self, rule: ModeRule) -> None:
         """Add a custom mode selection rule."""
         self.mode_rules.append(rule)
+        self._build_matcher()
+        self.classifier.set_weight(f"rule:{rule.name}", rule.mode, rule.weight * self.RULE_PRIOR_SCALE)
         self.logger.info(f"Added custom rule: {rule.name}")
     
     def remove_rule(self, rule_name: str) -> bool:
@@ -299,6 +480,7 @@ class ModeManager:
         for i, rule in enumerate(self.mode_rules):
             if rule.name == rule_name:
                 self.mode_rules.pop(i)
+                self._build_matcher()
                 self.logger.info(f"Removed rule: {rule_name}")
                 return True
         return False
\ No newline at end of file
@@ -0,0 +1,269 @@
+"""
+Pattern Matcher
+
+Compiled multi-pattern scanner for reasoning text. Keyword patterns are
+compiled into word lookup tables, so a text is tokenized once and every
+category is counted in the same pass, together with the words, numbers,
+sentences and questions found on the way.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterable, List, Optional, Pattern, Tuple
+
+# One pass over the text yields words and sentence punctuation
+_TOKEN = re.compile(r'(\w+)|[.!?]+')
+
+# Keyword patterns: \b(alt|alt...)\b or \b(alt|alt...)\w*\b, where each
+# alternative is words joined by literal separators or \s+
+_KEYWORD_PATTERN = re.compile(r"^\\b\(((?:[\w \-'|]|\\s\+)+)\)(\\w\*)?\\b$")
+_ALTERNATIVE_PART = re.compile(r"(\\s\+|[^\w\\]+)")
+
+# Separator between the words of an alternative; None means \s+
+Alternative = Tuple[Tuple[str, ...], Tuple[Optional[str], ...]]
+
+
+@dataclass
+class ScanResult:
+    """Represents everything found in one scan of a text."""
+    counts: Dict[Hashable, int] = field(default_factory=dict)
+    words: List[str] = field(default_factory=list)
+    numbers: List[str] = field(default_factory=list)
+    sentences: int = 0
+    questions: int = 0
+
+    def count(self, category: Hashable) -> int:
+        """Number of matches for a category."""
+        return self.counts.get(category, 0)
+
+    def matched(self, category: Hashable) -> bool:
+        """Whether a category matched at all."""
+        return self.counts.get(category, 0) > 0
+
+    def merge(self, other: 'ScanResult') -> None:
+        """Add another scan's findings to this one."""
+        for category, count in other.counts.items():
+            self.counts[category] = self.counts.get(category, 0) + count
+        self.words.extend(other.words)
+        self.numbers.extend(other.numbers)
+        self.sentences += other.sentences
+        self.questions += other.questions
+
+
+@dataclass
+class _KeywordPattern:
+    """A keyword pattern compiled to its alternatives."""
+    category: Hashable
+    alternatives: List[Alternative]
+    prefix: bool
+
+
+def _parse_keyword_pattern(pattern: str) -> Optional[Tuple[List[Alternative], bool]]:
+    """
+    Parse a keyword pattern into lowercased alternatives.
+
+    Args:
+        pattern: Regex pattern
+
+    Returns:
+        Alternatives and whether the last word is a prefix, or None if the
+        pattern is not a plain keyword pattern
+    """
+    match = _KEYWORD_PATTERN.match(pattern)
+    if not match:
+        return None
+
+    alternatives = []
+    for alternative in match.group(1).split('|'):
+        parts = _ALTERNATIVE_PART.split(alternative.lower())
+        words, separators = parts[0::2], parts[1::2]
+        if not all(words):
+            return None
+        alternatives.append((
+            tuple(words),
+            tuple(None if separator == r'\s+' else separator for separator in separators)
+        ))
+    return alternatives, match.group(2) is not None
+
+
+class PatternMatcher:
+    """
+    Scan text for many categorized patterns in a single pass.
+
+    Keyword patterns (``\\b(word|two\\s+words)\\b``, optionally with a
+    ``\\w*`` suffix making the last word a prefix) are indexed by their
+    first word. The text is tokenized once and each word is looked up in
+    those tables, which gives the same counts as summing ``re.findall``
+    over the patterns (case-insensitively). Any other pattern keeps its
+    own compiled regex and is counted separately.
+    """
+
+    def __init__(self, categories: Dict[Hashable, Iterable[str]], flags: int = re.IGNORECASE):
+        """
+        Compile the patterns.
+
+        Args:
+            categories: Patterns keyed by category
+            flags: Regex flags for patterns that are not keyword patterns
+        """
+        self.categories = {category: list(patterns) for category, patterns in categories.items()}
+        self._keyword_patterns: List[_KeywordPattern] = []
+        self._regex_patterns: List[Tuple[Hashable, Pattern]] = []
+        # First word (or prefix) -> [(pattern index, alternative index)]
+        self._exact_index: Dict[str, List[Tuple[int, int]]] = {}
+        self._prefix_index: Dict[str, List[Tuple[int, int]]] = {}
+
+        for category, patterns in self.categories.items():
+            for pattern in patterns:
+                parsed = _parse_keyword_pattern(pattern)
+                if parsed is None:
+                    self._regex_patterns.append((category, re.compile(pattern, flags)))
+                    continue
+
+                alternatives, prefix = parsed
+                pattern_index = len(self._keyword_patterns)
+                self._keyword_patterns.append(_KeywordPattern(category, alternatives, prefix))
+                for alternative_index, (words, _) in enumerate(alternatives):
+                    index = self._prefix_index if prefix and len(words) == 1 else self._exact_index
+                    index.setdefault(words[0], []).append((pattern_index, alternative_index))
+
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._prefix_index})
+
+    def scan(self, text: str) -> ScanResult:
+        """
+        Scan a text once.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            ScanResult: Category counts, lowercased words, numbers, and
+            sentence and question counts
+        """
+        counts = {category: 0 for category in self.categories}
+        words: List[str] = []
+        spans: List[Tuple[int, int]] = []
+        sentences = questions = 0
+
+        for token in _TOKEN.finditer(text):
+            if token.group(1) is None:
+                sentences += 1
+                questions += token.group().count('?')
+            else:
+                words.append(token.group().lower())
+                spans.append(token.span())
+
+        self._count_keywords(text, words, spans, counts)
+        for category, regex in self._regex_patterns:
+            counts[category] += len(regex.findall(text))
+
+        return ScanResult(
+            counts=counts,
+            words=words,
+            numbers=self._numbers(text, words, spans),
+            sentences=sentences,
+            questions=questions
+        )
+
+    def _count_keywords(
+        self,
+        text: str,
+        words: List[str],
+        spans: List[Tuple[int, int]],
+        counts: Dict[Hashable, int]
+    ) -> None:
+        """Count keyword pattern matches starting at each word."""
+        exact_index = self._exact_index
+        prefix_index = self._prefix_index
+        prefix_lengths = self._prefix_lengths
+        # Word index each pattern's previous match ends at (matches never overlap)
+        busy_until: Dict[int, int] = {}
+
+        for position, word in enumerate(words):
+            candidates = list(exact_index.get(word, ()))
+            for length in prefix_lengths:
+                if length > len(word):
+                    break
+                candidates.extend(prefix_index.get(word[:length], ()))
+            if not candidates:
+                continue
+
+            # Like a regex alternation, the first alternative that matches wins
+            candidates.sort()
+            matched_pattern = None
+            for pattern_index, alternative_index in candidates:
+                if pattern_index == matched_pattern or busy_until.get(pattern_index, -1) > position:
+                    continue
+                keyword_pattern = self._keyword_patterns[pattern_index]
+                length = self._match_length(
+                    text, words, spans, position,
+                    keyword_pattern.alternatives[alternative_index], keyword_pattern.prefix
+                )
+                if length:
+                    counts[keyword_pattern.category] += 1
+                    busy_until[pattern_index] = position + length
+                    matched_pattern = pattern_index
+
+    @staticmethod
+    def _match_length(
+        text: str,
+        words: List[str],
+        spans: List[Tuple[int, int]],
+        position: int,
+        alternative: Alternative,
+        prefix: bool
+    ) -> int:
+        """Number of words an alternative matches at a position, 0 if none."""
+        alternative_words, separators = alternative
+        last = len(alternative_words) - 1
+        if position + last >= len(words):
+            return 0
+
+        for offset, expected in enumerate(alternative_words):
+            word = words[position + offset]
+            if offset == last and prefix:
+                if not word.startswith(expected):
+                    return 0
+            elif word != expected:
+                return 0
+
+            if offset < last:
+                gap = text[spans[position + offset][1]:spans[position + offset + 1][0]]
+                separator = separators[offset]
+                if separator is None:
+                    if not gap or not gap.isspace():
+                        return 0
+                elif gap != separator:
+                    return 0
+
+        return last + 1
+
+    @staticmethod
+    def _numbers(text: str, words: List[str], spans: List[Tuple[int, int]]) -> List[str]:
+        """Integers and decimals, as ``\\b\\d+(?:\\.\\d+)?\\b`` finds them."""
+        numbers = []
+        position = 0
+        while position < len(words):
+            word = words[position]
+            if word.isdecimal():
+                following = position + 1
+                if (following < len(words) and words[following].isdecimal()
+                        and text[spans[position][1]:spans[following][0]] == '.'):
+                    numbers.append(text[spans[position][0]:spans[following][1]])
+                    position = following + 1
+                    continue
+                numbers.append(text[spans[position][0]:spans[position][1]])
+            position += 1
+        return numbers
+
+    def scan_many(self, texts: Iterable[str]) -> List[ScanResult]:
+        """
+        Scan several texts with the same compiled patterns.
+
+        Args:
+            texts: Texts to scan
+
+        Returns:
+            List[ScanResult]: One result per text, in order
+        """
+        return [self.scan(text) for text in texts]
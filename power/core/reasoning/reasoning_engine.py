@@ -7,7 +7,9 @@ different reasoning modes and manages the reasoning workflow.
 
 import logging
 import time
-from typing import AsyncIterator
+from contextlib import aclosing
+from dataclasses import replace
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional
 
 from shared.interfaces.reasoning_provider import ReasoningProvider
 from shared.models.reasoning_models import (
@@ -24,6 +26,8 @@ from shared.models.reasoning_models import (
 from .mode_manager import ModeManager
 from .step_processor import StepProcessor
 from .context_manager import ReasoningContextManager
+from .step_scheduler import StepScheduler
+from .complexity_classifier import ModeDecision
 
 
 class ReasoningEngine:
@@ -34,15 +38,28 @@ class ReasoningEngine:
     and coordinates between rapid and thoughtful responses.
     """
 
-    def __init__(self, reasoning_provider: ReasoningProvider):
+    # Expected seconds per mode, reported with locally classified requests
+    LOCAL_TIME_ESTIMATES = {
+        ReasoningMode.RAPID: 1.0,
+        ReasoningMode.THOUGHTFUL: 5.0,
+        ReasoningMode.CHAIN_OF_THOUGHT: 8.0,
+        ReasoningMode.STEP_BY_STEP: 12.0
+    }
+
+    def __init__(self, reasoning_provider: ReasoningProvider, speculative_execution: bool = True,
+                 classifier_path: Optional[str] = None):
         """
         Initialize the reasoning engine.
 
         Args:
             reasoning_provider: The reasoning provider implementation
+            speculative_execution: In adaptive mode, start the locally
+                predicted mode while complexity analysis is still running
+            classifier_path: Optional file persisting the mode classifier's weights
         """
         self.provider = reasoning_provider
-        self.mode_manager = ModeManager()
+        self.speculative_execution = speculative_execution
+        self.mode_manager = ModeManager(classifier_path=classifier_path)
         self.step_processor = StepProcessor()
         self.context_manager = ReasoningContextManager()
         self.metrics = ReasoningMetrics()
@@ -66,12 +83,11 @@ class ReasoningEngine:
 
             # Analyze complexity if adaptive mode
             if request.mode == ReasoningMode.ADAPTIVE:
-                analysis = await self._analyze_complexity(request.prompt)
-                request.mode = analysis.recommended_mode
-                request.metadata['complexity_analysis'] = analysis.to_dict()
-
-            # Process based on mode
-            response = await self._process_by_mode(request)
+                response = await self._process_adaptive(request)
+            else:
+                response = await self._timed_step(
+                    f"mode:{request.mode.value}", self._process_by_mode(request)
+                )
 
             # Calculate processing time
             processing_time = time.time() - start_time
@@ -104,6 +120,106 @@ class ReasoningEngine:
                 provider=self.provider.get_provider_info()['name']
             )
 
+    async def _process_adaptive(self, request: ReasoningRequest) -> ReasoningResponse:
+        """
+        Select a mode for the request and process it.
+
+        The ModeManager's local classifier answers first. Only when its
+        confidence is low is the provider's complexity analysis called; the
+        analysis and a predicted mode then run as independent steps of one
+        schedule, so on a correct prediction the reasoning is already under
+        way when the analysis returns. Since the classifier was unsure, the
+        prediction comes from the rule-based ``determine_optimal_mode``. A
+        wrong prediction is cancelled and the recommended mode runs instead.
+        """
+        decision = self.mode_manager.classify(
+            request.prompt, str(request.id), self._reasoning_patterns(request)
+        )
+
+        if not decision.escalated:
+            analysis = self._local_analysis(request.prompt, decision)
+            request.mode = analysis.recommended_mode
+            request.metadata['complexity_analysis'] = analysis.to_dict()
+            return await self._timed_step(f"mode:{request.mode.value}", self._process_by_mode(request))
+
+        scheduler = StepScheduler(on_step_timing=self.metrics.record_step_timing)
+        scheduler.add('complexity_analysis', lambda _: self._analyze_complexity(request.prompt))
+
+        predicted_mode = predicted_step = None
+        if self.speculative_execution:
+            predicted_mode = self.mode_manager.determine_optimal_mode(request.prompt, request.context)
+            predicted_step = f"mode:{predicted_mode.value}"
+            speculative_request = replace(request, mode=predicted_mode)
+            scheduler.add(predicted_step, lambda _: self._process_by_mode(speculative_request))
+
+        try:
+            analysis = await scheduler.result('complexity_analysis')
+            request.mode = analysis.recommended_mode
+            request.metadata['complexity_analysis'] = analysis.to_dict()
+            self.mode_manager.record_escalation(str(request.id), analysis.recommended_mode)
+
+            if predicted_step is not None:
+                if predicted_mode == analysis.recommended_mode:
+                    self.metrics.speculation_hits += 1
+                    return await scheduler.result(predicted_step)
+
+                self.metrics.speculation_misses += 1
+                scheduler.cancel(predicted_step)
+                self.logger.debug(
+                    "Speculative %s mode cancelled, analysis recommended %s",
+                    predicted_mode.value, request.mode.value
+                )
+        except BaseException:
+            scheduler.cancel_all()
+            raise
+
+        return await self._timed_step(f"mode:{request.mode.value}", self._process_by_mode(request))
+
+    def _reasoning_patterns(self, request: ReasoningRequest) -> Dict[str, Any]:
+        """Reasoning patterns of the request's session, if it has one."""
+        session_id = request.context.get('session_id')
+        if not session_id:
+            return {}
+        return self.context_manager.get_reasoning_patterns(session_id)
+
+    def _local_analysis(self, prompt: str, decision: ModeDecision) -> ComplexityAnalysis:
+        """Build a complexity analysis from a confident local decision."""
+        return ComplexityAnalysis(
+            prompt=prompt,
+            complexity_score=decision.complexity_score,
+            recommended_mode=decision.mode,
+            reasoning_factors=decision.matched_rules,
+            estimated_time=self.LOCAL_TIME_ESTIMATES.get(decision.mode, 5.0),
+            confidence=decision.confidence,
+            metadata={'source': 'local_classifier'}
+        )
+
+    async def _timed_step(self, step_name: str, step: Awaitable[Any]) -> Any:
+        """Await a step and record its duration in the metrics."""
+        start_time = time.perf_counter()
+        result = await step
+        self.metrics.record_step_timing(step_name, time.perf_counter() - start_time)
+        return result
+
+    async def _collect_provider_steps(
+        self,
+        request: ReasoningRequest,
+        thinking_chain: ThinkingChain
+    ) -> None:
+        """Add provider reasoning steps to the chain, timing each one."""
+        step_start = time.perf_counter()
+        async with aclosing(self.provider.think_step_by_step(request)) as steps:
+            async for step in steps:
+                duration = time.perf_counter() - step_start
+                step.metadata['duration_seconds'] = duration
+                self.metrics.record_step_timing('provider_step', duration)
+                thinking_chain.add_step(step)
+
+                # Stop if max steps reached
+                if len(thinking_chain.steps) >= request.max_steps:
+                    break
+                step_start = time.perf_counter()
+
     async def _process_by_mode(self, request: ReasoningRequest) -> ReasoningResponse:
         """Process request based on the specified reasoning mode."""
 
@@ -148,12 +264,7 @@ class ReasoningEngine:
         thinking_chain = ThinkingChain()
 
         # Process step by step through provider
-        async for step in self.provider.think_step_by_step(request):
-            thinking_chain.add_step(step)
-
-            # Stop if max steps reached
-            if len(thinking_chain.steps) >= request.max_steps:
-                break
+        await self._collect_provider_steps(request, thinking_chain)
 
         # Generate final answer based on steps
         if thinking_chain.steps:
@@ -185,11 +296,7 @@ class ReasoningEngine:
         thinking_chain.add_step(analysis_step)
 
         # Process through provider for detailed reasoning
-        async for step in self.provider.think_step_by_step(request):
-            thinking_chain.add_step(step)
-
-            if len(thinking_chain.steps) >= request.max_steps:
-                break
+        await self._collect_provider_steps(request, thinking_chain)
 
         # Add conclusion step
         if thinking_chain.steps:
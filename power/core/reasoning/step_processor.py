@@ -6,7 +6,7 @@ step validation, enhancement, and analysis.
 """
 
 import logging
-import re
+from collections import Counter
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
@@ -16,6 +16,7 @@ from shared.models.reasoning_models import (
     ConfidenceLevel,
     ThinkingChain
 )
+from .pattern_matcher import PatternMatcher, ScanResult
 
 
 class StepProcessor:
@@ -26,11 +27,22 @@ class StepProcessor:
     and provides utilities for step analysis and optimization.
     """
     
+    # Words ignored by keyword extraction
+    COMMON_WORDS = frozenset({
+        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+        'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+        'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+        'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we',
+        'they', 'me', 'him', 'her', 'us', 'them'
+    })
+    
     def __init__(self):
         """Initialize the step processor."""
         self.logger = logging.getLogger(__name__)
         self.step_patterns = self._initialize_step_patterns()
         self.confidence_indicators = self._initialize_confidence_indicators()
+        # Step type and confidence patterns share one compiled matcher
+        self.matcher = PatternMatcher({**self.step_patterns, **self.confidence_indicators})
         
     def _initialize_step_patterns(self) -> Dict[StepType, List[str]]:
         """Initialize patterns for step type detection."""
@@ -87,56 +99,81 @@ class StepProcessor:
             ]
         }
     
-    def process_step(self, step: ReasoningStep) -> ReasoningStep:
+    def scan_content(self, content: str) -> ScanResult:
+        """
+        Scan step content once for every step type and confidence pattern.
+        
+        Args:
+            content: The step content to scan
+            
+        Returns:
+            ScanResult: Pattern counts, words, numbers, sentences and questions
+        """
+        return self.matcher.scan(content)
+    
+    def scan_chain(self, chain: ThinkingChain) -> List[ScanResult]:
+        """
+        Scan every step of a thinking chain with the compiled patterns.
+        
+        Args:
+            chain: The thinking chain to scan
+            
+        Returns:
+            List[ScanResult]: One result per step, in step order
+        """
+        return self.matcher.scan_many(step.content for step in chain.steps)
+    
+    def process_step(self, step: ReasoningStep, scan: Optional[ScanResult] = None) -> ReasoningStep:
         """
         Process and enhance a reasoning step with additional metadata.
         
         Args:
             step: The reasoning step to process
+            scan: Scan of the step's content, if already available
             
         Returns:
             ReasoningStep: The enhanced step
         """
+        if scan is None:
+            scan = self.scan_content(step.content)
+        
         # Auto-detect step type if not set or generic
         if step.step_type == StepType.ANALYSIS:
-            detected_type = self._detect_step_type(step.content)
+            detected_type = self._detect_step_type(step.content, scan)
             if detected_type != StepType.ANALYSIS:
                 step.step_type = detected_type
         
         # Auto-detect confidence level if not set properly
         if step.confidence == ConfidenceLevel.MEDIUM:
-            detected_confidence = self._detect_confidence_level(step.content)
+            detected_confidence = self._detect_confidence_level(step.content, scan)
             if detected_confidence != ConfidenceLevel.MEDIUM:
                 step.confidence = detected_confidence
         
         # Enhance metadata
-        step.metadata.update(self._extract_metadata(step))
+        step.metadata.update(self._extract_metadata(step, scan))
         
         # Validate step content
-        validation_results = self._validate_step(step)
+        validation_results = self._validate_step(step, scan)
         step.metadata['validation'] = validation_results
         
         self.logger.debug(f"Processed step {step.step_number}: {step.step_type.value}")
         
         return step
     
-    def _detect_step_type(self, content: str) -> StepType:
+    def _detect_step_type(self, content: str, scan: Optional[ScanResult] = None) -> StepType:
         """
         Detect the type of reasoning step based on content.
         
         Args:
             content: The step content to analyze
+            scan: Scan of the content, if already available
             
         Returns:
             StepType: The detected step type
         """
-        content_lower = content.lower()
-        type_scores: Dict[StepType, int] = {step_type: 0 for step_type in StepType}
-        
-        for step_type, patterns in self.step_patterns.items():
-            for pattern in patterns:
-                matches = len(re.findall(pattern, content_lower, re.IGNORECASE))
-                type_scores[step_type] += matches
+        if scan is None:
+            scan = self.scan_content(content)
+        type_scores: Dict[StepType, int] = {step_type: scan.count(step_type) for step_type in StepType}
         
         # Return type with highest score, default to ANALYSIS
         if max(type_scores.values()) > 0:
@@ -144,95 +181,100 @@ class StepProcessor:
         
         return StepType.ANALYSIS
     
-    def _detect_confidence_level(self, content: str) -> ConfidenceLevel:
+    def _detect_confidence_level(
+        self,
+        content: str,
+        scan: Optional[ScanResult] = None
+    ) -> ConfidenceLevel:
         """
         Detect confidence level based on language used in content.
         
         Args:
             content: The content to analyze
+            scan: Scan of the content, if already available
             
         Returns:
             ConfidenceLevel: The detected confidence level
         """
-        content_lower = content.lower()
+        if scan is None:
+            scan = self.scan_content(content)
         confidence_scores: Dict[ConfidenceLevel, int] = {
-            level: 0 for level in ConfidenceLevel
+            level: scan.count(level) for level in ConfidenceLevel
         }
         
-        for confidence_level, patterns in self.confidence_indicators.items():
-            for pattern in patterns:
-                matches = len(re.findall(pattern, content_lower, re.IGNORECASE))
-                confidence_scores[confidence_level] += matches
-        
         # Return level with highest score, default to MEDIUM
         if max(confidence_scores.values()) > 0:
             return max(confidence_scores, key=confidence_scores.get)
         
         return ConfidenceLevel.MEDIUM
     
-    def _extract_metadata(self, step: ReasoningStep) -> Dict[str, Any]:
+    def _extract_metadata(
+        self,
+        step: ReasoningStep,
+        scan: Optional[ScanResult] = None
+    ) -> Dict[str, Any]:
         """
         Extract additional metadata from the step content.
         
         Args:
             step: The reasoning step
+            scan: Scan of the step's content, if already available
             
         Returns:
             Dict[str, Any]: Extracted metadata
         """
+        if scan is None:
+            scan = self.scan_content(step.content)
         metadata = {}
         
         # Content statistics
         metadata['word_count'] = len(step.content.split())
         metadata['character_count'] = len(step.content)
-        metadata['sentence_count'] = len(re.findall(r'[.!?]+', step.content))
+        metadata['sentence_count'] = scan.sentences
         
         # Extract keywords
-        keywords = self._extract_keywords(step.content)
+        keywords = self._extract_keywords(step.content, scan.words)
         metadata['keywords'] = keywords
         
         # Detect questions
-        questions = re.findall(r'[^.!?]*\?', step.content)
-        metadata['questions'] = len(questions)
+        metadata['questions'] = scan.questions
         
         # Detect numbers and calculations
-        numbers = re.findall(r'\b\d+(?:\.\d+)?\b', step.content)
-        metadata['numbers'] = numbers
+        metadata['numbers'] = list(scan.numbers)
         
         # Processing timestamp
         metadata['processed_at'] = datetime.utcnow().isoformat()
         
         return metadata
     
-    def _extract_keywords(self, content: str) -> List[str]:
-        """Extract key terms from content."""
+    def _extract_keywords(self, content: str, words: Optional[List[str]] = None) -> List[str]:
+        """Extract key terms from content, or from its already lowercased words."""
         # Simple keyword extraction - remove common words
-        common_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
-            'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-            'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we',
-            'they', 'me', 'him', 'her', 'us', 'them'
-        }
-        
-        words = re.findall(r'\b\w+\b', content.lower())
-        keywords = [word for word in words if len(word) > 3 and word not in common_words]
+        if words is None:
+            words = self.scan_content(content).words
+        keywords = [word for word in words if len(word) > 3 and word not in self.COMMON_WORDS]
         
         # Return unique keywords, limited to most frequent
-        from collections import Counter
         keyword_counts = Counter(keywords)
         return [word for word, count in keyword_counts.most_common(10)]
     
-    def _validate_step(self, step: ReasoningStep) -> Dict[str, Any]:
+    def _validate_step(
+        self,
+        step: ReasoningStep,
+        scan: Optional[ScanResult] = None
+    ) -> Dict[str, Any]:
         """
         Validate a reasoning step for quality and completeness.
         
         Args:
             step: The step to validate
+            scan: Scan of the step's content, if already available
             
         Returns:
             Dict[str, Any]: Validation results
         """
+        if scan is None:
+            scan = self.scan_content(step.content)
         validation = {
             'is_valid': True,
             'issues': [],
@@ -246,7 +288,7 @@ class StepProcessor:
             validation['quality_score'] -= 0.3
         
         # Check for meaningful content
-        if not re.search(r'\b\w{4,}\b', step.content):
+        if not any(len(word) >= 4 for word in scan.words):
             validation['issues'].append('Content lacks meaningful words')
             validation['quality_score'] -= 0.2
         
@@ -287,9 +329,10 @@ class StepProcessor:
         if not chain.steps:
             return chain
         
-        # Process each step
-        for i, step in enumerate(chain.steps):
-            chain.steps[i] = self.process_step(step)
+        # Process each step, scanning the whole chain with the compiled patterns
+        scans = self.scan_chain(chain)
+        for i, (step, scan) in enumerate(zip(chain.steps, scans)):
+            chain.steps[i] = self.process_step(step, scan)
         
         # Ensure logical flow
         chain = self._ensure_logical_flow(chain)
@@ -0,0 +1,169 @@
+"""
+Step Scheduler
+
+Runs reasoning steps as a dependency graph: each step starts as soon as the
+steps it depends on have finished, so independent steps run concurrently.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+StepFunction = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass
+class ScheduledStep:
+    """Represents a step in the scheduling graph."""
+    name: str
+    run: StepFunction
+    depends_on: Tuple[str, ...] = ()
+
+
+class StepScheduler:
+    """
+    Dependency-graph scheduler for asynchronous reasoning steps.
+
+    Each step receives the results of its dependencies keyed by step name.
+    Steps can be awaited individually, so a caller can act on an early
+    result (e.g. complexity analysis) and cancel a speculative step it no
+    longer needs while the rest of the graph keeps running.
+    """
+
+    def __init__(self, on_step_timing: Optional[Callable[[str, float], None]] = None):
+        """
+        Initialize an empty scheduler.
+
+        Args:
+            on_step_timing: Called with the step name and duration in seconds
+                whenever a step finishes successfully
+        """
+        self.logger = logging.getLogger(__name__)
+        self.steps: Dict[str, ScheduledStep] = {}
+        self.timings: Dict[str, float] = {}
+        self._on_step_timing = on_step_timing
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def add(
+        self,
+        name: str,
+        run: StepFunction,
+        depends_on: Tuple[str, ...] = ()
+    ) -> None:
+        """
+        Add a step to the graph.
+
+        Args:
+            name: Unique step name
+            run: Coroutine function taking the dependency results
+            depends_on: Names of steps that must finish first
+
+        Raises:
+            ValueError: If the name is taken, a dependency is unknown, or the
+                scheduler has already started
+        """
+        if self._tasks:
+            raise ValueError("Cannot add steps after the scheduler has started")
+        if name in self.steps:
+            raise ValueError(f"Duplicate step name: {name}")
+        unknown = [dep for dep in depends_on if dep not in self.steps]
+        if unknown:
+            raise ValueError(f"Step '{name}' depends on unknown steps: {', '.join(unknown)}")
+
+        self.steps[name] = ScheduledStep(name=name, run=run, depends_on=tuple(depends_on))
+
+    def start(self) -> None:
+        """Start every step; each waits for its own dependencies."""
+        if self._tasks:
+            return
+        # Dependencies must already exist when a step is added, so insertion
+        # order is a topological order and the graph cannot contain cycles
+        for step in self.steps.values():
+            task = asyncio.create_task(self._run_step(step), name=step.name)
+            task.add_done_callback(self._retrieve_exception)
+            self._tasks[step.name] = task
+
+    @staticmethod
+    def _retrieve_exception(task: asyncio.Task) -> None:
+        """Mark a failure retrieved in case nobody awaits the step."""
+        if not task.cancelled():
+            task.exception()
+
+    async def _run_step(self, step: ScheduledStep) -> Any:
+        """Wait for a step's dependencies, then run and time it."""
+        dependency_results = {}
+        for dep in step.depends_on:
+            dependency_results[dep] = await asyncio.shield(self._tasks[dep])
+
+        start_time = time.perf_counter()
+        result = await step.run(dependency_results)
+        duration = time.perf_counter() - start_time
+
+        self.timings[step.name] = duration
+        if self._on_step_timing:
+            self._on_step_timing(step.name, duration)
+        self.logger.debug("Step '%s' finished in %.3fs", step.name, duration)
+        return result
+
+    async def result(self, name: str) -> Any:
+        """
+        Wait for a step and return its result.
+
+        Args:
+            name: Step name
+
+        Returns:
+            The step's result
+
+        Raises:
+            Exception: Whatever the step (or one of its dependencies) raised
+        """
+        self.start()
+        return await asyncio.shield(self._tasks[name])
+
+    def cancel(self, name: str) -> None:
+        """
+        Cancel a step and every step depending on it.
+
+        Args:
+            name: Step name
+        """
+        for step_name in self._dependents(name):
+            task = self._tasks.get(step_name)
+            if task and not task.done():
+                task.cancel()
+                self.logger.debug("Cancelled step '%s'", step_name)
+
+    def cancel_all(self) -> None:
+        """Cancel every unfinished step."""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+
+    def _dependents(self, name: str) -> Tuple[str, ...]:
+        """A step followed by all steps that depend on it, directly or not."""
+        affected = [name]
+        for step in self.steps.values():
+            if any(dep in affected for dep in step.depends_on):
+                affected.append(step.name)
+        return tuple(affected)
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Run the whole graph.
+
+        Returns:
+            Results keyed by step name
+
+        Raises:
+            Exception: The first step failure; unfinished steps are cancelled
+        """
+        self.start()
+        try:
+            results = await asyncio.gather(*self._tasks.values())
+        except BaseException:
+            self.cancel_all()
+            raise
+        return dict(zip(self._tasks.keys(), results))
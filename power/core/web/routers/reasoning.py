@@ -6,8 +6,9 @@ with step-by-step thinking and adaptive response modes.
 """
 
 import logging
+from contextlib import aclosing
 from typing import Dict, Any, List, Optional
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 import json
@@ -23,6 +24,7 @@ from shared.models.reasoning_models import (
     ComplexityAnalysis
 )
 from adapters.claude_reasoning import ClaudeReasoningClient
+from shared.utils.bounded_stream import bounded_stream
 # from core.web.dependencies import get_current_user
 
 
@@ -94,6 +96,9 @@ logger = logging.getLogger(__name__)
 # Global reasoning engine instance
 _reasoning_engine: Optional[ReasoningEngine] = None
 
+# Steps read ahead of a slow SSE client before the reasoning stream pauses
+STREAM_BUFFER_SIZE = 8
+
 
 def get_current_user() -> Dict[str, Any]:
     """Mock current user for testing."""
@@ -110,12 +115,31 @@ def get_reasoning_engine() -> ReasoningEngine:
     if _reasoning_engine is None:
         # Initialize with Claude reasoning provider
         claude_provider = ClaudeReasoningClient()
-        _reasoning_engine = ReasoningEngine(claude_provider)
+        _reasoning_engine = ReasoningEngine(
+            claude_provider, classifier_path=claude_provider.config.classifier_weights_path
+        )
         logger.info("Reasoning engine initialized with Claude provider")
     
     return _reasoning_engine
 
 
+async def close_reasoning_engine() -> None:
+    """Close the shared reasoning provider's pooled connections on app shutdown."""
+    global _reasoning_engine
+    
+    if _reasoning_engine is None:
+        return
+    
+    close = getattr(_reasoning_engine.provider, 'aclose', None)
+    if close is not None:
+        await close()
+    _reasoning_engine = None
+    logger.info("Reasoning engine closed")
+
+
+router.add_event_handler("shutdown", close_reasoning_engine)
+
+
 @router.post("/reason", response_model=ReasoningResponseAPI)
 async def reason(
     request: ReasoningRequestAPI,
@@ -219,13 +243,16 @@ async def thoughtful_response(
 @router.post("/stream")
 async def stream_reasoning(
     request: ReasoningRequestAPI,
+    http_request: Request,
     current_user: Dict[str, Any] = Depends(get_current_user),
     reasoning_engine: ReasoningEngine = Depends(get_reasoning_engine)
 ):
     """
     Stream reasoning steps as they are generated.
     
-    Returns a server-sent events stream of reasoning steps.
+    Returns a server-sent events stream of reasoning steps. Steps are read
+    ahead through a bounded queue, and the reasoning stream is closed as
+    soon as the client disconnects.
     """
     try:
         async def generate_steps():
@@ -249,22 +276,29 @@ async def stream_reasoning(
             
             try:
                 step_count = 0
-                async for step in reasoning_engine.stream_reasoning(reasoning_request):
-                    step_data = {
-                        'step_number': step.step_number,
-                        'step_type': step.step_type.value,
-                        'description': step.description,
-                        'content': step.content,
-                        'confidence': step.confidence.value,
-                        'timestamp': step.timestamp.isoformat()
-                    }
-                    
-                    yield f"data: {json.dumps(step_data)}\n\n"
-                    step_count += 1
-                    
-                    if step_count >= request.max_steps:
-                        break
-                
+                steps = bounded_stream(reasoning_engine.stream_reasoning(reasoning_request),
+                                       STREAM_BUFFER_SIZE)
+                async with aclosing(steps):
+                    async for step in steps:
+                        if await http_request.is_disconnected():
+                            logger.info("Client disconnected, stopping reasoning stream")
+                            return
+
+                        step_data = {
+                            'step_number': step.step_number,
+                            'step_type': step.step_type.value,
+                            'description': step.description,
+                            'content': step.content,
+                            'confidence': step.confidence.value,
+                            'timestamp': step.timestamp.isoformat()
+                        }
+
+                        yield f"data: {json.dumps(step_data)}\n\n"
+                        step_count += 1
+
+                        if step_count >= request.max_steps:
+                            break
+
                 # Send completion event
                 yield f"data: {json.dumps({'type': 'complete', 'total_steps': step_count})}\n\n"
                 
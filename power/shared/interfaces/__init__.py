@@ -2,12 +2,15 @@
 
 # Shared interfaces for adapter contracts
 from .memory_provider import MemoryProvider, MemoryType, MemoryQuery, MemoryItem
-from .llm_provider import LLMProvider
+from .llm_provider import LLMProvider, AsyncLLMProvider
+from .embedding_provider import EmbeddingProvider
 
 __all__ = [
     'MemoryProvider',
     'MemoryType', 
     'MemoryQuery',
     'MemoryItem',
-    'LLMProvider'
+    'LLMProvider',
+    'AsyncLLMProvider',
+    'EmbeddingProvider'
 ]
@@ -0,0 +1,56 @@
+"""
+Embedding Provider Interface
+
+Defines the contract for turning text into dense vector embeddings.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+import numpy as np
+
+
+class EmbeddingProvider(ABC):
+    """Abstract base class for embedding providers."""
+
+    @abstractmethod
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed a batch of texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 array of shape ``(len(texts), dimension)``
+        """
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """Return the dimension of the produced embeddings."""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def model_name(self) -> str:
+        """
+        Return a stable identifier for the embedding model.
+
+        Embeddings from different models are not comparable, so caches key
+        on this name as well as the text.
+        """
+        raise NotImplementedError
+
+    def embed_text(self, text: str) -> np.ndarray:
+        """
+        Embed a single text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            float32 vector of length ``dimension``
+        """
+        return self.embed_texts([text])[0]
@@ -3,10 +3,13 @@ Abstract interface for LLM providers.
 All LLM adapters MUST implement this interface to ensure compatibility.
 """
 
+import asyncio
+import uuid
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Callable
+from datetime import datetime
+from typing import Dict, Any, List, Callable, Optional
 from shared.models.llm_request import LLMRequest
-from shared.models.llm_response import LLMResponse
+from shared.models.llm_response import BatchResponse, FinishReason, LLMResponse, UsageStats
 
 
 class LLMProvider(ABC):
@@ -101,6 +104,140 @@ class LLMProvider(ABC):
         return feature in self.supported_features
 
 
+class AsyncLLMProvider(ABC):
+    """
+    Asynchronous counterpart of LLMProvider for use from an event loop.
+
+    Implementations await the provider's async SDK and back off with
+    ``asyncio.sleep``, so a slow or rate-limited call never blocks other
+    coroutines.
+    """
+
+    # Upper bound on in-flight requests for one batch
+    default_batch_concurrency = 8
+
+    @abstractmethod
+    async def generate_text(self, request: LLMRequest) -> LLMResponse:
+        """
+        Generate text based on the provided request.
+
+        Args:
+            request: LLM request containing prompt and parameters
+
+        Returns:
+            LLM response with generated content and metadata
+
+        Raises:
+            LLMProviderError: Base exception for LLM-related errors
+            RateLimitError: When rate limits are exceeded
+            QuotaExceededError: When usage quotas are exceeded
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def generate_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Generate chat completion from conversation messages.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            LLM response with generated content and metadata
+        """
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def provider_name(self) -> str:
+        """Return the name of the LLM provider (e.g., 'gemini', 'openai')."""
+        raise NotImplementedError
+
+    def batch_concurrency(self, batch_size: int) -> int:
+        """
+        Decide how many requests of a batch may be in flight at once.
+
+        Providers with a rate limiter override this to size the batch to
+        the remaining budget.
+
+        Args:
+            batch_size: Number of requests in the batch
+
+        Returns:
+            Concurrency limit (at least 1)
+        """
+        return max(1, min(batch_size, self.default_batch_concurrency))
+
+    async def batch_generate_text(
+        self,
+        requests: List[LLMRequest],
+        max_concurrency: Optional[int] = None
+    ) -> BatchResponse:
+        """
+        Generate text for many requests concurrently.
+
+        Requests run behind a semaphore so at most ``max_concurrency`` are
+        in flight; a failed request becomes an error response instead of
+        failing the batch. Responses keep the order of ``requests``.
+
+        Args:
+            requests: LLM requests to run
+            max_concurrency: Override for :meth:`batch_concurrency`
+
+        Returns:
+            BatchResponse with one response per request
+        """
+        start_time = datetime.now()
+        semaphore = asyncio.Semaphore(
+            max(1, max_concurrency or self.batch_concurrency(len(requests)))
+        )
+
+        async def run(request: LLMRequest) -> LLMResponse:
+            async with semaphore:
+                try:
+                    return await self.generate_text(request)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    return LLMResponse(
+                        content="",
+                        finish_reason=FinishReason.ERROR,
+                        usage=UsageStats(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+                        model=request.model or 'unknown',
+                        provider=self.provider_name,
+                        request_id=request.request_id,
+                        provider_metadata={'error': str(e)}
+                    )
+
+        responses = list(await asyncio.gather(*(run(request) for request in requests)))
+        failed = sum(1 for response in responses if response.had_error)
+        costs = [r.usage.total_cost for r in responses if r.usage.total_cost is not None]
+
+        return BatchResponse(
+            responses=responses,
+            batch_id=uuid.uuid4().hex,
+            total_requests=len(responses),
+            successful_requests=len(responses) - failed,
+            failed_requests=failed,
+            start_time=start_time,
+            end_time=datetime.now(),
+            total_usage=UsageStats(
+                prompt_tokens=sum(r.usage.prompt_tokens for r in responses),
+                completion_tokens=sum(r.usage.completion_tokens for r in responses),
+                total_tokens=sum(r.usage.total_tokens for r in responses),
+                total_cost=sum(costs) if costs else None,
+                cached_prompt_tokens=sum(r.usage.cached_prompt_tokens for r in responses),
+                cache_write_tokens=sum(r.usage.cache_write_tokens for r in responses)
+            )
+        )
+
+    async def aclose(self) -> None:
+        """Release async resources such as HTTP sessions."""
+
+
 class MultiModalLLMProvider(LLMProvider):
     """Extended interface for LLM providers that support multimodal inputs."""
 
@@ -32,6 +32,15 @@ class UsageStats:
     completion_cost: Optional[float] = None
     total_cost: Optional[float] = None
 
+    # Prompt-prefix caching (subset of prompt_tokens, if the provider reports it)
+    cached_prompt_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Fraction of prompt tokens served from the provider's prompt cache."""
+        return self.cached_prompt_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert usage stats to dictionary format."""
         result = {
@@ -46,6 +55,10 @@ class UsageStats:
             result['completion_cost'] = self.completion_cost
         if self.total_cost is not None:
             result['total_cost'] = self.total_cost
+        if self.cached_prompt_tokens:
+            result['cached_prompt_tokens'] = self.cached_prompt_tokens
+        if self.cache_write_tokens:
+            result['cache_write_tokens'] = self.cache_write_tokens
 
         return result
 
@@ -190,6 +203,116 @@ class StreamingResponse:
         return result
 
 
+class StreamAccumulator:
+    """
+    Streamed content collected as a list of deltas.
+
+    Appending is O(1) and the full text is joined only when asked for, so
+    a stream costs O(n) in its final length rather than the O(n^2) of
+    concatenating a growing string per chunk.
+    """
+
+    __slots__ = ('_parts', '_length')
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, delta: str) -> int:
+        """
+        Add a content delta.
+
+        Args:
+            delta: New content
+
+        Returns:
+            Content length after the delta
+        """
+        if delta:
+            self._parts.append(delta)
+            self._length += len(delta)
+        return self._length
+
+    @property
+    def text(self) -> str:
+        """All content so far, joined once and kept joined."""
+        if len(self._parts) > 1:
+            self._parts = [''.join(self._parts)]
+        return self._parts[0] if self._parts else ''
+
+    def text_until(self, end: int) -> str:
+        """
+        Content up to a length the stream had earlier.
+
+        Args:
+            end: Content length to cut at
+
+        Returns:
+            Prefix of the content
+        """
+        text = self.text
+        return text if end >= len(text) else text[:end]
+
+
+class StreamChunk:
+    """
+    Delta-only chunk in a streaming LLM response.
+
+    Lighter alternative to StreamingResponse: it carries only the new
+    content and a shared accumulator reference, so memory for the whole
+    stream stays bounded by the final output size. ``cumulative_content``
+    is still available, materialized on demand.
+    """
+
+    __slots__ = ('content_delta', 'is_final', 'chunk_index', 'final_response', '_accumulator', '_end')
+
+    def __init__(
+        self,
+        content_delta: str,
+        accumulator: StreamAccumulator,
+        is_final: bool = False,
+        chunk_index: int = 0,
+        final_response: Optional[LLMResponse] = None
+    ):
+        """
+        Initialize a chunk; the delta must already be in the accumulator.
+
+        Args:
+            content_delta: New content since last chunk
+            accumulator: Accumulator holding the stream's content
+            is_final: Whether this is the last chunk
+            chunk_index: Position of the chunk in the stream
+            final_response: Complete response, on the final chunk only
+        """
+        self.content_delta = content_delta
+        self.is_final = is_final
+        self.chunk_index = chunk_index
+        self.final_response = final_response
+        self._accumulator = accumulator
+        self._end = len(accumulator)
+
+    @property
+    def cumulative_content(self) -> str:
+        """All content up to and including this chunk."""
+        return self._accumulator.text_until(self._end)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the chunk to dictionary format, without cumulative content."""
+        result = {
+            'content_delta': self.content_delta,
+            'is_final': self.is_final,
+            'chunk_index': self.chunk_index
+        }
+
+        if self.final_response:
+            result['final_response'] = self.final_response.to_dict()
+
+        return result
+
+
 @dataclass
 class BatchResponse:  # pylint: disable=too-many-instance-attributes
     """Response for batch processing of multiple LLM requests."""
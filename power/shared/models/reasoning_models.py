@@ -225,6 +225,9 @@ class ReasoningMetrics:
     complexity_distribution: Dict[str, int] = field(default_factory=dict)
     confidence_distribution: Dict[str, int] = field(default_factory=dict)
     total_tokens_used: int = 0
+    step_timings: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    speculation_hits: int = 0
+    speculation_misses: int = 0
     last_updated: datetime = field(default_factory=datetime.utcnow)
     
     def success_rate(self) -> float:
@@ -233,6 +236,25 @@ class ReasoningMetrics:
             return 0.0
         return self.successful_requests / self.total_requests
     
+    def record_step_timing(self, step_name: str, duration: float) -> None:
+        """
+        Add one run of a named step to its timing statistics.
+        
+        Args:
+            step_name: Step name, e.g. 'complexity_analysis'
+            duration: Step duration in seconds
+        """
+        timing = self.step_timings.get(step_name)
+        if timing is None:
+            timing = self.step_timings[step_name] = {
+                'count': 0, 'total_time': 0.0, 'average_time': 0.0, 'max_time': 0.0
+            }
+        timing['count'] += 1
+        timing['total_time'] += duration
+        timing['average_time'] = timing['total_time'] / timing['count']
+        timing['max_time'] = max(timing['max_time'], duration)
+        self.last_updated = datetime.utcnow()
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert reasoning metrics to dictionary."""
         return {
@@ -245,6 +267,9 @@ class ReasoningMetrics:
             'complexity_distribution': self.complexity_distribution,
             'confidence_distribution': self.confidence_distribution,
             'total_tokens_used': self.total_tokens_used,
+            'step_timings': self.step_timings,
+            'speculation_hits': self.speculation_hits,
+            'speculation_misses': self.speculation_misses,
             'last_updated': self.last_updated.isoformat()
         }
 
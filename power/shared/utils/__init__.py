@@ -1,7 +1,14 @@
 """Shared utilities for Power Builder."""
 
-from .rate_limiter import BaseRateLimiter, AdaptiveRateLimiter, RateLimitStats
+from .rate_limiter import BaseRateLimiter, AdaptiveRateLimiter, RateLimitStats, GCRABucket
 from .cache import ResponseCache, CacheStats, generate_cache_key, cache_response, get_global_cache
+from .disk_cache import DiskCache
+from .shared_rate_limit import SharedRateLimitState
+from .latency import LatencyTracker
+from .single_flight import SingleFlight
+from .bounded_stream import bounded_stream, close_stream
+from .token_counter import TokenCounter, MessageTally, get_token_counter
+from .conversation_window import ConversationWindow
 from .email_validator import (
     EmailValidationError,
     validate_email_address,
@@ -13,11 +20,22 @@ __all__ = [
     'BaseRateLimiter',
     'AdaptiveRateLimiter',
     'RateLimitStats',
+    'GCRABucket',
     'ResponseCache',
     'CacheStats',
     'generate_cache_key',
     'cache_response',
     'get_global_cache',
+    'DiskCache',
+    'SharedRateLimitState',
+    'LatencyTracker',
+    'SingleFlight',
+    'bounded_stream',
+    'close_stream',
+    'TokenCounter',
+    'MessageTally',
+    'get_token_counter',
+    'ConversationWindow',
     'EmailValidationError',
     'validate_email_address',
     'is_valid_email',
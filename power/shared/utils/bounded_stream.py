@@ -0,0 +1,93 @@
+"""
+Bounded async stream buffering.
+Reads an async source ahead of its consumer through a fixed-size queue, so
+network reads overlap with a slow consumer without ever buffering more than
+a few chunks, and closing the consumer cancels and closes the source.
+"""
+
+import asyncio
+import inspect
+from typing import Any, AsyncIterator, TypeVar
+
+T = TypeVar('T')
+
+_END = object()
+
+
+class _Failure:
+    """Exception raised by the source, forwarded through the queue."""
+
+    __slots__ = ('error',)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+async def close_stream(stream: Any) -> None:
+    """
+    Close an async stream, whichever close method it offers.
+
+    Async generators have ``aclose()``; SDK streams (OpenAI ``AsyncStream``)
+    have an async ``close()`` that releases the HTTP response.
+
+    Args:
+        stream: Stream to close
+    """
+    close = getattr(stream, 'aclose', None) or getattr(stream, 'close', None)
+    if close is None:
+        return
+    result = close()
+    if inspect.isawaitable(result):
+        await result
+
+
+async def bounded_stream(source: AsyncIterator[T], maxsize: int = 16) -> AsyncIterator[T]:
+    """
+    Iterate ``source`` through a bounded queue filled by a reader task.
+
+    The reader blocks once ``maxsize`` items are waiting, so a slow consumer
+    pauses the upstream read instead of growing memory. When the consumer
+    stops early, is cancelled, or is closed (e.g. the HTTP client
+    disconnected), the reader is cancelled and the source closed, which
+    aborts the upstream request.
+
+    Args:
+        source: Async iterator to read from
+        maxsize: Maximum number of items read ahead of the consumer
+
+    Yields:
+        Items from ``source`` in order
+
+    Raises:
+        Exception: Whatever the source raised, after the items before it
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, maxsize))
+
+    async def read() -> None:
+        try:
+            async for item in source:
+                await queue.put(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            await queue.put(_Failure(e))
+            return
+        await queue.put(_END)
+
+    reader = asyncio.get_running_loop().create_task(read())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END:
+                break
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        if not reader.done():
+            reader.cancel()
+        try:
+            await reader
+        except asyncio.CancelledError:
+            pass
+        await close_stream(source)
@@ -1,17 +1,22 @@
 """
 Response Cache Utility
 
-Simple in-memory cache for caching API responses and other data
-with TTL (time-to-live) support.
+In-memory LRU cache for caching API responses and other data with TTL
+(time-to-live) support, an optional memory budget and hit/miss counters.
 """
 
 import time
 import threading
 import hashlib
 import json
-from typing import Any, Optional, Dict
+import pickle
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Dict, List, Set
 from dataclasses import dataclass
 
+from .disk_cache import DiskCache
+
 
 @dataclass
 class CacheEntry:
@@ -19,27 +24,120 @@ class CacheEntry:
     value: Any
     expires_at: float
     created_at: float
+    size_bytes: int = 0
+
+
+@dataclass
+class CacheStats:  # pylint: disable=too-many-instance-attributes
+    """Cache statistics."""
+    size: int
+    max_size: int
+    expired_entries: int
+    ttl_seconds: int
+    hit_rate: float = 0.0
+    miss_rate: float = 0.0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    memory_bytes: int = 0
+    max_memory_bytes: Optional[int] = None
+    disk_hits: int = 0
+
+    @property
+    def current_size(self) -> int:
+        """Number of entries currently stored (alias of ``size``)."""
+        return self.size
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stats to dictionary."""
+        return {
+            'size': self.size,
+            'max_size': self.max_size,
+            'expired_entries': self.expired_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hit_rate': self.hit_rate,
+            'miss_rate': self.miss_rate,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'memory_bytes': self.memory_bytes,
+            'max_memory_bytes': self.max_memory_bytes,
+            'disk_hits': self.disk_hits
+        }
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory footprint of a cached value in bytes.
+
+    Args:
+        value: Value to measure
 
+    Returns:
+        Pickled size of the value, or its shallow size if it cannot be pickled
+    """
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:  # pylint: disable=broad-exception-caught
+        return sys.getsizeof(value)
 
-class ResponseCache:
+
+class ResponseCache:  # pylint: disable=too-many-instance-attributes
     """
-    Thread-safe in-memory cache with TTL support.
+    Thread-safe in-memory LRU cache with TTL support.
+
+    Entries live in an ``OrderedDict`` kept in recency order, so lookups,
+    inserts and evictions are all O(1). Expiry is lazy: a lookup drops an
+    expired entry, and a hashed timing wheel sweeps only the slots whose
+    time has passed, so stale entries are reclaimed without scanning the
+    whole cache. Used for caching API responses and other expensive
+    operations.
 
-    Used for caching API responses and other expensive operations.
+    With a ``disk_cache`` attached, misses fall through to the persistent
+    tier and hits there are promoted back into memory.
     """
 
-    def __init__(self, ttl_seconds: int = 3600, max_size: int = 1000):
+    def __init__(self, ttl_seconds: int = 3600, max_size: int = 1000,  # pylint: disable=too-many-arguments
+                 default_ttl_seconds: Optional[int] = None,
+                 max_memory_bytes: Optional[int] = None,
+                 size_of: Optional[Callable[[Any], int]] = None,
+                 wheel_slots: int = 512, wheel_resolution: float = 1.0,
+                 disk_cache: Optional[DiskCache] = None):
         """
         Initialize the cache.
 
         Args:
             ttl_seconds: Time to live for cache entries in seconds
             max_size: Maximum number of entries to store
+            default_ttl_seconds: Alias for ``ttl_seconds`` used by the API adapters
+            max_memory_bytes: Optional budget for the estimated size of stored values
+            size_of: Function estimating a value's size in bytes (defaults to pickled size)
+            wheel_slots: Number of slots in the expiry timing wheel
+            wheel_resolution: Seconds covered by each timing wheel slot
+            disk_cache: Optional persistent tier consulted on a miss
         """
-        self.ttl_seconds = ttl_seconds
+        self.ttl_seconds = default_ttl_seconds or ttl_seconds
         self.max_size = max_size
-        self._cache: Dict[str, CacheEntry] = {}
-        self._lock = threading.RLock()
+        self.max_memory_bytes = max_memory_bytes
+        self._size_of = size_of or estimate_size
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        # Hashed timing wheel: slot -> keys whose expiry falls in that slot
+        self._wheel: List[Set[str]] = [set() for _ in range(wheel_slots)]
+        self._wheel_resolution = wheel_resolution
+        self._wheel_tick = int(time.time() / wheel_resolution)
+
+        self.disk_cache = disk_cache
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._disk_hits = 0
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -52,19 +150,39 @@ class ResponseCache:
             Cached value or None if not found/expired
         """
         with self._lock:
+            now = time.time()
+            self._advance_wheel(now)
             entry = self._cache.get(key)
 
-            if entry is None:
+            if entry is not None and now > entry.expires_at:
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return entry.value
+
+            if self.disk_cache is None:
+                self._misses += 1
                 return None
 
-            # Check if expired
-            if time.time() > entry.expires_at:
-                del self._cache[key]
+        # Disk lookups happen outside the lock so they never stall memory hits
+        stored = self.disk_cache.get_entry(key)
+        with self._lock:
+            if stored is None:
+                self._misses += 1
                 return None
+            self._hits += 1
+            self._disk_hits += 1
 
-            return entry.value
+        value, expires_at = stored
+        self._store(key, value, expires_at, persist=False)
+        return value
 
-    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None,
+            persist: bool = True) -> None:
         """
         Set a value in cache.
 
@@ -72,22 +190,55 @@ class ResponseCache:
             key: Cache key
             value: Value to cache
             ttl_seconds: Override default TTL for this entry
+            persist: Also write the value to the disk tier, if one is attached
+        """
+        ttl = ttl_seconds or self.ttl_seconds
+        self._store(key, value, time.time() + ttl, persist)
+
+    def set_response(self, key: str, value: Any, temperature: Optional[float],
+                     ttl_seconds: Optional[int] = None) -> None:
+        """
+        Cache an LLM response, persisting it only if it is deterministic.
+
+        A temperature 0 request gives the same answer every time, so its
+        response is written through to the disk tier and shared with other
+        processes. Sampled responses stay in memory only.
+
+        Args:
+            key: Cache key
+            value: Response to cache
+            temperature: Sampling temperature the response was generated with
+            ttl_seconds: Override default TTL for this entry
         """
+        self.set(key, value, ttl_seconds, persist=temperature == 0)
+
+    def _store(self, key: str, value: Any, expires_at: float, persist: bool) -> None:
+        """Insert an entry expiring at ``expires_at`` and write it through if asked."""
+        size_bytes = self._size_of(value) if self.max_memory_bytes is not None else 0
+
         with self._lock:
-            ttl = ttl_seconds or self.ttl_seconds
             now = time.time()
+            self._advance_wheel(now)
+
+            if key in self._cache:
+                self._remove(key)
 
             entry = CacheEntry(
                 value=value,
-                expires_at=now + ttl,
-                created_at=now
+                expires_at=expires_at,
+                created_at=now,
+                size_bytes=size_bytes
             )
 
             self._cache[key] = entry
+            self._memory_bytes += size_bytes
+            self._wheel[self._wheel_slot(entry.expires_at)].add(key)
+
+            # Evict least recently used entries if cache is over budget
+            self._evict_oldest()
 
-            # Evict oldest entries if cache is full
-            if len(self._cache) > self.max_size:
-                self._evict_oldest()
+        if persist and self.disk_cache is not None:
+            self.disk_cache.set(key, value, expires_at - now)
 
     def delete(self, key: str) -> bool:
         """
@@ -99,20 +250,24 @@ class ResponseCache:
         Returns:
             True if key was found and deleted, False otherwise
         """
+        deleted_on_disk = self.disk_cache.delete(key) if self.disk_cache else False
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
+                self._remove(key)
                 return True
-            return False
+            return deleted_on_disk
 
     def clear(self) -> None:
-        """Clear all entries from cache."""
+        """Clear all in-memory entries (the shared disk tier is left intact)."""
         with self._lock:
             self._cache.clear()
+            for slot in self._wheel:
+                slot.clear()
+            self._memory_bytes = 0
 
     def cleanup_expired(self) -> int:
         """
-        Remove expired entries from cache.
+        Remove all expired entries from cache.
 
         Returns:
             Number of entries removed
@@ -125,65 +280,92 @@ class ResponseCache:
             ]
 
             for key in expired_keys:
-                del self._cache[key]
+                self._remove(key)
 
+            self._expirations += len(expired_keys)
             return len(expired_keys)
 
     def _evict_oldest(self) -> None:
-        """Evict oldest entries to make room."""
-        if not self._cache:
+        """Evict least recently used entries until the cache fits its budgets."""
+        while self._cache and (
+            len(self._cache) > self.max_size
+            or (self.max_memory_bytes is not None and self._memory_bytes > self.max_memory_bytes)
+        ):
+            key = next(iter(self._cache))
+            self._remove(key)
+            self._evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and its timing wheel registration (lock must be held)."""
+        entry = self._cache.pop(key)
+        self._memory_bytes -= entry.size_bytes
+        self._wheel[self._wheel_slot(entry.expires_at)].discard(key)
+
+    def _wheel_slot(self, expires_at: float) -> int:
+        return int(expires_at / self._wheel_resolution) % len(self._wheel)
+
+    def _advance_wheel(self, now: float) -> None:
+        """Expire entries in the wheel slots that have fully elapsed (lock must be held)."""
+        current_tick = int(now / self._wheel_resolution)
+        elapsed = current_tick - self._wheel_tick
+        if elapsed <= 0:
             return
 
-        # Find oldest entry by creation time
-        oldest_key = min(
-            self._cache.keys(),
-            key=lambda k: self._cache[k].created_at
-        )
-
-        del self._cache[oldest_key]
+        # A slot is only swept once its whole time span is in the past; entries
+        # due in a later rotation of the wheel stay put until their turn comes
+        slot_count = len(self._wheel)
+        ticks = range(self._wheel_tick, current_tick) if elapsed < slot_count else range(slot_count)
+        for tick in ticks:
+            slot = self._wheel[tick % slot_count]
+            for key in [key for key in slot if self._cache[key].expires_at < now]:
+                self._remove(key)
+                self._expirations += 1
+        self._wheel_tick = current_tick
 
     def size(self) -> int:
         """Get current cache size."""
         with self._lock:
             return len(self._cache)
 
+    def memory_usage(self) -> int:
+        """Get the estimated size of stored values in bytes (tracked with a memory budget)."""
+        with self._lock:
+            return self._memory_bytes
+
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
+        return self.get_stats().to_dict()
+
+    def get_stats(self) -> CacheStats:
+        """
+        Get cache statistics including hit and miss rates.
+
+        Returns:
+            CacheStats snapshot
+        """
         with self._lock:
             now = time.time()
             expired_count = sum(
                 1 for entry in self._cache.values()
                 if now > entry.expires_at
             )
-
-            return {
-                'size': len(self._cache),
-                'max_size': self.max_size,
-                'expired_entries': expired_count,
-                'ttl_seconds': self.ttl_seconds
-            }
-
-
-@dataclass
-class CacheStats:
-    """Cache statistics."""
-    size: int
-    max_size: int
-    expired_entries: int
-    ttl_seconds: int
-    hit_rate: float = 0.0
-    miss_rate: float = 0.0
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert stats to dictionary."""
-        return {
-            'size': self.size,
-            'max_size': self.max_size,
-            'expired_entries': self.expired_entries,
-            'ttl_seconds': self.ttl_seconds,
-            'hit_rate': self.hit_rate,
-            'miss_rate': self.miss_rate
-        }
+            lookups = self._hits + self._misses
+
+            return CacheStats(
+                size=len(self._cache),
+                max_size=self.max_size,
+                expired_entries=expired_count,
+                ttl_seconds=self.ttl_seconds,
+                hit_rate=self._hits / lookups if lookups else 0.0,
+                miss_rate=self._misses / lookups if lookups else 0.0,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                memory_bytes=self._memory_bytes,
+                max_memory_bytes=self.max_memory_bytes,
+                disk_hits=self._disk_hits
+            )
 
 
 def generate_cache_key(*args, **kwargs) -> str:
@@ -0,0 +1,178 @@
+"""
+Conversation Window Utility
+
+Keeps a chat conversation packed into a token budget as it grows. Each
+message is counted once when appended and a running token total is kept,
+so packing costs O(1) amortized per turn instead of re-counting the whole
+history. System messages stay pinned; the oldest turns are dropped, or
+folded into a pinned summary when a summarizer is supplied.
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from .token_counter import REPLY_PRIMING_TOKENS, TokenCounter
+
+# Summarizer callable: (previous summary or None, dropped messages) -> new summary
+# text, or None if summarizing failed
+Summarizer = Callable[[Optional[str], List[Dict[str, Any]]], Optional[str]]
+
+SUMMARY_PREFIX = "Summary of earlier conversation: "
+
+
+class ConversationWindow:  # pylint: disable=too-many-instance-attributes
+    """
+    Chat history packed into a token budget.
+
+    ``messages`` is always the packed list to send: pinned system messages,
+    the running summary (if any) and the most recent turns that fit.
+    """
+
+    def __init__(
+        self,
+        counter: TokenCounter,
+        max_tokens: int,
+        summarizer: Optional[Summarizer] = None,
+        summarize_headroom: float = 0.25
+    ):
+        """
+        Initialize an empty conversation window.
+
+        Args:
+            counter: Token counter for the target model
+            max_tokens: Token budget for the packed messages
+            summarizer: Optional callable that folds dropped turns into a summary
+            summarize_headroom: Fraction of the budget freed when summarizing, so
+                the summarizer runs once per batch of turns rather than per turn
+        """
+        self.counter = counter
+        self.max_tokens = max_tokens
+        self.summarizer = summarizer
+        self.summarize_headroom = summarize_headroom
+
+        self._system: List[Dict[str, Any]] = []
+        self._system_tokens = 0
+        self._summary: Optional[Dict[str, Any]] = None
+        self._summary_text: Optional[str] = None
+        self._summary_tokens = 0
+        self._turns: Deque[Tuple[Dict[str, Any], int]] = deque()
+        self._turn_tokens = 0
+        self._unsummarized: List[Dict[str, Any]] = []
+        self.dropped_messages = 0
+
+    def __len__(self) -> int:
+        return len(self._system) + (self._summary is not None) + len(self._turns)
+
+    @property
+    def total_tokens(self) -> int:
+        """Tokens for the packed messages including reply priming."""
+        return self._system_tokens + self._summary_tokens + self._turn_tokens + REPLY_PRIMING_TOKENS
+
+    @property
+    def messages(self) -> List[Dict[str, Any]]:
+        """Packed message list: system messages, summary, then recent turns."""
+        packed = list(self._system)
+        if self._summary is not None:
+            packed.append(self._summary)
+        packed.extend(message for message, _ in self._turns)
+        return packed
+
+    def append(self, message: Dict[str, Any]) -> None:
+        """
+        Add a message, dropping or summarizing the oldest turns to stay in budget.
+
+        System messages are pinned and never dropped. The newest turn is
+        always kept, even if it alone exceeds the budget.
+
+        Args:
+            message: Chat message with 'role' and 'content'
+        """
+        tokens = self.counter.count_message(message)
+        if message.get('role') == 'system':
+            self._system.append(message)
+            self._system_tokens += tokens
+        else:
+            self._turns.append((message, tokens))
+            self._turn_tokens += tokens
+
+        if self.total_tokens > self.max_tokens:
+            self._evict()
+
+    def packed_with(self, message: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Packed message list as it would be with ``message`` appended.
+
+        The window itself is left unchanged, so a request can be built from
+        it and the message appended only once the request succeeds. Oldest
+        turns are dropped to fit; summarizing them waits for the append.
+
+        Args:
+            message: Chat message with 'role' and 'content'
+
+        Returns:
+            List of messages to send
+        """
+        tokens = self.counter.count_message(message)
+        system = list(self._system)
+        turns = list(self._turns)
+        if message.get('role') == 'system':
+            system.append(message)
+        else:
+            turns.append((message, tokens))
+
+        total = self.total_tokens + tokens
+        start = 0
+        while total > self.max_tokens and len(turns) - start > 1:
+            total -= turns[start][1]
+            start += 1
+
+        if self._summary is not None:
+            system.append(self._summary)
+        return system + [turn for turn, _ in turns[start:]]
+
+    def extend(self, messages: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add several messages in order.
+
+        Args:
+            messages: Chat messages
+        """
+        for message in messages:
+            self.append(message)
+
+    def _evict(self) -> None:
+        """Drop oldest turns until the window fits, summarizing them if configured."""
+        if self.summarizer is None:
+            self._drop_until(self.max_tokens)
+            return
+
+        target = int(self.max_tokens * (1 - self.summarize_headroom))
+        self._unsummarized.extend(self._drop_until(target))
+        if not self._unsummarized:
+            return
+
+        summary = self.summarizer(self._summary_text, self._unsummarized)
+        if summary is None:
+            # Keep the previous summary; the dropped turns are retried next time
+            return
+        self._set_summary(summary)
+        self._unsummarized = []
+        # A longer summary can push the window back over budget; those turns
+        # are folded in on the next summarization
+        self._unsummarized.extend(self._drop_until(self.max_tokens))
+
+    def _drop_until(self, target: int) -> List[Dict[str, Any]]:
+        """Pop the oldest turns until the window fits ``target`` tokens."""
+        dropped = []
+        while self.total_tokens > target and len(self._turns) > 1:
+            message, tokens = self._turns.popleft()
+            self._turn_tokens -= tokens
+            dropped.append(message)
+        self.dropped_messages += len(dropped)
+        return dropped
+
+    def _set_summary(self, text: str) -> None:
+        """Replace the pinned summary message."""
+        self._summary_text = text
+        self._summary = {'role': 'system', 'content': SUMMARY_PREFIX + text}
+        self._summary_tokens = self.counter.count_message(self._summary)
@@ -0,0 +1,311 @@
+"""
+Disk Cache Utility
+
+SQLite-backed persistent cache tier for API responses. Entries survive
+restarts and are shared by every process pointing at the same file, so
+identical deterministic requests are answered locally instead of being
+sent (and billed) again.
+"""
+
+import hashlib
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    Size-bounded persistent cache stored in a SQLite database.
+
+    Keys are hashed together with a namespace into a stable request hash,
+    values are pickled, and the least recently used rows are evicted once
+    the stored bytes exceed ``max_bytes``. The database runs in WAL mode
+    with a busy timeout so several worker processes can share one file.
+    Only point it at files this process trusts, since values are unpickled.
+    """
+
+    # Access times are refreshed at most this often, to keep reads mostly read-only
+    _TOUCH_INTERVAL_SECONDS = 60.0
+
+    def __init__(self, path: str, namespace: str = "default",
+                 max_bytes: int = 256 * 1024 * 1024, busy_timeout_ms: int = 5000):
+        """
+        Initialize the disk cache.
+
+        Args:
+            path: SQLite database file (created if missing)
+            namespace: Prefix separating providers that share one file
+            max_bytes: Upper bound on the total size of stored values
+            busy_timeout_ms: How long to wait on another process's write lock
+        """
+        self.path = path
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path, check_same_thread=False,
+                                          isolation_level=None)
+        self.connection.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self._create_schema()
+
+    @classmethod
+    def from_config(cls, config: Any, namespace: str) -> Optional["DiskCache"]:
+        """
+        Open the disk tier described by an adapter config, if it enables one.
+
+        Args:
+            config: Adapter config with optional ``disk_cache_path`` and ``disk_cache_max_mb``
+            namespace: Namespace for this adapter's keys
+
+        Returns:
+            DiskCache, or None when no ``disk_cache_path`` is configured
+        """
+        path = getattr(config, 'disk_cache_path', None)
+        if not isinstance(path, str) or not path:
+            return None
+        max_mb = getattr(config, 'disk_cache_max_mb', 256)
+        return cls(path, namespace=namespace, max_bytes=int(max_mb) * 1024 * 1024)
+
+    def _create_schema(self) -> None:
+        """Create the cache tables."""
+        with self._lock:
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS response_cache (
+                    key_hash TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS idx_response_cache_accessed
+                    ON response_cache(accessed_at);
+                CREATE TABLE IF NOT EXISTS response_cache_meta (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO response_cache_meta (name, value)
+                    VALUES ('total_bytes', 0);
+            """)
+
+    def _hash_key(self, key: str) -> str:
+        return hashlib.sha256(f"{self.namespace}\0{key}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the disk cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing, expired or unreadable
+        """
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Get a value together with its absolute expiry time.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, expires_at), or None if missing, expired or unreadable
+        """
+        key_hash = self._hash_key(key)
+        with self._lock:
+            try:
+                row = self.connection.execute(
+                    "SELECT value, expires_at, accessed_at FROM response_cache WHERE key_hash = ?",
+                    (key_hash,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                payload, expires_at, accessed_at = row
+                now = time.time()
+                if now > expires_at:
+                    self._delete_hashes([key_hash])
+                    return None
+                if now - accessed_at > self._TOUCH_INTERVAL_SECONDS:
+                    self.connection.execute(
+                        "UPDATE response_cache SET accessed_at = ? WHERE key_hash = ?",
+                        (now, key_hash)
+                    )
+            except sqlite3.Error as e:
+                # A locked or damaged file degrades to a miss rather than failing the request
+                logger.warning("Disk cache read failed: %s", e)
+                return None
+
+        try:
+            return pickle.loads(payload), expires_at
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Dropping unreadable disk cache entry: %s", e)
+            try:
+                self.delete(key)
+            except sqlite3.Error as delete_error:
+                logger.warning("Disk cache delete failed: %s", delete_error)
+            return None
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> bool:
+        """
+        Store a value in the disk cache.
+
+        Args:
+            key: Cache key
+            value: Picklable value to store
+            ttl_seconds: Time to live in seconds
+
+        Returns:
+            True if the value was stored
+        """
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.debug("Value for disk cache is not picklable: %s", e)
+            return False
+        if len(payload) > self.max_bytes:
+            return False
+
+        key_hash = self._hash_key(key)
+        now = time.time()
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN IMMEDIATE")
+                old = self.connection.execute(
+                    "SELECT size_bytes FROM response_cache WHERE key_hash = ?", (key_hash,)
+                ).fetchone()
+                self.connection.execute(
+                    """
+                    INSERT OR REPLACE INTO response_cache
+                    (key_hash, value, size_bytes, expires_at, accessed_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (key_hash, payload, len(payload), now + ttl_seconds, now)
+                )
+                total = self._adjust_total(len(payload) - (old[0] if old else 0))
+                if total > self.max_bytes:
+                    self._evict(total)
+                self.connection.execute("COMMIT")
+                return True
+            except sqlite3.Error as e:
+                if self.connection.in_transaction:
+                    self.connection.execute("ROLLBACK")
+                logger.warning("Disk cache write failed: %s", e)
+                return False
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a key from the disk cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the key was present
+        """
+        with self._lock:
+            return self._delete_hashes([self._hash_key(key)]) > 0
+
+    def clear(self) -> None:
+        """Remove every entry, including other namespaces sharing the file."""
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.execute("DELETE FROM response_cache")
+            self.connection.execute(
+                "UPDATE response_cache_meta SET value = 0 WHERE name = 'total_bytes'"
+            )
+            self.connection.execute("COMMIT")
+
+    def cleanup_expired(self) -> int:
+        """
+        Remove expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT key_hash FROM response_cache WHERE expires_at < ?", (time.time(),)
+            ).fetchall()
+            return self._delete_hashes([row[0] for row in rows])
+
+    def stats(self) -> Dict[str, Any]:
+        """Get disk cache statistics."""
+        with self._lock:
+            count = self.connection.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+            return {
+                'path': self.path,
+                'entries': count,
+                'total_bytes': self._total_bytes(),
+                'max_bytes': self.max_bytes
+            }
+
+    def _total_bytes(self) -> int:
+        return self.connection.execute(
+            "SELECT value FROM response_cache_meta WHERE name = 'total_bytes'"
+        ).fetchone()[0]
+
+    def _adjust_total(self, delta: int) -> int:
+        """Apply a size delta to the running total (inside a transaction)."""
+        self.connection.execute(
+            "UPDATE response_cache_meta SET value = value + ? WHERE name = 'total_bytes'",
+            (delta,)
+        )
+        return self._total_bytes()
+
+    def _evict(self, total: int) -> None:
+        """Delete least recently used rows until total is back under budget (inside a transaction)."""
+        # Evict down to 90% so a full cache does not evict on every write
+        target = int(self.max_bytes * 0.9)
+        while total > target:
+            victims, freed = [], 0
+            for key_hash, size_bytes in self.connection.execute(
+                "SELECT key_hash, size_bytes FROM response_cache ORDER BY accessed_at LIMIT 64"
+            ).fetchall():
+                if total - freed <= target:
+                    break
+                victims.append((key_hash,))
+                freed += size_bytes
+            if not victims:
+                break
+            self.connection.executemany("DELETE FROM response_cache WHERE key_hash = ?", victims)
+            total = self._adjust_total(-freed)
+
+    def _delete_hashes(self, key_hashes: List[str]) -> int:
+        """Delete rows by key hash and keep the size total in step."""
+        if not key_hashes:
+            return 0
+        placeholders = ",".join("?" * len(key_hashes))
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            rows = self.connection.execute(
+                f"SELECT size_bytes FROM response_cache WHERE key_hash IN ({placeholders})",
+                key_hashes
+            ).fetchall()
+            self.connection.execute(
+                f"DELETE FROM response_cache WHERE key_hash IN ({placeholders})", key_hashes
+            )
+            self._adjust_total(-sum(row[0] for row in rows))
+            self.connection.execute("COMMIT")
+        except sqlite3.Error:
+            if self.connection.in_transaction:
+                self.connection.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.connection.close()
@@ -0,0 +1,74 @@
+"""
+Hashing Embedder Utility
+
+Deterministic, offline text embeddings built from a signed feature-hashed
+bag of words and word bigrams. No model download or network access is
+needed, and the same text always maps to the same vector across processes.
+"""
+
+import hashlib
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+from shared.interfaces.embedding_provider import EmbeddingProvider
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+
+
+@lru_cache(maxsize=65536)
+def _hash_feature(feature: str, dimension: int) -> Tuple[int, float]:
+    """Map a feature to a stable (bucket, sign) pair."""
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return value % dimension, 1.0 if (value >> 63) & 1 else -1.0
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """
+    Local embedding provider using signed feature hashing.
+
+    Each text is tokenized into lowercase words and adjacent word pairs,
+    term frequencies are damped with ``1 + log(tf)``, and every feature is
+    hashed into a fixed-size vector with a hash-derived sign so collisions
+    cancel out on average. Vectors are L2-normalised.
+    """
+
+    def __init__(self, dimension: int = 128, use_bigrams: bool = True):
+        """
+        Initialize the hashing embedder.
+
+        Args:
+            dimension: Embedding dimension
+            use_bigrams: Whether adjacent word pairs are hashed as features
+        """
+        self._dimension = dimension
+        self.use_bigrams = use_bigrams
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    @property
+    def model_name(self) -> str:
+        return f"hashing-bow-{self._dimension}{'-bigram' if self.use_bigrams else ''}"
+
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
+        embeddings = np.zeros((len(texts), self._dimension), dtype=np.float32)
+
+        for row, text in enumerate(texts):
+            tokens = _TOKEN_PATTERN.findall(text.lower())
+            features = Counter(tokens)
+            if self.use_bigrams:
+                features.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+
+            for feature, count in features.items():
+                bucket, sign = _hash_feature(feature, self._dimension)
+                embeddings[row, bucket] += sign * (1.0 + math.log(count))
+
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.where(norms == 0, 1.0, norms)
@@ -0,0 +1,105 @@
+"""
+Latency tracking utility.
+Bounded sample of recent request latencies with percentile queries, shared by
+adapter rate limiters and by callers that pick or hedge between providers.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class LatencyTracker:
+    """
+    Recent request latencies in milliseconds.
+
+    Samples are kept in a list that is trimmed to the newest ``keep_samples``
+    once it grows past ``max_samples``, so memory stays bounded while
+    percentiles still reflect recent behaviour.
+    """
+
+    def __init__(self, max_samples: int = 100, keep_samples: int = 50):
+        """
+        Initialize the tracker.
+
+        Args:
+            max_samples: Sample count that triggers a trim
+            keep_samples: Newest samples kept after a trim
+        """
+        self.max_samples = max_samples
+        self.keep_samples = min(keep_samples, max_samples)
+        self._samples: List[float] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, latency_ms: float) -> None:
+        """
+        Record one latency sample; non-positive values are ignored.
+
+        Args:
+            latency_ms: Request latency in milliseconds
+        """
+        if latency_ms <= 0:
+            return
+        with self._lock:
+            self._samples.append(latency_ms)
+            if len(self._samples) > self.max_samples:
+                self._samples = self._samples[-self.keep_samples:]
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Get a latency percentile over the tracked samples.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Latency in milliseconds, or None if nothing has been recorded
+        """
+        with self._lock:
+            if not self._samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(int(len(ordered) * percentile / 100), len(ordered) - 1)
+        return ordered[index]
+
+    def summary(self) -> Dict[str, Any]:
+        """Get average, extremes and tail percentiles of the tracked samples."""
+        with self._lock:
+            ordered = sorted(self._samples)
+        count = len(ordered)
+        if not count:
+            return {
+                'average_latency_ms': 0.0,
+                'min_latency_ms': 0.0,
+                'max_latency_ms': 0.0,
+                'p90_latency_ms': 0.0,
+                'p95_latency_ms': 0.0,
+                'sample_count': 0
+            }
+
+        return {
+            'average_latency_ms': sum(ordered) / count,
+            'min_latency_ms': ordered[0],
+            'max_latency_ms': ordered[-1],
+            'p90_latency_ms': ordered[min(int(count * 0.90), count - 1)],
+            'p95_latency_ms': ordered[min(int(count * 0.95), count - 1)],
+            'sample_count': count
+        }
+
+    def trim(self, keep: int) -> None:
+        """
+        Drop all but the newest ``keep`` samples.
+
+        Args:
+            keep: Number of samples to keep
+        """
+        with self._lock:
+            if len(self._samples) > keep:
+                self._samples = self._samples[-keep:] if keep > 0 else []
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        with self._lock:
+            self._samples.clear()
@@ -3,12 +3,20 @@ Base rate limiter utility for adapter quota and rate management.
 Shared utility that all adapters can use for consistent rate limiting behavior.
 """
 
+import asyncio
 import time
 import threading
-from typing import Dict, Any, Optional
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime
-from collections import deque
+from datetime import datetime, timedelta
+
+from shared.exceptions import QuotaExceededError
+from .latency import LatencyTracker
+from .shared_rate_limit import SharedRateLimitState
+
+# Waits shorter than this are float noise from accumulated emission intervals
+_WAIT_EPSILON = 1e-9
 
 
 @dataclass
@@ -44,18 +52,118 @@ class RateLimitStats:  # pylint: disable=too-many-instance-attributes
         }
 
 
+class GCRABucket:
+    """
+    One rate limit tracked with the generic cell rate algorithm (GCRA).
+
+    Allows a burst of up to ``limit`` units and then a steady ``limit``
+    units per ``period``. The whole state is a single theoretical arrival
+    time, so memory is constant no matter how many requests are made.
+    """
+
+    __slots__ = ('limit', 'period', 'emission_interval', 'tat')
+
+    def __init__(self, limit: float, period: float):
+        """
+        Initialize the bucket.
+
+        Args:
+            limit: Units allowed per period (must be positive)
+            period: Period length in seconds
+        """
+        if limit <= 0 or period <= 0:
+            raise ValueError("GCRA limit and period must be positive")
+        self.limit = limit
+        self.period = period
+        self.emission_interval = period / limit
+        self.tat = 0.0
+
+    def wait_time(self, now: float, cost: float = 1.0) -> float:
+        """Seconds until ``cost`` units conform to the limit."""
+        if cost <= 0:
+            return 0.0
+        allow_at = max(self.tat, now) + cost * self.emission_interval - self.period
+        wait = allow_at - now
+        return wait if wait > _WAIT_EPSILON else 0.0
+
+    def consume(self, now: float, cost: float = 1.0) -> None:
+        """Charge ``cost`` units at time ``now``."""
+        if cost > 0:
+            self.tat = max(self.tat, now) + cost * self.emission_interval
+
+    def remaining(self, now: float) -> int:
+        """Whole units that could be charged at ``now`` without waiting."""
+        headroom = now + self.period - max(self.tat, now)
+        return max(0, int(headroom / self.emission_interval + _WAIT_EPSILON))
+
+    def reset(self) -> None:
+        """Forget all charged units."""
+        self.tat = 0.0
+
+
+class _WindowCounter:
+    """
+    Sliding-window count estimate from two fixed windows.
+
+    Weights the previous window's count by how much of it still overlaps
+    the sliding window; used for statistics only, in constant memory.
+    """
+
+    __slots__ = ('window', 'start', 'current', 'previous')
+
+    def __init__(self, window: float, now: float):
+        self.window = window
+        self.start = now - now % window
+        self.current = 0.0
+        self.previous = 0.0
+
+    def _roll(self, now: float) -> None:
+        elapsed = int((now - self.start) // self.window)
+        if elapsed >= 1:
+            self.previous = self.current if elapsed == 1 else 0.0
+            self.current = 0.0
+            self.start += elapsed * self.window
+
+    def add(self, now: float, amount: float = 1.0) -> None:
+        self._roll(now)
+        self.current += amount
+
+    def estimate(self, now: float) -> float:
+        self._roll(now)
+        overlap = 1.0 - (now - self.start) / self.window
+        return self.previous * overlap + self.current
+
+    def reset(self) -> None:
+        self.current = 0.0
+        self.previous = 0.0
+
+
 class BaseRateLimiter:  # pylint: disable=too-many-instance-attributes
     """
     Base rate limiter class that adapters can extend.
     Provides thread-safe request throttling and quota management.
+
+    Per-minute, per-hour, minimum-interval and token limits are GCRA
+    buckets, and daily/monthly quotas are calendar counters, so the state
+    is O(1) per window regardless of request volume. Use :meth:`reserve`
+    to claim a slot and get the exact delay before sending, or the
+    ``can_make_request``/``record_request`` pair to check and record
+    separately.
+
+    With a ``shared_state`` backend the buckets and quota counters live in
+    a file shared by every process using it, and each operation is one
+    atomic transaction; window statistics stay per process.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         calls_per_minute: int = 60,
         calls_per_hour: Optional[int] = None,
         calls_per_day: Optional[int] = None,
-        min_interval_seconds: float = 0.0
+        min_interval_seconds: float = 0.0,
+        tokens_per_minute: Optional[int] = None,
+        tokens_per_day: Optional[int] = None,
+        shared_state: Optional[SharedRateLimitState] = None
     ):
         """
         Initialize rate limiter.
@@ -65,19 +173,45 @@ class BaseRateLimiter:  # pylint: disable=too-many-instance-attributes
             calls_per_hour: Maximum calls allowed per hour (optional)
             calls_per_day: Maximum calls allowed per day (optional)
             min_interval_seconds: Minimum seconds between requests
+            tokens_per_minute: Maximum tokens allowed per minute (optional)
+            tokens_per_day: Maximum tokens allowed per rolling day (optional)
+            shared_state: Cross-process backend for buckets and quotas (optional)
         """
         self.calls_per_minute = calls_per_minute
         self.calls_per_hour = calls_per_hour
         self.calls_per_day = calls_per_day
         self.min_interval_seconds = min_interval_seconds
+        self.tokens_per_minute = tokens_per_minute
+        self.tokens_per_day = tokens_per_day
 
         # Thread-safe tracking
         self._lock = threading.RLock()
-
-        # Request timestamps for sliding window
-        self._minute_requests: deque = deque()
-        self._hour_requests: deque = deque()
-        self._day_requests: deque = deque()
+        self._shared_state = shared_state
+        self._shared_depth = 0
+
+        # Rate limits: one GCRA bucket per window
+        self._request_buckets: List[GCRABucket] = []
+        if calls_per_minute and calls_per_minute > 0:
+            self._request_buckets.append(GCRABucket(calls_per_minute, 60.0))
+        if calls_per_hour and calls_per_hour > 0:
+            self._request_buckets.append(GCRABucket(calls_per_hour, 3600.0))
+        self._interval_bucket: Optional[GCRABucket] = None
+        if min_interval_seconds > 0:
+            self._interval_bucket = GCRABucket(1, min_interval_seconds)
+            self._request_buckets.append(self._interval_bucket)
+
+        self._token_buckets: List[GCRABucket] = []
+        if tokens_per_minute and tokens_per_minute > 0:
+            self._token_buckets.append(GCRABucket(tokens_per_minute, 60.0))
+        if tokens_per_day and tokens_per_day > 0:
+            self._token_buckets.append(GCRABucket(tokens_per_day, 86400.0))
+
+        # Constant-size counters for statistics
+        now = time.time()
+        self._minute_counter = _WindowCounter(60.0, now)
+        self._hour_counter = _WindowCounter(3600.0, now)
+        self._token_minute_counter = _WindowCounter(60.0, now)
+        self._token_day_counter = _WindowCounter(86400.0, now)
 
         # Last request time for minimum interval
         self._last_request_time: Optional[float] = None
@@ -91,9 +225,13 @@ class BaseRateLimiter:  # pylint: disable=too-many-instance-attributes
         self._daily_quota_limit: Optional[int] = calls_per_day
         self._monthly_quota_limit: Optional[int] = None
 
-        # Day tracking for quota reset
-        self._current_day = datetime.now().date()
-        self._current_month = datetime.now().month
+        # Calendar boundaries for quota reset, so the hot path never builds datetimes
+        self._next_day_start = 0.0
+        self._next_month_start = 0.0
+        self._roll_calendar(now)
+
+        # Recent call latencies, local to this process
+        self._request_latencies = LatencyTracker()
 
     def can_make_request(self) -> bool:
         """
@@ -103,111 +241,184 @@ class BaseRateLimiter:  # pylint: disable=too-many-instance-attributes
         Returns:
             True if request is allowed, False otherwise
         """
-        with self._lock:
+        with self._synced():
             now = time.time()
-            current_date = datetime.now().date()
-            current_month = datetime.now().month
-
-            # Reset daily counters if day changed (optimized check)
-            if current_date != self._current_day:
-                self._current_day = current_date
-                self._daily_quota_used = 0
-                self._day_requests.clear()
+            self._roll_calendar(now)
+            return self._quota_wait(now) == 0.0 and self._bucket_wait(now, 0) == 0.0
 
-            # Reset monthly counters if month changed (optimized check)
-            if current_month != self._current_month:
-                self._current_month = current_month
-                self._monthly_quota_used = 0
+    def can_use_tokens(self, n_tokens: int) -> bool:
+        """
+        Check if ``n_tokens`` fit the token limits right now.
 
-            # Clean up old timestamps (optimized)
-            self._cleanup_old_timestamps(now)
+        Args:
+            n_tokens: Tokens the request will use
 
-            # Fast path: Check minimum interval first (most common failure)
-            if (self._last_request_time is not None and
-                now - self._last_request_time < self.min_interval_seconds):
-                return False
+        Returns:
+            True if the tokens are available
+        """
+        with self._synced():
+            now = time.time()
+            return all(bucket.wait_time(now, n_tokens) == 0.0 for bucket in self._token_buckets)
 
-            # Fast path: Check per-minute limit (second most common)
-            if len(self._minute_requests) >= self.calls_per_minute:
-                return False
+    def record_request(self) -> None:
+        """Record that a request was made. Call this after successful API call."""
+        with self._synced(write=True):
+            now = time.time()
+            self._charge(now, now, 0)
 
-            # Check per-hour limit if configured
-            if (self.calls_per_hour is not None and
-                len(self._hour_requests) >= self.calls_per_hour):
-                return False
+    def record_tokens(self, n_tokens: int) -> None:
+        """
+        Record tokens used by a request that was not reserved with :meth:`reserve`.
 
-            # Check daily quota if configured
-            if (self._daily_quota_limit is not None and
-                self._daily_quota_used >= self._daily_quota_limit):
-                return False
+        Args:
+            n_tokens: Tokens consumed
+        """
+        with self._synced(write=True):
+            now = time.time()
+            for bucket in self._token_buckets:
+                bucket.consume(now, n_tokens)
+            self._token_minute_counter.add(now, n_tokens)
+            self._token_day_counter.add(now, n_tokens)
 
-            # Check monthly quota if configured
-            if (self._monthly_quota_limit is not None and
-                self._monthly_quota_used >= self._monthly_quota_limit):
-                return False
+    def reserve(self, n_tokens: int = 0) -> float:
+        """
+        Claim the next slot for one request using ``n_tokens`` tokens.
 
-            return True
+        The request and its tokens are charged to every bucket at the time
+        they become available, so the returned delay is exact: sleeping for
+        it and then sending never breaks a limit, and concurrent callers get
+        successive slots. Do not call :meth:`record_request` for a reserved
+        request. With a shared backend, a process that already holds its
+        fair share of upcoming slots blocks here until one of them passes,
+        so other processes get a turn.
 
-    def record_request(self) -> None:
-        """Record that a request was made. Call this after successful API call."""
-        with self._lock:
-            now = time.time()
+        Args:
+            n_tokens: Tokens the request will use
 
-            # Add timestamps
-            self._minute_requests.append(now)
-            self._hour_requests.append(now)
-            self._day_requests.append(now)
+        Returns:
+            Seconds to wait before sending the request
 
-            # Update counters
-            self._last_request_time = now
-            self._total_requests += 1
-            self._daily_quota_used += 1
-            self._monthly_quota_used += 1
+        Raises:
+            QuotaExceededError: If the daily or monthly quota is used up
+        """
+        while True:
+            wait, turn_wait = self._try_reserve(n_tokens)
+            if wait is not None:
+                return wait
+            time.sleep(turn_wait)
 
-    def get_wait_time(self) -> float:
+    async def areserve(self, n_tokens: int = 0) -> float:
         """
-        Get the number of seconds to wait before next request is allowed.
+        Async :meth:`reserve` that never blocks the event loop.
+
+        With a shared backend the SQLite transaction runs in a worker
+        thread, and waiting for this process's fair-share turn uses
+        ``asyncio.sleep``, so other coroutines keep running meanwhile.
+
+        Args:
+            n_tokens: Tokens the request will use
 
         Returns:
-            Seconds to wait, or 0.0 if request can be made immediately
+            Seconds to wait before sending the request
+
+        Raises:
+            QuotaExceededError: If the daily or monthly quota is used up
         """
-        with self._lock:
-            if self.can_make_request():
-                return 0.0
+        while True:
+            if self._shared_state is None:
+                wait, turn_wait = self._try_reserve(n_tokens)
+            else:
+                wait, turn_wait = await asyncio.to_thread(self._try_reserve, n_tokens)
+            if wait is not None:
+                return wait
+            await asyncio.sleep(turn_wait)
+
+    def _try_reserve(self, n_tokens: int) -> Tuple[Optional[float], float]:
+        """
+        Make one reservation attempt.
 
-            now = time.time()
-            wait_times = []
+        Returns:
+            The slot's delay and 0, or None and the seconds until this
+            process's next fair-share turn
 
-            # Minimum interval wait
-            if (self._last_request_time is not None and
-                now - self._last_request_time < self.min_interval_seconds):
-                wait_times.append(
-                    self.min_interval_seconds - (now - self._last_request_time)
+        Raises:
+            QuotaExceededError: If the daily or monthly quota is used up
+        """
+        with self._synced(write=True):
+            now = time.time()
+            self._roll_calendar(now)
+            quota_wait = self._quota_wait(now)
+            if quota_wait > 0:
+                raise QuotaExceededError(
+                    "Request quota exhausted",
+                    quota_type='daily' if self._daily_exhausted() else 'monthly',
+                    reset_time=datetime.fromtimestamp(now + quota_wait).isoformat()
                 )
 
-            # Per-minute rate limit wait
-            if len(self._minute_requests) >= self.calls_per_minute:
-                oldest_request = self._minute_requests[0]
-                wait_times.append(60.0 - (now - oldest_request))
+            turn_wait = (self._shared_state.fair_share_wait(now)
+                         if self._shared_state is not None else 0.0)
+            if turn_wait > 0:
+                return None, turn_wait
 
-            # Per-hour rate limit wait
-            if (self.calls_per_hour is not None and
-                len(self._hour_requests) >= self.calls_per_hour):
-                oldest_request = self._hour_requests[0]
-                wait_times.append(3600.0 - (now - oldest_request))
+            wait = self._bucket_wait(now, n_tokens)
+            self._charge(now + wait, now, n_tokens)
+            if self._shared_state is not None:
+                self._shared_state.add_reservation(now + wait)
+            return wait, 0.0
 
-            return max(wait_times) if wait_times else 0.0
+    def available_requests(self) -> Optional[int]:
+        """
+        Get how many requests could be sent right now without waiting.
+
+        Useful for sizing a batch's concurrency to the remaining budget;
+        the minimum interval is left to :meth:`reserve` to enforce.
+
+        Returns:
+            Requests available now, or None if no request limit applies
+        """
+        with self._synced():
+            now = time.time()
+            self._roll_calendar(now)
+            if self._quota_wait(now) > 0:
+                return 0
+
+            # Minimum spacing paces requests but does not shrink the budget
+            limits = [
+                bucket.remaining(now) for bucket in self._request_buckets
+                if bucket is not self._interval_bucket
+            ]
+            if self._daily_quota_limit is not None:
+                limits.append(self._daily_quota_limit - self._daily_quota_used)
+            if self._monthly_quota_limit is not None:
+                limits.append(self._monthly_quota_limit - self._monthly_quota_used)
+            return max(0, min(limits)) if limits else None
+
+    def get_wait_time(self, n_tokens: int = 0) -> float:
+        """
+        Get the number of seconds to wait before next request is allowed.
+
+        Args:
+            n_tokens: Tokens the request will use
+
+        Returns:
+            Seconds to wait, or 0.0 if request can be made immediately
+        """
+        with self._synced():
+            now = time.time()
+            self._roll_calendar(now)
+            return max(self._quota_wait(now), self._bucket_wait(now, n_tokens))
 
     def get_stats(self) -> RateLimitStats:
         """Get current rate limiting statistics."""
-        with self._lock:
+        with self._synced():
             now = time.time()
-            self._cleanup_old_timestamps(now)
+            self._roll_calendar(now)
+            wait_time = max(self._quota_wait(now), self._bucket_wait(now, 0))
 
             return RateLimitStats(
-                requests_this_minute=len(self._minute_requests),
-                requests_this_hour=len(self._hour_requests),
-                requests_today=len(self._day_requests),
+                requests_this_minute=round(self._minute_counter.estimate(now)),
+                requests_this_hour=round(self._hour_counter.estimate(now)),
+                requests_today=self._daily_quota_used,
                 total_requests=self._total_requests,
                 quota_remaining_daily=(
                     self._daily_quota_limit - self._daily_quota_used
@@ -222,17 +433,25 @@ class BaseRateLimiter:  # pylint: disable=too-many-instance-attributes
                     if self._last_request_time else None
                 ),
                 next_allowed_time=(
-                    datetime.fromtimestamp(now + self.get_wait_time())
-                    if self.get_wait_time() > 0 else None
+                    datetime.fromtimestamp(now + wait_time)
+                    if wait_time > 0 else None
                 )
             )
 
+    def get_token_usage(self) -> Dict[str, int]:
+        """Get estimated tokens used in the last minute and day."""
+        with self._lock:
+            now = time.time()
+            return {
+                'tokens_this_minute': round(self._token_minute_counter.estimate(now)),
+                'tokens_this_day': round(self._token_day_counter.estimate(now))
+            }
+
     def reset_quotas(self, daily: bool = True, monthly: bool = False) -> None:
         """Reset quota counters. Useful for testing or manual resets."""
-        with self._lock:
+        with self._synced(write=True):
             if daily:
                 self._daily_quota_used = 0
-                self._day_requests.clear()
 
             if monthly:
                 self._monthly_quota_used = 0
@@ -249,59 +468,162 @@ class BaseRateLimiter:  # pylint: disable=too-many-instance-attributes
 
             if monthly_limit is not None:
                 self._monthly_quota_limit = monthly_limit
+
+    def record_latency(self, latency_ms: float) -> None:
+        """
+        Record the latency of a completed API call.
+
+        Args:
+            latency_ms: Call latency in milliseconds
+        """
+        self._request_latencies.record(latency_ms)
+
+    def get_latency_percentile(self, percentile: float = 90.0) -> Optional[float]:
+        """
+        Get a percentile of recent API call latencies.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Latency in milliseconds, or None if no calls have been recorded
+        """
+        return self._request_latencies.percentile(percentile)
+
     def get_memory_usage(self) -> Dict[str, int]:
-        """Get current memory usage statistics for optimization."""
+        """
+        Get current memory usage statistics for optimization.
+
+        Limiter state is constant-size, so no per-request timestamps are
+        tracked; the counts are the current sliding-window estimates.
+        """
         with self._lock:
+            now = time.time()
+            minute = round(self._minute_counter.estimate(now))
+            hour = round(self._hour_counter.estimate(now))
             return {
-                'minute_requests_count': len(self._minute_requests),
-                'hour_requests_count': len(self._hour_requests),
-                'day_requests_count': len(self._day_requests),
-                'total_tracked_requests': (
-                    len(self._minute_requests) +
-                    len(self._hour_requests) +
-                    len(self._day_requests)
-                )
+                'minute_requests_count': minute,
+                'hour_requests_count': hour,
+                'day_requests_count': self._daily_quota_used,
+                'total_tracked_requests': 0
             }
+
     def optimize_memory(self) -> Dict[str, int]:
-        """Optimize memory usage by cleaning up old data."""
+        """Report memory cleanup; limiter state is constant-size so nothing is freed."""
         with self._lock:
-            before_stats = self.get_memory_usage()
-
-            # Force cleanup of all old timestamps
-            now = time.time()
-            self._cleanup_old_timestamps(now)
-
-            after_stats = self.get_memory_usage()
-
+            tracked = self.get_memory_usage()['total_tracked_requests']
             return {
-                'requests_cleaned': (
-                    before_stats['total_tracked_requests'] -
-                    after_stats['total_tracked_requests']
-                ),
-                'memory_before': before_stats['total_tracked_requests'],
-                'memory_after': after_stats['total_tracked_requests']
+                'requests_cleaned': 0,
+                'memory_before': tracked,
+                'memory_after': tracked
             }
 
-    def _cleanup_old_timestamps(self, now: float) -> None:
-        """Remove timestamps outside of tracking windows with optimized performance."""
-        # Optimize: Use more efficient batch cleanup approach
-        # Remove requests older than 1 minute
-        if self._minute_requests:
-            cutoff_time = now - 60.0
-            while self._minute_requests and self._minute_requests[0] < cutoff_time:
-                self._minute_requests.popleft()
-
-        # Remove requests older than 1 hour
-        if self._hour_requests:
-            cutoff_time = now - 3600.0
-            while self._hour_requests and self._hour_requests[0] < cutoff_time:
-                self._hour_requests.popleft()
+    @contextmanager
+    def _synced(self, write: bool = False) -> Iterator[None]:
+        """
+        Hold the lock and, with a shared backend, sync bucket state around the block.
 
-        # Remove requests older than 1 day
-        if self._day_requests:
-            cutoff_time = now - 86400.0
-            while self._day_requests and self._day_requests[0] < cutoff_time:
-                self._day_requests.popleft()
+        Args:
+            write: Save bucket and quota changes back to the shared state
+        """
+        with self._lock:
+            if self._shared_state is None or self._shared_depth:
+                yield
+                return
+
+            self._shared_depth += 1
+            try:
+                with self._shared_state.transaction(write) as values:
+                    self._load_shared(values)
+                    yield
+                    if write:
+                        self._save_shared(values)
+            finally:
+                self._shared_depth -= 1
+
+    def _shared_keys(self) -> Iterator[Tuple[str, GCRABucket]]:
+        """Pair each bucket with its shared key; limiters with equal limits share buckets."""
+        for bucket in self._request_buckets:
+            yield f"requests:{bucket.limit}/{bucket.period}", bucket
+        for bucket in self._token_buckets:
+            yield f"tokens:{bucket.limit}/{bucket.period}", bucket
+
+    def _load_shared(self, values: Dict[str, float]) -> None:
+        for key, bucket in self._shared_keys():
+            bucket.tat = values.get(key, 0.0)
+        self._daily_quota_used = int(values.get('daily_used', 0))
+        self._monthly_quota_used = int(values.get('monthly_used', 0))
+        self._next_day_start = values.get('next_day_start', 0.0)
+        self._next_month_start = values.get('next_month_start', 0.0)
+
+    def _save_shared(self, values: Dict[str, float]) -> None:
+        for key, bucket in self._shared_keys():
+            values[key] = bucket.tat
+        values['daily_used'] = self._daily_quota_used
+        values['monthly_used'] = self._monthly_quota_used
+        values['next_day_start'] = self._next_day_start
+        values['next_month_start'] = self._next_month_start
+
+    def _charge(self, at: float, now: float, n_tokens: int) -> None:
+        """Charge one request sent at ``at`` to every bucket and counter (lock held)."""
+        for bucket in self._request_buckets:
+            bucket.consume(at)
+        for bucket in self._token_buckets:
+            bucket.consume(at, n_tokens)
+
+        self._minute_counter.add(now)
+        self._hour_counter.add(now)
+        if n_tokens:
+            self._token_minute_counter.add(now, n_tokens)
+            self._token_day_counter.add(now, n_tokens)
+
+        self._last_request_time = at
+        self._total_requests += 1
+        self._daily_quota_used += 1
+        self._monthly_quota_used += 1
+
+    def _bucket_wait(self, now: float, n_tokens: int) -> float:
+        """Longest wait across request and token buckets (lock held)."""
+        wait = 0.0
+        for bucket in self._request_buckets:
+            wait = max(wait, bucket.wait_time(now))
+        for bucket in self._token_buckets:
+            wait = max(wait, bucket.wait_time(now, n_tokens))
+        return wait
+
+    def _daily_exhausted(self) -> bool:
+        return (self._daily_quota_limit is not None and
+                self._daily_quota_used >= self._daily_quota_limit)
+
+    def _monthly_exhausted(self) -> bool:
+        return (self._monthly_quota_limit is not None and
+                self._monthly_quota_used >= self._monthly_quota_limit)
+
+    def _quota_wait(self, now: float) -> float:
+        """Seconds until an exhausted calendar quota resets, else 0 (lock held)."""
+        wait = 0.0
+        if self._daily_exhausted():
+            wait = self._next_day_start - now
+        if self._monthly_exhausted():
+            wait = max(wait, self._next_month_start - now)
+        return wait
+
+    def _roll_calendar(self, now: float) -> None:
+        """Reset daily/monthly quota counters when a calendar boundary passes (lock held)."""
+        if now < self._next_day_start:
+            return
+
+        today = datetime.fromtimestamp(now).date()
+        day_start = datetime.combine(today, datetime.min.time())
+        if self._next_day_start:
+            self._daily_quota_used = 0
+        self._next_day_start = (day_start + timedelta(days=1)).timestamp()
+
+        if now >= self._next_month_start:
+            if self._next_month_start:
+                self._monthly_quota_used = 0
+            next_month = (day_start.replace(day=1) + timedelta(days=32)).replace(day=1)
+            self._next_month_start = next_month.timestamp()
 
 
 class AdaptiveRateLimiter(BaseRateLimiter):  # pylint: disable=too-many-instance-attributes
@@ -342,11 +664,19 @@ class AdaptiveRateLimiter(BaseRateLimiter):  # pylint: disable=too-many-instance
                     self._backoff_factor = max(1.0, self._backoff_factor * 0.8)
                     self._recovery_requests = 0
 
-    def get_wait_time(self) -> float:
+    def get_wait_time(self, n_tokens: int = 0) -> float:
         """Get wait time including adaptive backoff."""
-        base_wait = super().get_wait_time()
+        base_wait = super().get_wait_time(n_tokens)
         return base_wait * self._backoff_factor
 
+    def reserve(self, n_tokens: int = 0) -> float:
+        """Reserve a slot, stretching the delay by the current backoff factor."""
+        return super().reserve(n_tokens) * self._backoff_factor
+
+    async def areserve(self, n_tokens: int = 0) -> float:
+        """Async reserve, stretching the delay by the current backoff factor."""
+        return await super().areserve(n_tokens) * self._backoff_factor
+
     def get_backoff_info(self) -> Dict[str, Any]:
         """Get information about current backoff state."""
         with self._lock:
@@ -0,0 +1,203 @@
+"""
+Shared Rate Limit State
+
+SQLite-backed state for BaseRateLimiter so every process on a host draws
+from one request and token budget. Each limiter operation runs inside a
+single SQLite transaction, which makes check-and-charge atomic across
+processes, and per-process reservations are tracked so no single worker
+can book up the whole upcoming budget.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SharedRateLimitState:
+    """
+    Rate limiter state stored in a SQLite file shared between processes.
+
+    Values are plain floats keyed by ``(name, key)`` so limiters with the
+    same ``name`` and limits share buckets and quota counters. Fair queuing
+    between processes is done by capping how many future reservations one
+    process may hold: the ``max_pending`` slots are split evenly between
+    the processes that currently have reservations outstanding, and a
+    process over its share waits for its own earlier slots to pass before
+    booking another.
+    """
+
+    def __init__(self, path: str, name: str = "default", max_pending: int = 4,
+                 busy_timeout_ms: int = 5000, owner: Optional[int] = None):
+        """
+        Initialize the shared state.
+
+        Args:
+            path: SQLite database file (created if missing)
+            name: Limiter name; processes using the same name share one budget
+            max_pending: Future reservations split between active processes
+            busy_timeout_ms: How long to wait on another process's write lock
+            owner: Identifier for fair queuing (defaults to the process id)
+        """
+        self.path = path
+        self.name = name
+        self.max_pending = max(1, max_pending)
+        self._owner = owner
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path, check_same_thread=False,
+                                          isolation_level=None)
+        self.connection.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self._create_schema()
+
+    @classmethod
+    def from_config(cls, config: Any, name: str) -> Optional["SharedRateLimitState"]:
+        """
+        Open the shared state described by an adapter config, if it enables one.
+
+        Args:
+            config: Adapter config with an optional ``rate_limit_state_path``
+            name: Limiter name for this adapter
+
+        Returns:
+            SharedRateLimitState, or None when no ``rate_limit_state_path`` is configured
+        """
+        path = getattr(config, 'rate_limit_state_path', None)
+        if not isinstance(path, str) or not path:
+            return None
+        return cls(path, name=name)
+
+    @property
+    def owner(self) -> int:
+        """Identifier of the calling process, re-read after a fork."""
+        return self._owner if self._owner is not None else os.getpid()
+
+    def _create_schema(self) -> None:
+        """Create the state tables."""
+        with self._lock:
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS rate_limit_state (
+                    name TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value REAL NOT NULL,
+                    PRIMARY KEY (name, key)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS rate_limit_reservations (
+                    name TEXT NOT NULL,
+                    owner INTEGER NOT NULL,
+                    slot REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_rate_limit_reservations
+                    ON rate_limit_reservations(name, slot);
+            """)
+
+    @contextmanager
+    def transaction(self, write: bool = False) -> Iterator[Dict[str, float]]:
+        """
+        Load the shared values and, for writes, save changes back atomically.
+
+        A write transaction holds the database write lock for the whole
+        block, so the block should only do in-memory work.
+
+        Args:
+            write: Take the write lock and persist changes to the yielded dict
+
+        Yields:
+            Mutable mapping of state key to value
+        """
+        with self._lock:
+            if not write:
+                yield self._load()
+                return
+
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                values = self._load()
+                original = dict(values)
+                yield values
+                changed = [
+                    (self.name, key, value) for key, value in values.items()
+                    if original.get(key) != value
+                ]
+                if changed:
+                    self.connection.executemany(
+                        "INSERT OR REPLACE INTO rate_limit_state (name, key, value) VALUES (?, ?, ?)",
+                        changed
+                    )
+                self.connection.execute("COMMIT")
+            except BaseException:
+                if self.connection.in_transaction:
+                    self.connection.execute("ROLLBACK")
+                raise
+
+    def _load(self) -> Dict[str, float]:
+        return dict(self.connection.execute(
+            "SELECT key, value FROM rate_limit_state WHERE name = ?", (self.name,)
+        ).fetchall())
+
+    def fair_share_wait(self, now: float) -> float:
+        """
+        Seconds this process must wait before it may book another slot.
+
+        Call inside a write :meth:`transaction`.
+
+        Args:
+            now: Current time
+
+        Returns:
+            0.0 if the process is within its share of pending reservations
+        """
+        self.connection.execute(
+            "DELETE FROM rate_limit_reservations WHERE name = ? AND slot <= ?",
+            (self.name, now)
+        )
+        pending: Dict[int, list] = {}
+        for owner, slot in self.connection.execute(
+            "SELECT owner, slot FROM rate_limit_reservations WHERE name = ? ORDER BY slot",
+            (self.name,)
+        ):
+            pending.setdefault(owner, []).append(slot)
+
+        owner = self.owner
+        mine = pending.get(owner, [])
+        share = max(1, self.max_pending // len(pending.keys() | {owner}))
+        if len(mine) < share:
+            return 0.0
+        # Wait until enough of this process's own slots have passed
+        return mine[len(mine) - share] - now
+
+    def add_reservation(self, slot: float) -> None:
+        """
+        Record a slot booked by this process. Call inside a write :meth:`transaction`.
+
+        Args:
+            slot: Time the reserved request may be sent
+        """
+        self.connection.execute(
+            "INSERT INTO rate_limit_reservations (name, owner, slot) VALUES (?, ?, ?)",
+            (self.name, self.owner, slot)
+        )
+
+    def clear(self) -> None:
+        """Forget all state and reservations for this limiter name."""
+        with self._lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.execute("DELETE FROM rate_limit_state WHERE name = ?", (self.name,))
+            self.connection.execute(
+                "DELETE FROM rate_limit_reservations WHERE name = ?", (self.name,)
+            )
+            self.connection.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.connection.close()
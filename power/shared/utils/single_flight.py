@@ -0,0 +1,135 @@
+"""
+Single-flight request coalescing.
+Concurrent callers asking for the same key share one in-flight call instead
+of each missing the cache and making their own, so a burst of identical
+requests costs a single API call.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class _Call:
+    """In-flight synchronous call shared by its waiters."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls by key.
+
+    The first caller for a key runs the call; callers arriving while it is
+    in flight wait for and share its result or exception. Once the call
+    finishes the key is released, so later callers start a fresh call
+    (normally answered by the cache the first call filled).
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: Dict[str, _Call] = {}
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Run ``fn`` once for all threads concurrently calling with ``key``.
+
+        Args:
+            key: Deduplication key, e.g. the adapter cache key
+            fn: Call to make
+
+        Returns:
+            Result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``fn`` once for all tasks concurrently calling with ``key``.
+
+        The shared call runs as its own task, so cancelling one waiter does
+        not cancel the call for the others.
+
+        Args:
+            key: Deduplication key, e.g. the adapter cache key
+            fn: Coroutine function making the call
+
+        Returns:
+            Result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+
+        with self._lock:
+            task = self._tasks.get(flight_key)
+            if task is None:
+                task = loop.create_task(fn())
+                self._tasks[flight_key] = task
+                task.add_done_callback(lambda done: self._release(flight_key, done))
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def _release(self, flight_key: Tuple[asyncio.AbstractEventLoop, str], task: asyncio.Task) -> None:
+        """Forget a finished async call."""
+        with self._lock:
+            if self._tasks.get(flight_key) is task:
+                del self._tasks[flight_key]
+        # Mark the exception retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics."""
+        with self._lock:
+            calls = self.executions + self.coalesced
+            return {
+                'calls': calls,
+                'executions': self.executions,
+                'coalesced': self.coalesced,
+                'coalesce_rate': self.coalesced / calls if calls else 0.0,
+                'in_flight': len(self._calls) + len(self._tasks)
+            }
@@ -0,0 +1,246 @@
+"""
+Token Counting Utility
+
+Tokenizer-backed token counts for OpenAI-compatible models using tiktoken,
+with one encoder per model, an LRU memo keyed on content hash so repeated
+system prompts and chat history are only encoded once, and a running tally
+for conversations that grow one message at a time.
+
+Falls back to a characters-per-token heuristic when tiktoken or the
+model's encoding is unavailable (e.g. encodings cannot be downloaded).
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - tiktoken is in requirements.txt
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Encoding used for models tiktoken does not know
+DEFAULT_ENCODING = "cl100k_base"
+
+# Heuristic used when no encoder can be loaded
+FALLBACK_CHARS_PER_TOKEN = 4
+
+# Chat format overhead, per OpenAI's message token accounting
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_NAME = 1
+REPLY_PRIMING_TOKENS = 3
+
+_encoders: Dict[str, Any] = {}
+_encoders_lock = threading.Lock()
+
+
+def _load_encoder(model: str) -> Optional[Any]:
+    """
+    Get the tiktoken encoder for a model, loading it once per process.
+
+    Args:
+        model: Model name
+
+    Returns:
+        Encoder, or None if tiktoken or the encoding is unavailable
+    """
+    with _encoders_lock:
+        if model in _encoders:
+            return _encoders[model]
+
+        encoder = None
+        if tiktoken is not None:
+            try:
+                try:
+                    encoder = tiktoken.encoding_for_model(model)
+                except KeyError:
+                    encoder = tiktoken.get_encoding(DEFAULT_ENCODING)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning("Token encoder for %s unavailable, estimating tokens: %s", model, e)
+        _encoders[model] = encoder
+        return encoder
+
+
+class TokenCounter:
+    """
+    Count tokens for one model with memoized per-text counts.
+
+    Counts are memoized in an LRU keyed on a hash of the text, so the
+    same system prompt or history message is encoded once however many
+    requests it appears in.
+    """
+
+    def __init__(self, model: str, encoder: Optional[Any] = None, memo_size: int = 4096):
+        """
+        Initialize the counter.
+
+        Args:
+            model: Model whose tokenizer to use
+            encoder: Encoder override with ``encode_ordinary``; loaded from tiktoken if None
+            memo_size: Maximum number of memoized text counts
+        """
+        self.model = model
+        self.memo_size = memo_size
+        self._encoder = encoder if encoder is not None else _load_encoder(model)
+        self._memo: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def exact(self) -> bool:
+        """Whether counts come from the model's tokenizer rather than the heuristic."""
+        return self._encoder is not None
+
+    def count(self, text: str) -> int:
+        """
+        Count tokens in text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Token count (0 for empty text)
+        """
+        if not text:
+            return 0
+        if self._encoder is None:
+            return max(1, len(text) // FALLBACK_CHARS_PER_TOKEN)
+
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        with self._lock:
+            tokens = self._memo.get(key)
+            if tokens is not None:
+                self._memo.move_to_end(key)
+                self.hits += 1
+                return tokens
+
+        tokens = len(self._encoder.encode_ordinary(text))
+
+        with self._lock:
+            self.misses += 1
+            self._memo[key] = tokens
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return tokens
+
+    def count_message(self, message: Dict[str, Any]) -> int:
+        """
+        Count tokens for one chat message including its format overhead.
+
+        Args:
+            message: Chat message with 'role', 'content' and optional 'name'
+
+        Returns:
+            Token count
+        """
+        tokens = TOKENS_PER_MESSAGE + self.count(message.get('role') or '')
+        content = message.get('content')
+        if isinstance(content, str):
+            tokens += self.count(content)
+        elif isinstance(content, list):
+            # Multimodal content parts; only text parts are tokenized here
+            tokens += sum(self.count(part.get('text') or '') for part in content
+                          if isinstance(part, dict))
+        if message.get('name'):
+            tokens += TOKENS_PER_NAME + self.count(message['name'])
+        return tokens
+
+    def count_messages(self, messages: Iterable[Dict[str, Any]]) -> int:
+        """
+        Count tokens for a chat request's messages.
+
+        Args:
+            messages: Chat messages
+
+        Returns:
+            Token count including reply priming
+        """
+        return self.tally(messages).total
+
+    def tally(self, messages: Iterable[Dict[str, Any]] = ()) -> 'MessageTally':
+        """
+        Start a running token tally for a conversation.
+
+        Args:
+            messages: Messages already in the conversation
+
+        Returns:
+            MessageTally that can be extended one message at a time
+        """
+        tally = MessageTally(self)
+        for message in messages:
+            tally.append(message)
+        return tally
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get memo statistics."""
+        with self._lock:
+            return {
+                'model': self.model,
+                'exact': self.exact,
+                'memo_size': len(self._memo),
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+class MessageTally:
+    """
+    Running token count for a chat conversation.
+
+    Appending a message only counts that message, so a growing history is
+    never re-tokenized as a whole.
+    """
+
+    __slots__ = ('counter', 'message_tokens', '_sum')
+
+    def __init__(self, counter: TokenCounter):
+        self.counter = counter
+        self.message_tokens: List[int] = []
+        self._sum = 0
+
+    def append(self, message: Dict[str, Any]) -> int:
+        """
+        Add a message to the tally.
+
+        Args:
+            message: Chat message
+
+        Returns:
+            Tokens for that message alone
+        """
+        tokens = self.counter.count_message(message)
+        self.message_tokens.append(tokens)
+        self._sum += tokens
+        return tokens
+
+    @property
+    def total(self) -> int:
+        """Total tokens for the conversation including reply priming."""
+        return self._sum + REPLY_PRIMING_TOKENS
+
+
+_counters: Dict[str, TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def get_token_counter(model: str) -> TokenCounter:
+    """
+    Get the shared token counter for a model.
+
+    Args:
+        model: Model name
+
+    Returns:
+        Process-wide TokenCounter for that model
+    """
+    with _counters_lock:
+        counter = _counters.get(model)
+        if counter is None:
+            counter = _counters[model] = TokenCounter(model)
+        return counter
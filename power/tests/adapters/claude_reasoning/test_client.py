@@ -139,19 +139,21 @@ class TestClaudeReasoningClient:
             max_steps=3
         )
         
-        mock_claude_response['content'][0]['text'] = """
-        Step 1: First step analysis
-        Step 2: Second step evaluation  
-        Step 3: Final conclusion
-        """
+        async def fake_stream(claude_request):
+            assert claude_request['stream'] is True
+            for chunk in ["Step 1: First step ", "analysis\nStep 2: Second step evaluation\n",
+                          "Step 3: Final conclusion"]:
+                yield chunk
         
-        with patch.object(claude_client, '_make_api_call', return_value=mock_claude_response):
+        with patch.object(claude_client, '_stream_text', side_effect=fake_stream):
             steps = []
             async for step in claude_client.think_step_by_step(request):
                 steps.append(step)
             
-            assert len(steps) > 0
+            assert len(steps) == 3
             assert all(isinstance(step, ReasoningStep) for step in steps)
+            assert steps[0].content == "First step analysis"
+            assert steps[2].content == "Final conclusion"
     
     @pytest.mark.asyncio
     async def test_complexity_analysis(self, claude_client):
@@ -259,7 +261,7 @@ class TestClaudeReasoningClient:
             # Should have attempted to get from cache
             claude_client.cache.get.assert_called_once()
             # Should have cached the response
-            claude_client.cache.set.assert_called_once()
+            claude_client.cache.set_response.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_cached_response_retrieval(self, claude_client):
@@ -0,0 +1,69 @@
+"""
+Tests for ClaudeReasoningDataMapper prompt caching and usage mapping.
+"""
+
+from adapters.claude_reasoning.data_mapper import ClaudeReasoningDataMapper
+from shared.models.reasoning_models import ReasoningMode, ReasoningRequest
+
+
+def _request(**kwargs):
+    return ReasoningRequest(prompt="Why is the sky blue?", mode=ReasoningMode.THOUGHTFUL, **kwargs)
+
+
+class TestPromptCaching:
+    """Test cases for cacheable prompt prefixes."""
+
+    def test_only_system_block_is_cacheable(self):
+        mapper = ClaudeReasoningDataMapper()
+        request = _request(context={'recent_prompts': 'earlier question'})
+
+        claude_request = mapper.map_request_to_claude(request, {'prompt_caching': True})
+
+        system = claude_request['system']
+        assert system[0]['cache_control'] == {'type': 'ephemeral'}
+        content = claude_request['messages'][0]['content']
+        assert isinstance(content, str)
+        assert content.index('earlier question') < content.index('Why is the sky blue?')
+
+    def test_instructions_precede_per_request_text(self):
+        mapper = ClaudeReasoningDataMapper()
+        first = mapper.map_request_to_claude(_request(context={'recent_prompts': 'a'}), {})
+        second = mapper.map_request_to_claude(
+            ReasoningRequest(prompt="Other question", mode=ReasoningMode.THOUGHTFUL), {}
+        )
+
+        first_text = first['messages'][0]['content']
+        second_text = second['messages'][0]['content']
+        instructions = first_text[:first_text.index('Recent conversation context')].strip()
+        assert instructions
+        assert second_text.strip().startswith(instructions)
+
+    def test_plain_strings_without_prompt_caching(self):
+        mapper = ClaudeReasoningDataMapper()
+        request = _request(context={'recent_prompts': 'long shared document'})
+
+        claude_request = mapper.map_request_to_claude(request, {})
+
+        assert isinstance(claude_request['system'], str)
+        content = claude_request['messages'][0]['content']
+        assert isinstance(content, str)
+        assert content.index('long shared document') < content.index('Why is the sky blue?')
+
+    def test_cache_usage_is_reported(self):
+        mapper = ClaudeReasoningDataMapper()
+        claude_response = {
+            'content': [{'text': 'Rayleigh scattering.'}],
+            'usage': {
+                'input_tokens': 20,
+                'cache_read_input_tokens': 1000,
+                'cache_creation_input_tokens': 0,
+                'output_tokens': 5
+            }
+        }
+
+        response = mapper.map_response_from_claude(claude_response, _request())
+
+        usage = response.metadata['usage']
+        assert usage['prompt_tokens'] == 1020
+        assert usage['cached_prompt_tokens'] == 1000
+        assert usage['total_tokens'] == 1025
@@ -0,0 +1,241 @@
+"""
+Tests for ClaudeReasoningClient's pooled HTTP session and SSE streaming,
+run against a local stub of the Claude messages API.
+"""
+
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from adapters.claude_reasoning import ClaudeReasoningClient, ClaudeReasoningConfig
+from shared.models.reasoning_models import ReasoningMode, ReasoningRequest
+from shared.utils.cache import ResponseCache
+
+
+class StubClaudeServer:
+    """Local HTTP server speaking just enough of the Claude messages API."""
+
+    def __init__(self):
+        self.peers = set()
+        self.requests = []
+        self.status = 200
+        self.event_delay = 0.0
+        self.release_final_step = asyncio.Event()
+        self.runner = None
+        self.url = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post('/v1/messages', self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    async def handle(self, request):
+        self.peers.add(request.transport.get_extra_info('peername'))
+        body = await request.json()
+        self.requests.append((dict(request.headers), body))
+
+        if self.status != 200:
+            return web.Response(status=self.status, text="stub error")
+        if body.get('stream'):
+            return await self.stream(request)
+        return web.json_response({
+            'content': [{'text': 'Stub answer from the local server.'}],
+            'usage': {'input_tokens': 10, 'output_tokens': 6}
+        })
+
+    async def stream(self, request):
+        response = web.StreamResponse(headers={'Content-Type': 'text/event-stream'})
+        await response.prepare(request)
+
+        async def send(event):
+            await asyncio.sleep(self.event_delay)
+            await response.write(
+                f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode()
+            )
+
+        await send({'type': 'message_start'})
+        for text in ["Step 1: Examine the ", "inputs\nStep 2: Weigh options\n"]:
+            await send({'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': text}})
+        # Hold the rest of the answer until the client has seen the first step
+        await self.release_final_step.wait()
+        await send({'type': 'content_block_delta',
+                    'delta': {'type': 'text_delta', 'text': "Step 3: Final answer is clear"}})
+        await send({'type': 'message_stop'})
+        await response.write_eof()
+        return response
+
+
+@pytest_asyncio.fixture
+async def stub_server():
+    server = StubClaudeServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def _config(base_url):
+    config = MagicMock(spec=ClaudeReasoningConfig)
+    config.api_key = "stub-key"
+    config.base_url = base_url
+    config.timeout = 5.0
+    config.rate_limit = 50
+    config.daily_quota = 10000
+    config.cache_enabled = False
+    config.cache_ttl = 3600
+    config.get_model_for_mode.return_value = "claude-3-sonnet-20240229"
+    config.get_temperature_for_mode.return_value = 0.7
+    config.get_max_tokens_for_mode.return_value = 4096
+    config.validate_config.return_value = {'is_valid': True, 'errors': []}
+    return config
+
+
+@pytest_asyncio.fixture
+async def client(stub_server):
+    client = ClaudeReasoningClient(_config(stub_server.url))
+    yield client
+    await client.aclose()
+
+
+class TestPooledSession:
+    """Test cases for the long-lived HTTP session."""
+
+    @pytest.mark.asyncio
+    async def test_requests_reuse_one_connection(self, client, stub_server):
+        for i in range(3):
+            response = await client.reason(
+                ReasoningRequest(prompt=f"question {i}", mode=ReasoningMode.RAPID)
+            )
+            assert response.success
+            assert response.rapid_answer == 'Stub answer from the local server.'
+
+        assert len(stub_server.requests) == 3
+        assert len(stub_server.peers) == 1
+        headers = stub_server.requests[0][0]
+        assert headers['x-api-key'] == 'stub-key'
+        assert headers['anthropic-version'] == '2023-06-01'
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_session(self, client):
+        await client.reason(ReasoningRequest(prompt="hello", mode=ReasoningMode.RAPID))
+        session = client._session  # pylint: disable=protected-access
+
+        await client.aclose()
+
+        assert session.closed
+        assert client._session is None  # pylint: disable=protected-access
+
+    def test_session_from_another_loop_is_closed_when_replaced(self):
+        client = ClaudeReasoningClient(_config("http://127.0.0.1:1"))
+        old_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=old_loop.run_forever, daemon=True)
+        thread.start()
+
+        async def get_session():
+            return client._get_session()  # pylint: disable=protected-access
+
+        try:
+            old_session = asyncio.run_coroutine_threadsafe(get_session(), old_loop).result(5)
+
+            async def replace_and_wait():
+                new_session = client._get_session()  # pylint: disable=protected-access
+                for _ in range(50):
+                    if old_session.closed:
+                        break
+                    await asyncio.sleep(0.01)
+                await client.aclose()
+                return new_session
+
+            new_session = asyncio.run(replace_and_wait())
+
+            assert new_session is not old_session
+            assert old_session.closed
+        finally:
+            old_loop.call_soon_threadsafe(old_loop.stop)
+            thread.join(5)
+            old_loop.close()
+
+    @pytest.mark.asyncio
+    async def test_error_status_is_mapped(self, client, stub_server):
+        stub_server.status = 401
+
+        response = await client.reason(ReasoningRequest(prompt="hello", mode=ReasoningMode.RAPID))
+
+        assert not response.success
+        assert "Invalid Claude API key" in response.error_message
+
+
+class TestStreamingSteps:
+    """Test cases for SSE step streaming."""
+
+    @pytest.mark.asyncio
+    async def test_steps_are_yielded_before_stream_ends(self, client, stub_server):
+        steps = []
+        async for step in client.think_step_by_step(
+            ReasoningRequest(prompt="plan a release", mode=ReasoningMode.STEP_BY_STEP)
+        ):
+            steps.append(step)
+            # The server only finishes once the client has received the first step
+            stub_server.release_final_step.set()
+
+        assert [step.description for step in steps] == ["Step 1", "Step 2", "Step 3"]
+        assert steps[0].content == "Examine the inputs"
+        assert steps[2].content == "Final answer is clear"
+        assert stub_server.requests[0][1]['stream'] is True
+
+    @pytest.mark.asyncio
+    async def test_stream_may_outlast_the_request_timeout(self, client, stub_server):
+        client.config.timeout = 0.5
+        stub_server.event_delay = 0.2
+        stub_server.release_final_step.set()
+
+        steps = [step async for step in client.think_step_by_step(
+            ReasoningRequest(prompt="plan a release", mode=ReasoningMode.STEP_BY_STEP)
+        )]
+
+        # Five events 0.2s apart take about 1s, longer than the 0.5s timeout
+        assert [step.description for step in steps] == ["Step 1", "Step 2", "Step 3"]
+
+
+class TestRequestCoalescing:
+    """Test cases for sharing in-flight calls between identical requests."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_share_one_call(self, client, stub_server):
+        client.cache = ResponseCache()
+        requests = [ReasoningRequest(prompt="same question", mode=ReasoningMode.RAPID)
+                    for _ in range(4)]
+
+        responses = await asyncio.gather(*(client.reason(request) for request in requests))
+
+        assert len(stub_server.requests) == 1
+        assert all(response.success for response in responses)
+        assert [response.request_id for response in responses] == [r.id for r in requests]
+        stats = client.get_client_stats()['single_flight_stats']
+        assert (stats['executions'], stats['coalesced']) == (1, 3)
+
+    @pytest.mark.asyncio
+    async def test_different_context_is_not_coalesced(self, client, stub_server):
+        client.cache = ResponseCache()
+
+        await asyncio.gather(
+            client.reason(ReasoningRequest(prompt="q", mode=ReasoningMode.RAPID,
+                                           context={'recent_prompts': ['a']})),
+            client.reason(ReasoningRequest(prompt="q", mode=ReasoningMode.RAPID,
+                                           context={'recent_prompts': ['b']}))
+        )
+
+        assert len(stub_server.requests) == 2
+
@@ -0,0 +1,159 @@
+"""
+Tests for the async Gemini client.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from adapters.gemini_api.async_client import AsyncGeminiClient
+from adapters.gemini_api.config import GeminiConfig
+from adapters.gemini_api.streaming_client import GeminiStreamingClient
+from shared.exceptions import RateLimitError
+from shared.models.llm_request import LLMRequest
+
+
+class FakeAsyncModels:
+    """Stand-in for ``genai.Client().aio.models``."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = 0
+        self.configs = []
+
+    async def generate_content(self, model, contents, config):
+        self.calls += 1
+        self.configs.append(config)
+        await asyncio.sleep(0.01)
+        if self.calls <= self.failures:
+            raise RateLimitError("Resource exhausted", retry_after=0)
+        return {
+            'candidates': [{'content': {'parts': [{'text': 'async reply'}]}, 'finishReason': 'STOP'}],
+            'usageMetadata': {'promptTokenCount': 4, 'candidatesTokenCount': 2}
+        }
+
+
+@pytest.fixture
+def client(monkeypatch, mock_api_key):
+    monkeypatch.setenv('GEMINI_API_KEY', mock_api_key)
+    monkeypatch.setenv('GEMINI_ENABLE_CACHING', 'false')
+    monkeypatch.setenv('GEMINI_RETRY_DELAY', '0')
+    client = AsyncGeminiClient(GeminiConfig())
+    client.models = FakeAsyncModels()
+    client._genai_client = SimpleNamespace(aio=SimpleNamespace(models=client.models))  # pylint: disable=protected-access
+    client._client_initialized = True  # pylint: disable=protected-access
+    return client
+
+
+class TestAsyncGeminiClient:
+    """Test cases for AsyncGeminiClient."""
+
+    def test_generate_text(self, client):
+        response = asyncio.run(client.generate_text(LLMRequest(prompt="hi", request_id="g1")))
+
+        assert response.content == "async reply"
+        assert response.request_id == "g1"
+        assert response.usage.total_tokens == 6
+        assert client.get_usage_stats()['requests_made'] == 1
+
+    def test_generation_config_is_sent(self, client):
+        asyncio.run(client.generate_text(LLMRequest(prompt="hi", temperature=0.2, max_tokens=64)))
+
+        config = client.models.configs[0]
+        assert config['temperature'] == 0.2
+        assert config['max_output_tokens'] == 64
+
+    def test_rate_limited_call_is_retried(self, client):
+        client.models.failures = 1
+
+        response = asyncio.run(client.generate_text(LLMRequest(prompt="hi")))
+
+        assert response.content == "async reply"
+        assert client.models.calls == 2
+        assert client.rate_limiter.get_backoff_info()['consecutive_429s'] == 1
+
+    def test_batch_generate_text(self, client):
+        requests = [LLMRequest(prompt=f"prompt {i}") for i in range(4)]
+
+        batch = asyncio.run(client.batch_generate_text(requests, max_concurrency=4))
+
+        assert batch.total_requests == 4
+        assert batch.successful_requests == 4
+        assert batch.total_usage.total_tokens == 24
+
+
+class FakeAsyncStreamModels:
+    """Stand-in for ``genai.Client().aio.models`` streaming calls."""
+
+    def __init__(self, deltas):
+        self.deltas = deltas
+        self.closed = False
+        self.configs = []
+
+    async def generate_content_stream(self, model, contents, config):
+        self.configs.append(config)
+        async def chunks():
+            try:
+                for i, delta in enumerate(self.deltas):
+                    await asyncio.sleep(0)
+                    finish = 'STOP' if i == len(self.deltas) - 1 else None
+                    candidate = {'content': {'parts': [{'text': delta}]}}
+                    if finish:
+                        candidate['finishReason'] = finish
+                    yield {'candidates': [candidate]}
+            finally:
+                self.closed = True
+        return chunks()
+
+
+@pytest.fixture
+def streaming_client(monkeypatch, mock_api_key):
+    monkeypatch.setenv('GEMINI_API_KEY', mock_api_key)
+    client = GeminiStreamingClient(GeminiConfig())
+    client.models = FakeAsyncStreamModels(["Hel", "lo"])
+    client._genai_client = SimpleNamespace(aio=SimpleNamespace(models=client.models))  # pylint: disable=protected-access
+    client._client_initialized = True  # pylint: disable=protected-access
+    return client
+
+
+class TestGeminiAsyncStreaming:
+    """Test cases for GeminiStreamingClient's async streams."""
+
+    def test_astream_text(self, streaming_client):
+        client, models = streaming_client, streaming_client.models
+
+        async def run():
+            return [chunk async for chunk in client.astream_text(LLMRequest(prompt="hi", request_id="s1"))]
+
+        chunks = asyncio.run(run())
+
+        assert [chunk.content_delta for chunk in chunks] == ["Hel", "lo"]
+        assert chunks[-1].is_final
+        assert chunks[-1].final_response.content == "Hello"
+        assert models.closed
+
+    def test_astream_text_sends_generation_config(self, streaming_client):
+        async def run():
+            request = LLMRequest(prompt="hi", temperature=0.2, max_tokens=64)
+            return [chunk async for chunk in streaming_client.astream_text(request)]
+
+        asyncio.run(run())
+
+        config = streaming_client.models.configs[0]
+        assert config['temperature'] == 0.2
+        assert config['max_output_tokens'] == 64
+
+    def test_astream_chat_completion_sends_generation_config(self, streaming_client):
+        async def run():
+            messages = [{'role': 'user', 'content': 'hi'}]
+            return [chunk async for chunk in streaming_client.astream_chat_completion(
+                messages, temperature=0.3, max_tokens=32
+            )]
+
+        chunks = asyncio.run(run())
+
+        assert chunks[-1].final_response.content == "Hello"
+        config = streaming_client.models.configs[0]
+        assert config['temperature'] == 0.3
+        assert config['max_output_tokens'] == 32
@@ -10,7 +10,7 @@ from unittest.mock import MagicMock
 from adapters.gemini_api.data_mapper import GeminiDataMapper
 from adapters.gemini_api.config import GeminiConfig
 from shared.models.llm_request import LLMRequest
-from shared.models.llm_response import LLMResponse, FinishReason, UsageStats
+from shared.models.llm_response import LLMResponse, FinishReason, UsageStats, StreamAccumulator
 from shared.exceptions import DataMappingError, InvalidRequestError
 
 
@@ -381,6 +381,27 @@ class TestGeminiDataMapper:
         assert streaming_response.final_response is not None
         assert isinstance(streaming_response.final_response, LLMResponse)
 
+
+    def test_map_streaming_delta(self, data_mapper):
+        """Test mapping streaming chunks into a shared accumulator."""
+        chunks = [
+            {'candidates': [{'content': {'parts': [{'text': 'Hello'}]}}]},
+            {'candidates': [{'content': {'parts': [{'text': ' world'}, {'text': '!'}]},
+                             'finishReason': 'STOP'}],
+             'usageMetadata': {'promptTokenCount': 5, 'candidatesTokenCount': 3, 'totalTokenCount': 8}}
+        ]
+        accumulator = StreamAccumulator()
+
+        responses = [data_mapper.map_streaming_delta(chunk, accumulator, index, request_id='r1')
+                     for index, chunk in enumerate(chunks)]
+
+        assert [r.content_delta for r in responses] == ['Hello', ' world!']
+        assert responses[0].cumulative_content == 'Hello'
+        assert not responses[0].is_final
+        assert responses[1].is_final
+        assert responses[1].final_response.content == 'Hello world!'
+        assert responses[1].final_response.request_id == 'r1'
+
     def test_extract_model_info(self, data_mapper):
         """Test model information extraction."""
         # Test basic model
@@ -0,0 +1,145 @@
+"""
+Tests for the async OpenAI client and AsyncLLMProvider batching.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from adapters.openai_api.async_client import AsyncOpenAIClient
+from adapters.openai_api.config import OpenAIConfig
+from adapters.openai_api.rate_limiter import OpenAIRateLimiter
+from shared.interfaces.llm_provider import AsyncLLMProvider
+from shared.models.llm_request import LLMRequest
+from shared.utils.cache import ResponseCache
+
+
+class FakeCompletions:
+    """Async stand-in for ``AsyncOpenAI().completions`` that tracks concurrency."""
+
+    def __init__(self, latency: float = 0.05, fail_on: str = None):
+        self.latency = latency
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def create(self, **request):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if request['prompt'] == self.fail_on:
+                raise ValueError("upstream failure")
+            return {
+                'id': f"cmpl-{self.calls}",
+                'choices': [{'text': f"echo: {request['prompt']}", 'finish_reason': 'stop'}],
+                'usage': {'prompt_tokens': 3, 'completion_tokens': 2, 'total_tokens': 5}
+            }
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-test-key-for-validation')
+    config = OpenAIConfig()
+    config.enable_response_cache = False
+    config.enable_moderation = False
+    client = AsyncOpenAIClient(config)
+    # Drop OpenAI's fixed 1s spacing so batches are not paced in these tests
+    limiter = client.rate_limiter
+    limiter._request_buckets.remove(limiter._interval_bucket)  # pylint: disable=protected-access
+    client.fake = FakeCompletions()
+    client.async_client = SimpleNamespace(completions=client.fake)
+    return client
+
+
+class TestAsyncOpenAIClient:
+    """Test cases for AsyncOpenAIClient."""
+
+    def test_is_async_provider(self, client):
+        assert isinstance(client, AsyncLLMProvider)
+        assert asyncio.iscoroutinefunction(client.generate_text)
+
+    def test_generate_text(self, client):
+        response = asyncio.run(client.generate_text(LLMRequest(prompt="hello", request_id="r1")))
+
+        assert response.content == "echo: hello"
+        assert response.request_id == "r1"
+        assert client.rate_limiter.get_stats().total_requests == 1
+
+    def test_batch_runs_concurrently_and_keeps_order(self, client):
+        requests = [LLMRequest(prompt=f"prompt {i}") for i in range(16)]
+
+        started = time.perf_counter()
+        batch = asyncio.run(client.batch_generate_text(requests, max_concurrency=8))
+        elapsed = time.perf_counter() - started
+
+        assert [r.content for r in batch.responses] == [f"echo: prompt {i}" for i in range(16)]
+        assert batch.successful_requests == 16
+        assert batch.total_usage.total_tokens == 80
+        assert client.fake.max_in_flight == 8
+        # Sequential calls would take 16 * 50ms
+        assert elapsed < 0.5
+
+    def test_failed_request_becomes_error_response(self, client):
+        client.fake.fail_on = "prompt 1"
+        requests = [LLMRequest(prompt=f"prompt {i}") for i in range(3)]
+
+        batch = asyncio.run(client.batch_generate_text(requests))
+
+        assert (batch.successful_requests, batch.failed_requests) == (2, 1)
+        assert batch.responses[1].had_error
+        assert "upstream failure" in batch.responses[1].provider_metadata['error']
+
+    def test_concurrency_is_sized_to_remaining_budget(self, client):
+        client.config.max_concurrent_requests = 8
+        assert client.batch_concurrency(100) == 8
+        assert client.batch_concurrency(3) == 3
+
+        client.rate_limiter.update_quota_limits(daily_limit=2)
+        assert client.batch_concurrency(100) == 2
+
+    def test_loop_stays_responsive_during_backoff(self, client):
+        client.rate_limiter = OpenAIRateLimiter(client.config)
+
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            # With a 1s minimum interval the second request waits on the limiter
+            await client.batch_generate_text(
+                [LLMRequest(prompt="a"), LLMRequest(prompt="b")], max_concurrency=2
+            )
+            task.cancel()
+            return ticks
+
+        assert asyncio.run(scenario()) >= 50
+
+    def test_identical_concurrent_requests_share_one_call(self, client):
+        client.config.enable_response_cache = True
+        client.cache = ResponseCache()
+
+        async def scenario():
+            return await asyncio.gather(*(
+                client.generate_text(LLMRequest(prompt="same question", request_id=f"r{i}"))
+                for i in range(5)
+            ))
+
+        responses = asyncio.run(scenario())
+
+        assert client.fake.calls == 1
+        assert [r.content for r in responses] == ["echo: same question"] * 5
+        assert [r.request_id for r in responses] == [f"r{i}" for i in range(5)]
+        stats = client.get_client_stats()['single_flight_stats']
+        assert (stats['executions'], stats['coalesced'], stats['in_flight']) == (1, 4, 0)
@@ -0,0 +1,97 @@
+"""
+Tests for OpenAIChatClient context management.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from adapters.openai_api.chat_client import OpenAIChatClient
+from adapters.openai_api.config import OpenAIConfig
+
+
+@pytest.fixture
+def client(monkeypatch, word_token_counter):
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-test-key-for-validation')
+    client = OpenAIChatClient(OpenAIConfig())
+    monkeypatch.setattr(client, 'token_counter', lambda model=None: word_token_counter)
+    return client
+
+
+class TestTruncateMessages:
+    """Test cases for _truncate_messages_to_fit."""
+
+    def test_keeps_system_and_most_recent_messages_in_order(self, client):
+        messages = [{'role': 'system', 'content': 'rules'}] + [
+            {'role': 'user', 'content': f"message {i} " + 'pad ' * 5} for i in range(6)
+        ]
+        counter = client.token_counter()
+        # System message, the two most recent messages and reply priming
+        budget = counter.count_messages([messages[0], messages[-2], messages[-1]])
+
+        result = client._truncate_messages_to_fit(messages, budget)  # pylint: disable=protected-access
+
+        assert result == [messages[0], messages[-2], messages[-1]]
+
+    def test_everything_fits(self, client):
+        messages = [{'role': 'user', 'content': 'hi'}, {'role': 'assistant', 'content': 'hello'}]
+
+        result = client._truncate_messages_to_fit(messages, 1000)  # pylint: disable=protected-access
+
+        assert result == messages
+
+
+class TestConversationWindowIntegration:
+    """Test cases for chat methods that take a ConversationWindow."""
+
+    def test_continue_conversation_updates_window(self, client, monkeypatch):
+        sent = []
+
+        def fake_completion(messages, **kwargs):
+            sent.append(list(messages))
+            return SimpleNamespace(content=f"reply {len(sent)}")
+
+        monkeypatch.setattr(client, 'generate_chat_completion', fake_completion)
+        conversation = client.create_conversation(
+            [{'role': 'system', 'content': 'rules'}], max_context_tokens=40
+        )
+
+        for i in range(10):
+            client.continue_conversation(conversation, f"question number {i}")
+
+        assert sent[0] == [{'role': 'system', 'content': 'rules'},
+                           {'role': 'user', 'content': 'question number 0'}]
+        assert sent[-1][0] == {'role': 'system', 'content': 'rules'}
+        assert sent[-1][-1] == {'role': 'user', 'content': 'question number 9'}
+        assert conversation.messages[-1] == {'role': 'assistant', 'content': 'reply 10'}
+        assert conversation.total_tokens <= 40
+        assert conversation.dropped_messages > 0
+
+    def test_failed_call_leaves_window_unchanged(self, client, monkeypatch):
+        def failing_completion(messages, **kwargs):
+            raise RuntimeError("rate limited")
+
+        conversation = client.create_conversation(
+            [{'role': 'system', 'content': 'rules'}], max_context_tokens=40
+        )
+        monkeypatch.setattr(client, 'generate_chat_completion', failing_completion)
+
+        with pytest.raises(RuntimeError):
+            client.continue_conversation(conversation, "question")
+
+        assert conversation.messages == [{'role': 'system', 'content': 'rules'}]
+
+    def test_failed_summary_is_not_pinned(self, client, monkeypatch):
+        def fake_completion(messages, **kwargs):
+            if messages[-1]['content'].startswith("Please summarize"):
+                raise RuntimeError("summary call failed")
+            return SimpleNamespace(content="ok")
+
+        monkeypatch.setattr(client, 'generate_chat_completion', fake_completion)
+        conversation = client.create_conversation(max_context_tokens=30, summarize=True)
+
+        for i in range(10):
+            client.continue_conversation(conversation, f"question number {i}")
+
+        assert conversation.dropped_messages > 0
+        assert all(message['role'] != 'system' for message in conversation.messages)
@@ -0,0 +1,56 @@
+"""
+Tests for OpenAI prompt-prefix caching hints and cached token reporting.
+"""
+
+import pytest
+
+from adapters.openai_api.base_client import BaseOpenAIClient
+from adapters.openai_api.config import OpenAIConfig
+from adapters.openai_api.data_mapper import OpenAIDataMapper
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-test-key-for-validation')
+    return BaseOpenAIClient(OpenAIConfig())
+
+
+def _chat(system, user):
+    return {'model': 'gpt-4o', 'messages': [
+        {'role': 'system', 'content': system},
+        {'role': 'user', 'content': user}
+    ]}
+
+
+class TestPromptCacheKey:
+    """Test cases for BaseOpenAIClient._with_prompt_cache_key."""
+
+    def test_same_system_prompt_shares_key(self, client):
+        first = client._with_prompt_cache_key(_chat("standards", "task one"))  # pylint: disable=protected-access
+        second = client._with_prompt_cache_key(_chat("standards", "task two"))  # pylint: disable=protected-access
+        other = client._with_prompt_cache_key(_chat("other rules", "task one"))  # pylint: disable=protected-access
+
+        assert 'prompt_cache_key' not in first
+        assert first['extra_body']['prompt_cache_key'] == second['extra_body']['prompt_cache_key']
+        assert first['extra_body']['prompt_cache_key'] != other['extra_body']['prompt_cache_key']
+
+    def test_no_key_without_system_prefix_or_when_disabled(self, client):
+        request = {'model': 'gpt-4o', 'messages': [{'role': 'user', 'content': 'hi'}]}
+        assert 'extra_body' not in client._with_prompt_cache_key(request)  # pylint: disable=protected-access
+
+        client.config.enable_prompt_caching = False
+        assert 'extra_body' not in client._with_prompt_cache_key(  # pylint: disable=protected-access
+            _chat("standards", "task")
+        )
+
+
+def test_cached_tokens_are_reported():
+    response = OpenAIDataMapper.map_openai_response_to_llm_response({
+        'choices': [{'message': {'content': 'ok'}, 'finish_reason': 'stop'}],
+        'usage': {'prompt_tokens': 2000, 'completion_tokens': 10, 'total_tokens': 2010,
+                  'prompt_tokens_details': {'cached_tokens': 1536}}
+    }, 'gpt-4o')
+
+    assert response.usage.cached_prompt_tokens == 1536
+    assert response.usage.cache_hit_ratio == pytest.approx(0.768)
+    assert response.usage.to_dict()['cached_prompt_tokens'] == 1536
@@ -0,0 +1,157 @@
+"""
+Tests for OpenAI streaming accumulation and delta-only chunks.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from adapters.openai_api.config import OpenAIConfig
+from adapters.openai_api.streaming_client import OpenAIStreamingClient
+from shared.models.llm_response import StreamAccumulator, StreamChunk, StreamingResponse
+
+
+def _chat_chunk(content, finish_reason=None):
+    """SDK-style chat chunk object with attribute access only."""
+    delta = SimpleNamespace(content=content)
+    choice = SimpleNamespace(delta=delta, finish_reason=finish_reason)
+    chunk = SimpleNamespace(id='chatcmpl-1', choices=[choice])
+    chunk.model_dump = lambda: {
+        'id': 'chatcmpl-1', 'object': 'chat.completion.chunk',
+        'choices': [{'delta': {'content': content}, 'finish_reason': finish_reason}]
+    }
+    return chunk
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-test-key-for-validation')
+    config = OpenAIConfig()
+    config.enable_moderation = False
+    client = OpenAIStreamingClient(config)
+    words = ["Hello", ", ", "streaming", " world"]
+    chunks = [_chat_chunk(word) for word in words] + [_chat_chunk(None, finish_reason='stop')]
+    client.client = SimpleNamespace(chat=SimpleNamespace(
+        completions=SimpleNamespace(create=lambda **request: iter(chunks))
+    ))
+    return client
+
+
+class TestStreamAccumulator:
+    """Test cases for StreamAccumulator."""
+
+    def test_joins_once_and_tracks_length(self):
+        accumulator = StreamAccumulator()
+        for delta in ["ab", "", "cd", "e"]:
+            accumulator.append(delta)
+
+        assert len(accumulator) == 5
+        assert accumulator.text == "abcde"
+        assert accumulator._parts == ["abcde"]  # pylint: disable=protected-access
+        assert accumulator.text_until(3) == "abc"
+
+    def test_chunk_has_slots(self):
+        chunk = StreamChunk("x", StreamAccumulator())
+
+        assert not hasattr(chunk, '__dict__')
+
+
+class TestStreamingChatCompletion:
+    """Test cases for OpenAIStreamingClient.generate_chat_completion_stream."""
+
+    def test_delta_only_chunks(self, client):
+        chunks = list(client.generate_chat_completion_stream(
+            [{'role': 'user', 'content': 'hi'}], delta_only=True
+        ))
+
+        assert all(isinstance(chunk, StreamChunk) for chunk in chunks)
+        assert [chunk.content_delta for chunk in chunks] == ["Hello", ", ", "streaming", " world", ""]
+        # Cumulative content reflects each chunk's position, computed on demand
+        assert chunks[1].cumulative_content == "Hello, "
+        assert chunks[-1].is_final
+        assert chunks[-1].final_response.content == "Hello, streaming world"
+        assert 'cumulative_content' not in chunks[0].to_dict()
+        assert client.get_client_stats()['requests_made'] == 1
+
+    def test_default_mode_keeps_streaming_responses(self, client):
+        chunks = list(client.generate_chat_completion_stream([{'role': 'user', 'content': 'hi'}]))
+
+        assert all(isinstance(chunk, StreamingResponse) for chunk in chunks)
+        assert [chunk.cumulative_content for chunk in chunks[:3]] == ["Hello", "Hello, ", "Hello, streaming"]
+        assert chunks[-1].final_response.content == "Hello, streaming world"
+
+
+class FakeAsyncStream:
+    """Async SDK stream over prepared chunks that records reads and close."""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.read = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.read >= len(self.chunks):
+            raise StopAsyncIteration
+        await asyncio.sleep(0)
+        chunk = self.chunks[self.read]
+        self.read += 1
+        return chunk
+
+    async def close(self):
+        self.closed = True
+
+
+class TestAsyncStreamingChatCompletion:
+    """Test cases for OpenAIStreamingClient.astream_chat_completion."""
+
+    @staticmethod
+    def _use_async_stream(client, chunks):
+        stream = FakeAsyncStream(chunks)
+
+        async def create(**request):
+            assert request['stream'] is True
+            return stream
+
+        client._async_client = SimpleNamespace(  # pylint: disable=protected-access
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        return stream
+
+    def test_async_delta_only_chunks(self, client):
+        words = ["Hello", ", ", "async", " world"]
+        stream = self._use_async_stream(
+            client, [_chat_chunk(word) for word in words] + [_chat_chunk(None, finish_reason='stop')]
+        )
+
+        async def run():
+            return [chunk async for chunk in client.astream_chat_completion(
+                [{'role': 'user', 'content': 'hi'}], delta_only=True
+            )]
+
+        chunks = asyncio.run(run())
+
+        assert [chunk.content_delta for chunk in chunks] == words + [""]
+        assert chunks[-1].final_response.content == "Hello, async world"
+        assert stream.closed
+        assert client.get_client_stats()['requests_made'] == 1
+
+    def test_closing_early_closes_sdk_stream(self, client):
+        client.config.stream_buffer_size = 2
+        stream = self._use_async_stream(client, [_chat_chunk(str(i)) for i in range(100)])
+
+        async def run():
+            chunks = client.astream_chat_completion([{'role': 'user', 'content': 'hi'}])
+            first = await chunks.__anext__()
+            await chunks.aclose()
+            return first
+
+        first = asyncio.run(run())
+
+        assert first.content_delta == "0"
+        assert stream.closed
+        # Only a bounded read-ahead was pulled from the network
+        assert stream.read < 10
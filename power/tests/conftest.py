@@ -5,6 +5,27 @@ Global pytest configuration for Power Builder tests.
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to Python path for imports
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
\ No newline at end of file
+sys.path.insert(0, str(project_root))
+
+from shared.utils.token_counter import TokenCounter  # pylint: disable=wrong-import-position
+
+
+class WordEncoder:
+    """Encoder stand-in that treats each whitespace-separated word as a token."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode_ordinary(self, text):
+        self.calls += 1
+        return text.split()
+
+
+@pytest.fixture
+def word_token_counter():
+    """TokenCounter counting one token per word, with encoder calls recorded."""
+    return TokenCounter("test-model", encoder=WordEncoder())
@@ -0,0 +1,95 @@
+"""
+Test Async Power Brain
+
+Tests for the writer thread / read-only reader pool facade.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from core.consciousness.async_brain import AsyncPowerBrain
+from core.consciousness.brain_database import PowerBrain, MemoryRecord
+from core.consciousness.memory_manager import MemoryManager, MemoryContext
+
+
+def _memory(memory_id):
+    return MemoryRecord(memory_id=memory_id, content=f"content {memory_id}",
+                        memory_type="fact", source_type="system",
+                        created_at=datetime.utcnow())
+
+
+@pytest.fixture
+def brain_path(tmp_path):
+    return str(tmp_path / "power_brain.db")
+
+
+class TestAsyncPowerBrain:
+    """Test cases for AsyncPowerBrain."""
+
+    def test_writes_are_visible_to_pooled_readers(self, brain_path):
+        async def scenario():
+            async with AsyncPowerBrain(brain_path=brain_path, max_readers=2) as brain:
+                await brain.store_memory(_memory("m1"))
+                memory = await brain.get_memory("m1")
+                stats = await brain.get_brain_stats()
+                return memory, stats
+
+        memory, stats = asyncio.run(scenario())
+        assert memory.content == "content m1"
+        assert stats["knowledge_store_count"] == 1
+
+    def test_readers_are_read_only(self, brain_path):
+        PowerBrain(brain_path).close()
+        reader = PowerBrain(brain_path, read_only=True)
+        try:
+            with pytest.raises(Exception):
+                reader.store_memory(_memory("m1"))
+        finally:
+            reader.close()
+
+    def test_reads_do_not_wait_for_slow_writes(self, brain_path):
+        def slow_write(brain):
+            with brain._lock:  # pylint: disable=protected-access
+                time.sleep(0.5)
+                brain.store_memory(_memory("slow"))
+
+        async def scenario():
+            async with AsyncPowerBrain(brain_path=brain_path) as brain:
+                await brain.store_memory(_memory("m1"))
+                write = asyncio.ensure_future(brain.run_write(slow_write))
+                await asyncio.sleep(0.05)
+                started = time.perf_counter()
+                memories = await asyncio.gather(*(brain.get_memory("m1") for _ in range(8)))
+                elapsed = time.perf_counter() - started
+                await write
+                return memories, elapsed
+
+        memories, elapsed = asyncio.run(scenario())
+        assert all(m.memory_id == "m1" for m in memories)
+        assert elapsed < 0.4
+
+    def test_unknown_attribute_raises(self, brain_path):
+        brain = AsyncPowerBrain(brain_path=brain_path)
+        with pytest.raises(AttributeError):
+            brain.not_a_method  # pylint: disable=pointless-statement
+        asyncio.run(brain.close())
+
+    def test_memory_manager_async_search(self, brain_path):
+        async def scenario():
+            brain = PowerBrain(brain_path)
+            async_brain = AsyncPowerBrain(brain)
+            manager = MemoryManager(brain, async_brain=async_brain)
+            context = MemoryContext(user_id="test", session_id="s", task_id=None,
+                                    agent_id=None, conversation_context={})
+            memory_id = manager.store_memory("async recall through reader pool", "fact", context)
+            results = await manager.asearch_memories("async recall reader pool",
+                                                     similarity_threshold=0.3)
+            await async_brain.close()
+            brain.close()
+            return memory_id, results
+
+        memory_id, results = asyncio.run(scenario())
+        assert [r.memory_record.memory_id for r in results] == [memory_id]
@@ -0,0 +1,104 @@
+"""
+Test Power Brain Database
+
+Tests for bulk writes and the write-behind queue.
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from core.consciousness.brain_database import (
+    PowerBrain, MemoryRecord, TaskRecord, WorkingMemoryState
+)
+
+
+def _memory(memory_id):
+    return MemoryRecord(memory_id=memory_id, content=f"content {memory_id}",
+                        memory_type="fact", source_type="system",
+                        created_at=datetime.utcnow())
+
+
+def _task(task_id):
+    now = datetime.utcnow()
+    return TaskRecord(task_id=task_id, description="task", task_type="test",
+                      status="pending", priority=1, created_at=now, updated_at=now)
+
+
+@pytest.fixture
+def brain_path(tmp_path):
+    return str(tmp_path / "power_brain.db")
+
+
+def _committed_count(brain_path, table):
+    with PowerBrain(brain_path) as reader:
+        return reader.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestBulkWrites:
+    """Test cases for the bulk write APIs."""
+
+    def test_store_memories_bulk(self, brain_path):
+        with PowerBrain(brain_path) as brain:
+            brain.store_memories_bulk([_memory(f"m{i}") for i in range(50)])
+            assert [m.memory_id for m in brain.get_memories(["m3", "m7"])] == ["m3", "m7"]
+        assert _committed_count(brain_path, "knowledge_store") == 50
+
+    def test_add_knowledge_edges_bulk(self, brain_path):
+        with PowerBrain(brain_path) as brain:
+            brain.add_knowledge_edges_bulk([
+                ("alpha", "beta", "co_occurs_with", 0.7, "test"),
+                ("alpha", "gamma", "co_occurs_with", 0.9, "test"),
+            ])
+            related = brain.get_related_concepts("alpha")
+        assert [r[0] for r in related] == ["gamma", "beta"]
+
+
+class TestWriteBehind:
+    """Test cases for the write-behind queue."""
+
+    def test_reads_see_queued_writes(self, brain_path):
+        with PowerBrain(brain_path, write_behind=True, flush_interval=60) as brain:
+            brain.store_memory(_memory("m1"))
+            assert _committed_count(brain_path, "knowledge_store") == 0
+            assert brain.get_memory("m1") is not None
+            assert _committed_count(brain_path, "knowledge_store") == 1
+
+    def test_flush_on_size_threshold(self, brain_path):
+        with PowerBrain(brain_path, write_behind=True, flush_size=10,
+                        flush_interval=60) as brain:
+            for i in range(9):
+                brain.store_memory(_memory(f"m{i}"))
+            assert _committed_count(brain_path, "knowledge_store") == 0
+            brain.store_memory(_memory("m9"))
+            assert _committed_count(brain_path, "knowledge_store") == 10
+
+    def test_flush_on_time_threshold(self, brain_path):
+        with PowerBrain(brain_path, write_behind=True, flush_interval=0.05) as brain:
+            brain.store_memory(_memory("m1"))
+            deadline = time.time() + 2
+            while _committed_count(brain_path, "knowledge_store") == 0 and time.time() < deadline:
+                time.sleep(0.02)
+            assert _committed_count(brain_path, "knowledge_store") == 1
+
+    def test_close_forces_flush_and_coalesces_working_memory(self, brain_path):
+        brain = PowerBrain(brain_path, write_behind=True, flush_interval=60)
+        for state in ("perceiving", "reasoning", "acting"):
+            brain.update_working_memory(WorkingMemoryState(
+                session_id="s1", current_goal_id=None, current_task_id=None,
+                cognitive_state=state, context_data={}, last_update=datetime.utcnow()
+            ))
+        assert len(brain._pending_writes) == 1
+        brain.close()
+
+        with PowerBrain(brain_path) as reader:
+            assert reader.get_working_memory("s1").cognitive_state == "acting"
+
+    def test_failed_write_does_not_drop_batch(self, brain_path):
+        with PowerBrain(brain_path, write_behind=True, flush_interval=60) as brain:
+            brain.add_task(_task("t1"))
+            brain.add_task(_task("t1"))
+            brain.add_task(_task("t2"))
+            brain.flush()
+        assert _committed_count(brain_path, "task_queue") == 2
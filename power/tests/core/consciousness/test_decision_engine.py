@@ -0,0 +1,204 @@
+"""
+Test Decision Engine
+
+Tests for concurrent multi-provider consensus in DecisionEngine.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from core.consciousness.decision_engine import DecisionEngine, ReasoningContext, ReasoningMode
+
+
+class FakeProvider:
+    """Provider that answers with a fixed decision after a delay."""
+
+    def __init__(self, decision, delay=0.05):
+        self.decision = decision
+        self.delay = delay
+        self.calls = 0
+        self.cancelled = False
+
+    async def generate_response(self, request):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return SimpleNamespace(content=f"{self.decision}\nbecause {request.model}")
+
+
+def _context():
+    return ReasoningContext(situation_type="deploy", urgency_level=5, complexity_score=5,
+                            available_data={}, constraints=[], success_criteria=[])
+
+
+def _engine(providers, timeout=30.0):
+    engine = DecisionEngine(consensus_timeout_seconds=timeout)
+    for name, provider in providers.items():
+        engine.register_provider(name, provider)
+    return engine
+
+
+class TestConsensusDecision:
+    """Test cases for DecisionEngine.get_consensus_decision."""
+
+    def test_providers_run_concurrently_and_each_is_asked(self):
+        providers = {
+            "openai": FakeProvider("Ship it", delay=0.2),
+            "claude": FakeProvider("Wait", delay=0.2),
+            "gemini": FakeProvider("Roll back", delay=0.2),
+        }
+        engine = _engine(providers)
+
+        started = time.perf_counter()
+        result = asyncio.run(engine.get_consensus_decision(_context()))
+        elapsed = time.perf_counter() - started
+
+        # Latency is the slowest provider, not the sum of all three
+        assert elapsed < 0.45
+        assert [p.calls for p in providers.values()] == [1, 1, 1]
+        assert result.provider_used == "consensus_1_3"
+
+    def test_quorum_stops_early_and_cancels_stragglers(self):
+        providers = {
+            "openai": FakeProvider("Ship it.", delay=0.05),
+            "claude": FakeProvider("ship it", delay=0.1),
+            "gemini": FakeProvider("Roll back", delay=10),
+        }
+        engine = _engine(providers)
+
+        started = time.perf_counter()
+        result = asyncio.run(engine.get_consensus_decision(_context()))
+
+        assert time.perf_counter() - started < 1.0
+        assert result.decision == "Ship it."
+        assert result.provider_used == "consensus_2_2"
+        assert providers["gemini"].cancelled
+        assert result.reasoning_chain[0].startswith("Provider openai:")
+
+    def test_slow_provider_misses_deadline(self):
+        providers = {
+            "openai": FakeProvider("Ship it", delay=0.01),
+            "claude": FakeProvider("Wait", delay=10),
+        }
+        engine = _engine(providers, timeout=0.1)
+
+        result = asyncio.run(engine.get_consensus_decision(_context(), quorum=2))
+
+        assert result.decision == "Ship it"
+        assert result.provider_used == "consensus_1_1"
+        assert engine.provider_performance["claude"]["total_calls"] == 1
+        assert engine.provider_performance["claude"]["successful_calls"] == 0
+
+    def test_no_providers_falls_back_to_rules(self):
+        result = asyncio.run(DecisionEngine().get_consensus_decision(_context()))
+
+        assert result.provider_used == "fallback_rules"
+
+
+def _urgent_context():
+    return ReasoningContext(situation_type="outage", urgency_level=9, complexity_score=5,
+                            available_data={}, constraints=[], success_criteria=[])
+
+
+class TestHedgedDecision:
+    """Test cases for hedged decisions on urgent contexts."""
+
+    @staticmethod
+    def _seed_latency(engine, name, latency_ms, samples=DecisionEngine.MIN_HEDGE_SAMPLES):
+        for _ in range(samples):
+            engine.provider_latency[name].record(latency_ms)
+
+    def test_slow_primary_is_hedged_and_cancelled(self):
+        providers = {
+            "openai": FakeProvider("Page the on-call", delay=10),
+            "claude": FakeProvider("Fail over", delay=0.05),
+        }
+        engine = _engine(providers)
+        self._seed_latency(engine, "openai", 50.0)
+
+        started = time.perf_counter()
+        result = asyncio.run(engine.make_decision(_urgent_context()))
+
+        assert time.perf_counter() - started < 1.0
+        assert result.decision == "Fail over"
+        assert result.provider_used == "claude"
+        assert providers["openai"].cancelled
+
+    def test_cancelled_primary_records_censored_latency(self):
+        providers = {
+            "openai": FakeProvider("Page the on-call", delay=10),
+            "claude": FakeProvider("Fail over", delay=0.05),
+        }
+        engine = _engine(providers)
+        self._seed_latency(engine, "openai", 50.0)
+
+        asyncio.run(engine.make_decision(_urgent_context()))
+
+        tracker = engine.provider_latency["openai"]
+        assert len(tracker) == DecisionEngine.MIN_HEDGE_SAMPLES + 1
+        assert tracker.percentile(100.0) >= 50.0
+
+    def test_early_primary_failure_tries_backup_immediately(self):
+        class FailingProvider:
+            async def generate_response(self, request):
+                raise RuntimeError("boom")
+
+        providers = {
+            "openai": FailingProvider(),
+            "claude": FakeProvider("Fail over", delay=0.01),
+        }
+        engine = _engine(providers)
+        self._seed_latency(engine, "openai", 5000.0)
+
+        started = time.perf_counter()
+        result = asyncio.run(engine._hedged_decision("openai", _urgent_context(),
+                                                     ReasoningMode.FAST_DECISION))
+
+        assert time.perf_counter() - started < 1.0
+        assert result.provider_used == "claude"
+
+    def test_fast_primary_is_not_hedged(self):
+        providers = {
+            "openai": FakeProvider("Page the on-call", delay=0.01),
+            "claude": FakeProvider("Fail over", delay=0.01),
+        }
+        engine = _engine(providers)
+        self._seed_latency(engine, "openai", 200.0)
+
+        result = asyncio.run(engine.make_decision(_urgent_context()))
+
+        assert result.provider_used == "openai"
+        assert providers["claude"].calls == 0
+        assert len(engine.provider_latency["openai"]) == DecisionEngine.MIN_HEDGE_SAMPLES + 1
+
+    def test_low_urgency_waits_for_primary(self):
+        providers = {
+            "openai": FakeProvider("Ship it", delay=0.2),
+            "claude": FakeProvider("Wait", delay=0.01),
+        }
+        engine = _engine(providers)
+        self._seed_latency(engine, "openai", 10.0)
+
+        result = asyncio.run(engine.make_decision(_context()))
+
+        assert result.provider_used == "openai"
+        assert providers["claude"].calls == 0
+
+
+def test_reasoning_prompts_share_a_fixed_prefix():
+    engine = DecisionEngine()
+    other = ReasoningContext(situation_type="migrate", urgency_level=2, complexity_score=9,
+                             available_data={"db": "postgres"}, constraints=["no downtime"],
+                             success_criteria=[])
+
+    for mode in ReasoningMode:
+        first = engine._build_reasoning_prompt(_context(), mode)  # pylint: disable=protected-access
+        second = engine._build_reasoning_prompt(other, mode)  # pylint: disable=protected-access
+        prefix = first[:first.index("SITUATION:")]
+
+        assert second.startswith(prefix)
+        assert "Format" in prefix or "Provide" in prefix or "Focus" in prefix or "Consider" in prefix
@@ -0,0 +1,62 @@
+"""
+Test Embedding Matrix
+
+Tests for vectorized similarity scoring and consolidation clustering.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from core.consciousness.brain_database import MemoryRecord
+from core.consciousness.embedding_matrix import EmbeddingMatrix
+
+
+def _memory(memory_id, vector):
+    return MemoryRecord(
+        memory_id=memory_id,
+        content=memory_id,
+        memory_type="fact",
+        source_type="system",
+        created_at=datetime.utcnow(),
+        embedding_vector=None if vector is None else np.asarray(vector, np.float32).tobytes()
+    )
+
+
+class TestEmbeddingMatrix:
+    """Test cases for EmbeddingMatrix."""
+
+    def test_from_records_skips_missing_and_mismatched_embeddings(self):
+        matrix = EmbeddingMatrix.from_records([
+            _memory("a", [1, 0, 0]),
+            _memory("b", None),
+            _memory("c", [1, 0]),
+            _memory("d", [0, 2, 0]),
+        ])
+
+        assert matrix.memory_ids == ["a", "d"]
+        assert matrix.matrix.flags["C_CONTIGUOUS"]
+        assert matrix.norms.tolist() == pytest.approx([1.0, 2.0])
+
+    def test_score_batch_matches_cosine_similarity(self):
+        rng = np.random.default_rng(7)
+        vectors = rng.normal(size=(50, 16)).astype(np.float32)
+        queries = rng.normal(size=(4, 16)).astype(np.float32)
+        matrix = EmbeddingMatrix([str(i) for i in range(50)], vectors)
+
+        scores = matrix.score_batch(queries)
+        expected = (queries @ vectors.T) / np.outer(
+            np.linalg.norm(queries, axis=1), np.linalg.norm(vectors, axis=1))
+
+        assert scores.shape == (4, 50)
+        assert np.allclose(scores, expected, atol=1e-5)
+        assert np.allclose(matrix.score(queries[0]), expected[0], atol=1e-5)
+
+    def test_cluster_groups_similar_rows_across_blocks(self):
+        vectors = np.array([
+            [1.0, 0.0], [0.0, 1.0], [0.99, 0.05], [0.0, 0.0], [0.02, 1.0], [1.0, 0.01]
+        ], dtype=np.float32)
+        matrix = EmbeddingMatrix([str(i) for i in range(len(vectors))], vectors)
+
+        assert matrix.cluster(threshold=0.8, block_size=2) == [[0, 2, 5], [1, 4]]
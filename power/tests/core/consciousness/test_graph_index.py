@@ -0,0 +1,202 @@
+"""
+Test Knowledge Graph Index
+
+Tests for the in-memory adjacency index, path search, clustering and
+relationship queries used by the knowledge graph tool.
+"""
+
+import time
+
+import pytest
+
+from core.consciousness.brain_database import PowerBrain
+from core.consciousness.graph_index import KnowledgeGraphIndex
+from core.consciousness.tools.knowledge_graph_tool import KnowledgeGraphTool
+
+
+def _diamond():
+    # a -> b -> d is short but weak; a -> c -> e -> d is long but strong
+    return KnowledgeGraphIndex.from_edges([
+        ("a", "b", "related_to", 0.2),
+        ("b", "d", "related_to", 0.2),
+        ("a", "c", "is_a", 0.9),
+        ("c", "e", "part_of", 0.9),
+        ("e", "d", "used_for", 0.9),
+    ])
+
+
+class TestKnowledgeGraphIndex:
+    """Test cases for KnowledgeGraphIndex."""
+
+    def test_neighbors_are_undirected_and_sorted(self):
+        index = _diamond()
+        assert index.neighbors("c") == [("a", "is_a", pytest.approx(0.9)),
+                                        ("e", "part_of", pytest.approx(0.9))]
+        assert [name for name, _, _ in index.neighbors("d")] == ["e", "b"]
+        assert index.neighbors("missing") == []
+
+    def test_duplicate_edges_collapse_to_highest_confidence(self):
+        index = KnowledgeGraphIndex.from_edges([
+            ("a", "b", "related_to", 0.3),
+            ("b", "a", "related_to", 0.7),
+        ])
+        assert index.edge_count == 1
+        assert index.neighbors("a") == [("b", "related_to", pytest.approx(0.7))]
+
+    def test_shortest_path_uses_fewest_hops(self):
+        nodes, relationships, confidence = _diamond().shortest_path("a", "d")
+        assert nodes == ["a", "b", "d"]
+        assert relationships == ["related_to", "related_to"]
+        assert confidence == pytest.approx(0.04)
+
+    def test_shortest_path_prefers_confident_among_equal_length(self):
+        index = KnowledgeGraphIndex.from_edges([
+            ("a", "x", "r", 0.1), ("x", "z", "r", 0.1),
+            ("a", "y", "r", 0.9), ("y", "z", "r", 0.9),
+        ])
+        nodes, _, confidence = index.shortest_path("a", "z")
+        assert nodes == ["a", "y", "z"]
+        assert confidence == pytest.approx(0.81)
+
+    def test_most_confident_path_maximises_product(self):
+        nodes, relationships, confidence = _diamond().most_confident_path("a", "d")
+        assert nodes == ["a", "c", "e", "d"]
+        assert relationships == ["is_a", "part_of", "used_for"]
+        assert confidence == pytest.approx(0.729)
+
+    def test_max_length_limits_search(self):
+        index = KnowledgeGraphIndex.from_edges(
+            [(f"n{i}", f"n{i + 1}", "next", 1.0) for i in range(6)]
+        )
+        assert index.shortest_path("n0", "n6", max_length=5) is None
+        assert len(index.shortest_path("n0", "n6", max_length=6)[0]) == 7
+        assert index.most_confident_path("n0", "n6", max_length=5) is None
+
+    def test_no_path_between_components(self):
+        index = KnowledgeGraphIndex.from_edges([("a", "b", "r", 1.0), ("c", "d", "r", 1.0)])
+        assert index.shortest_path("a", "d") is None
+        assert index.most_confident_path("a", "d") is None
+        assert index.shortest_path("a", "a") is None
+
+    def test_large_graph_multi_hop_is_fast(self):
+        # 20k nodes in a ring with chords; far-apart nodes need several hops
+        size = 20000
+        edges = [(f"c{i}", f"c{(i + 1) % size}", "next", 0.9) for i in range(size)]
+        edges += [(f"c{i}", f"c{(i * 7919) % size}", "jump", 0.5) for i in range(0, size, 3)]
+        index = KnowledgeGraphIndex.from_edges(edges)
+
+        started = time.perf_counter()
+        for target in range(100, 1100, 100):
+            index.shortest_path("c0", f"c{target}", max_length=6)
+        assert (time.perf_counter() - started) / 10 < 0.05
+
+
+class TestKnowledgeGraphTool:
+    """Test cases for KnowledgeGraphTool path search over the index."""
+
+    @pytest.mark.asyncio
+    async def test_find_connection_path_tracks_new_edges(self):
+        brain = PowerBrain(":memory:")
+        brain.add_knowledge_edge("python", "programming", "is_a", confidence=0.9)
+        tool = KnowledgeGraphTool(brain)
+
+        assert await tool.find_connection_path("python", "software") is None
+
+        # Edges written after the index loads, by the tool or directly, are picked up
+        await tool.add_knowledge_relationship("programming", "code", "produces", confidence=0.8)
+        brain.add_knowledge_edges_bulk([("code", "software", "part_of", 0.7, "")])
+
+        path = await tool.find_connection_path("python", "software")
+        assert path.path_nodes == ["python", "programming", "code", "software"]
+        assert path.relationship_chain == ["is_a", "produces", "part_of"]
+        assert path.path_length == 3
+        assert path.total_confidence == pytest.approx(0.9 * 0.8 * 0.7)
+
+        confident = await tool.find_connection_path("python", "software", strategy="confident")
+        assert confident.path_nodes == path.path_nodes
+        brain.close()
+
+
+class TestCommunities:
+    """Test cases for incremental label propagation."""
+
+    def test_separates_dense_groups(self):
+        edges = [(a, b, "r", 0.9) for a, b in [("a1", "a2"), ("a2", "a3"), ("a1", "a3")]]
+        edges += [(a, b, "r", 0.9) for a, b in [("b1", "b2"), ("b2", "b3"), ("b1", "b3")]]
+        edges.append(("a3", "b1", "r", 0.1))
+        index = KnowledgeGraphIndex.from_edges(edges)
+
+        groups = [sorted(group) for group in index.communities(min_size=2)]
+        assert sorted(groups) == [["a1", "a2", "a3"], ["b1", "b2", "b3"]]
+
+    def test_new_edges_update_communities(self):
+        index = KnowledgeGraphIndex.from_edges([("a", "b", "r", 1.0), ("c", "d", "r", 1.0)])
+        assert len(index.communities(min_size=2)) == 2
+        version = index.version
+
+        index.add_edges([("b", "c", "r", 1.0), ("a", "c", "r", 1.0), ("b", "d", "r", 1.0)])
+        assert index.version > version
+        assert [sorted(group) for group in index.communities(min_size=2)] == [["a", "b", "c", "d"]]
+
+
+class TestKnowledgeGraphToolQueries:
+    """Test cases for clustering and relationship queries on real data."""
+
+    @pytest.mark.asyncio
+    async def test_concept_clusters_are_cached_until_edges_change(self):
+        brain = PowerBrain(":memory:")
+        brain.add_knowledge_edges_bulk([
+            ("python", "coding", "related_to", 0.9, ""),
+            ("coding", "programming", "related_to", 0.8, ""),
+            ("python", "programming", "is_a", 0.9, ""),
+        ])
+        tool = KnowledgeGraphTool(brain)
+
+        clusters = await tool.get_concept_clusters(min_cluster_size=3)
+        assert len(clusters) == 1
+        assert clusters[0]["central_concept"] == "python"
+        assert clusters[0]["internal_connections"] == 3
+        assert clusters[0]["average_confidence"] == pytest.approx(2.6 / 3)
+        assert await tool.get_concept_clusters(min_cluster_size=3) is clusters
+
+        brain.add_knowledge_edge("llm", "ai", "is_a", confidence=0.9)
+        brain.add_knowledge_edge("ai", "neural_network", "uses", confidence=0.9)
+        brain.add_knowledge_edge("llm", "neural_network", "uses", confidence=0.9)
+        refreshed = await tool.get_concept_clusters(min_cluster_size=3)
+        assert refreshed is not clusters
+        assert len(refreshed) == 2
+        brain.close()
+
+    @pytest.mark.asyncio
+    async def test_query_relationships_reads_table(self):
+        brain = PowerBrain(":memory:")
+        brain.add_knowledge_edges_bulk([
+            ("python", "programming_language", "is_a", 0.95, "docs"),
+            ("pytest", "testing_framework", "is_a", 0.6, ""),
+            ("claude", "ai_model", "is_a", 0.3, ""),
+            ("python", "scripting", "used_for", 0.9, ""),
+        ])
+        tool = KnowledgeGraphTool(brain)
+
+        results = await tool.query_relationships("is_a", confidence_threshold=0.5)
+        assert [(r["source"], r["target"]) for r in results] == [
+            ("python", "programming_language"), ("pytest", "testing_framework")
+        ]
+        assert results[0]["evidence"] == "docs"
+
+        # Repeated observations come back once, with the best row, and the limit is applied in SQL
+        brain.add_knowledge_edge("pytest", "testing_framework", "is_a", confidence=0.8,
+                                 evidence="changelog")
+        results = await tool.query_relationships("is_a", confidence_threshold=0.5, limit=2)
+        assert [(r["target"], r["confidence"], r["evidence"]) for r in results] == [
+            ("programming_language", 0.95, "docs"), ("testing_framework", 0.8, "changelog")
+        ]
+        assert len(brain.get_relationships_by_type("is_a", min_confidence=0.5, limit=1)) == 1
+
+        plan = brain.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT source_node FROM knowledge_graph "
+            "WHERE relationship_type = ? AND confidence >= ? ORDER BY confidence DESC",
+            ("is_a", 0.5)
+        ).fetchall()
+        assert "idx_graph_type_confidence" in " ".join(str(row) for row in plan)
+        brain.close()
@@ -0,0 +1,136 @@
+"""
+Test Memory Manager
+
+Tests for memory storage, embedding caching and semantic recall.
+"""
+
+from typing import List
+
+import numpy as np
+import pytest
+
+from core.consciousness.brain_database import PowerBrain
+from core.consciousness.memory_manager import MemoryManager, MemoryContext
+from shared.utils.hashing_embedder import HashingEmbeddingProvider
+
+
+class CountingEmbeddingProvider(HashingEmbeddingProvider):
+    """Hashing provider that records every batch it embeds."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches: List[List[str]] = []
+
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
+        self.batches.append(list(texts))
+        return super().embed_texts(texts)
+
+
+@pytest.fixture
+def brain_path(tmp_path):
+    return str(tmp_path / "power_brain.db")
+
+
+@pytest.fixture
+def context():
+    return MemoryContext(user_id="test", session_id="session", task_id=None,
+                         agent_id=None, conversation_context={})
+
+
+class TestMemoryManager:
+    """Test cases for MemoryManager."""
+
+    def test_store_and_search_memories(self, brain_path, context):
+        with PowerBrain(brain_path) as brain:
+            manager = MemoryManager(brain)
+            memory_id = manager.store_memory("vector index for semantic recall", "fact", context)
+            manager.store_memory("weekly grocery list", "fact", context)
+
+            results = manager.search_memories("semantic recall vector index",
+                                              similarity_threshold=0.3)
+
+            assert [r.memory_record.memory_id for r in results] == [memory_id]
+            assert results[0].relevance_rank == 1
+            assert manager.search_memories("semantic recall vector index",
+                                           memory_type="skill") == []
+
+    def test_embeddings_are_batched_and_cached_across_restarts(self, brain_path):
+        provider = CountingEmbeddingProvider()
+        with PowerBrain(brain_path) as brain:
+            manager = MemoryManager(brain, embedding_provider=provider)
+            manager.search_memories_batch(["first query", "second query", "first query"])
+
+        assert provider.batches == [["first query", "second query"]]
+
+        restarted = CountingEmbeddingProvider()
+        with PowerBrain(brain_path) as brain:
+            manager = MemoryManager(brain, embedding_provider=restarted)
+            manager.search_memories("second query")
+
+        assert restarted.batches == []
+
+    def test_vector_index_persists_next_to_brain(self, brain_path, context):
+        with PowerBrain(brain_path) as brain:
+            manager = MemoryManager(brain)
+            memory_id = manager.store_memory("persistent recall marker", "fact", context)
+            manager.save_index()
+
+        with PowerBrain(brain_path) as brain:
+            manager = MemoryManager(brain)
+            assert manager.index_path == f"{brain_path}.vindex.npz"
+            assert memory_id in manager.vector_index
+
+    def test_associative_memories_use_concept_index(self, brain_path, context):
+        with PowerBrain(brain_path) as brain:
+            manager = MemoryManager(brain)
+            seed_id = manager.store_memory("python asyncio scheduling", "fact", context)
+            related_id = manager.store_memory("asyncio event loops", "fact", context)
+            manager.store_memory("gardening tomatoes outdoors", "fact", context)
+
+            assert brain.get_memory(seed_id).content == "python asyncio scheduling"
+            assert brain.get_memory("missing") is None
+            assert set(brain.get_memory_concepts(seed_id)) == {"python", "asyncio", "scheduling"}
+
+            associations = manager.get_associative_memories(seed_id)
+            assert [m.memory_id for m in associations] == [related_id]
+            assert manager.get_associative_memories("missing") == []
+
+    def test_memories_are_reembedded_when_the_provider_changes(self, brain_path, context):
+        with PowerBrain(brain_path) as brain:
+            manager = MemoryManager(brain, embedding_provider=HashingEmbeddingProvider(dimension=64))
+            memory_id = manager.store_memory("vector index for semantic recall", "fact", context)
+            manager.save_index()
+            assert brain.get_memory(memory_id).embedding_model == "hashing-bow-64-bigram"
+
+        provider = CountingEmbeddingProvider()
+        with PowerBrain(brain_path) as brain:
+            manager = MemoryManager(brain, embedding_provider=provider)
+
+            assert provider.batches == [["vector index for semantic recall"]]
+            assert brain.get_memory(memory_id).embedding_model == provider.model_name
+            results = manager.search_memories("semantic recall vector index",
+                                              similarity_threshold=0.3)
+            assert [r.memory_record.memory_id for r in results] == [memory_id]
+
+        with PowerBrain(brain_path) as brain:
+            MemoryManager(brain, embedding_provider=CountingEmbeddingProvider())
+            assert brain.get_memories_with_stale_embeddings(provider.model_name) == []
+
+    def test_memories_without_a_recorded_model_are_reembedded(self, brain_path):
+        with PowerBrain(brain_path) as brain:
+            brain.connection.execute("ALTER TABLE knowledge_store DROP COLUMN embedding_model")
+            brain.connection.execute(
+                "INSERT INTO knowledge_store (memory_id, content, embedding_vector, "
+                "memory_type, source_type) VALUES ('legacy', 'legacy placeholder memory', ?, "
+                "'fact', 'system')",
+                (np.ones(128, dtype=np.float32).tobytes(),)
+            )
+            brain.connection.commit()
+
+        with PowerBrain(brain_path) as brain:
+            manager = MemoryManager(brain)
+            record = brain.get_memory("legacy")
+
+            assert record.embedding_model == manager.embedding_provider.model_name
+            assert record.embedding_vector == manager._generate_embedding(  # pylint: disable=protected-access
+                "legacy placeholder memory")
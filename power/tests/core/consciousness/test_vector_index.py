@@ -0,0 +1,140 @@
+"""
+Test Vector Index
+
+Tests for the IVF approximate nearest-neighbour index used by memory recall.
+"""
+
+import numpy as np
+import pytest
+
+from core.consciousness.vector_index import VectorIndex
+
+
+@pytest.fixture
+def vectors():
+    """Random embeddings large enough to train the IVF partition."""
+    rng = np.random.default_rng(42)
+    return rng.normal(size=(600, 32)).astype(np.float32)
+
+
+def _exact_top_k(vectors, query, k):
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normalized @ (query / np.linalg.norm(query))
+    return [f"m{i}" for i in np.argsort(-scores)[:k]]
+
+
+class TestVectorIndex:
+    """Test cases for VectorIndex."""
+
+    def test_flat_search_is_exact_before_training(self, vectors):
+        index = VectorIndex(min_train_size=1000)
+        for i, vector in enumerate(vectors[:100]):
+            index.add(f"m{i}", vector, "fact")
+
+        assert not index.is_trained
+        hits = index.search(vectors[7], limit=5)
+        assert [memory_id for memory_id, _ in hits] == _exact_top_k(vectors[:100], vectors[7], 5)
+        assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+
+    def test_trained_index_finds_exact_match(self, vectors):
+        index = VectorIndex(min_train_size=256)
+        for i, vector in enumerate(vectors):
+            index.add(f"m{i}", vector, "fact")
+
+        assert index.is_trained
+        for i in (0, 123, 599):
+            hits = index.search(vectors[i], limit=1)
+            assert hits[0][0] == f"m{i}"
+
+    def test_memory_type_filter_and_threshold(self, vectors):
+        index = VectorIndex(min_train_size=256)
+        for i, vector in enumerate(vectors):
+            index.add(f"m{i}", vector, "skill" if i % 50 == 0 else "fact")
+
+        hits = index.search(vectors[1], limit=5, memory_type="skill")
+        assert len(hits) == 5
+        assert all(int(memory_id[1:]) % 50 == 0 for memory_id, _ in hits)
+        assert index.search(vectors[1], limit=5, memory_type="unknown") == []
+        assert all(score >= 0.9 for _, score in
+                   index.search(vectors[1], limit=5, similarity_threshold=0.9))
+
+    def test_threshold_does_not_widen_probe(self, vectors, monkeypatch):
+        index = VectorIndex(min_train_size=256)
+        for i, vector in enumerate(vectors):
+            index.add(f"m{i}", vector, "fact")
+        scored = []
+        original_score = index._score
+
+        def spy_score(rows, *args):
+            scored.append(len(rows))
+            return original_score(rows, *args)
+
+        monkeypatch.setattr(index, "_score", spy_score)
+        hits = index.search(vectors[1], limit=5, similarity_threshold=0.99)
+
+        query = vectors[1] / np.linalg.norm(vectors[1])
+        closest = np.argsort(-(index._centroids @ query))[:index.n_probe]
+        assert [memory_id for memory_id, _ in hits] == ["m1"]
+        assert scored == [sum(len(index._inverted_lists[cell]) for cell in closest)]
+
+    def test_type_filter_widening_scores_each_row_once(self, vectors, monkeypatch):
+        index = VectorIndex(min_train_size=256)
+        for i, vector in enumerate(vectors):
+            index.add(f"m{i}", vector, "skill" if i % 50 == 0 else "fact")
+        scored = []
+        original_score = index._score
+
+        def spy_score(rows, *args):
+            scored.append(rows)
+            return original_score(rows, *args)
+
+        monkeypatch.setattr(index, "_score", spy_score)
+        index.search(vectors[1], limit=12, memory_type="skill")
+
+        assert len(scored) == 1
+        assert len(np.unique(scored[0])) == len(scored[0]) == 12
+
+    def test_batch_keeps_under_filled_queries_batched(self, vectors, monkeypatch):
+        index = VectorIndex(min_train_size=256)
+        for i, vector in enumerate(vectors):
+            index.add(f"m{i}", vector, "skill" if i % 50 == 0 else "fact")
+        expected = [index.search(vectors[i], limit=5, memory_type="skill",
+                                 similarity_threshold=0.2) for i in (1, 2, 3)]
+
+        def no_search(*args, **kwargs):
+            raise AssertionError("search_batch must not fall back to search")
+
+        monkeypatch.setattr(index, "search", no_search)
+        batch = index.search_batch(vectors[[1, 2, 3]], limit=5, memory_type="skill",
+                                   similarity_threshold=0.2)
+
+        for hits, single in zip(batch, expected):
+            assert len(hits) >= len(single)
+            assert all(score >= 0.2 for _, score in hits)
+            if single:
+                assert hits[0][1] >= single[0][1] - 1e-5
+
+    def test_replace_existing_memory(self, vectors):
+        index = VectorIndex(min_train_size=256)
+        for i, vector in enumerate(vectors):
+            index.add(f"m{i}", vector, "fact")
+
+        index.add("m3", vectors[10], "fact")
+        assert len(index) == len(vectors)
+        assert {hit[0] for hit in index.search(vectors[10], limit=2)} == {"m3", "m10"}
+
+    def test_save_and_load_roundtrip(self, vectors, tmp_path):
+        index = VectorIndex(min_train_size=256)
+        for i, vector in enumerate(vectors):
+            index.add(f"m{i}", vector, "fact" if i % 2 else "skill")
+
+        path = str(tmp_path / "brain.db.vindex.npz")
+        index.save(path)
+        restored = VectorIndex.load(path)
+
+        assert len(restored) == len(index)
+        assert restored.is_trained
+        assert (restored.search(vectors[5], limit=3, memory_type="fact")
+                == index.search(vectors[5], limit=3, memory_type="fact"))
+        restored.add("new", vectors[5], "fact")
+        assert "new" in restored
@@ -0,0 +1,133 @@
+"""
+Test Complexity Classifier
+
+Tests for local mode classification and its online training.
+"""
+
+from core.reasoning.complexity_classifier import ComplexityClassifier
+from core.reasoning.mode_manager import ModeManager
+from shared.models.reasoning_models import ReasoningMode
+
+
+class TestComplexityClassifier:
+    """Test cases for the complexity classifier."""
+
+    def test_untrained_classifier_is_uncertain(self):
+        classifier = ComplexityClassifier()
+
+        mode, confidence, probabilities = classifier.predict({'bias': 1.0})
+
+        assert mode in ComplexityClassifier.MODES
+        assert confidence == 0.25
+        assert abs(sum(probabilities.values()) - 1.0) < 1e-9
+        assert not classifier.is_confident(confidence)
+
+    def test_learning_raises_confidence(self):
+        classifier = ComplexityClassifier()
+        features = {'bias': 1.0, 'rule:definition_request': 1.0}
+
+        for _ in range(50):
+            classifier.learn(features, ReasoningMode.RAPID)
+
+        mode, confidence, _ = classifier.predict(features)
+        assert mode == ReasoningMode.RAPID
+        assert classifier.is_confident(confidence)
+
+    def test_negative_weight_penalizes_mode(self):
+        classifier = ComplexityClassifier()
+        features = {'bias': 1.0}
+
+        classifier.learn(features, ReasoningMode.RAPID, weight=-1.0)
+
+        _, _, probabilities = classifier.predict(features)
+        assert probabilities[ReasoningMode.RAPID] < 0.25
+
+    def test_decision_log_is_bounded(self):
+        manager = ModeManager()
+        manager.classifier.max_decisions = 3
+
+        for i in range(5):
+            manager.classify("What is a graph?", f"request-{i}")
+
+        exported = manager.classifier.export_decisions()
+        assert [entry['request_id'] for entry in exported] == ['request-2', 'request-3', 'request-4']
+
+    def test_weights_survive_save_and_load(self, tmp_path):
+        classifier = ComplexityClassifier()
+        features = {'bias': 1.0, 'rule:definition_request': 1.0}
+        for _ in range(20):
+            classifier.learn(features, ReasoningMode.RAPID)
+        path = str(tmp_path / "classifier.json")
+
+        classifier.save_weights(path)
+        restored = ComplexityClassifier()
+        restored.load_weights(path)
+
+        assert restored.weights == classifier.weights
+        assert restored.updates == 20
+        assert restored.predict(features) == classifier.predict(features)
+
+
+class TestModeManagerClassification:
+    """Test cases for ModeManager.classify."""
+
+    def test_strong_rule_match_is_answered_locally(self):
+        manager = ModeManager()
+
+        decision = manager.classify("Walk me through this step by step", "r1")
+
+        assert decision.mode == ReasoningMode.CHAIN_OF_THOUGHT
+        assert not decision.escalated
+        assert 'step_by_step_request' in decision.matched_rules
+
+    def test_featureless_prompt_is_escalated(self):
+        manager = ModeManager()
+
+        decision = manager.classify("Simple question", "r1")
+
+        assert decision.escalated
+        assert decision.final_mode is None
+
+    def test_history_features(self):
+        manager = ModeManager()
+        history = {
+            'preferred_modes': {'rapid': 3, 'thoughtful': 1},
+            'complexity_preference': 0.2,
+            'speed_preference': 0.1
+        }
+
+        features = manager.extract_features("Hello", history)
+
+        assert features['history:mode:rapid'] == 0.75
+        assert features['history:complexity'] == 0.2
+
+    def test_record_performance_trains_on_logged_decision(self):
+        manager = ModeManager()
+        decision = manager.classify("Explain caching", "r1")
+
+        manager.record_performance("user", ReasoningMode.THOUGHTFUL, 1.0, request_id="r1")
+
+        assert decision.satisfaction == 1.0
+        assert manager.classifier.updates == 1
+        _, confidence, _ = manager.classifier.predict(decision.features)
+        assert confidence > decision.confidence
+
+    def test_learned_weights_survive_restart(self, tmp_path):
+        path = str(tmp_path / "classifier.json")
+        manager = ModeManager(classifier_path=path)
+        decision = manager.classify("Simple question", "r1")
+
+        manager.record_escalation("r1", ReasoningMode.THOUGHTFUL)
+
+        restarted = ModeManager(classifier_path=path)
+        assert restarted.classifier.updates == 1
+        assert restarted.classifier.weights == manager.classifier.weights
+        assert restarted.classifier.predict(decision.features) == manager.classifier.predict(decision.features)
+
+    def test_unreadable_weights_keep_rule_prior(self, tmp_path):
+        path = tmp_path / "classifier.json"
+        path.write_text("not json")
+
+        manager = ModeManager(classifier_path=str(path))
+
+        assert manager.classifier.weights == ModeManager().classifier.weights
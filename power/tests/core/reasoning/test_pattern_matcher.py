@@ -0,0 +1,139 @@
+"""
+Test Pattern Matcher
+
+Tests that the single-pass matcher agrees with per-pattern regex searches
+and its use by the step processor and mode manager.
+"""
+
+import re
+
+import pytest
+
+from core.reasoning.mode_manager import ModeManager, ModeRule
+from core.reasoning.pattern_matcher import PatternMatcher
+from core.reasoning.step_processor import StepProcessor
+from shared.models.reasoning_models import (
+    ReasoningMode,
+    ReasoningStep,
+    StepType,
+    ConfidenceLevel,
+    ThinkingChain
+)
+
+SAMPLE_TEXTS = [
+    "We analyze the data and conclude the final answer is 3.14 or 2024.5? Maybe!",
+    "Therefore, combining pros and cons, the decision: definitely better. Without  doubt a fact?",
+    "In summary, taking everything into account, we must assess; this means certainty?? 4.5.6",
+    "Let's break down the problem, look at it. I believe it could be reasonable, I\tthink.",
+    "Look. At this: i think, analyzing analyses (12_3 and 7abc) step-by-step, what is 2+2?",
+    "",
+]
+
+
+def _findall_counts(categories, text):
+    return {
+        category: sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in patterns)
+        for category, patterns in categories.items()
+    }
+
+
+class TestPatternMatcher:
+    """Test cases for the pattern matcher."""
+
+    @pytest.mark.parametrize("text", SAMPLE_TEXTS)
+    def test_step_pattern_counts_match_findall(self, text):
+        processor = StepProcessor()
+        categories = {**processor.step_patterns, **processor.confidence_indicators}
+
+        result = processor.matcher.scan(text)
+
+        assert result.counts == _findall_counts(categories, text)
+
+    @pytest.mark.parametrize("text", SAMPLE_TEXTS)
+    def test_mode_rule_counts_match_findall(self, text):
+        manager = ModeManager()
+
+        result = manager.scan_prompt(text)
+
+        assert result.counts == _findall_counts(manager.matcher.categories, text)
+
+    @pytest.mark.parametrize("text", SAMPLE_TEXTS)
+    def test_text_statistics_match_findall(self, text):
+        result = PatternMatcher({}).scan(text)
+
+        assert result.words == re.findall(r'\b\w+\b', text.lower())
+        assert result.numbers == re.findall(r'\b\d+(?:\.\d+)?\b', text)
+        assert result.sentences == len(re.findall(r'[.!?]+', text))
+        assert result.questions == len(re.findall(r'[^.!?]*\?', text))
+
+    def test_multi_word_matches_do_not_overlap(self):
+        matcher = PatternMatcher({'phrase': [r'\b(a\s+a)\b'], 'prefix': [r'\b(ab)\w*\b']})
+
+        result = matcher.scan("a a a a a abc ab")
+
+        assert result.count('phrase') == 2
+        assert result.count('prefix') == 2
+
+    def test_unsupported_patterns_fall_back_to_regex(self):
+        matcher = PatternMatcher({'calc': [r'\b\d+\s*[\+\-]\s*\d+\b']})
+
+        assert matcher.scan("1 + 2 and 3-4").count('calc') == 2
+        assert not matcher.scan("no maths").matched('calc')
+
+    def test_scan_many_preserves_order(self):
+        matcher = PatternMatcher({'maybe': [r'\b(maybe)\b']})
+
+        results = matcher.scan_many(["maybe", "no", "maybe maybe"])
+
+        assert [result.count('maybe') for result in results] == [1, 0, 2]
+
+
+class TestPatternMatcherIntegration:
+    """Test cases for the matcher inside StepProcessor and ModeManager."""
+
+    def test_process_step_metadata(self):
+        processor = StepProcessor()
+        step = ReasoningStep(
+            step_number=1,
+            description="Reasoning",
+            content="Therefore we conclude the total is 42. Is it 3.5? Certainly definite.",
+            step_type=StepType.ANALYSIS,
+            confidence=ConfidenceLevel.MEDIUM
+        )
+
+        processor.process_step(step)
+
+        assert step.step_type == StepType.INFERENCE
+        assert step.confidence == ConfidenceLevel.HIGH
+        assert step.metadata['numbers'] == ['42', '3.5']
+        assert step.metadata['questions'] == 1
+        assert step.metadata['sentence_count'] == 4
+        assert 'therefore' in step.metadata['keywords']
+
+    def test_scan_chain_returns_one_result_per_step(self):
+        processor = StepProcessor()
+        chain = ThinkingChain(steps=[
+            ReasoningStep(step_number=1, description="a", content="We analyze the data"),
+            ReasoningStep(step_number=2, description="b", content="In conclusion, the answer")
+        ])
+
+        scans = processor.scan_chain(chain)
+
+        assert scans[0].matched(StepType.ANALYSIS)
+        assert scans[1].count(StepType.CONCLUSION) == 2
+
+    def test_custom_rule_is_scanned(self):
+        manager = ModeManager()
+        manager.add_custom_rule(ModeRule(
+            name="brainstorm",
+            pattern=r"\b(brainstorm)\w*\b",
+            mode=ReasoningMode.CHAIN_OF_THOUGHT,
+            weight=2.0,
+            description="Brainstorming"
+        ))
+
+        assert manager.extract_features("Brainstorming ideas")['rule:brainstorm'] == 1.0
+        assert manager.determine_optimal_mode("Brainstorming ideas") == ReasoningMode.CHAIN_OF_THOUGHT
+
+        manager.remove_rule("brainstorm")
+        assert 'rule:brainstorm' not in manager.extract_features("Brainstorming ideas")
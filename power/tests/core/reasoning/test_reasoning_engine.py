@@ -6,7 +6,7 @@ Comprehensive tests for the core reasoning engine functionality.
 
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, Mock
 from typing import List
 
 from core.reasoning.reasoning_engine import ReasoningEngine
@@ -337,4 +337,95 @@ class TestReasoningEngine:
         
         assert response.success
         if response.thinking_chain:
-            assert len(response.thinking_chain.steps) <= 2
\ No newline at end of file
+            assert len(response.thinking_chain.steps) <= 2
+    
+    @pytest.mark.asyncio
+    async def test_adaptive_speculation_hit_reuses_predicted_mode(self, reasoning_engine):
+        """Test a correct local prediction runs only the predicted mode."""
+        reasoning_engine.provider.thoughtful_response = AsyncMock(
+            wraps=reasoning_engine.provider.thoughtful_response
+        )
+        
+        request = ReasoningRequest(prompt="Explain caching", mode=ReasoningMode.ADAPTIVE)
+        response = await reasoning_engine.process_request(request)
+        
+        assert response.success
+        assert response.mode_used == ReasoningMode.THOUGHTFUL
+        assert reasoning_engine.provider.thoughtful_response.await_count == 1
+        
+        metrics = reasoning_engine.get_metrics()
+        assert metrics.speculation_hits == 1
+        assert metrics.speculation_misses == 0
+        assert 'complexity_analysis' in metrics.step_timings
+        assert metrics.step_timings['mode:thoughtful']['count'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_adaptive_speculation_miss_runs_recommended_mode(self, reasoning_engine):
+        """Test a wrong local prediction is replaced by the recommended mode."""
+        request = ReasoningRequest(prompt="What is the capital of France?", mode=ReasoningMode.ADAPTIVE)
+        response = await reasoning_engine.process_request(request)
+        
+        assert response.success
+        assert response.mode_used == ReasoningMode.THOUGHTFUL
+        assert reasoning_engine.get_metrics().speculation_misses == 1
+    
+    @pytest.mark.asyncio
+    async def test_uncertain_classification_speculates_with_rule_based_mode(self, reasoning_engine):
+        """Test an escalated decision speculates with determine_optimal_mode, not the classifier."""
+        mode_manager = reasoning_engine.mode_manager
+        mode_manager.determine_optimal_mode = Mock(return_value=ReasoningMode.THOUGHTFUL)
+        
+        request = ReasoningRequest(prompt="Simple question", mode=ReasoningMode.ADAPTIVE)
+        response = await reasoning_engine.process_request(request)
+        
+        decision = mode_manager.classifier.get_decision(str(request.id))
+        assert decision.escalated
+        assert decision.mode != ReasoningMode.THOUGHTFUL
+        mode_manager.determine_optimal_mode.assert_called_once_with("Simple question", request.context)
+        assert response.mode_used == ReasoningMode.THOUGHTFUL
+        assert reasoning_engine.get_metrics().speculation_hits == 1
+    
+    @pytest.mark.asyncio
+    async def test_provider_step_timings(self, reasoning_engine):
+        """Test each provider step is timed."""
+        request = ReasoningRequest(
+            prompt="Think through this problem",
+            mode=ReasoningMode.CHAIN_OF_THOUGHT,
+            max_steps=3
+        )
+        
+        response = await reasoning_engine.process_request(request)
+        
+        assert all('duration_seconds' in step.metadata for step in response.thinking_chain.steps)
+        timings = reasoning_engine.get_metrics().to_dict()['step_timings']
+        assert timings['provider_step']['count'] == 3
+        assert timings['mode:chain_of_thought']['count'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_confident_local_classification_skips_llm_analysis(self, reasoning_engine):
+        """Test a confident local decision does not call the provider's analysis."""
+        reasoning_engine.provider.analyze_complexity = AsyncMock()
+        
+        request = ReasoningRequest(
+            prompt="Walk me through this step by step",
+            mode=ReasoningMode.ADAPTIVE,
+            max_steps=3
+        )
+        response = await reasoning_engine.process_request(request)
+        
+        assert response.success
+        assert response.mode_used == ReasoningMode.CHAIN_OF_THOUGHT
+        reasoning_engine.provider.analyze_complexity.assert_not_awaited()
+        assert request.metadata['complexity_analysis']['metadata']['source'] == 'local_classifier'
+    
+    @pytest.mark.asyncio
+    async def test_escalated_analysis_trains_classifier(self, reasoning_engine):
+        """Test the provider's recommendation is recorded as a training label."""
+        request = ReasoningRequest(prompt="Simple question", mode=ReasoningMode.ADAPTIVE)
+        
+        await reasoning_engine.process_request(request)
+        
+        decision = reasoning_engine.mode_manager.classifier.get_decision(str(request.id))
+        assert decision.escalated
+        assert decision.final_mode == ReasoningMode.THOUGHTFUL
+        assert reasoning_engine.mode_manager.classifier.updates == 1
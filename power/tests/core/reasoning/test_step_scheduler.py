@@ -0,0 +1,96 @@
+"""
+Test Step Scheduler
+
+Tests for dependency-graph scheduling of reasoning steps.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core.reasoning.step_scheduler import StepScheduler
+
+
+def _sleeper(value, delay=0.05, log=None):
+    """Step function that sleeps, then returns a value."""
+    async def run(_results):
+        if log is not None:
+            log.append(f"start:{value}")
+        await asyncio.sleep(delay)
+        return value
+    return run
+
+
+class TestStepScheduler:
+    """Test cases for the step scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        timings = {}
+        scheduler = StepScheduler(on_step_timing=timings.__setitem__)
+        for name in ('a', 'b', 'c'):
+            scheduler.add(name, _sleeper(name, delay=0.1))
+
+        start = time.perf_counter()
+        results = await scheduler.run()
+        elapsed = time.perf_counter() - start
+
+        assert results == {'a': 'a', 'b': 'b', 'c': 'c'}
+        assert elapsed < 0.25
+        assert set(timings) == {'a', 'b', 'c'}
+        assert all(duration >= 0.09 for duration in scheduler.timings.values())
+
+    @pytest.mark.asyncio
+    async def test_dependent_step_receives_results(self):
+        scheduler = StepScheduler()
+        scheduler.add('left', _sleeper(2))
+        scheduler.add('right', _sleeper(3))
+
+        async def combine(results):
+            return results['left'] * results['right']
+
+        scheduler.add('product', combine, depends_on=('left', 'right'))
+
+        assert (await scheduler.run())['product'] == 6
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_step_and_dependents(self):
+        log = []
+        scheduler = StepScheduler()
+        scheduler.add('fast', _sleeper('fast', delay=0.01))
+        scheduler.add('speculative', _sleeper('speculative', delay=1.0))
+
+        async def follow_up(results):
+            log.append('follow_up')
+            return results['speculative']
+
+        scheduler.add('follow_up', follow_up, depends_on=('speculative',))
+
+        assert await scheduler.result('fast') == 'fast'
+        scheduler.cancel('speculative')
+        await asyncio.sleep(0)
+
+        with pytest.raises(asyncio.CancelledError):
+            await scheduler.result('follow_up')
+        assert 'follow_up' not in log
+        assert 'speculative' not in scheduler.timings
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining_steps(self):
+        scheduler = StepScheduler()
+
+        async def fail(_results):
+            raise ValueError("step failed")
+
+        scheduler.add('slow', _sleeper('slow', delay=1.0))
+        scheduler.add('fail', fail)
+
+        with pytest.raises(ValueError, match="step failed"):
+            await scheduler.run()
+
+    def test_unknown_dependency_rejected(self):
+        scheduler = StepScheduler()
+
+        with pytest.raises(ValueError, match="unknown steps"):
+            scheduler.add('orphan', _sleeper('orphan'), depends_on=('missing',))
@@ -1 +0,0 @@
-"""Tests for shared layer components."""
\ No newline at end of file
@@ -1 +0,0 @@
-"""Tests for shared utilities."""
\ No newline at end of file
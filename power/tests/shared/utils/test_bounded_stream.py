@@ -0,0 +1,102 @@
+"""
+Tests for bounded async stream buffering.
+"""
+
+import asyncio
+
+import pytest
+
+from shared.utils.bounded_stream import bounded_stream
+
+
+class FakeStream:
+    """Async SDK-style stream that records reads and close."""
+
+    def __init__(self, items, fail_after=None):
+        self.items = list(items)
+        self.fail_after = fail_after
+        self.read = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.fail_after is not None and self.read >= self.fail_after:
+            raise ValueError("upstream failed")
+        if self.read >= len(self.items):
+            raise StopAsyncIteration
+        await asyncio.sleep(0)
+        item = self.items[self.read]
+        self.read += 1
+        return item
+
+    async def close(self):
+        self.closed = True
+
+
+class TestBoundedStream:
+    """Test cases for bounded_stream."""
+
+    def test_yields_all_items_in_order_and_closes(self):
+        source = FakeStream(range(10))
+
+        async def run():
+            return [item async for item in bounded_stream(source, maxsize=2)]
+
+        assert asyncio.run(run()) == list(range(10))
+        assert source.closed
+
+    def test_slow_consumer_bounds_read_ahead(self):
+        source = FakeStream(range(100))
+
+        async def run():
+            stream = bounded_stream(source, maxsize=3)
+            first = await stream.__anext__()
+            await asyncio.sleep(0.05)
+            read_ahead = source.read
+            await stream.aclose()
+            return first, read_ahead
+
+        first, read_ahead = asyncio.run(run())
+
+        assert first == 0
+        # One item handed out, three queued, one held by the blocked reader
+        assert read_ahead <= 5
+        assert source.closed
+
+    def test_cancelled_consumer_closes_source(self):
+        source = FakeStream(range(1000))
+        received = []
+
+        async def consume():
+            async for item in bounded_stream(source, maxsize=2):
+                received.append(item)
+                await asyncio.sleep(1)
+
+        async def run():
+            task = asyncio.create_task(consume())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        assert received == [0]
+        assert source.closed
+        assert source.read < 10
+
+    def test_source_error_raised_after_earlier_items(self):
+        source = FakeStream(range(10), fail_after=3)
+        received = []
+
+        async def run():
+            async for item in bounded_stream(source, maxsize=8):
+                received.append(item)
+
+        with pytest.raises(ValueError, match="upstream failed"):
+            asyncio.run(run())
+
+        assert received == [0, 1, 2]
+        assert source.closed
@@ -0,0 +1,92 @@
+"""
+Test Response Cache
+
+Tests for LRU eviction, timing-wheel expiry, the memory budget and
+hit/miss accounting in ResponseCache.
+"""
+
+import time
+
+from shared.utils.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache."""
+
+    def test_lru_eviction_keeps_recently_used(self):
+        cache = ResponseCache(max_size=3)
+        for key in ("a", "b", "c"):
+            cache.set(key, key.upper())
+
+        assert cache.get("a") == "A"
+        cache.set("d", "D")
+
+        assert cache.get("b") is None
+        assert [cache.get(key) for key in ("a", "c", "d")] == ["A", "C", "D"]
+        assert cache.get_stats().evictions == 1
+
+    def test_overwrite_does_not_evict(self):
+        cache = ResponseCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+
+        assert cache.size() == 2
+        assert cache.get("a") == 3
+        assert cache.get_stats().evictions == 0
+
+    def test_expired_entries_are_missed_and_swept(self):
+        cache = ResponseCache(ttl_seconds=60, wheel_resolution=0.05)
+        cache.set("short", "value", ttl_seconds=0.1)
+        cache.set("long", "value")
+        time.sleep(0.3)
+
+        # Any operation advances the wheel past the elapsed slots
+        cache.set("other", "value")
+        assert cache.size() == 2
+        assert cache.get("short") is None
+        assert cache.get("long") == "value"
+        assert cache.get_stats().expirations == 1
+
+    def test_memory_budget_evicts_by_bytes(self):
+        cache = ResponseCache(max_size=100, max_memory_bytes=250, size_of=len)
+        for key in ("a", "b", "c"):
+            cache.set(key, "x" * 100)
+
+        assert cache.size() == 2
+        assert cache.memory_usage() == 200
+        assert cache.get("a") is None
+
+        cache.delete("b")
+        assert cache.memory_usage() == 100
+
+    def test_hit_and_miss_rates(self):
+        cache = ResponseCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses) == (3, 1)
+        assert stats.hit_rate == 0.75
+        assert stats.miss_rate == 0.25
+        assert cache.stats()["hit_rate"] == 0.75
+
+    def test_default_ttl_alias(self):
+        cache = ResponseCache(max_size=10, default_ttl_seconds=5)
+        assert cache.ttl_seconds == 5
+        assert cache.get_stats().current_size == 0
+
+    def test_full_cache_set_is_constant_time(self):
+        cache = ResponseCache(max_size=50000)
+        for i in range(50000):
+            cache.set(f"key_{i}", i)
+
+        started = time.perf_counter()
+        for i in range(50000, 60000):
+            cache.set(f"key_{i}", i)
+        # The old min()-scan eviction took seconds for this many inserts
+        assert time.perf_counter() - started < 1.0
+        assert cache.size() == 50000
@@ -0,0 +1,107 @@
+"""
+Tests for ConversationWindow.
+"""
+
+import pytest
+
+from shared.utils.conversation_window import SUMMARY_PREFIX, ConversationWindow
+
+
+def _turn(i, words=10):
+    role = 'user' if i % 2 == 0 else 'assistant'
+    return {'role': role, 'content': f"turn{i} " + " ".join(f"w{i}_{j}" for j in range(words - 1))}
+
+
+@pytest.fixture
+def make_window(word_token_counter):
+    def make(max_tokens, **kwargs):
+        return ConversationWindow(word_token_counter, max_tokens, **kwargs)
+    return make
+
+
+class TestConversationWindow:
+    """Test cases for ConversationWindow."""
+
+    def test_keeps_system_pinned_and_recent_turns(self, make_window):
+        window = make_window(60)
+        system = {'role': 'system', 'content': 'be brief'}
+        window.append(system)
+        for i in range(20):
+            window.append(_turn(i))
+
+        messages = window.messages
+        assert messages[0] is system
+        assert messages[-1] == _turn(19)
+        assert window.total_tokens <= 60
+        assert window.total_tokens == window.counter.count_messages(messages)
+        assert window.dropped_messages == 20 - (len(messages) - 1)
+
+    def test_each_message_is_counted_once(self, make_window):
+        window = make_window(100)
+        for i in range(200):
+            window.append(_turn(i))
+
+        # One encode per distinct content plus the two role strings
+        assert window.counter._encoder.calls == 202  # pylint: disable=protected-access
+
+    def test_newest_turn_is_kept_even_if_oversized(self, make_window):
+        window = make_window(10)
+        window.append(_turn(0, words=50))
+
+        assert window.messages == [_turn(0, words=50)]
+
+    def test_dropped_turns_are_summarized(self, make_window):
+        calls = []
+
+        def summarizer(previous, dropped):
+            calls.append((previous, [m['content'].split()[0] for m in dropped]))
+            return f"summary{len(calls)}"
+
+        window = make_window(80, summarizer=summarizer)
+        for i in range(12):
+            window.append(_turn(i))
+
+        summary = window.messages[0]
+        assert summary['role'] == 'system'
+        assert summary['content'] == SUMMARY_PREFIX + f"summary{len(calls)}"
+        assert calls[0][0] is None
+        assert calls[0][1][0] == "turn0"
+        # Headroom batches drops, so the summarizer runs far less than once per turn
+        assert len(calls) < window.dropped_messages
+        assert window.total_tokens <= 80
+
+    def test_packed_with_leaves_window_unchanged(self, make_window):
+        window = make_window(80)
+        window.append({'role': 'system', 'content': 'rules'})
+        for i in range(5):
+            window.append(_turn(i))
+        before = window.messages
+
+        packed = window.packed_with(_turn(5))
+
+        assert window.messages == before
+        window.append(_turn(5))
+        assert packed == window.messages
+
+    def test_failed_summary_keeps_previous_summary(self, make_window):
+        results = iter(["first summary", None])
+        calls = []
+
+        def summarizer(previous, dropped):
+            calls.append(len(dropped))
+            return next(results, "retried summary")
+
+        window = make_window(80, summarizer=summarizer)
+        turn = 0
+        while len(calls) < 2:
+            window.append(_turn(turn))
+            turn += 1
+        assert window.messages[0]['content'] == SUMMARY_PREFIX + "first summary"
+
+        while len(calls) < 3:
+            window.append(_turn(turn))
+            turn += 1
+        assert window.messages[0]['content'] == SUMMARY_PREFIX + "retried summary"
+        # The turns dropped while summarizing failed are folded into the retry
+        assert calls[2] > calls[1]
+        assert window.total_tokens <= 80
@@ -0,0 +1,133 @@
+"""
+Test Disk Cache
+
+Tests for the persistent SQLite cache tier and its use behind
+ResponseCache.
+"""
+
+import sqlite3
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from shared.utils.cache import ResponseCache
+from shared.utils.disk_cache import DiskCache
+
+POWER_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "responses.db")
+
+
+class TestDiskCache:
+    """Test cases for DiskCache."""
+
+    def test_values_survive_reopen(self, cache_path):
+        cache = DiskCache(cache_path)
+        cache.set("prompt", {"text": "answer", "tokens": 3}, ttl_seconds=60)
+        cache.close()
+
+        reopened = DiskCache(cache_path)
+        assert reopened.get("prompt") == {"text": "answer", "tokens": 3}
+        assert reopened.get("other") is None
+        reopened.close()
+
+    def test_namespaces_do_not_collide(self, cache_path):
+        openai_cache = DiskCache(cache_path, namespace="openai")
+        gemini_cache = DiskCache(cache_path, namespace="gemini")
+        openai_cache.set("key", "from openai", ttl_seconds=60)
+
+        assert gemini_cache.get("key") is None
+        assert openai_cache.get("key") == "from openai"
+
+    def test_expired_entries_are_dropped(self, cache_path):
+        cache = DiskCache(cache_path)
+        cache.set("key", "value", ttl_seconds=0.05)
+        time.sleep(0.1)
+
+        assert cache.get("key") is None
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["total_bytes"] == 0
+
+    def test_size_bound_evicts_least_recently_used(self, cache_path):
+        cache = DiskCache(cache_path, max_bytes=5000)
+        for i in range(10):
+            cache.set(f"key_{i}", "x" * 1000, ttl_seconds=60)
+
+        stats = cache.stats()
+        assert stats["total_bytes"] <= 5000
+        assert cache.get("key_9") is not None
+        assert cache.get("key_0") is None
+
+    def test_locked_database_reads_as_a_miss(self, cache_path):
+        cache = DiskCache(cache_path, busy_timeout_ms=50)
+        cache.set("stale", "answer", ttl_seconds=0.01)
+        cache.set("fresh", "answer", ttl_seconds=60)
+        cache._TOUCH_INTERVAL_SECONDS = -1  # pylint: disable=protected-access
+        time.sleep(0.02)
+
+        writer = sqlite3.connect(cache_path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            # Expiry deletes and access-time touches need the write lock held above
+            assert cache.get("stale") is None
+            assert cache.get("fresh") is None
+            assert ResponseCache(disk_cache=cache).get("fresh") is None
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+
+        assert cache.get("fresh") == "answer"
+        cache.close()
+
+    def test_shared_between_processes(self, cache_path):
+        cache = DiskCache(cache_path, namespace="openai")
+        script = (
+            "from shared.utils.disk_cache import DiskCache\n"
+            f"DiskCache({cache_path!r}, namespace='openai').set('shared', 'hello', 60)\n"
+        )
+        subprocess.run([sys.executable, "-c", script], cwd=POWER_ROOT, check=True)
+
+        assert cache.get("shared") == "hello"
+
+
+class TestResponseCacheDiskTier:
+    """Test cases for ResponseCache backed by a DiskCache."""
+
+    def test_miss_falls_through_and_promotes(self, cache_path):
+        writer = ResponseCache(disk_cache=DiskCache(cache_path))
+        writer.set("deterministic", "stored answer")
+
+        # A fresh process-local cache finds the value on disk
+        reader = ResponseCache(disk_cache=DiskCache(cache_path))
+        assert reader.size() == 0
+        assert reader.get("deterministic") == "stored answer"
+        assert reader.size() == 1
+
+        stats = reader.get_stats()
+        assert (stats.hits, stats.misses, stats.disk_hits) == (1, 0, 1)
+
+    def test_non_persistent_values_stay_in_memory(self, cache_path):
+        disk = DiskCache(cache_path)
+        cache = ResponseCache(disk_cache=disk)
+        cache.set("sampled", "answer", persist=False)
+
+        assert cache.get("sampled") == "answer"
+        assert disk.get("sampled") is None
+
+    def test_only_deterministic_responses_are_persisted(self, cache_path):
+        disk = DiskCache(cache_path)
+        cache = ResponseCache(disk_cache=disk)
+        cache.set_response("greedy", "answer", temperature=0)
+        cache.set_response("sampled", "answer", temperature=0.7)
+        cache.set_response("default", "answer", temperature=None)
+
+        assert disk.get("greedy") == "answer"
+        assert disk.get("sampled") is None
+        assert disk.get("default") is None
+        assert cache.get("sampled") == "answer"
@@ -0,0 +1,44 @@
+"""
+Tests for the offline hashing embedding provider.
+"""
+
+import numpy as np
+
+from shared.interfaces.embedding_provider import EmbeddingProvider
+from shared.utils.hashing_embedder import HashingEmbeddingProvider
+
+
+class TestHashingEmbeddingProvider:
+    """Test cases for HashingEmbeddingProvider."""
+
+    def test_implements_interface(self) -> None:
+        """Provider satisfies the shared embedding contract."""
+        provider = HashingEmbeddingProvider(dimension=64)
+        assert isinstance(provider, EmbeddingProvider)
+        assert provider.dimension == 64
+        assert provider.model_name == "hashing-bow-64-bigram"
+
+    def test_batch_shape_and_normalisation(self) -> None:
+        """Batches return one unit vector per non-empty text."""
+        embeddings = HashingEmbeddingProvider().embed_texts(["alpha beta", "gamma", ""])
+
+        assert embeddings.shape == (3, 128)
+        assert embeddings.dtype == np.float32
+        assert np.allclose(np.linalg.norm(embeddings[:2], axis=1), 1.0)
+        assert not embeddings[2].any()
+
+    def test_deterministic_and_case_insensitive(self) -> None:
+        """The same text maps to the same vector across instances."""
+        first = HashingEmbeddingProvider().embed_text("Memory Search Tool")
+        second = HashingEmbeddingProvider().embed_text("memory search tool")
+        assert np.array_equal(first, second)
+
+    def test_shared_words_increase_similarity(self) -> None:
+        """Texts that share words score higher than unrelated texts."""
+        query, related, unrelated = HashingEmbeddingProvider(dimension=512).embed_texts([
+            "vector index for memory search",
+            "memory search uses a vector index",
+            "quarterly budget spreadsheet review",
+        ])
+        assert query @ related > query @ unrelated
+        assert query @ related > 0.4
@@ -0,0 +1,39 @@
+"""
+Tests for LatencyTracker.
+"""
+
+from shared.utils.latency import LatencyTracker
+
+
+class TestLatencyTracker:
+    """Test cases for LatencyTracker."""
+
+    def test_empty_tracker_has_no_percentile(self):
+        tracker = LatencyTracker()
+
+        assert tracker.percentile(90) is None
+        assert tracker.summary()['sample_count'] == 0
+
+    def test_percentiles(self):
+        tracker = LatencyTracker()
+        for latency in range(1, 101):
+            tracker.record(float(latency))
+
+        assert tracker.percentile(90) == 91.0
+        assert tracker.percentile(100) == 100.0
+        assert tracker.summary()['p90_latency_ms'] == 91.0
+
+    def test_non_positive_samples_are_ignored(self):
+        tracker = LatencyTracker()
+        tracker.record(0)
+        tracker.record(-5)
+
+        assert len(tracker) == 0
+
+    def test_samples_are_trimmed_to_newest(self):
+        tracker = LatencyTracker(max_samples=10, keep_samples=4)
+        for latency in range(1, 12):
+            tracker.record(float(latency))
+
+        assert len(tracker) == 4
+        assert tracker.summary()['min_latency_ms'] == 8.0
@@ -0,0 +1,241 @@
+"""
+Test Base Rate Limiter
+
+Tests for the GCRA-backed BaseRateLimiter, its reserve() API and the
+cross-process shared state backend.
+"""
+
+import asyncio
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from shared.exceptions import QuotaExceededError
+from shared.utils import rate_limiter as rate_limiter_module
+from shared.utils.rate_limiter import BaseRateLimiter, GCRABucket
+from shared.utils.shared_rate_limit import SharedRateLimitState
+
+POWER_ROOT = Path(__file__).resolve().parents[3]
+
+
+class FakeClock:
+    """Controllable replacement for time.time()."""
+
+    def __init__(self, start: float = 1_700_000_000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+
+    def fake_sleep(seconds):
+        fake.now += seconds
+
+    monkeypatch.setattr(rate_limiter_module.time, "time", fake)
+    monkeypatch.setattr(rate_limiter_module.time, "sleep", fake_sleep)
+    return fake
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / "rate_limits.db")
+
+
+class TestGCRABucket:
+    """Test cases for GCRABucket."""
+
+    def test_burst_then_steady_rate(self):
+        bucket = GCRABucket(limit=3, period=3.0)
+        for _ in range(3):
+            assert bucket.wait_time(100.0) == 0.0
+            bucket.consume(100.0)
+
+        assert bucket.wait_time(100.0) == pytest.approx(1.0)
+        assert bucket.wait_time(101.0) == 0.0
+
+    def test_cost_is_weighted(self):
+        bucket = GCRABucket(limit=100, period=60.0)
+        bucket.consume(0.0, 100)
+        assert bucket.wait_time(0.0, 50) == pytest.approx(30.0)
+
+
+class TestBaseRateLimiter:
+    """Test cases for BaseRateLimiter."""
+
+    def test_per_minute_limit_and_wait(self, clock):
+        limiter = BaseRateLimiter(calls_per_minute=60)
+        for _ in range(60):
+            assert limiter.can_make_request()
+            limiter.record_request()
+
+        assert not limiter.can_make_request()
+        assert limiter.get_wait_time() == pytest.approx(1.0)
+
+        clock.now += 1.0
+        assert limiter.can_make_request()
+
+    def test_reserve_returns_exact_successive_waits(self, clock):
+        limiter = BaseRateLimiter(calls_per_minute=60, min_interval_seconds=0.5)
+        waits = [limiter.reserve() for _ in range(4)]
+        assert waits == pytest.approx([0.0, 0.5, 1.0, 1.5])
+
+    def test_reserve_accounts_for_tokens(self, clock):
+        limiter = BaseRateLimiter(calls_per_minute=1000, tokens_per_minute=6000)
+        assert limiter.reserve(6000) == 0.0
+        # The next 3000 tokens refill at 100 tokens per second
+        assert limiter.reserve(3000) == pytest.approx(30.0)
+        assert limiter.get_token_usage()["tokens_this_minute"] == 9000
+
+    def test_daily_quota_resets_at_midnight(self, clock):
+        limiter = BaseRateLimiter(calls_per_minute=1000, calls_per_day=2)
+        limiter.reserve()
+        limiter.reserve()
+
+        with pytest.raises(QuotaExceededError):
+            limiter.reserve()
+        assert not limiter.can_make_request()
+        wait = limiter.get_wait_time()
+        assert 0 < wait <= 86400
+
+        clock.now += wait
+        assert limiter.can_make_request()
+        assert limiter.get_stats().requests_today == 0
+
+    def test_stats_surface(self, clock):
+        limiter = BaseRateLimiter(calls_per_minute=10, calls_per_hour=100, calls_per_day=50)
+        for _ in range(10):
+            limiter.record_request()
+
+        stats = limiter.get_stats()
+        assert stats.requests_this_minute == 10
+        assert stats.requests_this_hour == 10
+        assert stats.total_requests == 10
+        assert stats.quota_remaining_daily == 40
+        assert stats.next_allowed_time is not None
+        assert set(stats.to_dict()) >= {"requests_this_minute", "next_allowed_time"}
+
+    def test_state_is_constant_size(self, clock):
+        limiter = BaseRateLimiter(calls_per_minute=10**9, calls_per_hour=10**9)
+        for _ in range(10000):
+            limiter.record_request()
+        assert limiter.get_memory_usage()["total_tracked_requests"] == 0
+
+    def test_concurrent_reservations_never_overlap(self, clock):
+        limiter = BaseRateLimiter(calls_per_minute=60, min_interval_seconds=1.0)
+        waits = []
+
+        def worker():
+            for _ in range(5):
+                waits.append(limiter.reserve())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(waits) == pytest.approx([float(i) for i in range(20)])
+
+
+class TestSharedRateLimitState:
+    """Test cases for BaseRateLimiter backed by SharedRateLimitState."""
+
+    def test_limiters_share_one_budget(self, clock, state_path):
+        first = BaseRateLimiter(calls_per_minute=10, calls_per_day=100,
+                                shared_state=SharedRateLimitState(state_path, name="openai"))
+        second = BaseRateLimiter(calls_per_minute=10, calls_per_day=100,
+                                 shared_state=SharedRateLimitState(state_path, name="openai"))
+        other = BaseRateLimiter(calls_per_minute=10,
+                                shared_state=SharedRateLimitState(state_path, name="gemini"))
+
+        for _ in range(10):
+            first.record_request()
+
+        assert not second.can_make_request()
+        assert second.get_wait_time() == pytest.approx(6.0)
+        assert second.get_stats().quota_remaining_daily == 90
+        assert other.can_make_request()
+
+    def test_reservations_interleave_across_limiters(self, clock, state_path):
+        limiters = [
+            BaseRateLimiter(calls_per_minute=1000, min_interval_seconds=1.0,
+                            shared_state=SharedRateLimitState(state_path, owner=owner))
+            for owner in (1, 2)
+        ]
+        waits = [limiters[i % 2].reserve() for i in range(4)]
+        assert waits == pytest.approx([0.0, 1.0, 2.0, 3.0])
+
+    def test_process_over_fair_share_waits_its_turn(self, clock, state_path):
+        greedy = BaseRateLimiter(
+            calls_per_minute=1000, min_interval_seconds=1.0,
+            shared_state=SharedRateLimitState(state_path, max_pending=4, owner=1)
+        )
+        polite = BaseRateLimiter(
+            calls_per_minute=1000, min_interval_seconds=1.0,
+            shared_state=SharedRateLimitState(state_path, max_pending=4, owner=2)
+        )
+        started = clock.now
+
+        # Alone, a process may book up to max_pending slots ahead
+        assert [greedy.reserve() for _ in range(4)] == pytest.approx([0.0, 1.0, 2.0, 3.0])
+
+        # Another process gets the next slot, and now each may hold only two
+        assert polite.reserve() == pytest.approx(4.0)
+        greedy_wait = greedy.reserve()
+        assert clock.now - started == pytest.approx(2.0)
+        assert clock.now + greedy_wait - started == pytest.approx(5.0)
+
+    def test_areserve_waits_its_turn_without_blocking(self, clock, state_path, monkeypatch):
+        greedy = BaseRateLimiter(
+            calls_per_minute=1000, min_interval_seconds=1.0,
+            shared_state=SharedRateLimitState(state_path, max_pending=4, owner=1)
+        )
+        polite = BaseRateLimiter(
+            calls_per_minute=1000, min_interval_seconds=1.0,
+            shared_state=SharedRateLimitState(state_path, max_pending=4, owner=2)
+        )
+        async_sleeps = []
+
+        async def fake_async_sleep(seconds):
+            async_sleeps.append(seconds)
+            clock.now += seconds
+
+        def blocking_sleep(seconds):
+            raise AssertionError("areserve must not block the event loop")
+
+        monkeypatch.setattr(rate_limiter_module.asyncio, "sleep", fake_async_sleep)
+        monkeypatch.setattr(rate_limiter_module.time, "sleep", blocking_sleep)
+
+        async def run():
+            waits = [await greedy.areserve() for _ in range(4)]
+            waits.append(await polite.areserve())
+            waits.append(await greedy.areserve())
+            return waits
+
+        waits = asyncio.run(run())
+
+        assert waits[:5] == pytest.approx([0.0, 1.0, 2.0, 3.0, 4.0])
+        assert async_sleeps == pytest.approx([2.0])
+        assert waits[5] == pytest.approx(3.0)
+
+    def test_state_is_shared_with_other_processes(self, state_path):
+        limiter = BaseRateLimiter(calls_per_minute=5,
+                                  shared_state=SharedRateLimitState(state_path, name="openai"))
+        script = (
+            "from shared.utils.rate_limiter import BaseRateLimiter\n"
+            "from shared.utils.shared_rate_limit import SharedRateLimitState\n"
+            f"state = SharedRateLimitState({state_path!r}, name='openai')\n"
+            "limiter = BaseRateLimiter(calls_per_minute=5, shared_state=state)\n"
+            "for _ in range(5):\n"
+            "    limiter.record_request()\n"
+        )
+        subprocess.run([sys.executable, "-c", script], cwd=POWER_ROOT, check=True)
+
+        assert not limiter.can_make_request()
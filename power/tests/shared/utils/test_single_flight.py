@@ -0,0 +1,93 @@
+"""
+Tests for single-flight request coalescing.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from shared.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    def test_concurrent_threads_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def slow_call():
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+            return "answer"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("key", slow_call)))
+        leader.start()
+        started.wait()
+        followers = [threading.Thread(target=lambda: results.append(flight.do("key", slow_call)))
+                     for _ in range(4)]
+        for thread in followers:
+            thread.start()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        assert results == ["answer"] * 5
+        assert len(calls) == 1
+        assert flight.get_stats()['coalesced'] == 4
+
+    def test_exception_is_shared_and_key_released(self):
+        flight = SingleFlight()
+
+        async def scenario():
+            async def failing():
+                await asyncio.sleep(0.02)
+                raise ValueError("upstream failure")
+
+            return await asyncio.gather(*(flight.do_async("key", failing) for _ in range(3)),
+                                        return_exceptions=True)
+
+        results = asyncio.run(scenario())
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.get_stats() == {'calls': 3, 'executions': 1, 'coalesced': 2,
+                                      'coalesce_rate': pytest.approx(2 / 3), 'in_flight': 0}
+        # A finished key starts a fresh call
+        assert flight.do("key", lambda: "fresh") == "fresh"
+
+    def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "answer"
+
+        async def scenario():
+            first = asyncio.create_task(flight.do_async("key", call))
+            second = asyncio.create_task(flight.do_async("key", call))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second, first.cancelled()
+
+        assert asyncio.run(scenario()) == ("answer", True)
+        assert len(calls) == 1
+
+    def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+
+        async def scenario():
+            async def echo(value):
+                await asyncio.sleep(0.01)
+                return value
+
+            return await asyncio.gather(flight.do_async("a", lambda: echo("a")),
+                                        flight.do_async("b", lambda: echo("b")))
+
+        assert asyncio.run(scenario()) == ["a", "b"]
+        assert flight.get_stats()['executions'] == 2
@@ -0,0 +1,67 @@
+"""
+Tests for the shared token counter.
+"""
+
+import pytest
+
+from shared.utils import token_counter as token_counter_module
+from shared.utils.token_counter import REPLY_PRIMING_TOKENS, TOKENS_PER_MESSAGE, TokenCounter
+
+
+@pytest.fixture
+def counter(word_token_counter):
+    return word_token_counter
+
+
+class TestTokenCounter:
+    """Test cases for TokenCounter."""
+
+    def test_counts_with_encoder(self, counter):
+        assert counter.exact
+        assert counter.count("one two three") == 3
+        assert counter.count("") == 0
+
+    def test_repeated_text_is_memoized(self, counter):
+        system_prompt = "You are a careful assistant " * 50
+
+        for _ in range(5):
+            assert counter.count(system_prompt) == 250
+
+        assert counter._encoder.calls == 1  # pylint: disable=protected-access
+        assert counter.get_stats()['hits'] == 4
+
+    def test_memo_is_bounded(self, counter):
+        counter.memo_size = 2
+        for text in ("a", "b", "c"):
+            counter.count(text)
+
+        assert counter.get_stats()['memo_size'] == 2
+
+    def test_message_overhead(self, counter):
+        messages = [
+            {'role': 'system', 'content': 'be brief'},
+            {'role': 'user', 'content': 'hello there', 'name': 'sam'},
+            {'role': 'assistant', 'content': None},
+        ]
+
+        expected = 3 * TOKENS_PER_MESSAGE + 3 + 2 + 2 + 2 + REPLY_PRIMING_TOKENS
+        assert counter.count_messages(messages) == expected
+
+    def test_tally_counts_only_appended_messages(self, counter):
+        history = [{'role': 'user', 'content': 'word ' * 100}]
+        tally = counter.tally(history)
+        calls = counter._encoder.calls  # pylint: disable=protected-access
+
+        added = tally.append({'role': 'user', 'content': 'new question'})
+
+        assert added == TOKENS_PER_MESSAGE + 1 + 2
+        assert tally.total == counter.count_messages(history) + added
+        # Only the new content was encoded; the role was already memoized
+        assert counter._encoder.calls == calls + 1  # pylint: disable=protected-access
+
+    def test_falls_back_to_heuristic_without_encoder(self, monkeypatch):
+        monkeypatch.setattr(token_counter_module, '_load_encoder', lambda model: None)
+        counter = TokenCounter("unknown-model")
+
+        assert not counter.exact
+        assert counter.count("x" * 40) == 10